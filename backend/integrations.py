@@ -0,0 +1,341 @@
+# integrations.py
+"""
+Native integration engine (INTEGRATION_ENGINE=native).
+
+Python port of the n8n "Checkin Orchestrator v5 (PG)" flow and its
+sub-workflows ("Start.gg Check", "eBas Membership Check"):
+
+    Parse Input -> eBas Check  ---\
+                -> Start.gg Check -> Combine Results -> report startgg + ebas
+
+The two checks run concurrently on the backend's shared httpx client (keep-alive
+connections to api.start.gg / ebas.sverok.se), and results are applied through
+apply_integration_result directly instead of a POST back to
+/api/integration/result.
+
+Outputs keep the n8n shapes so callers can switch engines freely:
+    startgg_check -> {isRegistered, tournament, participant_id, tag, name, email, events, eventCount}
+    ebas_check    -> {isMember, message}
+Both add {error: True, message} on failure instead of raising (startgg_check
+can opt into raising for admin rechecks).
+"""
+
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+STARTGG_API_URL = os.getenv("STARTGG_API_URL", "https://api.start.gg/gql/alpha")
+EBAS_API_URL = os.getenv("EBAS_API_URL", "https://ebas.sverok.se/apis/confirm_membership.json")
+EBAS_ASSOC = os.getenv("EBAS_ASSOC")
+EBAS_API_KEY = os.getenv("EBAS_API_KEY")
+STARTGG_TOKEN = os.getenv("STARTGG_API_KEY") or os.getenv("STARTGG_TOKEN")
+# Per-check timeout; the n8n flow had no explicit limit besides the webhook timeout
+INTEGRATION_TIMEOUT_SECONDS = float(os.getenv("INTEGRATION_TIMEOUT_SECONDS", "15"))
+# Start.gg allows 80 requests/min per token; stay below it. The budget is for
+# the whole backend: every uvicorn worker has its own bucket, so each gets an
+# equal share (WEB_CONCURRENCY is also uvicorn's default for --workers).
+STARTGG_RATE_LIMIT_PER_MINUTE = float(os.getenv("STARTGG_RATE_LIMIT_PER_MINUTE", "60"))
+STARTGG_RATE_BURST = int(os.getenv("STARTGG_RATE_BURST", "10"))
+BACKEND_WORKERS = max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+
+STARTGG_PARTICIPANT_QUERY = (
+    "query Q($slug: String!, $tag: String!) { tournament(slug: $slug) { id name "
+    "participants(query: { filter: { gamerTag: $tag } }) { nodes { id gamerTag email "
+    "user { name } events { id name } } } } }"
+)
+
+STARTGG_ROSTER_QUERY = (
+    "query Roster($slug: String!, $page: Int!, $perPage: Int!) { tournament(slug: $slug) { "
+    "id name numAttendees participants(query: { page: $page, perPage: $perPage }) { "
+    "pageInfo { totalPages } nodes { id gamerTag email user { name } events { id name } } } } }"
+)
+STARTGG_ATTENDEES_QUERY = "query Q($slug: String!) { tournament(slug: $slug) { id numAttendees } }"
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter for asyncio callers.
+
+    `acquire()` takes one token, sleeping until one is available. Waiters
+    reserve tokens in call order (the balance may go negative), so no lock is
+    needed and the bucket is not tied to a particular event loop.
+    """
+
+    def __init__(self, rate_per_second: float, burst: int):
+        self.rate = rate_per_second
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+
+    def _reserve(self) -> float:
+        """Take a token and return how long the caller must wait for it."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def acquire(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+# Shared by every Start.gg request this worker makes (checks, roster sync, rechecks)
+startgg_limiter = TokenBucket(
+    STARTGG_RATE_LIMIT_PER_MINUTE / 60.0 / BACKEND_WORKERS, STARTGG_RATE_BURST // BACKEND_WORKERS
+)
+
+
+def normalize_personnummer(raw) -> Optional[str]:
+    """
+    Normalize a personnummer to 12 digits (YYYYMMDDXXXX).
+
+    Returns None when fewer than 10 digits remain. 10-digit numbers get a
+    century prefix with the same heuristic as n8n: YY > 30 -> 19XX, else 20XX.
+    """
+    digits = "".join(ch for ch in str(raw or "") if ch.isdigit())
+    if len(digits) < 10:
+        return None
+    if len(digits) == 10:
+        digits = ("19" if int(digits[:2]) > 30 else "20") + digits
+    return digits
+
+
+def _timeout() -> httpx.Timeout:
+    return httpx.Timeout(INTEGRATION_TIMEOUT_SECONDS, connect=5.0)
+
+
+def _startgg_headers() -> dict:
+    return {"Authorization": f"Bearer {STARTGG_TOKEN}"} if STARTGG_TOKEN else {}
+
+
+async def startgg_check(
+    client: httpx.AsyncClient, tag: str, slug: str, raise_on_error: bool = False
+) -> dict:
+    """
+    Check whether `tag` is registered in tournament `slug` on Start.gg.
+
+    With raise_on_error, transport/HTTP failures raise httpx.HTTPError instead
+    of reading as "not registered" (admin rechecks must not clear a flag just
+    because Start.gg was unreachable).
+    """
+    tag = (tag or "").strip()
+    slug = (slug or "").strip()
+    if not tag or not slug:
+        return {
+            "isRegistered": False,
+            "error": True,
+            "message": "Tag saknas" if not tag else "Slug saknas",
+        }
+
+    await startgg_limiter.acquire()
+    try:
+        resp = await client.post(
+            STARTGG_API_URL,
+            json={"query": STARTGG_PARTICIPANT_QUERY, "variables": {"slug": slug, "tag": tag}},
+            headers=_startgg_headers(),
+            timeout=_timeout(),
+        )
+        resp.raise_for_status()
+        payload = resp.json()
+    except (httpx.HTTPError, ValueError) as e:
+        if raise_on_error:
+            raise
+        logger.warning(f"Start.gg check failed for '{tag}' @ '{slug}': {e}")
+        return {"isRegistered": False, "error": True, "message": str(e)}
+
+    tournament = (payload.get("data") or {}).get("tournament")
+    if not tournament:
+        return {"isRegistered": False, "error": True, "message": "Turnering hittades inte"}
+
+    participants = (tournament.get("participants") or {}).get("nodes") or []
+    if not participants:
+        return {
+            "isRegistered": False,
+            "tournament": tournament.get("name"),
+            "message": "Ej registrerad",
+        }
+
+    player = participants[0]
+    events = [e.get("name") for e in (player.get("events") or []) if e.get("name")]
+    return {
+        "isRegistered": True,
+        "tournament": tournament.get("name"),
+        "participant_id": str(player["id"]) if player.get("id") else None,
+        "tag": player.get("gamerTag"),
+        "name": (player.get("user") or {}).get("name"),
+        "email": player.get("email") or None,
+        "events": events,
+        "eventCount": len(events),
+    }
+
+
+async def _startgg_query(client: httpx.AsyncClient, query: str, variables: dict) -> dict:
+    """POST a GraphQL query to Start.gg; raises httpx.HTTPError / ValueError on failure."""
+    await startgg_limiter.acquire()
+    resp = await client.post(
+        STARTGG_API_URL,
+        json={"query": query, "variables": variables},
+        headers=_startgg_headers(),
+        timeout=_timeout(),
+    )
+    resp.raise_for_status()
+    payload = resp.json()
+    if payload.get("errors"):
+        raise ValueError(f"Start.gg GraphQL errors: {payload['errors']}")
+    return payload.get("data") or {}
+
+
+async def startgg_attendee_count(client: httpx.AsyncClient, slug: str) -> Optional[int]:
+    """Return numAttendees for tournament slug (cheap change probe), None if not found."""
+    tournament = (await _startgg_query(client, STARTGG_ATTENDEES_QUERY, {"slug": slug})).get(
+        "tournament"
+    )
+    if not tournament:
+        return None
+    return tournament.get("numAttendees")
+
+
+async def startgg_roster(client: httpx.AsyncClient, slug: str, per_page: int = 50) -> dict:
+    """
+    Page through all participants of tournament slug.
+
+    Returns {"attendee_count", "entries": [{participant_id, gamer_tag, email,
+    user_name, events}]}. Raises on HTTP/GraphQL errors or an unknown slug, so a
+    partial roster is never mistaken for the complete one.
+    """
+    entries = []
+    attendee_count = None
+    page = 1
+    while True:
+        data = await _startgg_query(
+            client, STARTGG_ROSTER_QUERY, {"slug": slug, "page": page, "perPage": per_page}
+        )
+        tournament = data.get("tournament")
+        if not tournament:
+            raise ValueError(f"Tournament not found: {slug}")
+        attendee_count = tournament.get("numAttendees")
+        participants = tournament.get("participants") or {}
+        for node in participants.get("nodes") or []:
+            if not node.get("id") or not node.get("gamerTag"):
+                continue
+            entries.append(
+                {
+                    "participant_id": str(node["id"]),
+                    "gamer_tag": node["gamerTag"],
+                    "email": node.get("email") or None,
+                    "user_name": (node.get("user") or {}).get("name"),
+                    "events": [e.get("name") for e in (node.get("events") or []) if e.get("name")],
+                }
+            )
+        total_pages = (participants.get("pageInfo") or {}).get("totalPages") or 0
+        if page >= total_pages:
+            break
+        page += 1
+    return {"attendee_count": attendee_count, "entries": entries}
+
+
+async def ebas_check(client: httpx.AsyncClient, personnummer: str) -> dict:
+    """Check Sverok membership for the current year via eBas confirm_membership."""
+    if not personnummer:
+        return {"isMember": False, "skipped": True, "message": "Inget personnummer angivet"}
+
+    pnr = normalize_personnummer(personnummer)
+    if not pnr:
+        return {"isMember": False, "error": True, "message": "Ogiltigt personnummer-format"}
+
+    body = {
+        "request": {
+            "action": "confirm_membership",
+            "association_number": EBAS_ASSOC or "",
+            "api_key": EBAS_API_KEY or "",
+            "year_id": datetime.now().year,
+            "socialsecuritynumber": pnr,
+        }
+    }
+    try:
+        resp = await client.post(EBAS_API_URL, json=body, timeout=_timeout())
+        resp.raise_for_status()
+        payload = resp.json()
+    except (httpx.HTTPError, ValueError) as e:
+        # Never log the personnummer
+        logger.warning(f"eBas membership check failed: {e}")
+        return {"isMember": False, "error": True, "message": str(e)}
+
+    member_found = (payload.get("response") or {}).get("member_found") is True
+    return {
+        "isMember": member_found,
+        "message": "Medlem i Sverok" if member_found else "Ej medlem i Sverok",
+    }
+
+
+def _error_info(result: dict) -> Optional[dict]:
+    if not result.get("error"):
+        return None
+    return {"code": "api_error", "message": str(result.get("message") or result["error"])}
+
+
+async def run_checkin_integrations(
+    client: httpx.AsyncClient,
+    apply_fn: Callable[..., Awaitable[dict]],
+    checkin_id: str,
+    tag: str,
+    slug: str,
+    personnummer: str,
+    startgg_check_fn: Optional[Callable[..., Awaitable[dict]]] = None,
+) -> dict:
+    """
+    Run eBas + Start.gg checks concurrently and apply both results.
+
+    Same contract as the n8n v5 flow: both sources are always reported (a
+    failed or skipped check counts as not member / not registered) and the
+    summary {checkin_id, member, startgg, events, integration_complete} is
+    returned. startgg_check_fn(tag, slug) replaces the live Start.gg query
+    (e.g. the roster index).
+    """
+    tag = (tag or "").strip().lower()
+    if startgg_check_fn is not None:
+        sgg_call = startgg_check_fn(tag, slug)
+    else:
+        sgg_call = startgg_check(client, tag, slug)
+    ebas, sgg = await asyncio.gather(ebas_check(client, personnummer), sgg_call)
+
+    is_member = ebas.get("isMember") is True
+    is_registered = sgg.get("isRegistered") is True
+    events = sgg.get("events") or []
+    fetched_at = datetime.now(timezone.utc).isoformat()
+
+    await asyncio.gather(
+        apply_fn(
+            checkin_id=checkin_id,
+            source="startgg",
+            ok=is_registered,
+            data={"registered": is_registered, "events": events, "email": sgg.get("email") or None},
+            error=_error_info(sgg),
+            fetched_at=fetched_at,
+        ),
+        apply_fn(
+            checkin_id=checkin_id,
+            source="ebas",
+            ok=is_member,
+            data={"member": is_member},
+            error=_error_info(ebas),
+            fetched_at=fetched_at,
+        ),
+    )
+
+    return {
+        "checkin_id": checkin_id,
+        "member": is_member,
+        "startgg": is_registered,
+        "events": events,
+        "integration_complete": True,
+    }
@@ -2,7 +2,13 @@
 
 # Import FastAPI, templating, static files, and other dependencies
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import HTMLResponse, RedirectResponse, Response, StreamingResponse
+from fastapi.responses import (
+    HTMLResponse,
+    JSONResponse,
+    RedirectResponse,
+    Response,
+    StreamingResponse,
+)
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
@@ -12,8 +18,10 @@ import json
 import logging
 import time
 import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
 from urllib.parse import quote
-from typing import Set
+from typing import Dict, Optional, Set
 from contextlib import asynccontextmanager
 
 import httpx
@@ -21,7 +29,9 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-from shared.storage import (
+# Async storage facade: every storage call is awaited so queries never stall
+# the event loop (SSE streams, concurrent check-ins).
+from shared.async_storage import (
     get_players as storage_get_players,
     get_event_history as storage_get_event_history,
     get_active_settings as storage_get_active_settings,
@@ -33,15 +43,17 @@ from shared.storage import (
 
 # Backend-specific optional functions (available in Postgres mode)
 try:
-    from shared.storage import (
+    from shared.async_storage import (
         get_checkin_by_record_id,
         compute_checkin_status,
     )
 except ImportError:
     get_checkin_by_record_id = None
     compute_checkin_status = None
-import shared.storage as storage_api
+import shared.async_storage as storage_api
 from validation import sanitize_checkin_payload, validate_checkin_payload
+import integrations
+from startgg_roster import STARTGG_ROSTER_ENABLED, StartggRoster
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -58,6 +70,13 @@ OAUTH_ADMIN_KEY = os.getenv("OAUTH_ADMIN_KEY", "supersecret")  # simple protecti
 N8N_INTERNAL = os.getenv("N8N_INTERNAL_URL", "http://n8n:5678")
 INTEGRATION_ENGINE = os.getenv("INTEGRATION_ENGINE", "n8n").lower().strip()
 EBAS_REGISTER_TIMEOUT_SECONDS = float(os.getenv("EBAS_REGISTER_TIMEOUT_SECONDS", "75"))
+# "sync" (default): /api/checkin/orchestrate waits for integrations.
+# "async": respond 202 + checkin_id, push the result (clients can also pick per request).
+CHECKIN_ORCHESTRATION_MODE = os.getenv("CHECKIN_ORCHESTRATION_MODE", "sync").lower().strip()
+CHECKIN_JOB_CONCURRENCY = int(os.getenv("CHECKIN_JOB_CONCURRENCY", "8"))
+STARTGG_BULK_CONCURRENCY = int(os.getenv("STARTGG_BULK_CONCURRENCY", "8"))
+# Audit log retention (maintain_audit_log) runs in every worker; one wins the lock.
+AUDIT_MAINTENANCE_INTERVAL_SECONDS = int(os.getenv("AUDIT_MAINTENANCE_INTERVAL_SECONDS", "86400"))
 N8N_WEBHOOK_TOKEN = os.getenv("N8N_WEBHOOK_TOKEN")  # optional shared secret for webhook calls
 SSE_TOKEN = os.getenv("SSE_TOKEN")  # token for SSE authentication (used instead of Basic Auth)
 ADMIN_AUTH_COOKIE_TOKEN = os.getenv("ADMIN_AUTH_COOKIE_TOKEN")
@@ -68,17 +87,82 @@ N8N_BASIC_AUTH_USER = os.getenv("N8N_BASIC_AUTH_USER")
 N8N_BASIC_AUTH_PASSWORD = os.getenv("N8N_BASIC_AUTH_PASSWORD")
 
 # === SSE (Server-Sent Events) for real-time dashboard updates ===
+SSE_NOTIFY_CHANNEL = "fgc_sse"
+# Row-level active_event_data change feed (Postgres backend only)
+CHECKIN_DELTA_CHANNEL = getattr(storage_api, "CHECKIN_DELTA_CHANNEL", None)
+
+
 class SSEManager:
-    """Manages SSE connections and broadcasts events to all connected clients."""
+    """
+    Manages SSE connections and broadcasts events to all connected clients.
+
+    Each uvicorn worker only holds its own clients, so broadcasts are also
+    published on a Postgres NOTIFY channel. Every worker keeps one LISTEN
+    connection (start_relay) and relays messages from other workers to its
+    local clients. Without a relay (Airtable backend) delivery is local only.
+
+    `checkin_result` events (async check-in orchestration) carry player data
+    and are only routed to per-checkin watchers (watch_checkin) - the player's
+    page - never to the general client streams.
+
+    The relay also forwards the Postgres check-in change feed as
+    `checkin_delta` events: {"stream", "seq", "op", "rows"}. `seq` increases by
+    one per event within this worker's stream, so a client that sees a gap (or
+    a new stream after reconnecting to another worker) does a full refresh.
+    """
 
     def __init__(self):
         self.clients: Set[asyncio.Queue] = set()
         self._lock = asyncio.Lock()
+        self.worker_id = uuid.uuid4().hex
+        self._relay_task: Optional[asyncio.Task] = None
+        self._relay_ready = asyncio.Event()
+        self._delta_task: Optional[asyncio.Task] = None
+        self._delta_ready = asyncio.Event()
+        self._delta_seq = 0
+        self.checkin_watchers: Dict[str, Set[asyncio.Queue]] = {}
+
+    async def start_relay(self):
+        """Start the cross-worker LISTEN relay (Postgres backend only)."""
+        listen_fn = getattr(storage_api, "listen_notifications", None)
+        if not listen_fn or self._relay_task is not None:
+            return
+        self._relay_task = asyncio.create_task(
+            listen_fn(SSE_NOTIFY_CHANNEL, self._on_notification, ready=self._relay_ready)
+        )
+        if CHECKIN_DELTA_CHANNEL:
+            self._delta_task = asyncio.create_task(
+                listen_fn(
+                    CHECKIN_DELTA_CHANNEL,
+                    self._on_checkin_delta,
+                    ready=self._delta_ready,
+                    on_connect=self._on_delta_feed_connected,
+                )
+            )
+
+    async def stop_relay(self):
+        for task in (self._relay_task, self._delta_task):
+            if task is None:
+                continue
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._relay_task = None
+        self._delta_task = None
 
     async def connect(self) -> asyncio.Queue:
-        """Register a new SSE client."""
+        """Register a new SSE client (its first message is the connection confirmation)."""
         queue = asyncio.Queue()
         async with self._lock:
+            # Delta baseline is taken under the lock so no checkin_delta can slip in between
+            hello = {
+                "status": "connected",
+                "delta_stream": self.worker_id if self._delta_ready.is_set() else None,
+                "delta_seq": self._delta_seq,
+            }
+            queue.put_nowait(self._format("connected", hello))
             self.clients.add(queue)
         logger.info(f"SSE client connected. Total clients: {len(self.clients)}")
         return queue
@@ -89,22 +173,94 @@ class SSEManager:
             self.clients.discard(queue)
         logger.info(f"SSE client disconnected. Total clients: {len(self.clients)}")
 
+    async def watch_checkin(self, checkin_id: str) -> asyncio.Queue:
+        """Subscribe to the `checkin_result` event of one check-in."""
+        queue = asyncio.Queue()
+        async with self._lock:
+            self.checkin_watchers.setdefault(checkin_id, set()).add(queue)
+        return queue
+
+    async def unwatch_checkin(self, checkin_id: str, queue: asyncio.Queue):
+        async with self._lock:
+            watchers = self.checkin_watchers.get(checkin_id)
+            if watchers is not None:
+                watchers.discard(queue)
+                if not watchers:
+                    self.checkin_watchers.pop(checkin_id, None)
+
     async def broadcast(self, event: str, data: dict):
-        """Send an event to all connected clients."""
-        message = f"event: {event}\ndata: {json.dumps(data)}\n\n"
+        """Send an event to all connected clients, in this and every other worker."""
+        await self._deliver(event, data)
+
+        publish_fn = getattr(storage_api, "publish_notification", None)
+        if publish_fn:
+            payload = json.dumps({"origin": self.worker_id, "event": event, "data": data})
+            if not await publish_fn(SSE_NOTIFY_CHANNEL, payload):
+                # Too large (or DB hiccup): let other workers' dashboards refresh instead
+                refresh = {"origin": self.worker_id, "event": "update", "data": {"type": "refresh"}}
+                await publish_fn(SSE_NOTIFY_CHANNEL, json.dumps(refresh))
+
+    async def _on_notification(self, payload: str):
+        """Relay a broadcast published by another worker to local clients."""
+        try:
+            envelope = json.loads(payload)
+        except (TypeError, ValueError):
+            return
+        if envelope.get("origin") == self.worker_id:
+            return  # already delivered locally
+        await self._deliver(envelope.get("event") or "update", envelope.get("data") or {})
+
+    async def _on_checkin_delta(self, payload: str):
+        """Forward one check-in change feed notification to local clients."""
+        try:
+            delta = json.loads(payload)
+        except (TypeError, ValueError):
+            return
+        if delta.get("op") not in ("insert", "update", "delete"):
+            await self._deliver("update", {"type": "refresh"})
+            return
         async with self._lock:
-            disconnected = []
-            for queue in self.clients:
-                try:
-                    queue.put_nowait(message)
-                except asyncio.QueueFull:
-                    disconnected.append(queue)
-            # Clean up full queues (likely dead connections)
-            for queue in disconnected:
-                self.clients.discard(queue)
+            self._delta_seq += 1
+            data = {
+                "stream": self.worker_id,
+                "seq": self._delta_seq,
+                "op": delta["op"],
+                "rows": delta.get("rows") or [],
+            }
+            self._put_all(self._format("checkin_delta", data))
+
+    async def _on_delta_feed_connected(self):
+        """Changes may have been missed while the feed was down - resync clients."""
+        await self._deliver("update", {"type": "refresh"})
+
+    @staticmethod
+    def _format(event: str, data: dict) -> str:
+        return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+    async def _deliver(self, event: str, data: dict):
+        """Put an event on the queues of this worker's clients."""
+        async with self._lock:
+            if event == "checkin_result":
+                # Carries player data: only the watchers of that check-in get it.
+                for queue in self.checkin_watchers.get(data.get("checkin_id"), ()):
+                    queue.put_nowait(data)
+                return
+            self._put_all(self._format(event, data))
         if self.clients:
             logger.debug(f"Broadcasted '{event}' to {len(self.clients)} clients")
 
+    def _put_all(self, message: str):
+        """Enqueue message for every client. Caller must hold self._lock."""
+        disconnected = []
+        for queue in self.clients:
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                disconnected.append(queue)
+        # Clean up full queues (likely dead connections)
+        for queue in disconnected:
+            self.clients.discard(queue)
+
 sse_manager = SSEManager()
 
 # === App ===
@@ -132,6 +288,13 @@ templates = Jinja2Templates(directory="templates")
 # === HTTP clients ===
 # httpx for proxy to n8n
 httpx_client = httpx.AsyncClient(timeout=httpx.Timeout(30.0, connect=5.0))  # Increased for duplicate check
+# Shared keep-alive client for the native integration engine (Start.gg + eBas)
+integrations_client = httpx.AsyncClient(
+    timeout=httpx.Timeout(integrations.INTEGRATION_TIMEOUT_SECONDS, connect=5.0),
+    limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0),
+)
+# Prefetched Start.gg entrants of the active tournament (O(1) tag lookups)
+startgg_roster = StartggRoster(integrations_client, storage_api)
 
 # requests Session with retries (used for Start.gg GraphQL, OAuth, health checks)
 SESSION = requests.Session()
@@ -343,14 +506,14 @@ async def proxy_n8n(path: str, request: Request):
         raise HTTPException(status_code=502, detail=f"n8n proxy error: {e}")
 
 # === Domain logic ===
-def get_active_settings() -> dict:
+async def get_active_settings() -> dict:
     """
     Fetch active event settings from the configured storage backend.
     Returns dict with swish_number, swish_expected_per_game, active_event_slug,
     and configurable check-in requirements.
-    Uses shared storage facade.
+    Uses shared async storage facade.
     """
-    fields = storage_get_active_settings() or {}
+    fields = await storage_get_active_settings() or {}
     return {
         "swish_number": fields.get("swish_number", "123 456 78 90"),
         "swish_expected_per_game": int(fields.get("swish_expected_per_game", 25)),
@@ -373,7 +536,7 @@ STARTGG_CACHE = {}
 STARTGG_CACHE_TTL = 600  # 10 minutes
 
 
-def get_tournament_events(tournament_slug: str) -> list:
+async def get_tournament_events(tournament_slug: str) -> list:
     """
     Fetch events (games) for a tournament from Start.gg with caching.
     Returns list of dicts: [{"id": "123", "name": "Street Fighter 6"}, ...]
@@ -381,10 +544,10 @@ def get_tournament_events(tournament_slug: str) -> list:
     Cache TTL: 10 minutes (events don't change during a tournament)
     Fallback: Returns empty list if API fails or no token configured
     """
-    def _events_from_settings_fallback() -> list:
+    async def _events_from_settings_fallback() -> list:
         """Build event list from active settings when Start.gg is unavailable."""
         try:
-            settings = storage_get_active_settings() or {}
+            settings = await storage_get_active_settings() or {}
         except Exception:
             return []
 
@@ -425,7 +588,7 @@ def get_tournament_events(tournament_slug: str) -> list:
 
     if not STARTGG_API_KEY:
         logger.warning("STARTGG_API_KEY not configured, cannot fetch events")
-        return _events_from_settings_fallback()
+        return await _events_from_settings_fallback()
 
     now = time.time()
 
@@ -461,7 +624,9 @@ def get_tournament_events(tournament_slug: str) -> list:
     }
 
     try:
-        resp = SESSION.post(
+        # requests Session (with retries) runs in a worker thread - keep the loop free
+        resp = await asyncio.to_thread(
+            SESSION.post,
             "https://api.start.gg/gql/alpha",
             json=query,
             headers=headers,
@@ -473,7 +638,7 @@ def get_tournament_events(tournament_slug: str) -> list:
 
         if "errors" in data:
             logger.error(f"Start.gg GraphQL errors: {data['errors']}")
-            fallback_events = _events_from_settings_fallback()
+            fallback_events = await _events_from_settings_fallback()
             if fallback_events:
                 logger.info("Using settings fallback events after Start.gg GraphQL errors")
                 return fallback_events
@@ -482,7 +647,7 @@ def get_tournament_events(tournament_slug: str) -> list:
         tournament = data.get("data", {}).get("tournament")
         if not tournament:
             logger.warning(f"Tournament not found: {tournament_slug}")
-            fallback_events = _events_from_settings_fallback()
+            fallback_events = await _events_from_settings_fallback()
             if fallback_events:
                 logger.info("Using settings fallback events for missing tournament")
                 return fallback_events
@@ -503,21 +668,21 @@ def get_tournament_events(tournament_slug: str) -> list:
 
     except requests.RequestException as e:
         logger.error(f"Start.gg API request failed: {e}")
-        fallback_events = _events_from_settings_fallback()
+        fallback_events = await _events_from_settings_fallback()
         if fallback_events:
             logger.info("Using settings fallback events after Start.gg request failure")
             return fallback_events
         return []
     except Exception as e:
         logger.error(f"Error parsing Start.gg response: {e}")
-        fallback_events = _events_from_settings_fallback()
+        fallback_events = await _events_from_settings_fallback()
         if fallback_events:
             logger.info("Using settings fallback events after parsing error")
             return fallback_events
         return []
 
 
-def check_participant_status(name: str) -> dict:
+async def check_participant_status(name: str) -> dict:
     """
     Fetch and evaluate a participant's registration status from current storage backend.
     Uses flexible match on name/tag fields.
@@ -535,12 +700,14 @@ def check_participant_status(name: str) -> dict:
         return status
 
     try:
-        active_slug = get_active_settings().get("active_event_slug", "")
+        active_slug = (await get_active_settings()).get("active_event_slug", "")
         record = None
         if active_slug:
-            record = get_checkin_by_tag(query, active_slug) or get_checkin_by_name(query, active_slug)
+            record = await get_checkin_by_tag(query, active_slug) or await get_checkin_by_name(
+                query, active_slug
+            )
         if not record:
-            record = get_checkin_by_name(query)
+            record = await get_checkin_by_name(query)
 
         if not record:
             return status
@@ -603,10 +770,10 @@ async def _integration_engine_health() -> bool:
         return False
 
 
-def _data_backend_health() -> bool:
+async def _data_backend_health() -> bool:
     """Check data backend status with lightweight call."""
     try:
-        storage_get_active_settings()
+        await storage_get_active_settings()
         return True
     except Exception:
         return False
@@ -640,7 +807,7 @@ async def health_check_deep():
     Full health check including external APIs.
     Use this manually for diagnostics – NOT for automated polling.
     """
-    data_ok = _data_backend_health()
+    data_ok = await _data_backend_health()
     integration_ok = await _integration_engine_health()
 
     return {
@@ -657,7 +824,7 @@ async def health_check_deep():
     }
 
 # === Views ===
-def get_participant_details(namn: str) -> dict:
+async def get_participant_details(namn: str) -> dict:
     """
     Fetch full participant details from current storage backend for status display.
     Returns tag, event_name, games, etc.
@@ -667,12 +834,14 @@ def get_participant_details(namn: str) -> dict:
         return {}
 
     try:
-        active_slug = get_active_settings().get("active_event_slug", "")
+        active_slug = (await get_active_settings()).get("active_event_slug", "")
         record = None
         if active_slug:
-            record = get_checkin_by_tag(query, active_slug) or get_checkin_by_name(query, active_slug)
+            record = await get_checkin_by_tag(query, active_slug) or await get_checkin_by_name(
+                query, active_slug
+            )
         if not record:
-            record = get_checkin_by_name(query)
+            record = await get_checkin_by_name(query)
 
         if record:
             f = (record.get("fields") or {}) if isinstance(record, dict) else {}
@@ -695,9 +864,9 @@ def get_participant_details(namn: str) -> dict:
 
 @app.get("/status/{name}", response_class=HTMLResponse, tags=["Checkin"])
 async def status_view(request: Request, name: str, kiosk: bool = False):
-    status = check_participant_status(name)
-    details = get_participant_details(name)
-    settings = get_active_settings()
+    status = await check_participant_status(name)
+    details = await get_participant_details(name)
+    settings = await get_active_settings()
 
     # Task 1.3: Use centralized READY calculation for template selection
     requirements = compute_requirements(settings)
@@ -739,9 +908,9 @@ async def api_participant_status(name: str):
     Used by status_pending.html to check if all requirements are met.
     Respects configurable requirements from settings.
     """
-    status = check_participant_status(name)
-    details = get_participant_details(name)
-    settings = get_active_settings()
+    status = await check_participant_status(name)
+    details = await get_participant_details(name)
+    settings = await get_active_settings()
 
     # Use centralized helpers (Task 1.1, 1.2)
     requirements = compute_requirements(settings)
@@ -765,7 +934,7 @@ async def api_participant_status(name: str):
 
 @app.get("/", response_class=HTMLResponse, tags=["Checkin"])
 async def root(request: Request):
-    settings = get_active_settings()
+    settings = await get_active_settings()
     requirements = compute_requirements(settings)
     return templates.TemplateResponse(
         request=request,
@@ -775,6 +944,7 @@ async def root(request: Request):
             "n8n_token": N8N_WEBHOOK_TOKEN or "",
             "kiosk": False,
             "collect_acquisition_source": settings.get("collect_acquisition_source") is True,
+            "checkin_async": CHECKIN_ORCHESTRATION_MODE == "async",
             # Pass all requirements so frontend can compute missing array correctly
             **requirements,
         },
@@ -787,7 +957,7 @@ async def kiosk_mode(request: Request):
     Kiosk mode for self-service check-in stations.
     After check-in, automatically redirects back to this page.
     """
-    settings = get_active_settings()
+    settings = await get_active_settings()
     requirements = compute_requirements(settings)
     return templates.TemplateResponse(
         request=request,
@@ -797,16 +967,17 @@ async def kiosk_mode(request: Request):
             "n8n_token": N8N_WEBHOOK_TOKEN or "",
             "kiosk": True,
             "collect_acquisition_source": settings.get("collect_acquisition_source") is True,
+            "checkin_async": CHECKIN_ORCHESTRATION_MODE == "async",
             **requirements,
         },
     )
 
 @app.get("/register", response_class=HTMLResponse, tags=["Checkin"])
 async def register_form(request: Request):
-    settings = get_active_settings()
+    settings = await get_active_settings()
     requirements = compute_requirements(settings)
     tournament_slug = settings.get("active_event_slug", "")
-    games = get_tournament_events(tournament_slug)
+    games = await get_tournament_events(tournament_slug)
     return templates.TemplateResponse(
         request=request,
         name="register.html",
@@ -826,10 +997,10 @@ async def register_form(request: Request):
 @app.get("/register.html", response_class=HTMLResponse, tags=["Checkin"])
 async def register_form_alias(request: Request):
     """Alias to support legacy links to /register.html."""
-    settings = get_active_settings()
+    settings = await get_active_settings()
     requirements = compute_requirements(settings)
     tournament_slug = settings.get("active_event_slug", "")
-    games = get_tournament_events(tournament_slug)
+    games = await get_tournament_events(tournament_slug)
     return templates.TemplateResponse(
         request=request,
         name="register.html",
@@ -848,7 +1019,7 @@ async def register_form_alias(request: Request):
 
 @app.get("/players", tags=["Dashboard"])
 async def get_players():
-    return storage_get_players()
+    return await storage_get_players()
 
 
 @app.patch("/players/{record_id}/payment", tags=["Dashboard"])
@@ -865,7 +1036,7 @@ async def update_payment_status(record_id: str, request: Request):
         raise HTTPException(status_code=400, detail="Invalid JSON body")
 
     # Update payment using shared storage backend
-    result = update_checkin(record_id, {"payment_valid": payment_valid})
+    result = await update_checkin(record_id, {"payment_valid": payment_valid})
 
     if not result:
         raise HTTPException(status_code=500, detail="Storage update failed")
@@ -881,7 +1052,55 @@ async def update_payment_status(record_id: str, request: Request):
 
 @app.get("/event-history", tags=["Dashboard"])
 async def get_event_history():
-    return storage_get_event_history()
+    return await storage_get_event_history()
+
+
+def _n8n_auth_headers() -> dict:
+    """JSON headers for backend -> n8n webhook calls (Basic Auth when configured)."""
+    headers = {"Content-Type": "application/json"}
+    if N8N_BASIC_AUTH_USER and N8N_BASIC_AUTH_PASSWORD:
+        import base64
+        token = base64.b64encode(
+            f"{N8N_BASIC_AUTH_USER}:{N8N_BASIC_AUTH_PASSWORD}".encode()
+        ).decode()
+        headers["authorization"] = f"Basic {token}"
+    return headers
+
+
+def _roster_enabled() -> bool:
+    """Roster prefetch needs a Start.gg token and the Postgres roster tables."""
+    return STARTGG_ROSTER_ENABLED and bool(STARTGG_API_KEY) and startgg_roster.available
+
+
+async def _startgg_check(tag: str, slug: str) -> dict:
+    """
+    Start.gg registration check for admin rechecks.
+
+    Answers from the roster index when the tag is in a fresh roster; otherwise
+    asks the configured engine. Returns the n8n "Start.gg Check" shape:
+    {isRegistered, events, eventCount, tag, tournament, email}.
+    Raises when the check itself failed (engine unreachable, HTTP error).
+    """
+    if _roster_enabled():
+        hit = startgg_roster.lookup(tag, slug)
+        if hit is not None:
+            return hit
+
+    if INTEGRATION_ENGINE == "native":
+        if _roster_enabled():
+            return await startgg_roster.check(tag, slug, raise_on_error=True)
+        return await integrations.startgg_check(integrations_client, tag, slug, raise_on_error=True)
+
+    await integrations.startgg_limiter.acquire()
+    n8n_resp = await httpx_client.post(
+        f"{N8N_INTERNAL}/webhook/startgg/check",
+        json={"tag": tag, "slug": slug},
+        headers=_n8n_auth_headers(),
+        timeout=httpx.Timeout(15.0, connect=5.0),
+    )
+    if n8n_resp.status_code >= 400:
+        raise RuntimeError(f"n8n returned {n8n_resp.status_code}: {n8n_resp.text[:200]}")
+    return n8n_resp.json()
 
 
 @app.post("/api/admin/recheck-startgg", tags=["Admin"])
@@ -890,8 +1109,8 @@ async def admin_recheck_startgg(request: Request):
     Re-run Start.gg validation for a single checked-in player.
 
     Called from dashboard after TO corrects a tag or wants to sync games.
-    Uses the n8n Start.gg Check sub-workflow, then applies the result
-    and recomputes status.
+    Uses the Start.gg check of the configured integration engine, then
+    applies the result and recomputes status.
 
     Body: { "record_id": "..." }
     """
@@ -909,7 +1128,7 @@ async def admin_recheck_startgg(request: Request):
     if not get_by_id:
         raise HTTPException(status_code=501, detail="Not available for current backend")
 
-    checkin = get_by_id(record_id)
+    checkin = await get_by_id(record_id)
     if not checkin:
         raise HTTPException(status_code=404, detail="Checkin not found")
 
@@ -927,37 +1146,15 @@ async def admin_recheck_startgg(request: Request):
     prev_startgg = bool(fields.get("startgg"))
     prev_games = fields.get("tournament_games_registered") or []
 
-    # 2. Call n8n Start.gg Check sub-workflow
-    n8n_url = f"{N8N_INTERNAL}/webhook/startgg/check"
-    n8n_headers = {"Content-Type": "application/json"}
-    if N8N_BASIC_AUTH_USER and N8N_BASIC_AUTH_PASSWORD:
-        import base64
-        b64 = base64.b64encode(
-            f"{N8N_BASIC_AUTH_USER}:{N8N_BASIC_AUTH_PASSWORD}".encode()
-        ).decode()
-        n8n_headers["authorization"] = f"Basic {b64}"
-
+    # 2. Start.gg check (n8n sub-workflow or native engine)
     try:
-        n8n_resp = await httpx_client.post(
-            n8n_url,
-            json={"tag": tag, "slug": slug},
-            headers=n8n_headers,
-            timeout=httpx.Timeout(15.0, connect=5.0),
-        )
+        sgg_data = await _startgg_check(tag, slug)
     except Exception as e:
-        raise HTTPException(status_code=502, detail=f"n8n Start.gg check failed: {e}")
-
-    if n8n_resp.status_code >= 400:
-        raise HTTPException(
-            status_code=502,
-            detail=f"n8n returned {n8n_resp.status_code}: {n8n_resp.text[:200]}",
-        )
+        raise HTTPException(status_code=502, detail=f"Start.gg check failed: {e}")
 
-    n8n_data = n8n_resp.json()
-    # n8n Start.gg Check returns: {isRegistered, events, eventCount, tag, tournament, email}
-    is_registered = bool(n8n_data.get("isRegistered", False))
-    events = n8n_data.get("events") or []
-    startgg_email = n8n_data.get("email") or None
+    is_registered = bool(sgg_data.get("isRegistered", False))
+    events = sgg_data.get("events") or []
+    startgg_email = sgg_data.get("email") or None
 
     # 3. Apply result via existing integration mechanism
     apply_fn = getattr(storage_api, "apply_integration_result", None)
@@ -965,7 +1162,7 @@ async def admin_recheck_startgg(request: Request):
         result_data = {"registered": is_registered, "events": events}
         if startgg_email:
             result_data["email"] = startgg_email
-        apply_fn(
+        await apply_fn(
             checkin_id=record_id,
             source="startgg",
             ok=is_registered,
@@ -973,10 +1170,10 @@ async def admin_recheck_startgg(request: Request):
         )
 
     # 4. Recompute status
-    settings = get_active_settings()
+    settings = await get_active_settings()
     requirements = compute_requirements(settings)
 
-    updated_checkin = get_by_id(record_id)
+    updated_checkin = await get_by_id(record_id)
     uf = (updated_checkin or {}).get("fields", {})
 
     status_dict = {
@@ -986,13 +1183,13 @@ async def admin_recheck_startgg(request: Request):
     }
     ready, missing = compute_ready_and_missing(status_dict, requirements)
     final_status = "Ready" if ready else "Pending"
-    update_checkin(record_id, {"status": final_status})
+    await update_checkin(record_id, {"status": final_status})
 
     # 5. Update payment_expected based on synced games
     per_game = settings.get("swish_expected_per_game") or 0
     new_games = uf.get("tournament_games_registered") or []
     if per_game and isinstance(new_games, list):
-        update_checkin(record_id, {"payment_expected": len(new_games) * per_game})
+        await update_checkin(record_id, {"payment_expected": len(new_games) * per_game})
 
     # 6. Broadcast SSE
     await sse_manager.broadcast("update", {
@@ -1017,123 +1214,201 @@ async def admin_recheck_startgg(request: Request):
     }
 
 
-@app.post("/api/admin/bulk-recheck-startgg", tags=["Admin"])
-async def admin_bulk_recheck_startgg():
-    """
-    Re-run Start.gg validation for ALL players in active event.
-
-    Loops through each player with a tag, calls n8n Start.gg Check,
-    applies result (email, events, startgg flag), and recomputes status.
-    Includes a small delay between calls to respect Start.gg rate limits.
-    """
-    get_checkins = getattr(storage_api, "get_checkins", None)
-    get_by_id = getattr(storage_api, "get_checkin_by_record_id", None)
-    apply_fn = getattr(storage_api, "apply_integration_result", None)
-    if not all([get_checkins, get_by_id, apply_fn]):
-        raise HTTPException(status_code=501, detail="Not available for current backend")
+# --- Bulk Start.gg recheck (background job) ---
+# Checks run concurrently (STARTGG_BULK_CONCURRENCY) under the shared Start.gg
+# token bucket; roster hits cost no Start.gg request. Progress is stored in
+# admin_jobs (any worker can report/cancel) and pushed as
+# `bulk_recheck_progress` SSE updates; results are written in one transaction.
+BULK_RECHECK_JOB_KIND = "bulk_recheck_startgg"
+_bulk_recheck_cancel: Dict[str, asyncio.Event] = {}
+_bulk_recheck_tasks: Set[asyncio.Task] = set()
 
-    settings = get_active_settings()
-    active_slug = settings.get("active_event_slug") or ""
-    if not active_slug:
-        raise HTTPException(status_code=400, detail="No active event configured")
 
-    checkins = get_checkins(slug=active_slug)
-    requirements = compute_requirements(settings)
-    per_game = settings.get("swish_expected_per_game") or 0
+def _admin_job_payload(job: dict) -> dict:
+    """Public view of an admin_jobs row: {job_id, state, ...progress, ...result}."""
+    progress = job.get("progress") if isinstance(job.get("progress"), dict) else {}
+    result = job.get("result") if isinstance(job.get("result"), dict) else {}
+    return {
+        **progress,
+        **result,
+        "job_id": job.get("job_id"),
+        "state": job.get("state"),
+        "event_slug": job.get("event_slug"),
+        "cancel_requested": bool(job.get("cancel_requested")),
+    }
 
-    n8n_url = f"{N8N_INTERNAL}/webhook/startgg/check"
-    n8n_headers = {"Content-Type": "application/json"}
-    if N8N_BASIC_AUTH_USER and N8N_BASIC_AUTH_PASSWORD:
-        import base64
-        b64 = base64.b64encode(
-            f"{N8N_BASIC_AUTH_USER}:{N8N_BASIC_AUTH_PASSWORD}".encode()
-        ).decode()
-        n8n_headers["authorization"] = f"Basic {b64}"
 
-    total = 0
-    checked = 0
-    emails_found = 0
+async def _run_bulk_recheck(job_id: str, slug: str, targets: list, requirements: dict, per_game: float):
+    """Background job: concurrent Start.gg checks -> one batched write -> final SSE."""
+    cancel = _bulk_recheck_cancel.setdefault(job_id, asyncio.Event())
+    slots = asyncio.Semaphore(STARTGG_BULK_CONCURRENCY)
+    results = []
     errors = []
+    progress = {"total": len(targets), "checked": 0, "emails_found": 0, "error_count": 0}
+    last_push = 0.0
+
+    async def push(force: bool = False):
+        nonlocal last_push
+        now = time.monotonic()
+        if not force and now - last_push < 0.5:
+            return
+        last_push = now
+        try:
+            if await storage_api.update_admin_job(job_id, {**progress, "errors": errors[-20:]}):
+                cancel.set()
+        except Exception as e:
+            logger.warning(f"Could not store bulk recheck progress for {job_id}: {e}")
+        await sse_manager.broadcast("update", {
+            "type": "bulk_recheck_progress",
+            "job_id": job_id,
+            "state": "cancelling" if cancel.is_set() else "running",
+            **progress,
+            "errors": errors[-5:],
+            "timestamp": time.time(),
+        })
 
-    for ci in checkins:
-        record_id = ci.get("record_id")
+    async def check_one(ci: dict):
         tag = (ci.get("tag") or "").strip()
-        slug = (ci.get("event_slug") or "").strip()
-        player_name = ci.get("name") or tag or "Unknown"
+        async with slots:
+            if cancel.is_set():
+                return
+            try:
+                sgg_data = await _startgg_check(tag, slug)
+            except Exception as e:
+                errors.append(f"{tag}: {str(e)[:100]}")
+                progress["error_count"] = len(errors)
+            else:
+                startgg_email = sgg_data.get("email") or None
+                results.append({
+                    "record_id": ci["record_id"],
+                    "registered": bool(sgg_data.get("isRegistered", False)),
+                    "events": sgg_data.get("events") or [],
+                    "email": startgg_email,
+                })
+                progress["checked"] += 1
+                if startgg_email:
+                    progress["emails_found"] += 1
+        await push()
+
+    state = "done"
+    try:
+        await push(force=True)
+        await asyncio.gather(*(check_one(ci) for ci in targets))
+        updated = await storage_api.apply_startgg_results(results, requirements, per_game)
+        if cancel.is_set():
+            state = "cancelled"
+        result = {**progress, "updated": updated, "errors": errors}
+    except Exception as e:
+        logger.exception(f"Bulk recheck {job_id} failed: {e}")
+        state = "failed"
+        result = {**progress, "errors": errors, "error": str(e)}
+    finally:
+        _bulk_recheck_cancel.pop(job_id, None)
 
-        if not tag or not slug or not record_id:
-            continue
+    try:
+        await storage_api.finish_admin_job(job_id, state, result)
+    except Exception as e:
+        logger.warning(f"Could not store bulk recheck result for {job_id}: {e}")
 
-        total += 1
+    await sse_manager.broadcast("update", {
+        "type": "bulk_recheck_startgg",
+        "job_id": job_id,
+        "state": state,
+        "total": result["total"],
+        "checked": result["checked"],
+        "emails_found": result["emails_found"],
+        "error_count": result["error_count"],
+        "timestamp": time.time(),
+    })
 
-        try:
-            n8n_resp = await httpx_client.post(
-                n8n_url,
-                json={"tag": tag, "slug": slug},
-                headers=n8n_headers,
-                timeout=httpx.Timeout(15.0, connect=5.0),
-            )
 
-            if n8n_resp.status_code >= 400:
-                errors.append(f"{tag}: n8n {n8n_resp.status_code}")
-                continue
+def _bulk_recheck_available() -> bool:
+    return all(
+        hasattr(storage_api, fn)
+        for fn in ("get_checkins", "apply_startgg_results", "start_admin_job", "update_admin_job",
+                   "finish_admin_job", "cancel_admin_job", "get_admin_job")
+    )
 
-            n8n_data = n8n_resp.json()
-            is_registered = bool(n8n_data.get("isRegistered", False))
-            events = n8n_data.get("events") or []
-            startgg_email = n8n_data.get("email") or None
-
-            result_data = {"registered": is_registered, "events": events}
-            if startgg_email:
-                result_data["email"] = startgg_email
-                emails_found += 1
-
-            apply_fn(
-                checkin_id=record_id,
-                source="startgg",
-                ok=is_registered,
-                data=result_data,
-            )
 
-            # Recompute status
-            updated = get_by_id(record_id)
-            uf = (updated or {}).get("fields", {})
-            status_dict = {
-                "member": bool(uf.get("member")),
-                "payment": bool(uf.get("payment_valid")),
-                "startgg": bool(uf.get("startgg")),
-            }
-            ready, _ = compute_ready_and_missing(status_dict, requirements)
-            final_status = "Ready" if ready else "Pending"
-            update_checkin(record_id, {"status": final_status})
+@app.post("/api/admin/bulk-recheck-startgg", tags=["Admin"])
+async def admin_bulk_recheck_startgg():
+    """
+    Start a Start.gg re-check for ALL players in the active event.
 
-            if per_game and isinstance(events, list):
-                update_checkin(record_id, {"payment_expected": len(events) * per_game})
+    Returns 202 with job_id right away; the job checks every player with a tag
+    concurrently under the Start.gg rate budget, then applies all results
+    (email, events, startgg flag, status, payment_expected) in one transaction.
+    Progress: `bulk_recheck_progress` SSE updates and
+    GET /api/admin/bulk-recheck-startgg. Only one job runs at a time (409).
+    """
+    if not _bulk_recheck_available():
+        raise HTTPException(status_code=501, detail="Not available for current backend")
 
-            checked += 1
+    settings = await get_active_settings()
+    active_slug = settings.get("active_event_slug") or ""
+    if not active_slug:
+        raise HTTPException(status_code=400, detail="No active event configured")
 
-        except Exception as e:
-            errors.append(f"{tag}: {str(e)[:100]}")
+    checkins = await storage_api.get_checkins(slug=active_slug)
+    targets = [
+        ci for ci in checkins
+        if ci.get("record_id") and (ci.get("tag") or "").strip() and (ci.get("event_slug") or "").strip()
+    ]
 
-        # Small delay to respect Start.gg rate limits
-        await asyncio.sleep(0.3)
+    job_id = str(uuid.uuid4())
+    started = await storage_api.start_admin_job(
+        BULK_RECHECK_JOB_KIND, job_id, active_slug,
+        {"total": len(targets), "checked": 0, "emails_found": 0, "error_count": 0},
+    )
+    if not started:
+        running = await storage_api.get_admin_job(kind=BULK_RECHECK_JOB_KIND)
+        return JSONResponse(
+            status_code=409,
+            content={"success": False, "detail": "A bulk re-check is already running",
+                     **_admin_job_payload(running or {})},
+        )
 
-    # Broadcast single SSE update when done
-    await sse_manager.broadcast("update", {
-        "type": "bulk_recheck_startgg",
-        "total": total,
-        "checked": checked,
-        "emails_found": emails_found,
-        "timestamp": time.time(),
-    })
+    _bulk_recheck_cancel[job_id] = asyncio.Event()
+    task = asyncio.create_task(
+        _run_bulk_recheck(
+            job_id, active_slug, targets,
+            compute_requirements(settings), settings.get("swish_expected_per_game") or 0,
+        )
+    )
+    _bulk_recheck_tasks.add(task)
+    task.add_done_callback(_bulk_recheck_tasks.discard)
 
-    return {
-        "success": True,
-        "total": total,
-        "checked": checked,
-        "emails_found": emails_found,
-        "errors": errors,
-    }
+    return JSONResponse(
+        status_code=202,
+        content={"success": True, "job_id": job_id, "state": "running", "total": len(targets)},
+    )
+
+
+@app.get("/api/admin/bulk-recheck-startgg", tags=["Admin"])
+async def admin_bulk_recheck_status(job_id: Optional[str] = None):
+    """Progress/result of a bulk re-check job (latest one if job_id is omitted)."""
+    if not _bulk_recheck_available():
+        raise HTTPException(status_code=501, detail="Not available for current backend")
+    job = await storage_api.get_admin_job(job_id=job_id, kind=BULK_RECHECK_JOB_KIND)
+    if not job or job.get("kind") != BULK_RECHECK_JOB_KIND:
+        raise HTTPException(status_code=404, detail="No bulk re-check job found")
+    return _admin_job_payload(job)
+
+
+@app.post("/api/admin/bulk-recheck-startgg/{job_id}/cancel", tags=["Admin"])
+async def admin_bulk_recheck_cancel(job_id: str):
+    """
+    Cancel a running bulk re-check. Checks already in flight finish; results
+    gathered so far are still written.
+    """
+    if not _bulk_recheck_available():
+        raise HTTPException(status_code=501, detail="Not available for current backend")
+    if not await storage_api.cancel_admin_job(job_id):
+        raise HTTPException(status_code=404, detail="No running bulk re-check with that job_id")
+    # Owning worker stops right away; others pick the flag up on their next progress write
+    if job_id in _bulk_recheck_cancel:
+        _bulk_recheck_cancel[job_id].set()
+    return JSONResponse(status_code=202, content={"success": True, "job_id": job_id, "state": "cancelling"})
 
 
 @app.post("/api/startgg/registered-count", tags=["Integrations"])
@@ -1162,7 +1437,7 @@ async def update_startgg_registered_count(request: Request):
         raise HTTPException(status_code=400, detail="startgg_registered_count must be an integer")
 
     # Update events_json.tournament_entrants in active settings
-    settings = storage_get_active_settings() or {}
+    settings = await storage_get_active_settings() or {}
     events_json = settings.get("events_json")
 
     if isinstance(events_json, dict):
@@ -1177,7 +1452,7 @@ async def update_startgg_registered_count(request: Request):
     if not get_settings_fn:
         raise HTTPException(status_code=501, detail="Not available for current backend")
 
-    settings_data = get_settings_fn()
+    settings_data = await get_settings_fn()
     if not settings_data:
         raise HTTPException(status_code=404, detail="No active settings found")
 
@@ -1185,7 +1460,7 @@ async def update_startgg_registered_count(request: Request):
     if not update_fn:
         raise HTTPException(status_code=501, detail="Not available for current backend")
 
-    result = update_fn(settings_data["record_id"], {"events_json": events_json})
+    result = await update_fn(settings_data["record_id"], {"events_json": events_json})
     if not result:
         raise HTTPException(status_code=500, detail="Failed to update settings")
 
@@ -1210,7 +1485,7 @@ async def archive_event_endpoint(request: Request):
         raise HTTPException(status_code=400, detail="event_slug is required")
 
     try:
-        result = archive_fn(
+        result = await archive_fn(
             event_slug,
             event_date=body.get("event_date"),
             event_display_name=body.get("event_display_name") or "",
@@ -1245,7 +1520,7 @@ async def reopen_event_endpoint(request: Request):
         raise HTTPException(status_code=400, detail="event_slug is required")
 
     try:
-        result = reopen_fn(
+        result = await reopen_fn(
             event_slug,
             restore_active=bool(body.get("restore_active", True)),
             user=body.get("user") or None,
@@ -1279,7 +1554,7 @@ async def delete_archived_event_endpoint(request: Request):
         raise HTTPException(status_code=400, detail="reason is required")
 
     try:
-        result = delete_fn(
+        result = await delete_fn(
             event_slug,
             reason=reason,
             user=body.get("user") or None,
@@ -1307,7 +1582,7 @@ async def begin_checkin_endpoint(request: Request):
 
     event_slug = (body.get("event_slug") or "").strip()
     if not event_slug:
-        event_slug = get_active_settings().get("active_event_slug", "")
+        event_slug = (await get_active_settings()).get("active_event_slug", "")
     if not event_slug:
         raise HTTPException(status_code=400, detail="event_slug is required")
 
@@ -1316,7 +1591,7 @@ async def begin_checkin_endpoint(request: Request):
         payload["added_via"] = "api"
 
     try:
-        result = begin_fn(event_slug, payload)
+        result = await begin_fn(event_slug, payload)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -1349,7 +1624,7 @@ async def integration_result_endpoint(request: Request):
     fetched_at = body.get("fetched_at")
 
     try:
-        result = apply_fn(
+        result = await apply_fn(
             checkin_id=checkin_id,
             source=source,
             ok=ok,
@@ -1376,7 +1651,7 @@ async def checkin_member_status_endpoint(checkin_id: str, request: Request):
 
     member = bool(body.get("member", False))
 
-    result = update_checkin(checkin_id, {"member": member})
+    result = await update_checkin(checkin_id, {"member": member})
     if not result:
         raise HTTPException(status_code=500, detail="Storage update failed")
 
@@ -1386,6 +1661,172 @@ async def checkin_member_status_endpoint(checkin_id: str, request: Request):
 # === Orchestration endpoints (n8n migration) ===
 
 
+async def _run_checkin_integrations(checkin_id: str, tag: str, slug: str, personnummer: str, name: str):
+    """
+    Run external checks (Start.gg + eBas) for a check-in.
+
+    INTEGRATION_ENGINE=native runs both checks in-process and applies results
+    via apply_integration_result; n8n forwards to the v5 webhook, which calls
+    /api/integration/result during execution. Any other engine skips checks.
+    Failures are logged and swallowed - the check-in already exists,
+    integrations just didn't run.
+    """
+    if INTEGRATION_ENGINE == "native":
+        apply_fn = getattr(storage_api, "apply_integration_result", None)
+        if not apply_fn:
+            logger.warning("Native integrations need apply_integration_result (postgres backend)")
+            return
+        try:
+            await integrations.run_checkin_integrations(
+                integrations_client,
+                apply_fn,
+                checkin_id,
+                tag,
+                slug,
+                personnummer,
+                startgg_check_fn=startgg_roster.check if _roster_enabled() else None,
+            )
+        except Exception as e:
+            logger.warning(f"native integrations failed (graceful): {e}")
+        return
+
+    if INTEGRATION_ENGINE != "n8n":
+        return
+
+    n8n_payload = {
+        "checkin_id": checkin_id,
+        "tag": tag,
+        "slug": slug,
+        "personnummer": personnummer,
+        "name": name,
+    }
+
+    n8n_url = f"{N8N_INTERNAL}/webhook/checkin/validate-v5"
+
+    try:
+        n8n_resp = await httpx_client.post(
+            n8n_url,
+            json=n8n_payload,
+            headers=_n8n_auth_headers(),
+            timeout=httpx.Timeout(EBAS_REGISTER_TIMEOUT_SECONDS, connect=5.0),
+        )
+
+        if n8n_resp.status_code >= 400:
+            logger.warning(f"n8n v5 returned {n8n_resp.status_code}: {n8n_resp.text}")
+    except Exception as e:
+        logger.warning(f"n8n v5 call failed (graceful): {e}")
+
+
+async def _store_final_status(checkin_id: str, tag: str, slug: str, name: str, requirements: dict) -> dict:
+    """
+    Re-read the check-in after integrations, compute and store the final
+    Ready/Pending status and return the checkin.html result.
+    """
+    get_by_id = getattr(storage_api, "get_checkin_by_record_id", None)
+    checkin_record = None
+    if get_by_id:
+        checkin_record = await get_by_id(checkin_id)
+
+    if not checkin_record:
+        # Fallback to tag+slug lookup
+        checkin_record = await get_checkin_by_tag(tag.lower(), slug) if tag else None
+
+    fields = (checkin_record or {}).get("fields", {})
+
+    # Compute final status based on requirements
+    member_ok = bool(fields.get("member"))
+    startgg_ok = bool(fields.get("startgg"))
+    payment_ok = bool(fields.get("payment_valid"))
+
+    status_dict = {
+        "member": member_ok,
+        "payment": payment_ok,
+        "startgg": startgg_ok,
+    }
+    ready, missing = compute_ready_and_missing(status_dict, requirements)
+    final_status = "Ready" if ready else "Pending"
+
+    # Update status in DB
+    record_id = (checkin_record or {}).get("record_id", checkin_id)
+    await update_checkin(record_id, {"status": final_status})
+
+    # Response compatible with checkin.html
+    return {
+        "ready": ready,
+        "slug": slug,
+        "missing": missing,
+        "member": member_ok,
+        "payment_valid": payment_ok,
+        "startgg": startgg_ok,
+        "status": final_status,
+        "name": name,
+        "tag": tag,
+        "checkin_id": checkin_id,
+    }
+
+
+async def _broadcast_new_checkin(result: dict):
+    await sse_manager.broadcast("checkin", {
+        "type": "new_checkin",
+        "name": result["name"],
+        "tag": result["tag"],
+        "status": result["status"],
+        "timestamp": time.time(),
+    })
+
+
+async def _finalize_checkin(checkin_id: str, tag: str, slug: str, name: str, requirements: dict) -> dict:
+    """Store the final status (_store_final_status), broadcast it and return the result."""
+    result = await _store_final_status(checkin_id, tag, slug, name, requirements)
+    await _broadcast_new_checkin(result)
+    return result
+
+
+# --- Async orchestration (202 + push result) ---
+# Integrations run in a bounded background task pool; the result is stored in
+# checkin_jobs (poll fallback, any worker) and pushed as a `checkin_result` SSE
+# event (GET /api/checkin/{checkin_id}/events).
+_checkin_job_slots = asyncio.Semaphore(CHECKIN_JOB_CONCURRENCY)
+_checkin_job_tasks: Set[asyncio.Task] = set()
+
+
+def _async_checkin_available() -> bool:
+    return all(
+        hasattr(storage_api, fn)
+        for fn in ("start_checkin_job", "finish_checkin_job", "settle_checkin_job", "get_checkin_job")
+    )
+
+
+def _wants_async_checkin(request: Request) -> bool:
+    """Async mode via ?mode=async or `Prefer: respond-async`, else CHECKIN_ORCHESTRATION_MODE."""
+    mode = (request.query_params.get("mode") or "").lower().strip()
+    if mode in ("async", "sync"):
+        return mode == "async"
+    if "respond-async" in (request.headers.get("prefer") or "").lower():
+        return True
+    return CHECKIN_ORCHESTRATION_MODE == "async"
+
+
+async def _run_checkin_job(checkin_id: str, tag: str, slug: str, personnummer: str, name: str, requirements: dict):
+    """Background job: integrations -> final status -> store + push result."""
+    async with _checkin_job_slots:
+        state = "done"
+        try:
+            await _run_checkin_integrations(checkin_id, tag, slug, personnummer, name)
+            result = await _finalize_checkin(checkin_id, tag, slug, name, requirements)
+        except Exception as e:
+            logger.exception(f"Async check-in job failed for {checkin_id}: {e}")
+            state = "failed"
+            result = {"checkin_id": checkin_id, "slug": slug, "name": name, "tag": tag, "error": str(e)}
+
+    try:
+        await storage_api.finish_checkin_job(checkin_id, state, result)
+    except Exception as e:
+        logger.warning(f"Could not store check-in job result for {checkin_id}: {e}")
+
+    await sse_manager.broadcast("checkin_result", {"checkin_id": checkin_id, "state": state, **result})
+
+
 @app.post("/api/checkin/orchestrate", tags=["Checkin"])
 async def orchestrate_checkin(request: Request):
     """
@@ -1395,13 +1836,21 @@ async def orchestrate_checkin(request: Request):
     Flow:
       1. Validate & sanitize form data
       2. begin_checkin() in Postgres (dedupe by tag+slug)
-      3. Forward to n8n v5 webhook (Start.gg + eBas checks)
-      4. n8n calls /api/integration/result during execution
+      3. Start.gg + eBas checks: n8n v5 webhook, or in-process with
+         INTEGRATION_ENGINE=native (see integrations.py)
+      4. Results applied via apply_integration_result (n8n: through
+         /api/integration/result)
       5. Re-read updated checkin, compute final status
       6. Update status, broadcast SSE, return result
 
-    Returns response compatible with checkin.html:
+    Sync mode (default) returns response compatible with checkin.html:
       { ready, slug, missing[], member, payment_valid, startgg }
+
+    Async mode (?mode=async, `Prefer: respond-async` or
+    CHECKIN_ORCHESTRATION_MODE=async) returns 202 with checkin_id right after
+    step 2; steps 3-6 run in the background. The same result is then available
+    from GET /api/checkin/{checkin_id}/result and pushed on
+    GET /api/checkin/{checkin_id}/events.
     """
     begin_fn = getattr(storage_api, "begin_checkin", None)
     if not begin_fn:
@@ -1421,13 +1870,12 @@ async def orchestrate_checkin(request: Request):
     sanitized = sanitize_checkin_payload(body)
 
     # Get active settings
-    settings = get_active_settings()
+    settings = await get_active_settings()
     slug = settings.get("active_event_slug", "")
     if not slug:
         raise HTTPException(status_code=400, detail="No active event configured")
 
     requirements = compute_requirements(settings)
-    per_game = settings.get("swish_expected_per_game", 25)
 
     # Extract fields
     tag = (sanitized.get("tag") or "").strip()
@@ -1439,7 +1887,7 @@ async def orchestrate_checkin(request: Request):
 
     # 1. begin_checkin (dedupe by tag+slug)
     try:
-        checkin_result = begin_fn(slug, {
+        checkin_result = await begin_fn(slug, {
             "name": name,
             "tag": tag,
             "email": email,
@@ -1455,93 +1903,124 @@ async def orchestrate_checkin(request: Request):
     checkin_id = checkin_result["checkin_id"]
     logger.info(f"Orchestrate: checkin_id={checkin_id}, tag={tag}, slug={slug}")
 
-    # 2. Forward to n8n v5 webhook (synchronous - n8n calls /api/integration/result internally)
-    n8n_payload = {
-        "checkin_id": checkin_id,
-        "tag": tag,
-        "slug": slug,
-        "personnummer": personnummer,
-        "name": name,
-    }
+    if _async_checkin_available() and _wants_async_checkin(request):
+        await storage_api.start_checkin_job(checkin_id)
+        task = asyncio.create_task(
+            _run_checkin_job(checkin_id, tag, slug, personnummer, name, requirements)
+        )
+        _checkin_job_tasks.add(task)
+        task.add_done_callback(_checkin_job_tasks.discard)
+        return JSONResponse(
+            status_code=202,
+            content={
+                "accepted": True,
+                "checkin_id": checkin_id,
+                "slug": slug,
+                "name": name,
+                "tag": tag,
+                "status": "Pending",
+                "result_url": f"/api/checkin/{checkin_id}/result",
+                "events_url": f"/api/checkin/{checkin_id}/events",
+            },
+        )
 
-    n8n_url = f"{N8N_INTERNAL}/webhook/checkin/validate-v5"
-    n8n_response_data = {}
+    # 2. Integrations (synchronous - results are applied before we re-read)
+    await _run_checkin_integrations(checkin_id, tag, slug, personnummer, name)
 
-    try:
-        n8n_headers = {"Content-Type": "application/json"}
-        if N8N_BASIC_AUTH_USER and N8N_BASIC_AUTH_PASSWORD:
-            import base64
-            token = base64.b64encode(
-                f"{N8N_BASIC_AUTH_USER}:{N8N_BASIC_AUTH_PASSWORD}".encode()
-            ).decode()
-            n8n_headers["authorization"] = f"Basic {token}"
+    # 3. Final status, broadcast, checkin.html response
+    return await _finalize_checkin(checkin_id, tag, slug, name, requirements)
 
-        n8n_resp = await httpx_client.post(
-            n8n_url,
-            json=n8n_payload,
-            headers=n8n_headers,
-            timeout=httpx.Timeout(EBAS_REGISTER_TIMEOUT_SECONDS, connect=5.0),
-        )
 
-        if n8n_resp.status_code < 400:
-            n8n_response_data = n8n_resp.json()
-        else:
-            logger.warning(f"n8n v5 returned {n8n_resp.status_code}: {n8n_resp.text}")
-    except Exception as e:
-        logger.warning(f"n8n v5 call failed (graceful): {e}")
-        # Continue - checkin is created, integrations just didn't run
+def _checkin_job_payload(job: dict) -> dict:
+    """Public view of a checkin_jobs row: {state, ...result}."""
+    result = job.get("result") if isinstance(job.get("result"), dict) else {}
+    return {"checkin_id": job.get("checkin_id"), "state": job.get("state"), **result}
 
-    # 3. Re-read the updated checkin record
-    get_by_id = getattr(storage_api, "get_checkin_by_record_id", None)
-    checkin_record = None
-    if get_by_id:
-        checkin_record = get_by_id(checkin_id)
 
-    if not checkin_record:
-        # Fallback to tag+slug lookup
-        checkin_record = get_checkin_by_tag(tag.lower(), slug) if tag else None
+async def _load_checkin_job(checkin_id: str) -> dict:
+    """Load a checkin_jobs row; settles jobs orphaned by a worker restart."""
+    if not _async_checkin_available():
+        raise HTTPException(status_code=501, detail="Async check-in is not available for current backend")
+    job = await storage_api.get_checkin_job(checkin_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Unknown checkin_id")
 
-    fields = (checkin_record or {}).get("fields", {})
+    created_at = job.get("created_at")
+    stale_after = timedelta(seconds=EBAS_REGISTER_TIMEOUT_SECONDS + 60)
+    if (
+        job.get("state") == "running"
+        and created_at
+        and datetime.now(timezone.utc) - created_at > stale_after
+    ):
+        # The worker running it died - settle from whatever the integrations wrote
+        get_by_id = getattr(storage_api, "get_checkin_by_record_id", None)
+        record = await get_by_id(checkin_id) if get_by_id else None
+        fields = (record or {}).get("fields", {})
+        requirements = compute_requirements(await get_active_settings())
+        result = await _store_final_status(
+            checkin_id,
+            fields.get("tag") or "",
+            fields.get("event_slug") or "",
+            fields.get("name") or "",
+            requirements,
+        )
+        # Concurrent polls all get here; only the one that settles the row announces it
+        if await storage_api.settle_checkin_job(checkin_id, result):
+            await _broadcast_new_checkin(result)
+            job = {**job, "state": "done", "result": result}
+        else:
+            job = await storage_api.get_checkin_job(checkin_id) or job
+    return job
 
-    # 4. Compute final status based on requirements
-    member_ok = bool(fields.get("member"))
-    startgg_ok = bool(fields.get("startgg"))
-    payment_ok = bool(fields.get("payment_valid"))
 
-    status_dict = {
-        "member": member_ok,
-        "payment": payment_ok,
-        "startgg": startgg_ok,
-    }
-    ready, missing = compute_ready_and_missing(status_dict, requirements)
-    final_status = "Ready" if ready else "Pending"
+@app.get("/api/checkin/{checkin_id}/result", tags=["Checkin"])
+async def checkin_job_result(checkin_id: str):
+    """
+    Poll fallback for async check-in orchestration.
+    Returns {state: "running"} until the job is done, then the same payload as
+    sync /api/checkin/orchestrate plus state ("done" | "failed").
+    """
+    job = await _load_checkin_job(checkin_id)
+    return _checkin_job_payload(job)
 
-    # 5. Update status in DB
-    record_id = (checkin_record or {}).get("record_id", checkin_id)
-    update_checkin(record_id, {"status": final_status})
 
-    # 6. Broadcast SSE
-    await sse_manager.broadcast("checkin", {
-        "type": "new_checkin",
-        "name": name,
-        "tag": tag,
-        "status": final_status,
-        "timestamp": time.time(),
-    })
+@app.get("/api/checkin/{checkin_id}/events", tags=["Checkin"])
+async def checkin_job_events(checkin_id: str, request: Request):
+    """
+    SSE stream for one async check-in: emits a single `result` event when the
+    job finishes, then closes. The unguessable checkin_id acts as the token.
+    """
+    await _load_checkin_job(checkin_id)  # 404 for unknown ids
 
-    # 7. Return response compatible with checkin.html
-    return {
-        "ready": ready,
-        "slug": slug,
-        "missing": missing,
-        "member": member_ok,
-        "payment_valid": payment_ok,
-        "startgg": startgg_ok,
-        "status": final_status,
-        "name": name,
-        "tag": tag,
-        "checkin_id": checkin_id,
-    }
+    async def event_generator():
+        queue = await sse_manager.watch_checkin(checkin_id)
+        try:
+            # Re-check after subscribing so a result published in between isn't missed
+            job = await _load_checkin_job(checkin_id)
+            deadline = time.monotonic() + EBAS_REGISTER_TIMEOUT_SECONDS + 30
+            while job.get("state") == "running":
+                if await request.is_disconnected() or time.monotonic() > deadline:
+                    return
+                try:
+                    data = await asyncio.wait_for(queue.get(), timeout=15.0)
+                    job = {"checkin_id": checkin_id, "state": data.get("state"), "result": data}
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+            yield f"event: result\ndata: {json.dumps(_checkin_job_payload(job))}\n\n"
+        except asyncio.CancelledError:
+            pass
+        finally:
+            await sse_manager.unwatch_checkin(checkin_id, queue)
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",  # Disable nginx buffering
+        }
+    )
 
 
 @app.post("/api/ebas/register", tags=["Checkin"])
@@ -1577,7 +2056,7 @@ async def ebas_register(request: Request):
     # Find checkin_id by tag+slug (for n8n v2 callback)
     checkin_id = None
     if tag and slug:
-        checkin = get_checkin_by_tag(tag, slug)
+        checkin = await get_checkin_by_tag(tag, slug)
         if checkin:
             checkin_id = checkin.get("record_id")
 
@@ -1643,14 +2122,14 @@ async def update_player_games(request: Request):
         raise HTTPException(status_code=400, detail="games must be an array")
 
     # Find the player record by tag + slug using shared storage backend
-    checkin = get_checkin_by_tag(tag, slug)
+    checkin = await get_checkin_by_tag(tag, slug)
     if not checkin:
         raise HTTPException(status_code=404, detail="Player not found")
 
     record_id = checkin["record_id"]
 
     # Get settings to calculate payment_expected
-    settings = get_active_settings()
+    settings = await get_active_settings()
     per_game = settings.get("swish_expected_per_game", 25)
     payment_expected = len(games) * per_game
 
@@ -1659,7 +2138,7 @@ async def update_player_games(request: Request):
         "tournament_games_registered": games,
         "payment_expected": payment_expected,
     }
-    result = update_checkin(record_id, fields, typecast=True)
+    result = await update_checkin(record_id, fields, typecast=True)
 
     if not result:
         raise HTTPException(status_code=500, detail="Storage update failed")
@@ -1701,14 +2180,14 @@ async def update_player_member(request: Request):
         raise HTTPException(status_code=400, detail="tag and slug are required")
 
     # Find the player record by tag + slug using shared storage backend
-    checkin = get_checkin_by_tag(tag, slug)
+    checkin = await get_checkin_by_tag(tag, slug)
     if not checkin:
         raise HTTPException(status_code=404, detail="Player not found")
 
     record_id = checkin["record_id"]
 
     # Update the record with member status
-    result = update_checkin(record_id, {"member": member})
+    result = await update_checkin(record_id, {"member": member})
 
     if not result:
         raise HTTPException(status_code=500, detail="Storage update failed")
@@ -1791,9 +2270,7 @@ async def sse_stream(request: Request, token: str = None):
     async def event_generator():
         queue = await sse_manager.connect()
         try:
-            # Send initial connection confirmation
-            yield f"event: connected\ndata: {json.dumps({'status': 'connected'})}\n\n"
-
+            # Initial connection confirmation is already queued by connect()
             while True:
                 # Check if client disconnected
                 if await request.is_disconnected():
@@ -1864,7 +2341,49 @@ async def notify_update(request: Request):
     return {"success": True, "clients_notified": len(sse_manager.clients)}
 
 
-# === Shutdown ===
+# === Startup / Shutdown ===
+async def _active_event_slug() -> Optional[str]:
+    return (await get_active_settings()).get("active_event_slug") or None
+
+
+_audit_maintenance_task: Optional[asyncio.Task] = None
+
+
+async def _audit_maintenance_loop(maintain) -> None:
+    """Create upcoming audit_log partitions and apply retention, once per interval."""
+    while True:
+        try:
+            await maintain()
+        except Exception as e:
+            logger.warning(f"Audit log maintenance failed: {e}")
+        await asyncio.sleep(AUDIT_MAINTENANCE_INTERVAL_SECONDS)
+
+
+@app.on_event("startup")
+async def startup_event():
+    global _audit_maintenance_task
+    await sse_manager.start_relay()
+    if _roster_enabled():
+        startgg_roster.start(_active_event_slug)
+    maintain = getattr(storage_api, "maintain_audit_log", None)
+    if maintain and AUDIT_MAINTENANCE_INTERVAL_SECONDS > 0:
+        _audit_maintenance_task = asyncio.create_task(_audit_maintenance_loop(maintain))
+
+
 @app.on_event("shutdown")
 async def shutdown_event():
+    # Let in-flight async check-ins finish (they hold their own timeouts)
+    if _checkin_job_tasks:
+        await asyncio.wait(_checkin_job_tasks, timeout=EBAS_REGISTER_TIMEOUT_SECONDS)
+    # Bulk rechecks stop early but still write what they have
+    for cancel in _bulk_recheck_cancel.values():
+        cancel.set()
+    if _bulk_recheck_tasks:
+        await asyncio.wait(_bulk_recheck_tasks, timeout=30)
+    await sse_manager.stop_relay()
+    await startgg_roster.stop()
+    if _audit_maintenance_task is not None:
+        _audit_maintenance_task.cancel()
     await httpx_client.aclose()
+    await integrations_client.aclose()
+    await storage_api.close_pool()
@@ -0,0 +1,230 @@
+# startgg_roster.py
+"""
+Start.gg roster prefetch for the active tournament.
+
+Instead of asking Start.gg "is <tag> registered?" once per check-in / recheck,
+the backend pages through all participants of the active tournament and keeps
+them in the startgg_roster table plus a case-folded in-memory index per worker:
+
+    index[tag.casefold()] -> {participant_id, gamer_tag, email, user_name, events}
+
+Refresh (every STARTGG_ROSTER_REFRESH_SECONDS, one worker per interval via the
+startgg_roster_sync lease):
+  - probe numAttendees (one small request); unchanged and the last full sync
+    is younger than STARTGG_ROSTER_FULL_SYNC_SECONDS -> just mark it current
+  - otherwise page through the full roster and write only changed rows
+Other workers reload their index from the table when synced_at moves.
+
+Lookups are only trusted while the roster is fresh (3 refresh intervals).
+A miss (or a stale roster) falls back to the live single-tag check, and live
+hits are added to table + index so the next lookup is local.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, Optional
+
+import httpx
+import integrations
+
+logger = logging.getLogger(__name__)
+
+STARTGG_ROSTER_ENABLED = os.getenv("STARTGG_ROSTER_ENABLED", "true").lower() in ("true", "1", "yes")
+STARTGG_ROSTER_REFRESH_SECONDS = float(os.getenv("STARTGG_ROSTER_REFRESH_SECONDS", "120"))
+STARTGG_ROSTER_FULL_SYNC_SECONDS = float(os.getenv("STARTGG_ROSTER_FULL_SYNC_SECONDS", "1800"))
+STARTGG_ROSTER_PAGE_SIZE = int(os.getenv("STARTGG_ROSTER_PAGE_SIZE", "50"))
+
+
+def tag_key(tag: str) -> str:
+    """Index key for a gamer tag (trimmed + case-folded)."""
+    return (tag or "").strip().casefold()
+
+
+def _age_seconds(ts: Optional[datetime]) -> float:
+    if ts is None:
+        return float("inf")
+    return time.time() - ts.timestamp()
+
+
+class StartggRoster:
+    """
+    Per-worker roster index for one tournament (the active event).
+
+    `storage` is the async storage module; the roster needs its
+    claim/get/save/touch_startgg_roster* functions (Postgres backend).
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        storage,
+        refresh_seconds: float = STARTGG_ROSTER_REFRESH_SECONDS,
+        full_sync_seconds: float = STARTGG_ROSTER_FULL_SYNC_SECONDS,
+        page_size: int = STARTGG_ROSTER_PAGE_SIZE,
+    ):
+        self.client = client
+        self.storage = storage
+        self.refresh_seconds = refresh_seconds
+        self.full_sync_seconds = full_sync_seconds
+        self.page_size = page_size
+        self.slug: Optional[str] = None
+        self.synced_at: Optional[datetime] = None
+        self._index: Dict[str, dict] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def available(self) -> bool:
+        """True when the storage backend supports the roster."""
+        return all(
+            hasattr(self.storage, fn)
+            for fn in (
+                "claim_startgg_roster_sync",
+                "get_startgg_roster",
+                "get_startgg_roster_state",
+                "save_startgg_roster",
+                "touch_startgg_roster",
+            )
+        )
+
+    def is_fresh(self, slug: str) -> bool:
+        """True if the index holds a recently synced roster for slug."""
+        return (
+            bool(slug)
+            and slug == self.slug
+            and _age_seconds(self.synced_at) < 3 * self.refresh_seconds
+        )
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    # --- Lookups ---
+
+    def lookup(self, tag: str, slug: str) -> Optional[dict]:
+        """
+        O(1) local registration check. Returns the Start.gg Check shape
+        ({isRegistered: True, events, email, ...}) on a hit, None on a miss
+        or when the roster for slug is not fresh.
+        """
+        if not self.is_fresh(slug):
+            return None
+        entry = self._index.get(tag_key(tag))
+        if not entry:
+            return None
+        events = list(entry.get("events") or [])
+        return {
+            "isRegistered": True,
+            "participant_id": entry.get("participant_id"),
+            "tag": entry.get("gamer_tag"),
+            "name": entry.get("user_name"),
+            "email": entry.get("email"),
+            "events": events,
+            "eventCount": len(events),
+            "source": "roster",
+        }
+
+    async def check(self, tag: str, slug: str, raise_on_error: bool = False) -> dict:
+        """Roster lookup, falling back to the live Start.gg check on a miss."""
+        hit = self.lookup(tag, slug)
+        if hit is not None:
+            return hit
+
+        result = await integrations.startgg_check(
+            self.client, tag, slug, raise_on_error=raise_on_error
+        )
+        if result.get("isRegistered") and result.get("participant_id") and self.available:
+            await self._remember(slug, result)
+        return result
+
+    async def _remember(self, slug: str, result: dict) -> None:
+        """Add a live hit to table + index (registrations after the last sync)."""
+        entry = {
+            "participant_id": result["participant_id"],
+            "gamer_tag": result.get("tag") or "",
+            "email": result.get("email"),
+            "user_name": result.get("name"),
+            "events": result.get("events") or [],
+        }
+        if not entry["gamer_tag"]:
+            return
+        try:
+            await self.storage.save_startgg_roster(slug, [entry])
+        except Exception as e:
+            logger.warning(f"Could not store Start.gg roster entry for '{entry['gamer_tag']}': {e}")
+        if slug == self.slug:
+            self._index[tag_key(entry["gamer_tag"])] = entry
+
+    # --- Sync ---
+
+    async def refresh(self, slug: str) -> None:
+        """Sync from Start.gg if this worker holds the lease, then reload if the table moved."""
+        if not slug:
+            return
+        if slug != self.slug:
+            self.slug = slug
+            self.synced_at = None
+            self._index = {}
+
+        state = await self.storage.claim_startgg_roster_sync(slug, self.refresh_seconds * 0.9)
+        if state is not None:
+            await self._sync_from_startgg(slug, state)
+
+        await self._reload(slug)
+
+    async def _sync_from_startgg(self, slug: str, state: dict) -> None:
+        full_age = _age_seconds(state.get("full_synced_at"))
+        try:
+            if full_age < self.full_sync_seconds and state.get("attendee_count") is not None:
+                count = await integrations.startgg_attendee_count(self.client, slug)
+                if count == state.get("attendee_count"):
+                    await self.storage.touch_startgg_roster(slug)
+                    return
+
+            roster = await integrations.startgg_roster(self.client, slug, per_page=self.page_size)
+            stats = await self.storage.save_startgg_roster(
+                slug, roster["entries"], complete=True, attendee_count=roster["attendee_count"]
+            )
+            logger.info(
+                f"Start.gg roster synced for '{slug}': {len(roster['entries'])} entrants "
+                f"({stats['changed']} changed, {stats['deleted']} removed)"
+            )
+        except Exception as e:
+            logger.warning(f"Start.gg roster sync failed for '{slug}': {e}")
+
+    async def _reload(self, slug: str) -> None:
+        state = await self.storage.get_startgg_roster_state(slug)
+        synced_at = (state or {}).get("synced_at")
+        if synced_at is None:
+            return
+        if self.synced_at is not None and synced_at <= self.synced_at and self._index:
+            self.synced_at = synced_at
+            return
+        entries = await self.storage.get_startgg_roster(slug)
+        self._index = {tag_key(e["gamer_tag"]): e for e in entries if e.get("gamer_tag")}
+        self.synced_at = synced_at
+
+    async def run(self, get_slug: Callable[[], Awaitable[Optional[str]]]) -> None:
+        """Refresh loop for the active tournament; runs until cancelled."""
+        while True:
+            try:
+                await self.refresh(await get_slug())
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Start.gg roster refresh failed: {e}")
+            await asyncio.sleep(self.refresh_seconds)
+
+    def start(self, get_slug: Callable[[], Awaitable[Optional[str]]]) -> None:
+        if self._task is None and self.available:
+            self._task = asyncio.create_task(self.run(get_slug))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
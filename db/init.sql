@@ -6,6 +6,7 @@
 --   shared/airtable_tables_backup/*.csv (existing Airtable fields)
 
 CREATE EXTENSION IF NOT EXISTS "pgcrypto";
+CREATE EXTENSION IF NOT EXISTS "pg_trgm";
 
 -- =============================================
 -- settings - Active event configuration
@@ -37,6 +38,57 @@ CREATE TABLE settings (
     updated_at              TIMESTAMPTZ DEFAULT now()
 );
 
+-- Notify listeners (per-process settings cache) whenever settings change
+CREATE OR REPLACE FUNCTION notify_settings_changed() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('fgc_settings_changed', TG_OP);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_settings_notify
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON settings
+FOR EACH STATEMENT EXECUTE FUNCTION notify_settings_changed();
+
+-- =============================================
+-- games / game_aliases - Canonical game dimension
+-- Raw game names (Start.gg event names, form values) are registered as aliases
+-- (LOWER(btrim(name))) of their canonical game at ingest, see shared/games.py.
+-- A trigger stores the matching ids in tournament_game_ids next to the raw names.
+-- =============================================
+CREATE TABLE games (
+    id    SERIAL PRIMARY KEY,
+    name  TEXT NOT NULL
+);
+
+CREATE UNIQUE INDEX idx_games_name ON games(LOWER(name));
+
+CREATE TABLE game_aliases (
+    alias    TEXT PRIMARY KEY,
+    game_id  INTEGER NOT NULL REFERENCES games(id)
+);
+
+-- Distinct game ids for raw names, in order of first appearance (unregistered names are skipped)
+CREATE OR REPLACE FUNCTION game_ids_for(names TEXT[]) RETURNS INTEGER[] AS $$
+    SELECT COALESCE(array_agg(game_id ORDER BY pos), '{}')
+    FROM (
+        SELECT a.game_id, MIN(n.pos) AS pos
+        FROM unnest(names) WITH ORDINALITY AS n(name, pos)
+        JOIN game_aliases a ON a.alias = LOWER(btrim(n.name))
+        GROUP BY a.game_id
+    ) ids
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION set_tournament_game_ids() RETURNS trigger AS $$
+BEGIN
+    NEW.tournament_game_ids := CASE
+        WHEN NEW.tournament_games_registered IS NULL THEN NULL
+        ELSE game_ids_for(NEW.tournament_games_registered)
+    END;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
 -- =============================================
 -- active_event_data - Live check-ins
 -- =============================================
@@ -56,6 +108,7 @@ CREATE TABLE active_event_data (
     payment_amount                  NUMERIC(10,2) DEFAULT 0,
     payment_expected                NUMERIC(10,2) DEFAULT 0,
     tournament_games_registered     TEXT[],
+    tournament_game_ids             INTEGER[],       -- games.id per registered game (trigger)
     checkin_uuid                    TEXT,            -- maps to Airtable "UUID"
     startgg_event_id                TEXT,
     is_guest                        BOOLEAN DEFAULT false,
@@ -69,6 +122,94 @@ CREATE INDEX idx_active_event_slug ON active_event_data(event_slug);
 CREATE INDEX idx_active_tag ON active_event_data(LOWER(tag));
 CREATE INDEX idx_active_name ON active_event_data(LOWER(name));
 CREATE INDEX idx_active_player_uuid ON active_event_data(player_uuid);
+-- Dashboard check-ins table: newest-first pages, game filter, name/tag search (ILIKE)
+CREATE INDEX idx_active_slug_created ON active_event_data(event_slug, created DESC, id DESC);
+CREATE INDEX idx_active_game_ids ON active_event_data USING gin (tournament_game_ids);
+CREATE INDEX idx_active_name_trgm ON active_event_data USING gin (name gin_trgm_ops);
+CREATE INDEX idx_active_tag_trgm ON active_event_data USING gin (tag gin_trgm_ops);
+-- One live check-in per event + tag (begin_checkin upserts on it)
+CREATE UNIQUE INDEX idx_active_event_tag_unique ON active_event_data(event_slug, LOWER(tag))
+    WHERE tag IS NOT NULL AND tag <> '';
+
+CREATE TRIGGER trg_active_event_data_game_ids
+BEFORE INSERT OR UPDATE OF tournament_games_registered ON active_event_data
+FOR EACH ROW EXECUTE FUNCTION set_tournament_game_ids();
+
+-- Row-level change feed for dashboard delta updates:
+-- every insert/update stamps row_version, statement triggers NOTIFY the changed rows
+CREATE SEQUENCE checkin_row_version_seq;
+ALTER TABLE active_event_data ADD COLUMN row_version BIGINT;
+
+CREATE OR REPLACE FUNCTION set_checkin_row_version() RETURNS trigger AS $$
+BEGIN
+    NEW.row_version := nextval('checkin_row_version_seq');
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_checkin_row_version
+BEFORE INSERT OR UPDATE ON active_event_data
+FOR EACH ROW EXECUTE FUNCTION set_checkin_row_version();
+
+CREATE OR REPLACE FUNCTION notify_checkin_delta() RETURNS trigger AS $$
+DECLARE
+    rows_json JSON;
+    payload TEXT;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        SELECT json_agg(json_build_object(
+            'record_id', o.record_id, 'event_slug', o.event_slug))
+        INTO rows_json FROM old_rows o;
+    ELSE
+        SELECT json_agg(json_build_object(
+            'record_id', n.record_id,
+            'row_version', n.row_version,
+            'created', n.created,
+            'event_slug', n.event_slug,
+            'status', n.status,
+            'member', n.member,
+            'startgg', n.startgg,
+            'is_guest', n.is_guest,
+            'payment_amount', n.payment_amount,
+            'payment_expected', n.payment_expected,
+            'payment_valid', n.payment_valid,
+            'name', n.name,
+            'email', n.email,
+            'tag', n.tag,
+            'telephone', n.telephone,
+            'tournament_games_registered', n.tournament_games_registered,
+            'UUID', n.checkin_uuid,
+            'startgg_event_id', n.startgg_event_id,
+            'external_id', n.external_id,
+            'added_via', n.added_via,
+            'acquisition_source', n.acquisition_source
+        ) ORDER BY n.row_version)
+        INTO rows_json FROM new_rows n;
+    END IF;
+    IF rows_json IS NULL THEN
+        RETURN NULL;
+    END IF;
+    payload := json_build_object('op', lower(TG_OP), 'rows', rows_json)::text;
+    IF octet_length(payload) >= 7900 THEN
+        -- Too large for NOTIFY (bulk statements): ask clients to reload
+        payload := json_build_object('op', 'refresh')::text;
+    END IF;
+    PERFORM pg_notify('fgc_checkin_delta', payload);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_checkin_delta_insert AFTER INSERT ON active_event_data
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION notify_checkin_delta();
+
+CREATE TRIGGER trg_checkin_delta_update AFTER UPDATE ON active_event_data
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION notify_checkin_delta();
+
+CREATE TRIGGER trg_checkin_delta_delete AFTER DELETE ON active_event_data
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION notify_checkin_delta();
 
 -- =============================================
 -- event_archive - Archived check-ins per event
@@ -92,6 +233,7 @@ CREATE TABLE event_archive (
     payment_expected                NUMERIC(10,2) DEFAULT 0,
     swish_expected_per_game         INTEGER,
     tournament_games_registered     TEXT[],          -- renamed from games_registered
+    tournament_game_ids             INTEGER[],       -- games.id per registered game (trigger)
     checkin_uuid                    TEXT,            -- maps to Airtable "UUID"
     external_id                     TEXT,
     startgg_event_id                TEXT,
@@ -109,6 +251,30 @@ CREATE TABLE event_archive (
 CREATE INDEX idx_archive_event_slug ON event_archive(event_slug);
 CREATE INDEX idx_archive_player_uuid ON event_archive(player_uuid);
 
+CREATE TRIGGER trg_event_archive_game_ids
+BEFORE INSERT OR UPDATE OF tournament_games_registered ON event_archive
+FOR EACH ROW EXECUTE FUNCTION set_tournament_game_ids();
+
+-- =============================================
+-- player_event_facts - Per-player analytics facts derived from event_archive
+-- One attendance row (game_id NULL) per player + event + date, plus one row per
+-- canonical game. Rebuilt for the touched events/players by archive_event,
+-- delete_archived_event, merge_players and undo_merge.
+-- =============================================
+CREATE TABLE player_event_facts (
+    player_uuid   TEXT NOT NULL,
+    event_slug    TEXT NOT NULL,
+    event_date    DATE,
+    game_id       INTEGER,            -- games.id, NULL = attendance row
+    display_tag   TEXT,               -- MAX tag/name over the archive rows behind the fact
+    display_name  TEXT
+);
+
+CREATE INDEX idx_pef_event ON player_event_facts(event_slug, game_id);
+CREATE INDEX idx_pef_player_date ON player_event_facts(player_uuid, event_date);
+CREATE INDEX idx_pef_date_player ON player_event_facts(event_date, player_uuid);
+CREATE INDEX idx_pef_game ON player_event_facts(game_id, event_date) WHERE game_id IS NOT NULL;
+
 -- =============================================
 -- event_stats - Aggregated statistics per event
 -- =============================================
@@ -180,6 +346,7 @@ CREATE TABLE players (
 CREATE INDEX idx_players_uuid ON players(uuid);
 CREATE INDEX idx_players_tag ON players(LOWER(tag));
 CREATE INDEX idx_players_name ON players(LOWER(name));
+CREATE INDEX idx_players_email ON players(LOWER(email));
 
 -- =============================================
 -- sessions - Auth sessions (Start.gg OAuth)
@@ -198,12 +365,32 @@ CREATE TABLE sessions (
 
 CREATE INDEX idx_sessions_session_id ON sessions(session_id);
 
+-- Notify listeners (per-process session cache) when a session is revoked
+CREATE OR REPLACE FUNCTION notify_session_revoked() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        PERFORM pg_notify('fgc_session_revoked', '');
+    ELSE
+        PERFORM pg_notify('fgc_session_revoked', OLD.session_id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_sessions_notify
+AFTER DELETE OR UPDATE OF session_id, expires_at ON sessions
+FOR EACH ROW EXECUTE FUNCTION notify_session_revoked();
+
+CREATE TRIGGER trg_sessions_notify_truncate
+AFTER TRUNCATE ON sessions
+FOR EACH STATEMENT EXECUTE FUNCTION notify_session_revoked();
+
 -- =============================================
 -- audit_log - Traceability for all actions
 -- =============================================
 CREATE TABLE audit_log (
-    id              SERIAL PRIMARY KEY,
-    timestamp       TIMESTAMPTZ DEFAULT now(),
+    id              SERIAL,
+    timestamp       TIMESTAMPTZ NOT NULL DEFAULT now(),
     user_id         TEXT,
     user_name       TEXT,
     user_email      TEXT,
@@ -215,12 +402,19 @@ CREATE TABLE audit_log (
     reason          TEXT,
     details         TEXT,
     before_state    JSONB,
-    after_state     JSONB
-);
+    after_state     JSONB,
+    PRIMARY KEY (id, timestamp)
+) PARTITION BY RANGE (timestamp);
 
-CREATE INDEX idx_audit_timestamp ON audit_log(timestamp);
-CREATE INDEX idx_audit_action ON audit_log(action);
-CREATE INDEX idx_audit_user ON audit_log(user_id);
+-- Monthly partitions (audit_log_pYYYY_MM) are created by the app on startup
+-- and by maintain_audit_log, which also drops expired ones. Rows outside
+-- every monthly partition land here until their month is created.
+CREATE TABLE audit_log_default PARTITION OF audit_log DEFAULT;
+
+-- (column, timestamp, id): keyset pagination and filter-option skip scans
+CREATE INDEX idx_audit_timestamp ON audit_log(timestamp, id);
+CREATE INDEX idx_audit_action ON audit_log(action, timestamp, id);
+CREATE INDEX idx_audit_user ON audit_log(user_id, timestamp, id);
 
 -- =============================================
 -- merge_log - Player merge history (undo-capable)
@@ -242,5 +436,248 @@ CREATE TABLE merge_log (
     undone_at               TIMESTAMPTZ
 );
 
+-- =============================================
+-- duplicate_candidates - Persisted duplicate-player index for the Merge tab
+-- One row per player pair (uuid_a < uuid_b). Open pairs are recomputed for the
+-- players queued in duplicate_scan_queue (refresh_duplicate_candidates);
+-- rejected / merged pairs keep their decision and are not offered again.
+-- =============================================
+CREATE TABLE duplicate_candidates (
+    uuid_a      TEXT NOT NULL,
+    uuid_b      TEXT NOT NULL,
+    reasons     TEXT[] NOT NULL DEFAULT '{}',   -- same_phone, exact_tag, similar_tag, ...
+    confidence  TEXT,                           -- high | medium | low
+    state       TEXT NOT NULL DEFAULT 'open',
+    found_at    TIMESTAMPTZ DEFAULT now(),
+    decided_at  TIMESTAMPTZ,
+    decided_by  TEXT,
+    PRIMARY KEY (uuid_a, uuid_b),
+    CHECK (uuid_a < uuid_b),
+    CHECK (state IN ('open', 'rejected', 'merged'))
+);
+
+CREATE INDEX idx_duplicate_candidates_b ON duplicate_candidates(uuid_b);
+
+-- Players inserted or with changed name/tag/telephone since the last refresh
+CREATE TABLE duplicate_scan_queue (
+    player_uuid  TEXT PRIMARY KEY,
+    queued_at    TIMESTAMPTZ DEFAULT now()
+);
+
+CREATE OR REPLACE FUNCTION queue_duplicate_scan() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        DELETE FROM duplicate_candidates
+        WHERE state = 'open' AND (uuid_a = OLD.uuid OR uuid_b = OLD.uuid);
+        DELETE FROM duplicate_scan_queue WHERE player_uuid = OLD.uuid;
+    ELSE
+        INSERT INTO duplicate_scan_queue (player_uuid) VALUES (NEW.uuid)
+        ON CONFLICT (player_uuid) DO NOTHING;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_players_duplicate_scan_insert
+AFTER INSERT ON players
+FOR EACH ROW EXECUTE FUNCTION queue_duplicate_scan();
+
+CREATE TRIGGER trg_players_duplicate_scan_update
+AFTER UPDATE OF name, tag, telephone ON players
+FOR EACH ROW
+WHEN (OLD.name IS DISTINCT FROM NEW.name
+      OR OLD.tag IS DISTINCT FROM NEW.tag
+      OR OLD.telephone IS DISTINCT FROM NEW.telephone)
+EXECUTE FUNCTION queue_duplicate_scan();
+
+CREATE TRIGGER trg_players_duplicate_scan_delete
+AFTER DELETE ON players
+FOR EACH ROW EXECUTE FUNCTION queue_duplicate_scan();
+
 CREATE INDEX idx_merge_log_keep ON merge_log(keep_uuid);
 CREATE INDEX idx_merge_log_remove ON merge_log(remove_uuid);
+
+-- =============================================
+-- checkin_jobs - Async check-in orchestration state (202 + poll/SSE result)
+-- =============================================
+CREATE TABLE checkin_jobs (
+    checkin_id      TEXT PRIMARY KEY,
+    state           TEXT NOT NULL DEFAULT 'running',   -- running | done | failed
+    result          JSONB,
+    created_at      TIMESTAMPTZ DEFAULT now(),
+    finished_at     TIMESTAMPTZ
+);
+
+CREATE INDEX idx_checkin_jobs_created ON checkin_jobs(created_at);
+
+-- =============================================
+-- startgg_roster - Prefetched Start.gg entrants of the active tournament
+-- Synced by the backend (one worker per interval, see startgg_roster_sync);
+-- tag_key is the case-folded gamer tag used for local registration lookups.
+-- =============================================
+CREATE TABLE startgg_roster (
+    tournament_slug TEXT NOT NULL,
+    participant_id  TEXT NOT NULL,
+    gamer_tag       TEXT NOT NULL,
+    tag_key         TEXT NOT NULL,
+    email           TEXT,
+    user_name       TEXT,
+    events          JSONB DEFAULT '[]'::jsonb,               -- ["Street Fighter 6", ...]
+    updated_at      TIMESTAMPTZ DEFAULT now(),
+    PRIMARY KEY (tournament_slug, participant_id)
+);
+
+CREATE INDEX idx_startgg_roster_tag ON startgg_roster(tournament_slug, tag_key);
+
+CREATE TABLE startgg_roster_sync (
+    tournament_slug TEXT PRIMARY KEY,
+    claimed_at      TIMESTAMPTZ,        -- last sync lease taken by a worker
+    synced_at       TIMESTAMPTZ,        -- roster confirmed current (probe or full sync)
+    full_synced_at  TIMESTAMPTZ,        -- last complete pagination
+    attendee_count  INTEGER             -- Start.gg numAttendees at last sync
+);
+
+-- =============================================
+-- admin_jobs - Long-running admin operations (e.g. bulk Start.gg recheck)
+-- At most one running job per kind; progress is polled/pushed, cancel is a flag
+-- the runner checks between steps.
+-- =============================================
+CREATE TABLE admin_jobs (
+    job_id            TEXT PRIMARY KEY,
+    kind              TEXT NOT NULL,                      -- e.g. 'bulk_recheck_startgg'
+    event_slug        TEXT,
+    state             TEXT NOT NULL DEFAULT 'running',    -- running | done | cancelled | failed
+    progress          JSONB DEFAULT '{}'::jsonb,
+    result            JSONB,
+    cancel_requested  BOOLEAN DEFAULT false,
+    created_at        TIMESTAMPTZ DEFAULT now(),
+    updated_at        TIMESTAMPTZ DEFAULT now(),
+    finished_at       TIMESTAMPTZ
+);
+
+CREATE UNIQUE INDEX idx_admin_jobs_one_running ON admin_jobs(kind) WHERE state = 'running';
+CREATE INDEX idx_admin_jobs_kind_created ON admin_jobs(kind, created_at DESC);
+
+-- =============================================
+-- archive_generation / insights_cache - Shared insights result cache
+-- Any statement changing rows of event_archive, event_stats, players, games or
+-- game_aliases bumps the generation (in the writer's transaction); cached
+-- results are served only for the current generation and evicted
+-- least-recently-hit first. New games/aliases only resolve rows written later
+-- (which bump themselves), so inserts into games/game_aliases do not bump.
+-- =============================================
+CREATE TABLE archive_generation (
+    id          SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    generation  BIGINT NOT NULL DEFAULT 0
+);
+
+INSERT INTO archive_generation (id) VALUES (1);
+
+-- Statements that touch no rows (transition tables empty) do not bump
+CREATE OR REPLACE FUNCTION bump_archive_generation() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        IF NOT EXISTS (SELECT 1 FROM new_rows) THEN
+            RETURN NULL;
+        END IF;
+    ELSIF TG_OP = 'DELETE' THEN
+        IF NOT EXISTS (SELECT 1 FROM old_rows) THEN
+            RETURN NULL;
+        END IF;
+    END IF;
+    UPDATE archive_generation SET generation = generation + 1 WHERE id = 1;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_event_archive_archive_generation_insert
+AFTER INSERT ON event_archive REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION bump_archive_generation();
+
+CREATE TRIGGER trg_event_archive_archive_generation_update
+AFTER UPDATE ON event_archive REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION bump_archive_generation();
+
+CREATE TRIGGER trg_event_archive_archive_generation_delete
+AFTER DELETE ON event_archive REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION bump_archive_generation();
+
+CREATE TRIGGER trg_event_archive_archive_generation_truncate
+AFTER TRUNCATE ON event_archive
+FOR EACH STATEMENT EXECUTE FUNCTION bump_archive_generation();
+
+CREATE TRIGGER trg_event_stats_archive_generation_insert
+AFTER INSERT ON event_stats REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION bump_archive_generation();
+
+CREATE TRIGGER trg_event_stats_archive_generation_update
+AFTER UPDATE ON event_stats REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION bump_archive_generation();
+
+CREATE TRIGGER trg_event_stats_archive_generation_delete
+AFTER DELETE ON event_stats REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION bump_archive_generation();
+
+CREATE TRIGGER trg_event_stats_archive_generation_truncate
+AFTER TRUNCATE ON event_stats
+FOR EACH STATEMENT EXECUTE FUNCTION bump_archive_generation();
+
+CREATE TRIGGER trg_players_archive_generation_insert
+AFTER INSERT ON players REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION bump_archive_generation();
+
+CREATE TRIGGER trg_players_archive_generation_update
+AFTER UPDATE ON players REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION bump_archive_generation();
+
+CREATE TRIGGER trg_players_archive_generation_delete
+AFTER DELETE ON players REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION bump_archive_generation();
+
+CREATE TRIGGER trg_players_archive_generation_truncate
+AFTER TRUNCATE ON players
+FOR EACH STATEMENT EXECUTE FUNCTION bump_archive_generation();
+
+CREATE TRIGGER trg_games_archive_generation_update
+AFTER UPDATE ON games REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION bump_archive_generation();
+
+CREATE TRIGGER trg_games_archive_generation_delete
+AFTER DELETE ON games REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION bump_archive_generation();
+
+CREATE TRIGGER trg_games_archive_generation_truncate
+AFTER TRUNCATE ON games
+FOR EACH STATEMENT EXECUTE FUNCTION bump_archive_generation();
+
+CREATE TRIGGER trg_game_aliases_archive_generation_update
+AFTER UPDATE ON game_aliases REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION bump_archive_generation();
+
+CREATE TRIGGER trg_game_aliases_archive_generation_delete
+AFTER DELETE ON game_aliases REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION bump_archive_generation();
+
+CREATE TRIGGER trg_game_aliases_archive_generation_truncate
+AFTER TRUNCATE ON game_aliases
+FOR EACH STATEMENT EXECUTE FUNCTION bump_archive_generation();
+
+CREATE TABLE insights_cache (
+    cache_key   TEXT PRIMARY KEY,               -- sha256 of (kind, scope, filters)
+    generation  BIGINT NOT NULL,                -- archive_generation at compute time
+    payload     JSONB NOT NULL,
+    created_at  TIMESTAMPTZ DEFAULT now(),
+    hit_at      TIMESTAMPTZ DEFAULT now()
+);
+
+CREATE INDEX idx_insights_cache_hit_at ON insights_cache(hit_at DESC);
+
+-- =============================================
+-- schema_backfills - One-time data backfills of the startup migrations
+-- Recorded in the backfill's own transaction (see _run_backfill), so an
+-- interrupted backfill runs again on the next start.
+-- =============================================
+CREATE TABLE schema_backfills (
+    name     TEXT PRIMARY KEY,                -- e.g. 'player_event_facts'
+    done_at  TIMESTAMPTZ DEFAULT now()
+);
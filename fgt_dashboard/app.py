@@ -14,9 +14,10 @@ except ImportError:
 # that don't exist at startup (needed for dynamic layout)
 app = Dash(__name__, requests_pathname_prefix='/', suppress_callback_exceptions=True)
 
-# Layout as function reference (not called) = regenerated on each page load
-# This allows the event dropdown to show updated events from Airtable
-# without requiring a container rebuild
+# Layout as function reference: returns the cached static skeleton (rebuilt
+# once a day for date defaults). Per-user and per-event data (auth, event
+# dropdown, settings) is loaded by the page-load callbacks, so serving the
+# page itself runs no DB queries.
 app.layout = create_layout
 
 # Register interactive callbacks
@@ -1,6 +1,13 @@
 /**
  * SSE Client for real-time dashboard updates
- * Connects to backend and triggers refresh when check-in events arrive
+ * Connects to backend and triggers refresh when check-in events arrive.
+ *
+ * Row-level `checkin_delta` events are handed to Dash (checkin-delta-store)
+ * and patched into checkins-table without a full reload. A gap in the
+ * per-stream `seq` (missed events) or a reconnect falls back to a refresh.
+ *
+ * Bulk Start.gg recheck progress/completion updates go to bulk-recheck-store
+ * (progress bar); only completion triggers a refresh.
  */
 (function() {
     let eventSource = null;
@@ -8,6 +15,18 @@
     const maxReconnectAttempts = 10;
     const reconnectDelay = 3000;
     let fallbackInterval = null;
+    let hasConnected = false;
+
+    // Delta stream state (stream = backend worker id, seq = last seen event)
+    let deltaStream = null;
+    let deltaSeq = 0;
+    let deltaSince = 0;  // seq already covered by the last full refresh
+    let recentDeltas = [];
+    const maxRecentDeltas = 50;
+    // Broadcast types whose row changes also arrive as checkin_delta events
+    const deltaCoveredTypes = [
+        'new_checkin', 'payment_updated', 'recheck_startgg', 'games_updated', 'member_updated'
+    ];
 
     function updateIndicator(status) {
         const dot = document.getElementById('connection-dot');
@@ -44,6 +63,65 @@
         }
     }
 
+    function resetDeltaStream(stream, seq) {
+        deltaStream = stream || null;
+        deltaSeq = seq || 0;
+        deltaSince = deltaSeq;
+        recentDeltas = [];
+    }
+
+    function handleDelta(delta) {
+        if (!deltaStream || delta.stream !== deltaStream || delta.seq !== deltaSeq + 1) {
+            // Missed events (or a different worker's stream): reload and resync
+            console.log('Delta gap, full refresh');
+            resetDeltaStream(delta.stream, delta.seq);
+            triggerRefresh();
+            return;
+        }
+        deltaSeq = delta.seq;
+        recentDeltas.push(delta);
+        if (recentDeltas.length > maxRecentDeltas) {
+            recentDeltas = recentDeltas.slice(-maxRecentDeltas);
+        }
+
+        const dc = window.dash_clientside;
+        if (!dc || typeof dc.set_props !== 'function') {
+            triggerRefresh();
+            return;
+        }
+        // Recent deltas are resent each time; the Dash callback skips applied ones
+        dc.set_props('checkin-delta-store', {
+            data: { stream: deltaStream, since: deltaSince, deltas: recentDeltas.slice() }
+        });
+    }
+
+    function setBulkRecheck(data) {
+        const dc = window.dash_clientside;
+        if (dc && typeof dc.set_props === 'function') {
+            dc.set_props('bulk-recheck-store', { data: data });
+        }
+    }
+
+    function handleBroadcast(e) {
+        let data = {};
+        try {
+            data = JSON.parse(e.data || '{}');
+        } catch (err) {
+            data = {};
+        }
+        if (data.type === 'bulk_recheck_progress') {
+            setBulkRecheck(data);
+            return;
+        }
+        if (data.type === 'bulk_recheck_startgg') {
+            setBulkRecheck(data);
+        }
+        if (deltaStream && deltaCoveredTypes.indexOf(data.type) !== -1) {
+            return;  // table will be patched by the matching checkin_delta
+        }
+        triggerRefresh();
+    }
+
     function startFallbackPolling() {
         if (fallbackInterval) return;
         updateIndicator('fallback');
@@ -134,16 +212,37 @@
             eventSource.addEventListener('connected', function(e) {
                 console.log('SSE connected event received:', e.data);
                 updateIndicator('connected');
+                let info = {};
+                try {
+                    info = JSON.parse(e.data || '{}');
+                } catch (err) {
+                    info = {};
+                }
+                resetDeltaStream(info.delta_stream, info.delta_seq);
+                // Events may have been missed while reconnecting
+                if (hasConnected) {
+                    triggerRefresh();
+                }
+                hasConnected = true;
             });
 
             eventSource.addEventListener('checkin', function(e) {
                 console.log('New checkin event:', e.data);
-                triggerRefresh();
+                handleBroadcast(e);
             });
 
             eventSource.addEventListener('update', function(e) {
                 console.log('Update event:', e.data);
-                triggerRefresh();
+                handleBroadcast(e);
+            });
+
+            eventSource.addEventListener('checkin_delta', function(e) {
+                try {
+                    handleDelta(JSON.parse(e.data));
+                } catch (err) {
+                    console.error('Bad checkin_delta event:', err);
+                    triggerRefresh();
+                }
             });
 
             eventSource.onerror = function(e) {
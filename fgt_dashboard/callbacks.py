@@ -1,6 +1,6 @@
 # callbacks.py
 from dash.dependencies import Input, Output, State, ALL
-from dash import no_update, html, ctx, dcc
+from dash import no_update, html, ctx, dcc, Patch
 from shared.storage import (
     get_checkins,
     get_active_settings,
@@ -12,16 +12,50 @@ from shared.storage import (
     get_audit_log,
 )
 import shared.storage as storage_api
+from shared.games import canonical_game_name
+
+try:
+    # When running in Docker (files copied flat to /app/)
+    from layout import (
+        ADMIN_JOB_STATUS_HIDDEN,
+        ADMIN_JOB_STATUS_VISIBLE,
+        build_auth_ui,
+        column_visibility_options,
+        default_visible_columns,
+        event_dropdown_options,
+        format_datetime_local,
+        get_auth_state,
+        reopen_event_options,
+        requirements_from_settings,
+    )
+except ImportError:
+    # When running locally with package structure
+    from fgt_dashboard.layout import (
+        ADMIN_JOB_STATUS_HIDDEN,
+        ADMIN_JOB_STATUS_VISIBLE,
+        build_auth_ui,
+        column_visibility_options,
+        default_visible_columns,
+        event_dropdown_options,
+        format_datetime_local,
+        get_auth_state,
+        reopen_event_options,
+        requirements_from_settings,
+    )
 import pandas as pd
 import requests
 import os
 import logging
 import json
 import re
+import threading
+import time
 import unicodedata
+import uuid
+from functools import lru_cache, wraps
 from urllib.parse import urlparse
 from datetime import datetime, timezone, timedelta, date
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -127,6 +161,1014 @@ def action_sort_key(action: str) -> tuple:
     return (group_rank, label.lower())
 
 
+# ---------------------------------------------------------------------
+# Check-ins table formatting (shared by full refresh and SSE delta patching)
+# ---------------------------------------------------------------------
+DEFAULT_TABLE_COLUMNS = [
+    "name",
+    "tag",
+    "telephone",
+    "member",
+    "startgg",
+    "is_guest",
+    "payment_valid",
+    "status",
+]
+
+# Game name shortening map
+GAME_SHORT_NAMES = {
+    "STREET FIGHTER 6 TOURNAMENT": "SF6",
+    "STREET FIGHTER 6": "SF6",
+    "TEKKEN 8 TOURNAMENT": "T8",
+    "TEKKEN 8": "T8",
+    "SMASH SINGLES": "SSBU",
+    "SUPER SMASH BROS": "SSBU",
+    "SUPER SMASH BROS ULTIMATE": "SSBU",
+}
+
+GAME_SHORT_PATTERNS = [
+    ("SUPER SMASH BROS", "SSBU"),
+    ("SMASH", "SSBU"),
+    ("TEKKEN 8", "T8"),
+    ("STREET FIGHTER 6", "SF6"),
+]
+
+# Hidden per-row keys kept in table data (not shown as columns)
+TABLE_ROW_KEYS = ["record_id", "row_version"]
+
+# Players listed under Needs Attention (the count badge covers all of them)
+NEEDS_ATTENTION_LIMIT = 50
+
+
+def shorten_game(name):
+    """Shorten game name using mapping, case-insensitive."""
+    if not name:
+        return ""
+    normalized = str(name).upper().strip()
+    if normalized in GAME_SHORT_NAMES:
+        return GAME_SHORT_NAMES[normalized]
+    for pattern, short in GAME_SHORT_PATTERNS:
+        if pattern in normalized:
+            return short
+    return name
+
+
+def resolve_table_columns(visible_columns, requirements) -> List[str]:
+    """Visible check-in columns, minus columns for disabled requirements."""
+    visible_columns = visible_columns or list(DEFAULT_TABLE_COLUMNS)
+    requirements = requirements or {}
+    if requirements.get("require_membership") is not True:
+        visible_columns = [c for c in visible_columns if c != "member"]
+    if requirements.get("require_payment") is not True:
+        visible_columns = [c for c in visible_columns if c != "payment_valid"]
+    return visible_columns
+
+
+def format_checkins(df):
+    """Format raw check-in rows for display (short game names, ✓/✗ icons)."""
+    # Format multi-select fields: shorten names + join with comma
+    if "tournament_games_registered" in df.columns:
+        df["tournament_games_registered"] = df["tournament_games_registered"].apply(
+            lambda x: (
+                ", ".join(shorten_game(g) for g in x)
+                if isinstance(x, list)
+                else shorten_game(x) if x else ""
+            )
+        )
+
+    # Convert booleans to icons ✓/✗
+    for col in ["member", "startgg", "payment_valid", "is_guest"]:
+        if col in df.columns:
+            df[col] = df[col].apply(lambda x: "✓" if x is True or str(x).lower() == "true" else "✗")
+
+    return df
+
+
+def checkin_filters(active_filter, search_query, game_filter, requirements) -> Dict[str, Any]:
+    """
+    Storage filter kwargs (get_checkins_page & co.) for the quick filter,
+    search box and game filter. The no-payment filter only applies while
+    payment is required.
+    """
+    requirements = requirements or {}
+    filters: Dict[str, Any] = {}
+    if (search_query or "").strip():
+        filters["search"] = search_query.strip()
+    if game_filter:
+        filters["game"] = game_filter
+    if active_filter == "pending":
+        filters["status"] = "Pending"
+    elif active_filter == "ready":
+        filters["status"] = "Ready"
+    elif active_filter == "no-payment" and requirements.get("require_payment") is True:
+        filters["payment_valid"] = False
+    return filters
+
+
+def attention_columns(requirements) -> List[str]:
+    """Requirement columns a player can be missing - enabled requirements only."""
+    requirements = requirements or {}
+    return [
+        col
+        for col, key in (
+            ("member", "require_membership"),
+            ("payment_valid", "require_payment"),
+            ("startgg", "require_startgg"),
+        )
+        if requirements.get(key) is True
+    ]
+
+
+# ---------------------------------------------------------------------
+# In-memory check-in paging for storage backends without it (Airtable).
+# Mirrors the SQL in postgres_api.get_checkins_page & co.
+# ---------------------------------------------------------------------
+def _is_true(val) -> bool:
+    return val is True or str(val).lower() == "true"
+
+
+def _filter_checkins_in_memory(
+    rows, search=None, status=None, payment_valid=None, game=None, missing=None
+):
+    search = (search or "").strip().lower()
+    game_key = canonical_game_name(game).lower() if game else ""
+    out = []
+    for r in rows:
+        if search and not any(search in str(r.get(c) or "").lower() for c in ("name", "tag")):
+            continue
+        if status and r.get("status") != status:
+            continue
+        if payment_valid is not None and _is_true(r.get("payment_valid")) != payment_valid:
+            continue
+        if game_key:
+            games = r.get("tournament_games_registered") or []
+            if isinstance(games, str):
+                games = [games]
+            if not any(canonical_game_name(g).lower() == game_key for g in games):
+                continue
+        if missing and all(_is_true(r.get(c)) for c in missing):
+            continue
+        out.append(r)
+    return out
+
+
+def _sort_checkins_in_memory(rows, sort_by):
+    for entry in reversed(sort_by or []):
+        col = entry.get("column_id")
+        present = [r for r in rows if r.get(col) not in (None, "")]
+        missing = [r for r in rows if r.get(col) in (None, "")]
+        present.sort(
+            key=lambda r: str(r.get(col)).lower(), reverse=entry.get("direction") == "desc"
+        )
+        rows = present + missing
+    return rows
+
+
+def _duplicate_checkins_in_memory(rows, limit=4):
+    """Rows sharing at least two of name / tag / phone (see find_duplicate_checkins)."""
+
+    def _text(v):
+        return re.sub(r"\s+", " ", str(v or "").strip().lower())
+
+    def _phone(v):
+        return re.sub(r"\D+", "", str(v or ""))
+
+    keys = [(_text(r.get("name")), _text(r.get("tag")), _phone(r.get("telephone"))) for r in rows]
+    hits: Dict[int, set] = {}
+    for (i, j, reason) in ((0, 1, "name + tag"), (0, 2, "name + phone"), (1, 2, "tag + phone")):
+        buckets: Dict[tuple, List[int]] = {}
+        for idx, key in enumerate(keys):
+            if key[i] and key[j]:
+                buckets.setdefault((key[i], key[j]), []).append(idx)
+        for idxs in buckets.values():
+            if len(idxs) > 1:
+                for idx in idxs:
+                    hits.setdefault(idx, set()).add(reason)
+    flagged = [
+        {
+            "record_id": rows[idx].get("record_id"),
+            "name": rows[idx].get("name"),
+            "tag": rows[idx].get("tag"),
+            "reasons": sorted(hits[idx]),
+        }
+        for idx in sorted(hits)
+    ]
+    return {"count": len(flagged), "rows": flagged[:limit]}
+
+
+def _checkin_scope(selected_slug):
+    """(slug, include_all) storage arguments for an event-dropdown value."""
+    if selected_slug == "__ALL__":
+        return None, True
+    return selected_slug, False
+
+
+def load_checkins_page(selected_slug, filters, sort_by, page, page_size) -> Dict[str, Any]:
+    """One page of check-ins + matching row count ({"rows", "total"})."""
+    slug, include_all = _checkin_scope(selected_slug)
+    page_fn = getattr(storage_api, "get_checkins_page", None)
+    if callable(page_fn):
+        return page_fn(
+            slug,
+            include_all=include_all,
+            page=page,
+            page_size=page_size,
+            sort_by=sort_by,
+            **filters,
+        )
+    rows = _filter_checkins_in_memory(get_checkins(slug, include_all=include_all) or [], **filters)
+    rows = _sort_checkins_in_memory(rows, sort_by)
+    start = page * page_size
+    return {"rows": rows[start : start + page_size], "total": len(rows)}
+
+
+def load_filtered_checkins(selected_slug, filters) -> List[Dict[str, Any]]:
+    """Every check-in matching the table filters (newest first)."""
+    slug, include_all = _checkin_scope(selected_slug)
+    if callable(getattr(storage_api, "get_checkins_page", None)):
+        return get_checkins(slug, include_all=include_all, **filters) or []
+    return _filter_checkins_in_memory(get_checkins(slug, include_all=include_all) or [], **filters)
+
+
+def load_checkins_summary(selected_slug, filters, requirements) -> Dict[str, Any]:
+    """
+    Counts for the stat cards / player count plus the first Needs Attention
+    rows ({"total", "filtered", "ready", "pending", "attention", "attention_rows"}).
+    """
+    slug, include_all = _checkin_scope(selected_slug)
+    attention = attention_columns(requirements)
+    summary_fn = getattr(storage_api, "get_checkins_summary", None)
+    if callable(summary_fn):
+        summary = summary_fn(slug, include_all=include_all, attention=attention, **filters)
+        attention_rows = []
+        if attention and summary.get("attention"):
+            attention_rows = get_checkins(
+                slug,
+                include_all=include_all,
+                missing=attention,
+                limit=NEEDS_ATTENTION_LIMIT,
+                **filters,
+            )
+    else:
+        all_rows = get_checkins(slug, include_all=include_all) or []
+        rows = _filter_checkins_in_memory(all_rows, **filters)
+        attention_rows = _filter_checkins_in_memory(rows, missing=attention) if attention else []
+        summary = {
+            "total": len(all_rows),
+            "filtered": len(rows),
+            "ready": len([r for r in rows if r.get("status") == "Ready"]),
+            "pending": len([r for r in rows if r.get("status") == "Pending"]),
+            "attention": len(attention_rows),
+        }
+    summary["attention_rows"] = [
+        {k: r.get(k) for k in ("record_id", "name", "tag", "member", "payment_valid", "startgg")}
+        for r in attention_rows[:NEEDS_ATTENTION_LIMIT]
+    ]
+    return summary
+
+
+def load_checkin_games(selected_slug) -> List[str]:
+    """Canonical names of the games registered in the selected event."""
+    slug, include_all = _checkin_scope(selected_slug)
+    games_fn = getattr(storage_api, "get_checkin_games", None)
+    if callable(games_fn):
+        return games_fn(slug, include_all=include_all)
+    games = set()
+    for r in get_checkins(slug, include_all=include_all) or []:
+        val = r.get("tournament_games_registered") or []
+        for g in [val] if isinstance(val, str) else val:
+            if canonical_game_name(g):
+                games.add(canonical_game_name(g))
+    return sorted(games, key=str.lower)
+
+
+def load_duplicate_checkins(selected_slug) -> Dict[str, Any]:
+    """Likely duplicate check-ins in the selected event ({"count", "rows"})."""
+    slug, include_all = _checkin_scope(selected_slug)
+    dupes_fn = getattr(storage_api, "find_duplicate_checkins", None)
+    if callable(dupes_fn):
+        return dupes_fn(slug, include_all=include_all)
+    return _duplicate_checkins_in_memory(get_checkins(slug, include_all=include_all) or [])
+
+
+def select_table_columns(df, visible_columns):
+    """Keep hidden row keys (record_id, row_version) plus the visible columns."""
+    visible_cols = [c for c in visible_columns if c in df.columns]
+    all_cols = [c for c in TABLE_ROW_KEYS if c in df.columns] + visible_cols
+    return df[all_cols], visible_cols
+
+
+# Column header display names (shorter/cleaner)
+COLUMN_HEADERS = {
+    "name": "Name",
+    "tag": "Tag",
+    "status": "Status",
+    "payment_valid": "Payment",
+    "telephone": "Phone",
+    "member": "Member",
+    "startgg": "Start.gg",
+    "is_guest": "Guest",
+    "tournament_games_registered": "Games",
+    "email": "Email",
+    "UUID": "UUID",
+    "created": "Created",
+}
+
+
+def table_column_defs(visible_cols) -> List[Dict[str, Any]]:
+    """DataTable column definitions - record_id/row_version stay hidden."""
+    return [
+        {
+            "name": COLUMN_HEADERS.get(c, str(c).replace("_", " ").title()),
+            "id": str(c),
+            "reorderable": True,
+            "editable": c in ["name", "tag", "telephone", "tournament_games_registered"],
+        }
+        for c in visible_cols
+    ]
+
+
+def event_coverage(selected_slug, total_count):
+    """
+    (coverage text, source) for the selected event: checked-in players vs.
+    Start.gg registrations, from the live settings snapshot for the active
+    event or from event_stats for archived ones.
+    """
+    coverage_text = ""
+    coverage_source = ""
+    try:
+        settings = get_active_settings() or {}
+        active_slug = (settings.get("active_event_slug") or "").strip()
+        events_json = settings.get("events_json")
+        registered_players = 0
+        registered_slots = 0
+
+        snapshot_slug = ""
+        startgg_url = (settings.get("startgg_event_url") or "").strip()
+        if startgg_url:
+            m = re.search(r"/tournament/([^/]+)", startgg_url)
+            if m:
+                snapshot_slug = (m.group(1) or "").strip()
+
+        # For active event: use live settings snapshot.
+        if selected_slug == active_slug:
+            # Guard against stale/mismatched settings snapshot.
+            snapshot_matches_selected = (not snapshot_slug) or (snapshot_slug == selected_slug)
+
+            if snapshot_matches_selected:
+                if isinstance(events_json, dict):
+                    registered_players = int(events_json.get("tournament_entrants_players") or 0)
+                    registered_slots = int(events_json.get("tournament_entrants") or 0)
+                elif isinstance(settings.get("startgg_registered_count"), (int, float, str)):
+                    registered_slots = int(settings.get("startgg_registered_count") or 0)
+
+                if registered_players > 0:
+                    coverage_rate = (total_count / registered_players) * 100
+                    coverage_text = f"Coverage: {total_count}/{registered_players} players ({coverage_rate:.0f}%)"
+                    coverage_source = "Source: Active snapshot"
+                    if registered_slots and registered_slots != registered_players:
+                        coverage_text += f" | {registered_slots} event slots"
+                elif registered_slots > 0:
+                    coverage_rate = (total_count / registered_slots) * 100
+                    coverage_text = f"Coverage (slots): {total_count}/{registered_slots} ({coverage_rate:.0f}%)"
+                    coverage_source = "Source: Active snapshot (slot fallback)"
+            else:
+                coverage_text = (
+                    "Coverage unavailable: Start.gg snapshot belongs to another event. "
+                    "Run Fetch Event Data for the selected event."
+                )
+                coverage_source = "Source: Guarded mismatch"
+
+        # For non-active/archived events: use event_stats by slug.
+        elif selected_slug and selected_slug != "__ALL__":
+            history_fn = getattr(storage_api, "get_event_history_dashboard", None)
+            if callable(history_fn):
+                history_raw = history_fn() or []
+                history_rows = history_raw if isinstance(history_raw, list) else []
+                stat_row = next(
+                    (r for r in history_rows if (r.get("event_slug") or "") == selected_slug),
+                    None,
+                )
+                if stat_row:
+                    checked_in = int(
+                        stat_row.get("checked_in_count")
+                        or stat_row.get("total_participants")
+                        or total_count
+                    )
+                    registered_players = int(stat_row.get("startgg_registered_players") or 0)
+                    registered_slots = int(stat_row.get("startgg_registered_count") or 0)
+
+                    if registered_players > 0:
+                        coverage_rate = (checked_in / registered_players) * 100
+                        coverage_text = f"Coverage: {checked_in}/{registered_players} players ({coverage_rate:.0f}%)"
+                        coverage_source = "Source: Archived stats"
+                        if registered_slots and registered_slots != registered_players:
+                            coverage_text += f" | {registered_slots} event slots"
+                    elif registered_slots > 0:
+                        coverage_rate = (checked_in / registered_slots) * 100
+                        coverage_text = (
+                            f"Coverage (slots): {checked_in}/{registered_slots} ({coverage_rate:.0f}%)"
+                            " | player coverage unavailable for this archived snapshot"
+                        )
+                        coverage_source = "Source: Archived stats (slot fallback)"
+                    else:
+                        coverage_text = "Coverage unavailable for this archived event"
+                        coverage_source = "Source: Archived stats"
+    except Exception:
+        coverage_text = ""
+        coverage_source = ""
+    return coverage_text, coverage_source
+
+
+def duplicate_warning(dupes):
+    """(style, text, list items) for the duplicate-participants banner."""
+    if not dupes or not dupes.get("count"):
+        return {"display": "none"}, "", []
+    preview_rows = [
+        html.Li(
+            f"{r.get('name') or 'Unknown'} ({r.get('tag') or '-'}) – {', '.join(r.get('reasons') or [])}"
+        )
+        for r in dupes.get("rows") or []
+    ]
+    style = {
+        "marginBottom": "0.75rem",
+        "display": "block",
+        "border": "1px solid rgba(245, 158, 11, 0.45)",
+        "backgroundColor": "rgba(245, 158, 11, 0.08)",
+        "borderRadius": "8px",
+        "padding": "0.55rem 0.75rem",
+    }
+    return style, f"⚠ Possible duplicate participants detected ({dupes['count']}).", preview_rows
+
+
+# ---------------------------------------------------------------------
+# Insights scope - resolved once per filter change and shared by the
+# per-section insights callbacks (KPIs, players, funnel, games, events)
+# ---------------------------------------------------------------------
+# Bundle sections per insights callback (see get_insights_bundle)
+INSIGHTS_KPI_SECTIONS = (
+    "manual_by_event",
+    "multi_game",
+    "community_health",
+    "unique_count",
+    "churn",
+)
+
+INSIGHTS_EMPTY_PERIOD_LABELS = {
+    "day": "last 24h",
+    "week": "last 7 days",
+    "month": "last 30 days",
+    "quarter": "last 90 days",
+    "year": "last 365 days",
+    "custom": "selected range",
+    "all": "all time",
+}
+
+INSIGHTS_PERIOD_TITLES = {
+    "day": "Last 24h",
+    "week": "Last 7 days",
+    "month": "Last 30 days",
+    "quarter": "Last 90 days",
+    "year": "Last 365 days",
+    "custom": "Year to date",
+    "all": "All time",
+}
+
+
+def _as_float(v):
+    try:
+        return float(v or 0)
+    except Exception:
+        return 0.0
+
+
+def _as_int(v):
+    try:
+        return int(v or 0)
+    except Exception:
+        return 0
+
+
+def _norm_text(value: Any) -> str:
+    txt = unicodedata.normalize("NFKD", str(value or ""))
+    txt = "".join(ch for ch in txt if not unicodedata.combining(ch))
+    txt = re.sub(r"[^a-z0-9]+", "", txt.lower())
+    return txt
+
+
+def _as_date(v):
+    if not v:
+        return None
+    if isinstance(v, datetime):
+        return v.date()
+    if isinstance(v, date):
+        return v
+    txt = str(v).strip()
+    if not txt:
+        return None
+    txt = txt.split("T")[0]
+    try:
+        return datetime.fromisoformat(txt).date()
+    except Exception:
+        return None
+
+
+def _insights_series_key(ev):
+    title = (ev.get("event_display_name") or ev.get("event_slug") or "").strip()
+    if not title:
+        return "Other"
+    # Remove trailing numbering patterns: "#12", "12", "- 12"
+    cleaned = re.sub(r"\s*[-#]?\s*\d+\s*$", "", title).strip(" -#")
+    return cleaned or title
+
+
+def _insights_period_range(period, custom_start, custom_end):
+    """(start, end) dates for an insights period (None = open-ended)."""
+    today = datetime.now(timezone.utc).date()
+    days = {"day": 1, "week": 7, "month": 30, "quarter": 90, "year": 365}.get(period)
+    if days:
+        return today - timedelta(days=days), today
+    if period == "custom":
+        return _as_date(custom_start), _as_date(custom_end)
+    return None, None
+
+
+def _fmt_delta(curr, prev, unit="count"):
+    if prev is None:
+        return "—"
+    diff = curr - prev
+    if diff > 0:
+        arrow = "↑"
+    elif diff < 0:
+        arrow = "↓"
+    else:
+        arrow = "→"
+
+    if unit == "kr":
+        return f"{arrow} {diff:+.0f} kr vs prev"
+    if unit == "pp":
+        return f"{arrow} {diff:+.1f} pp vs prev"
+    if unit == "count1":
+        return f"{arrow} {diff:+.1f} vs prev"
+    return f"{arrow} {int(diff):+d} vs prev"
+
+
+def aggregate_insights_metrics(event_rows) -> Dict[str, Any]:
+    """Totals / rates over event_stats rows (current or previous insights period)."""
+    total = 0
+    total_revenue = 0.0
+    member_count = 0
+    guest_count = 0
+    startgg_count = 0
+    startgg_account_count = 0
+    ready_count = 0
+    weighted_retention_sum = 0.0
+    weighted_retention_den = 0
+    top_game_counts = {}
+    slots = 0
+    new_players = 0
+    returning_players = 0
+    startgg_registered_total = 0
+    checked_in_total = 0
+    no_show_total = 0
+
+    for ev in event_rows:
+        ev_total = _as_int(ev.get("total_participants") or ev.get("participants"))
+        total += ev_total
+        total_revenue += _as_float(ev.get("total_revenue"))
+        member_count += _as_int(ev.get("member_count"))
+        guest_count += _as_int(ev.get("guest_count"))
+        startgg_count += _as_int(ev.get("startgg_count"))
+        new_players += _as_int(ev.get("new_players"))
+        returning_players += _as_int(ev.get("returning_players"))
+        startgg_account_count += max(
+            _as_int(ev.get("startgg_count")) - _as_int(ev.get("guest_count")),
+            0,
+        )
+
+        status_breakdown = ev.get("status_breakdown")
+        if isinstance(status_breakdown, dict):
+            ready_count += _as_int(status_breakdown.get("Ready"))
+
+        retention_val = _as_float(ev.get("retention_rate"))
+        if ev_total > 0:
+            weighted_retention_sum += retention_val * ev_total
+            weighted_retention_den += ev_total
+
+        breakdown = ev.get("games_breakdown")
+        if isinstance(breakdown, dict):
+            for game, count in breakdown.items():
+                cnt = _as_int(count)
+                if cnt <= 0:
+                    continue
+                top_game_counts[game] = top_game_counts.get(game, 0) + cnt
+                slots += cnt
+
+        # No-show aggregation (prefer player count, fall back to slot count)
+        reg_players = _as_int(ev.get("startgg_registered_players"))
+        reg_slots = _as_int(ev.get("startgg_registered_count"))
+        startgg_registered_total += reg_players or reg_slots
+        checked_in_total += _as_int(ev.get("checked_in_count"))
+        no_show_total += _as_int(ev.get("no_show_count"))
+
+    no_show_rate_agg = (
+        (no_show_total / startgg_registered_total * 100) if startgg_registered_total > 0 else 0.0
+    )
+
+    return {
+        "total": total,
+        "revenue": total_revenue,
+        "member_count": member_count,
+        "guest_count": guest_count,
+        "startgg_count": startgg_count,
+        "startgg_account_count": startgg_account_count,
+        "ready_count": ready_count,
+        "new_players": new_players,
+        "returning_players": returning_players,
+        "retention": (
+            (weighted_retention_sum / weighted_retention_den) if weighted_retention_den > 0 else 0.0
+        ),
+        "top_game_counts": top_game_counts,
+        "slots": slots,
+        "startgg_registered_total": startgg_registered_total,
+        "checked_in_total": checked_in_total,
+        "no_show_total": no_show_total,
+        "no_show_rate": no_show_rate_agg,
+    }
+
+
+def insights_game_totals(event_rows):
+    """
+    (check-in entries per canonical game, Start.gg snapshot totals per game,
+    total entries) over event_stats rows.
+    """
+    game_counts: Dict[str, int] = {}
+    configured_games: Dict[str, Dict[str, int]] = {}
+    total_entries = 0
+    for ev in event_rows:
+        breakdown = ev.get("games_breakdown")
+        if isinstance(breakdown, dict):
+            for game, count in breakdown.items():
+                cnt = _as_int(count)
+                if cnt <= 0:
+                    continue
+                normalized_game = canonical_game_name(game)
+                if not normalized_game:
+                    continue
+                game_counts[normalized_game] = game_counts.get(normalized_game, 0) + cnt
+                total_entries += cnt
+
+        snapshot = ev.get("startgg_snapshot")
+        if isinstance(snapshot, dict):
+            snapshot_events = snapshot.get("events") or []
+            if isinstance(snapshot_events, list):
+                for snap_ev in snapshot_events:
+                    if not isinstance(snap_ev, dict):
+                        continue
+                    normalized_game = canonical_game_name(snap_ev.get("name"))
+                    if not normalized_game:
+                        continue
+                    agg = configured_games.setdefault(
+                        normalized_game,
+                        {"registered": 0, "sets": 0, "games": 0, "configured": 0},
+                    )
+                    agg["registered"] += _as_int(snap_ev.get("numEntrants"))
+                    agg["sets"] += _as_int(snap_ev.get("setCount"))
+                    agg["games"] += _as_int(snap_ev.get("gamesPlayed"))
+                    agg["configured"] += 1
+    return game_counts, configured_games, total_entries
+
+
+def insights_bundle(scope, compare_scope=None, **options) -> Dict[str, Any]:
+    """get_insights_bundle when the backend has it ({"current", "previous"})."""
+    try:
+        bundle_fn = getattr(storage_api, "get_insights_bundle", None)
+        if bundle_fn:
+            return bundle_fn(scope, compare_scope, **options) or {}
+    except Exception as e:
+        logger.warning(f"Failed to load insights stats: {e}")
+    return {}
+
+
+@lru_cache(maxsize=16)
+def _resolve_insights_scope(period, series, event_slugs, custom_start, custom_end, token):
+    """
+    Archived events in scope for the insights filters. Memoized on the filter
+    values + load token (renewed when the tab opens or Refresh is clicked), so
+    the section callbacks fired by one filter change share a single event
+    history fetch. The returned dict is shared - callers must not mutate it.
+    """
+    result: Dict[str, Any] = {
+        "period": period or "custom",
+        "empty_hint": "",
+        "summary_title": "Insights overview",
+        "series_options": [],
+        "selected_series": [],
+        "options": [],
+        "selected_event_slugs": [],
+        "selected_events": [],
+        "single_event_scope": False,
+        "selected_single_slug": "",
+        "scope": None,
+        "prev_events": [],
+        "prev_scope": None,
+    }
+
+    try:
+        history_fn = getattr(storage_api, "get_event_history_dashboard", None)
+        if history_fn:
+            events = history_fn() or []
+        else:
+            events = storage_api.get_event_history() or []
+    except Exception as e:
+        logger.exception(f"Failed to load insights data: {e}")
+        result["empty_hint"] = "Could not load insights. Try refreshing."
+        result["summary_title"] = "Insights unavailable"
+        return result
+
+    if not events:
+        result["empty_hint"] = (
+            "No archived events yet. Archive your first event to unlock insights."
+        )
+        return result
+
+    all_events = list(events)
+    selected_period = result["period"]
+    range_start, range_end = _insights_period_range(selected_period, custom_start, custom_end)
+
+    filtered_events = []
+    for ev in events:
+        ev_date = _as_date(ev.get("event_date"))
+        if selected_period == "all":
+            filtered_events.append(ev)
+            continue
+
+        # For ranged filters, include only events with parseable date in range.
+        if not ev_date:
+            continue
+        if range_start and ev_date < range_start:
+            continue
+        if range_end and ev_date > range_end:
+            continue
+        filtered_events.append(ev)
+
+    events = filtered_events
+
+    if not events:
+        result["empty_hint"] = (
+            f"No archived events in {INSIGHTS_EMPTY_PERIOD_LABELS.get(selected_period, 'selected period')}. "
+            "Try widening date range or clearing filters."
+        )
+        return result
+
+    # Build series options from events in current period.
+    series_values = sorted({_insights_series_key(ev) for ev in events if _insights_series_key(ev)})
+    selected_series = [s for s in (series or ()) if s in set(series_values)]
+    result["series_options"] = [{"label": s, "value": s} for s in series_values]
+    result["selected_series"] = selected_series
+
+    series_scoped_events = [
+        ev for ev in events if (not selected_series) or (_insights_series_key(ev) in selected_series)
+    ]
+
+    options = []
+    for ev in series_scoped_events:
+        slug = ev.get("event_slug")
+        if not slug:
+            continue
+        name = ev.get("event_display_name") or slug.replace("-", " ").title()
+        ev_date_str = ev.get("event_date") or ""
+        label = f"{name} ({ev_date_str})" if ev_date_str else name
+        options.append({"label": label, "value": slug})
+
+    if not options:
+        result["empty_hint"] = "No archived events yet"
+        return result
+
+    available_slugs = {o["value"] for o in options}
+    selected_event_slugs = [s for s in (event_slugs or ()) if s in available_slugs]
+    result["options"] = options
+
+    # Empty selection means "all events in selected period"
+    selected_events = [
+        ev
+        for ev in series_scoped_events
+        if (not selected_event_slugs) or ev.get("event_slug") in selected_event_slugs
+    ]
+    if not selected_events:
+        result["empty_hint"] = "No events selected"
+        return result
+
+    result["selected_event_slugs"] = selected_event_slugs
+    result["selected_events"] = selected_events
+    result["single_event_scope"] = len(selected_events) == 1
+    if result["single_event_scope"]:
+        result["selected_single_slug"] = str(selected_events[0].get("event_slug") or "")
+
+    end_date_iso = range_end.isoformat() if range_end else None
+    result["scope"] = {
+        "event_slugs": [ev.get("event_slug") for ev in selected_events if ev.get("event_slug")],
+        "start_date": range_start.isoformat() if range_start else None,
+        "end_date": end_date_iso,
+        "anchor_date": end_date_iso,
+    }
+
+    # Previous period (same length) for deltas; disabled for all-time and specific-event selection.
+    if selected_period != "all" and not selected_event_slugs and range_start and range_end:
+        period_days = (range_end - range_start).days + 1
+        prev_end = range_start - timedelta(days=1)
+        prev_start = prev_end - timedelta(days=period_days - 1)
+
+        prev_events = []
+        for ev in all_events:
+            ev_date = _as_date(ev.get("event_date"))
+            if not ev_date:
+                continue
+            if ev_date < prev_start or ev_date > prev_end:
+                continue
+            if selected_series and (_insights_series_key(ev) not in selected_series):
+                continue
+            prev_events.append(ev)
+
+        if prev_events:
+            result["prev_events"] = prev_events
+            result["prev_scope"] = {
+                "event_slugs": [ev.get("event_slug") for ev in prev_events if ev.get("event_slug")],
+                "start_date": prev_start.isoformat(),
+                "end_date": prev_end.isoformat(),
+                "anchor_date": prev_end.isoformat(),
+            }
+
+    if selected_event_slugs:
+        scope_label = f"{len(selected_events)} selected events"
+    elif selected_series:
+        scope_label = f"All events in {', '.join(selected_series)}"
+    else:
+        scope_label = "All events"
+    period_label = INSIGHTS_PERIOD_TITLES.get(selected_period, "Selected period")
+    result["summary_title"] = f"{scope_label} • {period_label}"
+    return result
+
+
+def insights_scope(scope_store) -> Optional[Dict[str, Any]]:
+    """Resolved insights scope for the insights-scope-store filters (None before first load)."""
+    if not scope_store:
+        return None
+    return _resolve_insights_scope(
+        scope_store.get("period"),
+        tuple(scope_store.get("series") or ()),
+        tuple(scope_store.get("event_slugs") or ()),
+        scope_store.get("start_date"),
+        scope_store.get("end_date"),
+        scope_store.get("token"),
+    )
+
+
+# ---------------------------------------------------------------------
+# Admin jobs - archive, reopen, recompute, integrity scan and Fetch Event
+# Data run as Dash background callbacks in a separate process, so the
+# request workers stay free. Every run is an admin_jobs row: at most one
+# running job per kind across workers and TOs (double-clicks included).
+# ---------------------------------------------------------------------
+ADMIN_JOB_CACHE_DIR = os.getenv("ADMIN_JOB_CACHE_DIR", "/tmp/fgc-admin-jobs")
+ADMIN_JOB_HEARTBEAT_SECONDS = 2.0
+
+# Status row prefix (layout.admin_job_status) -> admin_jobs kind
+ADMIN_JOB_KINDS = {
+    "archive": "archive_event",
+    "reopen": "reopen_event",
+    "recompute": "recompute_event_stats",
+    "integrity": "scan_event_integrity",
+    "fetch-event": "fetch_event_data",
+}
+
+
+class AdminJobBusy(Exception):
+    """Another admin job of the same kind is still running."""
+
+
+def _admin_job_manager():
+    """DiskcacheManager shared by all dashboard workers, or None without dash[diskcache]."""
+    try:
+        import diskcache  # type: ignore
+        from dash import DiskcacheManager
+
+        return DiskcacheManager(diskcache.Cache(ADMIN_JOB_CACHE_DIR))
+    except ImportError as e:
+        logger.warning(f"Background admin jobs unavailable, running them in request workers: {e}")
+        return None
+
+
+ADMIN_JOB_MANAGER = _admin_job_manager()
+
+
+def admin_job_callback(app, prefix: str, *dependencies, **kwargs):
+    """
+    app.callback for a long admin action; the callback takes set_progress first.
+
+    With a background manager it runs in a job process: progress text goes to
+    {prefix}-job-progress, {prefix}-job-cancel terminates it and the
+    {prefix}-job-status row is shown while it runs. Without one it runs in the
+    request worker as before (set_progress is a no-op).
+    """
+
+    def decorator(fn):
+        if ADMIN_JOB_MANAGER is None:
+
+            @wraps(fn)
+            def run_inline(*args):
+                return fn(lambda _progress: None, *args)
+
+            return app.callback(*dependencies, **kwargs)(run_inline)
+
+        @wraps(fn)
+        def run_job(set_progress, *args):
+            try:
+                return fn(set_progress, *args)
+            finally:
+                # The job process exits without atexit hooks: write queued audit entries now
+                flush_fn = getattr(storage_api, "flush_audit_log", None)
+                if flush_fn:
+                    flush_fn()
+
+        running = list(kwargs.pop("running", []))
+        running.append(
+            (
+                Output(f"{prefix}-job-status", "style"),
+                ADMIN_JOB_STATUS_VISIBLE,
+                ADMIN_JOB_STATUS_HIDDEN,
+            )
+        )
+        return app.callback(
+            *dependencies,
+            background=True,
+            manager=ADMIN_JOB_MANAGER,
+            progress=[Output(f"{prefix}-job-progress", "children")],
+            cancel=[Input(f"{prefix}-job-cancel", "n_clicks")],
+            running=running,
+            **kwargs,
+        )(run_job)
+
+    return decorator
+
+
+def run_admin_job(
+    set_progress, kind: str, label: str, action, *, event_slug: str = "", started_by: str = ""
+):
+    """
+    Run action() as a running admin_jobs row of kind and return its result.
+
+    Raises AdminJobBusy while another job of the kind runs. Elapsed time is
+    reported every ADMIN_JOB_HEARTBEAT_SECONDS (progress text + admin_jobs
+    heartbeat, so a killed job is failed after ADMIN_JOB_STALE_AFTER).
+    """
+    start_fn = getattr(storage_api, "start_admin_job", None)
+    if start_fn is None:
+        set_progress(f"⏳ {label}…")
+        return action()
+
+    job_id = uuid.uuid4().hex
+    progress = {"label": label, "started_by": started_by or "system"}
+    if not start_fn(kind, job_id, event_slug, progress):
+        current = storage_api.get_admin_job(kind=kind) or {}
+        other = (current.get("progress") or {}).get("started_by") or "another TO"
+        raise AdminJobBusy(f"{label} is already running (started by {other}).")
+
+    started = time.monotonic()
+    stop = threading.Event()
+
+    def heartbeat():
+        while not stop.wait(ADMIN_JOB_HEARTBEAT_SECONDS):
+            elapsed = int(time.monotonic() - started)
+            set_progress(f"⏳ {label}… {elapsed}s")
+            try:
+                storage_api.update_admin_job(job_id, {**progress, "elapsed_seconds": elapsed})
+            except Exception as e:
+                logger.warning(f"Could not store progress for admin job {job_id}: {e}")
+
+    set_progress(f"⏳ {label}…")
+    beat = threading.Thread(target=heartbeat, name=f"admin-job-{kind}", daemon=True)
+    beat.start()
+    state, error = "failed", ""
+    try:
+        result = action()
+        state = "done"
+        return result
+    except Exception as e:
+        error = str(e)
+        raise
+    finally:
+        stop.set()
+        beat.join()
+        final = {**progress, "elapsed_seconds": int(time.monotonic() - started)}
+        if error:
+            final["error"] = error
+        try:
+            storage_api.finish_admin_job(job_id, state, final)
+        except Exception as e:
+            logger.warning(f"Could not store result for admin job {job_id}: {e}")
+
+
 def register_callbacks(app):
     """
     Register all Dash callbacks for:
@@ -136,12 +1178,32 @@ def register_callbacks(app):
     """
 
     # ---------------------------------------------------------------------
-    # Live check-ins table update (with column filtering, search, and quick filters)
+    # Live check-ins table update (server-side paging, sorting and filtering)
     # ---------------------------------------------------------------------
+    # Triggers that mean the underlying rows may have changed; the coverage
+    # line, game filter options and duplicate warning are only recomputed
+    # for these (not for paging / sorting / filtering).
+    TABLE_RELOAD_TRIGGERS = {
+        None,
+        "event-dropdown",
+        "interval-refresh",
+        "btn-refresh",
+        "sse-trigger",
+    }
+    # Inputs that change the row set - jump back to the first page
+    TABLE_PAGE_RESET_TRIGGERS = {
+        "event-dropdown",
+        "active-filter",
+        "search-input",
+        "game-filter",
+        "requirements-store",
+    }
+
     @app.callback(
         Output("checkins-table", "data"),
         Output("checkins-table", "columns"),
-        Output("player-count", "children"),
+        Output("checkins-table", "page_count"),
+        Output("checkins-table", "page_current"),
         Output("active-event-coverage", "children"),
         Output("active-event-coverage-source", "children"),
         Output("game-filter", "options"),
@@ -156,7 +1218,10 @@ def register_callbacks(app):
         Input("active-filter", "data"),
         Input("search-input", "value"),
         Input("game-filter", "value"),
-        State("requirements-store", "data"),
+        Input("requirements-store", "data"),
+        Input("checkins-table", "page_current"),
+        Input("checkins-table", "sort_by"),
+        State("checkins-table", "page_size"),
     )
     def update_table(
         selected_slug,
@@ -168,20 +1233,22 @@ def register_callbacks(app):
         search_query,
         game_filter,
         requirements,
+        page_current,
+        sort_by,
+        page_size,
     ):
         """
-        Refresh the check-ins table when:
-        - user selects a different event slug
-        - the interval timer ticks
-        - visible columns change
-        - filter or search changes
+        Load the visible page of the check-ins table. Filtering, sorting and
+        paging run in SQL (get_checkins_page), so only one page of rows is
+        fetched and sent to the browser.
         """
         if not selected_slug:
             logger.info("No event slug selected – clearing table.")
             return (
                 [],
                 [{"name": "No event selected", "id": "info"}],
-                "Select an event",
+                0,
+                0,
                 "",
                 "",
                 [],
@@ -190,43 +1257,53 @@ def register_callbacks(app):
                 [],
             )
 
-        # Default columns if none specified
-        if not visible_columns:
-            visible_columns = [
-                "name",
-                "tag",
-                "telephone",
-                "member",
-                "startgg",
-                "is_guest",
-                "payment_valid",
-                "status",
-            ]
+        trigger = ctx.triggered_id
+        page_size = page_size or 20
+        if trigger in TABLE_PAGE_RESET_TRIGGERS or "checkins-table.sort_by" in ctx.triggered_prop_ids:
+            page = 0
+        else:
+            page = page_current or 0
 
-        # Hide columns for disabled requirements
+        # Default columns if none specified; hide columns for disabled requirements
         requirements = requirements or {}
-        if requirements.get("require_membership") is not True:
-            visible_columns = [c for c in visible_columns if c != "member"]
-        if requirements.get("require_payment") is not True:
-            visible_columns = [c for c in visible_columns if c != "payment_valid"]
-
-        # Handle special "__ALL__" value for debugging
-        is_all_events = selected_slug == "__ALL__"
-        logger.info(
-            f"Updating check-ins table for: {'ALL EVENTS' if is_all_events else selected_slug}"
-        )
+        visible_columns = resolve_table_columns(visible_columns, requirements)
+        filters = checkin_filters(active_filter, search_query, game_filter, requirements)
 
         try:
-            if is_all_events:
-                data = get_checkins(include_all=True) or []
+            result = load_checkins_page(selected_slug, filters, sort_by, page, page_size)
+            total = result.get("total") or 0
+            page_count = max((total + page_size - 1) // page_size, 1)
+            if not result.get("rows") and page >= page_count:
+                # Rows were removed under the current page - show the last one
+                page = page_count - 1
+                result = load_checkins_page(selected_slug, filters, sort_by, page, page_size)
+            rows = result.get("rows") or []
+
+            if trigger in TABLE_RELOAD_TRIGGERS:
+                event_total = (
+                    total
+                    if not filters
+                    else load_checkins_page(selected_slug, {}, None, 0, 1).get("total") or 0
+                )
+                coverage_text, coverage_source = event_coverage(selected_slug, event_total)
+                game_options = [
+                    {"label": shorten_game(g), "value": g} for g in load_checkin_games(selected_slug)
+                ]
+                warning_style, warning_text, warning_list = duplicate_warning(
+                    load_duplicate_checkins(selected_slug)
+                )
             else:
-                data = get_checkins(selected_slug) or []
-            if not isinstance(data, list) or not data:
+                event_total = None
+                coverage_text = coverage_source = game_options = no_update
+                warning_style = warning_text = warning_list = no_update
+
+            if event_total == 0:
                 logger.info(f"No check-ins found for slug: {selected_slug}")
                 return (
                     [],
                     [{"name": "No participants", "id": "info"}],
-                    "0 players",
+                    0,
+                    0,
                     "",
                     "",
                     [],
@@ -235,324 +1312,27 @@ def register_callbacks(app):
                     [],
                 )
 
-            df = pd.DataFrame(data)
-            total_count = len(df)
-            coverage_text = ""
-            coverage_source = ""
-
-            try:
-                settings = get_active_settings() or {}
-                active_slug = (settings.get("active_event_slug") or "").strip()
-                events_json = settings.get("events_json")
-                registered_players = 0
-                registered_slots = 0
-
-                snapshot_slug = ""
-                startgg_url = (settings.get("startgg_event_url") or "").strip()
-                if startgg_url:
-                    m = re.search(r"/tournament/([^/]+)", startgg_url)
-                    if m:
-                        snapshot_slug = (m.group(1) or "").strip()
-
-                # For active event: use live settings snapshot.
-                if selected_slug == active_slug:
-                    # Guard against stale/mismatched settings snapshot.
-                    snapshot_matches_selected = (not snapshot_slug) or (
-                        snapshot_slug == selected_slug
-                    )
-
-                    if snapshot_matches_selected:
-                        if isinstance(events_json, dict):
-                            registered_players = int(
-                                events_json.get("tournament_entrants_players") or 0
-                            )
-                            registered_slots = int(events_json.get("tournament_entrants") or 0)
-                        elif isinstance(
-                            settings.get("startgg_registered_count"), (int, float, str)
-                        ):
-                            registered_slots = int(settings.get("startgg_registered_count") or 0)
-
-                        if registered_players > 0:
-                            coverage_rate = (total_count / registered_players) * 100
-                            coverage_text = f"Coverage: {total_count}/{registered_players} players ({coverage_rate:.0f}%)"
-                            coverage_source = "Source: Active snapshot"
-                            if registered_slots and registered_slots != registered_players:
-                                coverage_text += f" | {registered_slots} event slots"
-                        elif registered_slots > 0:
-                            coverage_rate = (total_count / registered_slots) * 100
-                            coverage_text = f"Coverage (slots): {total_count}/{registered_slots} ({coverage_rate:.0f}%)"
-                            coverage_source = "Source: Active snapshot (slot fallback)"
-                    else:
-                        coverage_text = (
-                            "Coverage unavailable: Start.gg snapshot belongs to another event. "
-                            "Run Fetch Event Data for the selected event."
-                        )
-                        coverage_source = "Source: Guarded mismatch"
-
-                # For non-active/archived events: use event_stats by slug.
-                elif selected_slug and selected_slug != "__ALL__":
-                    history_fn = getattr(storage_api, "get_event_history_dashboard", None)
-                    if callable(history_fn):
-                        history_raw = history_fn() or []
-                        history_rows = history_raw if isinstance(history_raw, list) else []
-                        stat_row = next(
-                            (
-                                r
-                                for r in history_rows
-                                if (r.get("event_slug") or "") == selected_slug
-                            ),
-                            None,
-                        )
-                        if stat_row:
-                            checked_in = int(
-                                stat_row.get("checked_in_count")
-                                or stat_row.get("total_participants")
-                                or total_count
-                            )
-                            registered_players = int(
-                                stat_row.get("startgg_registered_players") or 0
-                            )
-                            registered_slots = int(stat_row.get("startgg_registered_count") or 0)
-
-                            if registered_players > 0:
-                                coverage_rate = (checked_in / registered_players) * 100
-                                coverage_text = f"Coverage: {checked_in}/{registered_players} players ({coverage_rate:.0f}%)"
-                                coverage_source = "Source: Archived stats"
-                                if registered_slots and registered_slots != registered_players:
-                                    coverage_text += f" | {registered_slots} event slots"
-                            elif registered_slots > 0:
-                                coverage_rate = (checked_in / registered_slots) * 100
-                                coverage_text = (
-                                    f"Coverage (slots): {checked_in}/{registered_slots} ({coverage_rate:.0f}%)"
-                                    " | player coverage unavailable for this archived snapshot"
-                                )
-                                coverage_source = "Source: Archived stats (slot fallback)"
-                            else:
-                                coverage_text = "Coverage unavailable for this archived event"
-                                coverage_source = "Source: Archived stats"
-            except Exception:
-                coverage_text = ""
-                coverage_source = ""
-
-            def _normalize_text(v):
-                if v is None:
-                    return ""
-                txt = str(v).strip().lower()
-                txt = re.sub(r"\s+", " ", txt)
-                return txt
-
-            def _normalize_phone(v):
-                if v is None:
-                    return ""
-                return re.sub(r"\D+", "", str(v))
-
-            # Duplicate warning: flag likely duplicates when at least 2 of 3 identity fields match.
-            duplicate_warning_style = {"display": "none"}
-            duplicate_warning_text = ""
-            duplicate_warning_list = []
-            identity_pairs = [
-                ("name", "tag", "name + tag"),
-                ("name", "telephone", "name + phone"),
-                ("tag", "telephone", "tag + phone"),
-            ]
-            duplicate_hits = {}
-
-            for col_a, col_b, reason in identity_pairs:
-                if col_a not in df.columns or col_b not in df.columns:
-                    continue
-
-                buckets = {}
-                for idx, row in df[[col_a, col_b]].iterrows():
-                    a_raw = row.get(col_a)
-                    b_raw = row.get(col_b)
-                    a = _normalize_phone(a_raw) if col_a == "telephone" else _normalize_text(a_raw)
-                    b = _normalize_phone(b_raw) if col_b == "telephone" else _normalize_text(b_raw)
-                    if not a or not b:
-                        continue
-                    buckets.setdefault((a, b), []).append(idx)
-
-                for idxs in buckets.values():
-                    if len(idxs) < 2:
-                        continue
-                    for idx in idxs:
-                        duplicate_hits.setdefault(idx, set()).add(reason)
-
-            if duplicate_hits:
-                flagged = df.loc[list(duplicate_hits.keys())]
-                preview_rows = []
-                for idx, row in flagged.head(4).iterrows():
-                    display_name = str(row.get("name") or "Unknown")
-                    display_tag = str(row.get("tag") or "-")
-                    reasons = ", ".join(sorted(duplicate_hits.get(idx, [])))
-                    preview_rows.append(html.Li(f"{display_name} ({display_tag}) – {reasons}"))
-                duplicate_warning_style = {
-                    "marginBottom": "0.75rem",
-                    "display": "block",
-                    "border": "1px solid rgba(245, 158, 11, 0.45)",
-                    "backgroundColor": "rgba(245, 158, 11, 0.08)",
-                    "borderRadius": "8px",
-                    "padding": "0.55rem 0.75rem",
-                }
-                duplicate_warning_text = (
-                    f"⚠ Possible duplicate participants detected ({len(flagged)})."
-                )
-                duplicate_warning_list = preview_rows
-
-            # Game name shortening map
-            GAME_SHORT_NAMES = {
-                "STREET FIGHTER 6 TOURNAMENT": "SF6",
-                "STREET FIGHTER 6": "SF6",
-                "TEKKEN 8 TOURNAMENT": "T8",
-                "TEKKEN 8": "T8",
-                "SMASH SINGLES": "SSBU",
-                "SUPER SMASH BROS": "SSBU",
-                "SUPER SMASH BROS ULTIMATE": "SSBU",
-            }
-
-            GAME_SHORT_PATTERNS = [
-                ("SUPER SMASH BROS", "SSBU"),
-                ("SMASH", "SSBU"),
-                ("TEKKEN 8", "T8"),
-                ("STREET FIGHTER 6", "SF6"),
-            ]
-
-            def shorten_game(name):
-                """Shorten game name using mapping, case-insensitive."""
-                if not name:
-                    return ""
-                normalized = str(name).upper().strip()
-                if normalized in GAME_SHORT_NAMES:
-                    return GAME_SHORT_NAMES[normalized]
-                for pattern, short in GAME_SHORT_PATTERNS:
-                    if pattern in normalized:
-                        return short
-                return name
-
-            # Extract unique games for filter dropdown (before shortening)
-            all_games = set()
-            if "tournament_games_registered" in df.columns:
-                for val in df["tournament_games_registered"]:
-                    if isinstance(val, list):
-                        for g in val:
-                            if g:
-                                all_games.add(shorten_game(g))
-                    elif val:
-                        all_games.add(shorten_game(val))
-            game_options = [{"label": g, "value": g} for g in sorted(all_games)]
-
-            # Format multi-select fields: shorten names + join with comma
-            if "tournament_games_registered" in df.columns:
-                df["tournament_games_registered"] = df["tournament_games_registered"].apply(
-                    lambda x: (
-                        ", ".join(shorten_game(g) for g in x)
-                        if isinstance(x, list)
-                        else shorten_game(x) if x else ""
-                    )
+            # Include record_id/row_version in data for updates and delta patching,
+            # but NOT in visible columns
+            if rows:
+                df, visible_cols = select_table_columns(
+                    format_checkins(pd.DataFrame(rows)), visible_columns
                 )
-
-            # Store original boolean values for filtering before converting to icons
-            for col in ["member", "startgg", "payment_valid", "is_guest"]:
-                if col in df.columns:
-                    df[f"_{col}_bool"] = df[col].apply(
-                        lambda x: x is True or str(x).lower() == "true"
-                    )
-
-            # Convert booleans to icons ✓/✗
-            for col in ["member", "startgg", "payment_valid", "is_guest"]:
-                if col in df.columns:
-                    df[col] = df[col].apply(
-                        lambda x: "✓" if x is True or str(x).lower() == "true" else "✗"
-                    )
-
-            # Apply quick filter
-            # If payment is not required, disable the no-payment filter behavior.
-            if active_filter == "no-payment" and requirements.get("require_payment") is not True:
-                active_filter = "all"
-
-            if active_filter == "pending":
-                df = df[df["status"] == "Pending"]
-            elif active_filter == "ready":
-                df = df[df["status"] == "Ready"]
-            elif active_filter == "no-payment":
-                if "_payment_valid_bool" in df.columns:
-                    df = df[df["_payment_valid_bool"] == False]
-
-            # Apply search filter (case-insensitive on name and tag)
-            if search_query:
-                search_lower = search_query.lower()
-                mask = pd.Series([False] * len(df), index=df.index)
-                if "name" in df.columns:
-                    mask = mask | df["name"].str.lower().str.contains(search_lower, na=False)
-                if "tag" in df.columns:
-                    mask = mask | df["tag"].str.lower().str.contains(search_lower, na=False)
-                df = df[mask]
-
-            # Apply game filter
-            if game_filter and "tournament_games_registered" in df.columns:
-                df = df[
-                    df["tournament_games_registered"].str.contains(
-                        game_filter, case=False, na=False
-                    )
-                ]
-
-            filtered_count = len(df)
-
-            # Drop helper columns before output
-            helper_cols = [c for c in df.columns if c.startswith("_")]
-            df = df.drop(columns=helper_cols, errors="ignore")
-
-            # Include record_id in data for delete/update operations, but NOT in visible columns
-            visible_cols = [c for c in visible_columns if c in df.columns]
-            # Keep record_id in data but filter it from column list
-            all_cols = ["record_id"] + visible_cols if "record_id" in df.columns else visible_cols
-            df_filtered = df[[c for c in all_cols if c in df.columns]]
-
-            # Column header display names (shorter/cleaner)
-            COLUMN_HEADERS = {
-                "name": "Name",
-                "tag": "Tag",
-                "status": "Status",
-                "payment_valid": "Payment",
-                "telephone": "Phone",
-                "member": "Member",
-                "startgg": "Start.gg",
-                "is_guest": "Guest",
-                "tournament_games_registered": "Games",
-                "email": "Email",
-                "UUID": "UUID",
-                "created": "Created",
-            }
-
-            # Create column definitions - exclude record_id from display
-            cols = []
-            for c in visible_cols:
-                if c in df_filtered.columns:
-                    header = COLUMN_HEADERS.get(c, str(c).replace("_", " ").title())
-                    col_def = {
-                        "name": header,
-                        "id": str(c),
-                        "reorderable": True,
-                        "editable": c
-                        in ["name", "tag", "telephone", "tournament_games_registered"],
-                    }
-                    cols.append(col_def)
-
-            # Player count text
-            if filtered_count == total_count:
-                count_text = f"{total_count} players"
+                data = df.to_dict("records")
             else:
-                count_text = f"{filtered_count} of {total_count} players"
+                visible_cols, data = visible_columns, []
 
             return (
-                df_filtered.to_dict("records"),
-                cols,
-                count_text,
+                data,
+                table_column_defs(visible_cols),
+                page_count,
+                page,
                 coverage_text,
                 coverage_source,
                 game_options,
-                duplicate_warning_style,
-                duplicate_warning_text,
-                duplicate_warning_list,
+                warning_style,
+                warning_text,
+                warning_list,
             )
 
         except Exception as e:
@@ -560,7 +1340,8 @@ def register_callbacks(app):
             return (
                 [],
                 [{"name": "Error fetching data", "id": "error"}],
-                "Error",
+                0,
+                0,
                 "",
                 "",
                 [],
@@ -569,29 +1350,187 @@ def register_callbacks(app):
                 [],
             )
 
+    # ---------------------------------------------------------------------
+    # Check-ins summary (player count, stat cards, Needs Attention) - one
+    # SQL aggregate instead of counting rows in the browser
+    # ---------------------------------------------------------------------
     @app.callback(
-        Output("duplicate-warning", "style", allow_duplicate=True),
-        Input("duplicate-warning-dismiss", "n_clicks"),
-        prevent_initial_call=True,
+        Output("checkins-summary-store", "data"),
+        Output("player-count", "children"),
+        Input("event-dropdown", "value"),
+        Input("interval-refresh", "n_intervals"),
+        Input("btn-refresh", "n_clicks"),
+        Input("sse-trigger", "data"),
+        Input("checkin-delta-applied", "data"),
+        Input("active-filter", "data"),
+        Input("search-input", "value"),
+        Input("game-filter", "value"),
+        Input("requirements-store", "data"),
     )
-    def dismiss_duplicate_warning(n_clicks):
-        if n_clicks:
-            return {"display": "none"}
-        return no_update
+    def update_checkins_summary(
+        selected_slug,
+        _interval,
+        _clicks,
+        _sse_trigger,
+        _delta_applied,
+        active_filter,
+        search_query,
+        game_filter,
+        requirements,
+    ):
+        if not selected_slug:
+            return {}, "Select an event"
+        filters = checkin_filters(active_filter, search_query, game_filter, requirements)
+        try:
+            summary = load_checkins_summary(selected_slug, filters, requirements)
+        except Exception as e:
+            logger.exception(f"Error summarizing check-ins for slug '{selected_slug}': {e}")
+            return {}, "Error"
+
+        total = summary.get("total") or 0
+        filtered = summary.get("filtered") or 0
+        if filtered == total:
+            count_text = f"{total} players"
+        else:
+            count_text = f"{filtered} of {total} players"
+        return summary, count_text
 
     # ---------------------------------------------------------------------
-    # Sync column visibility: dropdown (Settings) ↔ checklist (Manual Tools)
+    # SSE delta patching - apply row-level changes without a full reload
     # ---------------------------------------------------------------------
     @app.callback(
-        Output("visible-columns-store", "data"),
-        Output("column-visibility-dropdown", "value"),
-        Output("quick-column-toggle", "value"),
-        Input("column-visibility-dropdown", "value"),
-        Input("quick-column-toggle", "value"),
+        Output("checkins-table", "data", allow_duplicate=True),
+        Output("checkin-delta-applied", "data"),
+        Output("sse-trigger", "data"),
+        Input("checkin-delta-store", "data"),
+        State("checkin-delta-applied", "data"),
+        State("checkins-table", "data"),
+        State("sse-trigger", "data"),
+        State("event-dropdown", "value"),
+        State("visible-columns-store", "data"),
+        State("active-filter", "data"),
+        State("search-input", "value"),
+        State("game-filter", "value"),
+        State("requirements-store", "data"),
+        State("checkins-table", "sort_by"),
         prevent_initial_call=True,
     )
-    def update_column_visibility(dropdown_val, checklist_val):
-        """Keep both column selectors and the store in sync."""
+    def apply_checkin_delta(
+        delta_batch,
+        applied,
+        table_data,
+        sse_trigger,
+        selected_slug,
+        visible_columns,
+        active_filter,
+        search_query,
+        game_filter,
+        requirements,
+        sort_by,
+    ):
+        """
+        Patch checkins-table with `checkin_delta` SSE events (see assets/sse-client.js).
+
+        The client sends its recent deltas as {"stream", "since", "deltas": [...]},
+        where `since` is the seq covered by its last full refresh. Deltas already
+        applied (by seq) are skipped and rows older than the row_version in the
+        table are ignored, so resending is harmless. A gap in seq means events were
+        lost - bump sse-trigger to force a full update_table refresh instead.
+
+        The table only holds one page, so only updates to rows on that page
+        are patched in place, and only while no filter or sort is active
+        (the row could otherwise move or drop out of the page). Inserts,
+        deletes and filtered / sorted views reload the page from SQL.
+        """
+        if not delta_batch or not selected_slug:
+            return no_update, no_update, no_update
+
+        stream = delta_batch.get("stream")
+        deltas = sorted(delta_batch.get("deltas") or [], key=lambda d: d.get("seq") or 0)
+        if not deltas:
+            return no_update, no_update, no_update
+
+        applied = applied or {}
+        since = delta_batch.get("since") or 0
+        last_seq = applied.get("seq") or 0
+        if applied.get("stream") != stream or last_seq < since:
+            last_seq = since
+        pending = [d for d in deltas if (d.get("seq") or 0) > last_seq]
+        new_applied = {"stream": stream, "seq": deltas[-1].get("seq") or 0}
+        if new_applied == applied:
+            new_applied = no_update
+        if not pending:
+            return no_update, new_applied, no_update
+        if pending[0].get("seq") != last_seq + 1:
+            logger.info(f"SSE delta gap after seq {last_seq} - full table refresh")
+            return no_update, new_applied, (sse_trigger or 0) + 1
+
+        is_all_events = selected_slug == "__ALL__"
+        relevant = [
+            (delta.get("op"), r)
+            for delta in pending
+            for r in (delta.get("rows") or [])
+            if r.get("record_id") and (is_all_events or r.get("event_slug") == selected_slug)
+        ]
+        if not relevant:
+            return no_update, new_applied, no_update
+
+        filtered = bool(checkin_filters(active_filter, search_query, game_filter, requirements))
+        if (
+            not isinstance(table_data, list)
+            or not table_data
+            or filtered
+            or sort_by
+            or any(op != "update" for op, _ in relevant)
+        ):
+            return no_update, new_applied, (sse_trigger or 0) + 1
+
+        visible_columns = resolve_table_columns(visible_columns, requirements)
+        positions = {row.get("record_id"): idx for idx, row in enumerate(table_data)}
+        versions = {row.get("record_id"): row.get("row_version") for row in table_data}
+
+        rows = [r for _, r in relevant if r["record_id"] in positions]
+        if not rows:
+            return no_update, new_applied, no_update  # changes to rows on other pages
+
+        df, _ = select_table_columns(format_checkins(pd.DataFrame(rows)), visible_columns)
+        formatted = {row["record_id"]: row for row in df.to_dict("records")}
+
+        patch = Patch()
+        for r in rows:
+            rid = r["record_id"]
+            current = versions.get(rid)
+            incoming = r.get("row_version")
+            if current is not None and incoming is not None and incoming <= current:
+                continue  # table already has this (or a newer) version
+            versions[rid] = incoming
+            patch[positions[rid]] = formatted[rid]
+
+        return patch, new_applied, no_update
+
+    @app.callback(
+        Output("duplicate-warning", "style", allow_duplicate=True),
+        Input("duplicate-warning-dismiss", "n_clicks"),
+        prevent_initial_call=True,
+    )
+    def dismiss_duplicate_warning(n_clicks):
+        if n_clicks:
+            return {"display": "none"}
+        return no_update
+
+    # ---------------------------------------------------------------------
+    # Sync column visibility: dropdown (Settings) ↔ checklist (Manual Tools)
+    # ---------------------------------------------------------------------
+    @app.callback(
+        Output("visible-columns-store", "data"),
+        Output("column-visibility-dropdown", "value"),
+        Output("quick-column-toggle", "value"),
+        Input("column-visibility-dropdown", "value"),
+        Input("quick-column-toggle", "value"),
+        prevent_initial_call=True,
+    )
+    def update_column_visibility(dropdown_val, checklist_val):
+        """Keep both column selectors and the store in sync."""
         default = ["name", "tag", "telephone", "member", "startgg", "payment_valid", "status"]
         trigger = ctx.triggered_id
         if trigger == "quick-column-toggle":
@@ -602,9 +1541,21 @@ def register_callbacks(app):
             return val, no_update, val
 
     # ---------------------------------------------------------------------
-    # Quick filter buttons - update active filter store
+    # Quick filter buttons - update active filter store (clientside: no
+    # server round-trip just to record which card was clicked)
     # ---------------------------------------------------------------------
-    @app.callback(
+    app.clientside_callback(
+        """
+        function(_all, _pending, _ready, _noPayment, requirements) {
+            var triggered = dash_clientside.callback_context.triggered_id;
+            if (triggered === "filter-pending") { return "pending"; }
+            if (triggered === "filter-ready") { return "ready"; }
+            if (triggered === "filter-no-payment") {
+                return (requirements || {}).require_payment === true ? "no-payment" : "all";
+            }
+            return "all";
+        }
+        """,
         Output("active-filter", "data"),
         Input("filter-all", "n_clicks"),
         Input("filter-pending", "n_clicks"),
@@ -613,25 +1564,53 @@ def register_callbacks(app):
         State("requirements-store", "data"),
         prevent_initial_call=True,
     )
-    def update_active_filter(
-        all_clicks, pending_clicks, ready_clicks, no_payment_clicks, requirements
-    ):
-        """Update the active filter based on which button was clicked."""
-        triggered = ctx.triggered_id
-        if triggered == "filter-pending":
-            return "pending"
-        elif triggered == "filter-ready":
-            return "ready"
-        elif triggered == "filter-no-payment":
-            if (requirements or {}).get("require_payment") is not True:
-                return "all"
-            return "no-payment"
-        return "all"
 
     # ---------------------------------------------------------------------
-    # Update stat card styles based on active filter
+    # Update stat card styles based on active filter - highlight the active
+    # card (glow + lift + tinted surface); hide No Payment unless required
     # ---------------------------------------------------------------------
-    @app.callback(
+    app.clientside_callback(
+        """
+        function(activeFilter, requirements) {
+            var base = {
+                backgroundColor: "#12121a",
+                borderRadius: "12px",
+                border: "1px solid #1e293b",
+                padding: "1.25rem",
+                textAlign: "center",
+                flex: "1",
+                minWidth: "150px",
+                cursor: "pointer",
+                transition: "all 0.2s",
+                position: "relative"
+            };
+            var colors = {
+                "all": "#00d4ff",
+                "ready": "#10b981",
+                "pending": "#f59e0b",
+                "no-payment": "#ef4444"
+            };
+            var styles = {};
+            Object.keys(colors).forEach(function(key) {
+                var color = colors[key];
+                var style = Object.assign({}, base, {borderTop: "3px solid " + color});
+                if (activeFilter === key) {
+                    Object.assign(style, {
+                        transform: "translateY(-3px) scale(1.03)",
+                        boxShadow: "0 10px 26px " + color + "4d, 0 0 0 1px " + color + "4d",
+                        background: "linear-gradient(180deg, " + color + "24 0%, #12121a 55%)"
+                    });
+                } else {
+                    style.opacity = "0.95";
+                }
+                styles[key] = style;
+            });
+            if ((requirements || {}).require_payment !== true) {
+                styles["no-payment"].display = "none";
+            }
+            return [styles["all"], styles["ready"], styles["pending"], styles["no-payment"]];
+        }
+        """,
         Output("filter-all", "style"),
         Output("filter-ready", "style"),
         Output("filter-pending", "style"),
@@ -639,57 +1618,6 @@ def register_callbacks(app):
         Input("active-filter", "data"),
         Input("requirements-store", "data"),
     )
-    def update_stat_card_styles(active_filter, requirements):
-        """Highlight active stat card filter with stronger visual state."""
-        base_style = {
-            "backgroundColor": "#12121a",
-            "borderRadius": "12px",
-            "border": "1px solid #1e293b",
-            "padding": "1.25rem",
-            "textAlign": "center",
-            "flex": "1",
-            "minWidth": "150px",
-            "cursor": "pointer",
-            "transition": "all 0.2s",
-            "position": "relative",
-        }
-
-        # Define colors for each card
-        colors = {
-            "all": "#00d4ff",  # accent_blue
-            "ready": "#10b981",  # accent_green
-            "pending": "#f59e0b",  # accent_yellow
-            "no-payment": "#ef4444",  # accent_red
-        }
-
-        styles = {}
-        for key in ["all", "ready", "pending", "no-payment"]:
-            color = colors[key]
-            if active_filter == key:
-                # Active: stronger glow + lift + tinted surface
-                styles[key] = {
-                    **base_style,
-                    "borderTop": f"3px solid {color}",
-                    "border": "1px solid #1e293b",
-                    "transform": "translateY(-3px) scale(1.03)",
-                    "boxShadow": f"0 10px 26px {color}4d, 0 0 0 1px {color}4d",
-                    "background": f"linear-gradient(180deg, {color}24 0%, #12121a 55%)",
-                }
-            else:
-                # Inactive: original style, full brightness
-                styles[key] = {
-                    **base_style,
-                    "borderTop": f"3px solid {color}",
-                    "opacity": "0.95",
-                }
-
-        if (requirements or {}).get("require_payment") is not True:
-            styles["no-payment"] = {
-                **styles["no-payment"],
-                "display": "none",
-            }
-
-        return styles["all"], styles["ready"], styles["pending"], styles["no-payment"]
 
     @app.callback(
         Output("manual-checkin-panel", "style"),
@@ -802,6 +1730,7 @@ def register_callbacks(app):
                     "settings",
                     target_event=selected_slug,
                     details=json.dumps({"cleared_via": "manual_clear_button"}),
+                    durable=True,
                 )
             except Exception as e:
                 logger.warning(f"Failed to write audit log for clear current event: {e}")
@@ -834,7 +1763,9 @@ def register_callbacks(app):
     # ---------------------------------------------------------------------
     # Admin: Fetch event data from Start.gg and update settings
     # ---------------------------------------------------------------------
-    @app.callback(
+    @admin_job_callback(
+        app,
+        "fetch-event",
         Output("settings-output", "children"),
         Output("event-dropdown", "options"),
         Output("event-dropdown", "value"),
@@ -844,8 +1775,31 @@ def register_callbacks(app):
         State("input-mock-event-slug", "value"),
         State("input-mock-event-name", "value"),
         State("auth-store", "data"),
+        prevent_initial_call=True,
+        running=[
+            (Output("btn-fetch-event", "disabled"), True, False),
+            (Output("btn-use-mock-event", "disabled"), True, False),
+        ],
     )
-    def fetch_event_data(n_clicks, mock_clicks, link, mock_slug, mock_name, auth_state):
+    def fetch_event_data(
+        set_progress, n_clicks, mock_clicks, link, mock_slug, mock_name, auth_state
+    ):
+        if not n_clicks and not mock_clicks:
+            return no_update, no_update, no_update
+        try:
+            return run_admin_job(
+                set_progress,
+                ADMIN_JOB_KINDS["fetch-event"],
+                "Fetching event data",
+                lambda: _fetch_event_data(
+                    n_clicks, mock_clicks, link, mock_slug, mock_name, auth_state
+                ),
+                started_by=(auth_state or {}).get("user_name", ""),
+            )
+        except AdminJobBusy as e:
+            return f"⏳ {e}", no_update, no_update
+
+    def _fetch_event_data(n_clicks, mock_clicks, link, mock_slug, mock_name, auth_state):
         """
         Admin action:
         1) Extract tournament slug from Start.gg URL
@@ -1377,19 +2331,24 @@ def register_callbacks(app):
     @app.callback(
         Output("needs-attention-list", "children"),
         Output("needs-attention-count", "children"),
-        Input("checkins-table", "data"),
+        Input("checkins-summary-store", "data"),
         Input("requirements-store", "data"),  # Task 2.2: Respect requirements
     )
-    def update_needs_attention(table_data, requirements):
+    def update_needs_attention(summary, requirements):
         """
         Build a list of players who are missing ACTIVE requirements only.
         Shows what each player is missing with icons to help TOs prioritize assistance.
         Disabled requirements never appear in "Needs Attention" (Task 2.2).
+        Rows come from the check-ins summary (first NEEDS_ATTENTION_LIMIT of
+        the whole filtered event, not just the visible table page).
         """
         from dash import html
 
-        if not table_data:
+        summary = summary or {}
+        if not summary.get("filtered"):
             return html.P("No players checked in yet.", style={"color": "#888"}), "0"
+        table_data = summary.get("attention_rows") or []
+        attention_count = summary.get("attention") or 0
 
         # Get active requirements (only enabled when explicitly True)
         requirements = requirements or {}
@@ -1529,7 +2488,15 @@ def register_callbacks(app):
                 )
             )
 
-        return items, str(len(needs_help))
+        if attention_count > len(needs_help):
+            items.append(
+                html.P(
+                    f"+{attention_count - len(needs_help)} more",
+                    style={"color": "#888", "fontSize": "0.85rem", "margin": "0.25rem 0 0"},
+                )
+            )
+
+        return items, str(attention_count)
 
     # -------------------------------------------------------------------------
     # Toggle "Needs Attention" collapse state
@@ -1576,8 +2543,142 @@ def register_callbacks(app):
             return visible, hidden, hidden
 
     # -------------------------------------------------------------------------
-    # Insights - load archived event options + summary KPIs
+    # Page load - fill the static layout skeleton with per-user/per-event state
+    # -------------------------------------------------------------------------
+    @app.callback(
+        Output("auth-store", "data"),
+        Output("auth-ui", "children"),
+        Output("requirements-store", "data", allow_duplicate=True),
+        Output("event-dropdown", "options", allow_duplicate=True),
+        Output("event-dropdown", "value", allow_duplicate=True),
+        Output("visible-columns-store", "data", allow_duplicate=True),
+        Output("column-visibility-dropdown", "value", allow_duplicate=True),
+        Output("quick-column-toggle", "value", allow_duplicate=True),
+        Input("page-url", "pathname"),
+        prevent_initial_call="initial_duplicate",
+    )
+    def load_page_state(_pathname):
+        """
+        Per-user and per-event state for a freshly loaded page.
+        Session and settings come from the storage caches, so a warm page load
+        costs one query (the event slug list). The check-ins table follows via
+        update_table once event-dropdown has a value.
+        """
+        auth_state = get_auth_state()
+
+        try:
+            settings = get_active_settings() or {}
+        except Exception as e:
+            logger.exception(f"Failed to fetch settings: {e}")
+            settings = {}
+        active_slug = settings.get("active_event_slug") or None
+
+        try:
+            event_slugs = storage_api.get_all_event_slugs() or []
+        except Exception as e:
+            logger.exception(f"Failed to fetch event slugs: {e}")
+            event_slugs = []
+        if active_slug and active_slug not in event_slugs:
+            event_slugs = [active_slug] + event_slugs
+
+        selected_slug = active_slug if active_slug in event_slugs else None
+        if not selected_slug and event_slugs:
+            selected_slug = event_slugs[0]
+
+        requirements = requirements_from_settings(settings)
+        columns = default_visible_columns(requirements)
+        return (
+            auth_state,
+            build_auth_ui(auth_state),
+            requirements,
+            event_dropdown_options(
+                event_slugs, active_slug, settings.get("event_display_name", "")
+            ),
+            selected_slug,
+            columns,
+            columns,
+            columns,
+        )
+
+    @app.callback(
+        Output("column-visibility-dropdown", "options"),
+        Output("quick-column-toggle", "options"),
+        Input("requirements-store", "data"),
+        prevent_initial_call=True,
+    )
+    def update_column_options(requirements):
+        """Offer payment/member columns only while those requirements are enabled."""
+        return (
+            column_visibility_options(requirements),
+            column_visibility_options(requirements, compact=True),
+        )
+
+    # -------------------------------------------------------------------------
+    # Settings tab - load settings form values and archived events on first open
+    # -------------------------------------------------------------------------
+    @app.callback(
+        Output("settings-tab-loaded", "data"),
+        Output("offer-membership-toggle", "value"),
+        Output("input-price-per-game", "value"),
+        Output("input-swish-number", "value"),
+        Output("input-checkin-opened-at", "value", allow_duplicate=True),
+        Output("input-event-started-at", "value", allow_duplicate=True),
+        Output("input-event-ended-at", "value", allow_duplicate=True),
+        Output("reopen-event-selector", "options", allow_duplicate=True),
+        Output("delete-archive-event-dropdown", "options"),
+        Output("delete-archive-event-dropdown", "value"),
+        Input("tabs", "value"),
+        State("settings-tab-loaded", "data"),
+        prevent_initial_call=True,
+    )
+    def load_settings_tab(selected_tab, loaded):
+        """
+        Fill the Settings tab the first time it is opened. Later visits keep
+        whatever the TO has typed; saves and archive/reopen update their own
+        fields.
+        """
+        if selected_tab != "tab-settings" or loaded:
+            return (no_update,) * 10
+
+        try:
+            settings = get_active_settings() or {}
+        except Exception as e:
+            logger.exception(f"Failed to fetch settings: {e}")
+            settings = {}
+
+        try:
+            archived_events = storage_api.get_event_history() or []
+        except Exception as e:
+            logger.exception(f"Failed to fetch archived events: {e}")
+            archived_events = []
+
+        archived_slugs = sorted(
+            {
+                ev.get("event_slug")
+                for ev in archived_events
+                if isinstance(ev, dict) and ev.get("event_slug")
+            }
+        )
+        return (
+            True,
+            [True] if settings.get("offer_membership") is True else [],
+            settings.get("swish_expected_per_game", 25),
+            settings.get("swish_number", "123-456 78 90"),
+            format_datetime_local(settings.get("checkin_opened_at")),
+            format_datetime_local(settings.get("event_started_at")),
+            format_datetime_local(settings.get("event_ended_at")),
+            reopen_event_options(archived_events),
+            [{"label": s.replace("-", " ").title(), "value": s} for s in archived_slugs],
+            archived_slugs[0] if archived_slugs else None,
+        )
+
+    # -------------------------------------------------------------------------
+    # Insights - resolve the filter scope (archived event options + summary).
+    # The sections below read insights-scope-store and share the memoized
+    # scope resolution; each only runs while its sub-tab is visible.
     # -------------------------------------------------------------------------
+    INSIGHTS_RELOAD_TRIGGERS = {None, "tabs", "btn-insights-refresh"}
+
     @app.callback(
         Output("insights-series-dropdown", "options"),
         Output("insights-series-dropdown", "value"),
@@ -1585,6 +2686,85 @@ def register_callbacks(app):
         Output("insights-event-dropdown", "value"),
         Output("insights-summary-title", "children"),
         Output("insights-empty-hint", "children"),
+        Output("insights-scope-store", "data"),
+        Input("tabs", "value"),
+        Input("btn-insights-refresh", "n_clicks"),
+        Input("insights-event-dropdown", "value"),
+        Input("insights-period-dropdown", "value"),
+        Input("insights-series-dropdown", "value"),
+        Input("insights-date-start", "value"),
+        Input("insights-date-end", "value"),
+        State("insights-scope-store", "data"),
+    )
+    def update_insights_scope(
+        selected_tab,
+        _refresh_clicks,
+        selected_event_slugs,
+        selected_period,
+        selected_series,
+        custom_start_date,
+        custom_end_date,
+        scope_store,
+    ):
+        if selected_tab != "tab-insights":
+            return (no_update,) * 7
+
+        # New token = reload archived events; filter changes reuse the loaded ones
+        token = (scope_store or {}).get("token")
+        if token is None or ctx.triggered_id in INSIGHTS_RELOAD_TRIGGERS:
+            token = datetime.now(timezone.utc).timestamp()
+
+        store = {
+            "period": selected_period or "custom",
+            "series": list(selected_series or []),
+            "event_slugs": list(selected_event_slugs or []),
+            "start_date": custom_start_date,
+            "end_date": custom_end_date,
+            "token": token,
+        }
+        scope = insights_scope(store)
+        store["series"] = list(scope["selected_series"])
+        store["event_slugs"] = list(scope["selected_event_slugs"])
+
+        # Community-friendly heads-up text for no-show trend (non-alarm tone).
+        heads_up_text = scope["empty_hint"]
+        if scope["selected_events"]:
+            metrics = aggregate_insights_metrics(scope["selected_events"])
+            reg_total = metrics.get("startgg_registered_total", 0)
+            checked_in_total = metrics.get("checked_in_total", 0)
+            no_show_total = metrics.get("no_show_total", 0)
+            no_show_rate = metrics.get("no_show_rate", 0.0)
+            if reg_total > 0:
+                checked_rate = (checked_in_total / reg_total) * 100
+                heads_up_text = (
+                    f"Player coverage: {checked_in_total}/{reg_total} ({checked_rate:.0f}%)."
+                )
+                if reg_total >= 10:
+                    if no_show_rate >= 30:
+                        heads_up_text += (
+                            f" Heads-up: no-show is {no_show_rate:.0f}% "
+                            f"({no_show_total} of {reg_total} registered players) in this scope."
+                        )
+                    elif no_show_rate >= 15:
+                        heads_up_text += (
+                            f" Heads-up: no-show is {no_show_rate:.0f}% "
+                            f"({no_show_total} of {reg_total} players) in this scope."
+                        )
+
+        return (
+            scope["series_options"],
+            list(scope["selected_series"]),
+            scope["options"],
+            list(scope["selected_event_slugs"]),
+            scope["summary_title"],
+            heads_up_text,
+            store,
+        )
+
+    # -------------------------------------------------------------------------
+    # Insights - KPI cards (visible on every sub-tab)
+    # -------------------------------------------------------------------------
+    @app.callback(
         Output("insights-kpi-total", "children"),
         Output("insights-kpi-revenue", "children"),
         Output("insights-kpi-readyrate", "children"),
@@ -1600,21 +2780,7 @@ def register_callbacks(app):
         Output("insights-kpi-guestrate-delta", "children"),
         Output("insights-kpi-startggrate-delta", "children"),
         Output("insights-kpi-retention-delta", "children"),
-        Output("insights-top-game", "children"),
-        Output("insights-added-via-summary", "children"),
         Output("insights-ops-live-note", "children"),
-        Output("insights-top-players-title", "children"),
-        Output("insights-top-players-table", "data"),
-        Output("insights-player-funnel-note", "children"),
-        Output("insights-player-funnel", "children"),
-        Output("insights-games-title", "children"),
-        Output("insights-games-table", "data"),
-        Output("insights-game-mover", "children"),
-        Output("insights-games-trend", "figure"),
-        Output("insights-crossover-title", "children"),
-        Output("insights-crossover-table", "data"),
-        Output("insights-events-table", "data"),
-        Output("insights-earnings-table", "data"),
         Output("insights-kpi-slots", "children"),
         Output("insights-kpi-avggames", "children"),
         Output("insights-kpi-multigame", "children"),
@@ -1645,575 +2811,51 @@ def register_callbacks(app):
         Output("insights-summary-community-value", "children"),
         Output("insights-summary-tournament-value", "children"),
         Output("insights-summary-operations-value", "children"),
-        Input("tabs", "value"),
-        Input("btn-insights-refresh", "n_clicks"),
-        Input("insights-event-dropdown", "value"),
-        Input("insights-period-dropdown", "value"),
-        Input("insights-series-dropdown", "value"),
-        Input("insights-top-players-limit", "value"),
-        Input("insights-top-players-game-filter", "value"),
-        Input("insights-top-players-search", "value"),
-        Input("insights-date-start", "value"),
-        Input("insights-date-end", "value"),
+        Input("insights-scope-store", "data"),
     )
-    def update_insights(
-        selected_tab,
-        _refresh_clicks,
-        selected_event_slugs,
-        selected_period,
-        selected_series,
-        top_players_limit,
-        selected_player_game,
-        top_players_search,
-        custom_start_date,
-        custom_end_date,
-    ):
-        if selected_tab != "tab-insights":
-            return (no_update,) * 66
-
-        def _normalize_game_name(name: Any) -> str:
-            raw = str(name or "").strip()
-            if not raw:
-                return ""
-            key = raw.lower()
-            compact = re.sub(r"[^a-z0-9]+", "", key)
-
-            # SSBU canonicalization
-            if (
-                "ssbu" in key
-                or "super smash bros ultimate" in key
-                or key == "smash singles"
-                or ("smash" in key and "ultimate" in key)
-            ):
-                return "SSBU Singles"
-
-            # SF6 canonicalization
-            if (
-                compact in {"sf6", "streetfighter6", "streetfighter6tournament"}
-                or "street fighter 6" in key
-                or "sf6" == key
-            ):
-                return "STREET FIGHTER 6 TOURNAMENT"
-
-            # Tekken 8 canonicalization
-            if (
-                compact in {"t8", "tekken8", "tekken8tournament"}
-                or "tekken 8" in key
-                or "t8" == key
-            ):
-                return "TEKKEN 8 TOURNAMENT"
-
-            return raw
-
-        def _empty_response(hint: str = "", summary: str = "Insights overview"):
+    def update_insights_kpis(scope_store):
+        scope = insights_scope(scope_store)
+        if scope is None:
+            return (no_update,) * 46
+        if not scope["selected_events"]:
             return (
-                [],
-                [],
-                [],
-                [],
-                summary,
-                hint,
-                "0",
-                "0 kr",
-                "0%",
-                "0%",
-                "0%",
-                "0%",
-                "0%",
-                "",
-                "—",
-                "—",
-                "—",
-                "—",
-                "—",
-                "—",
-                "—",
-                "Game highlight: -",
-                "Added via: -",
-                "",
-                "Top attendees",
-                [],
-                "",
-                [],
-                "Game distribution",
-                [],
-                "",
-                {},
-                "",
-                [],
-                [],
-                [],
-                "0",
-                "0.0",
-                "0.0%",
-                "0",
-                "0",
-                "0.0%",
-                "0.0%",
-                "-",
-                "-",
-                "-",
-                "-",
-                "—",
-                "—",
-                "—",
-                "—",
-                "—",
-                "—",
-                "—",
-                "Live",
-                "Live",
-                "Live",
-                "Live",
-                "0",
-                "0.0",
-                "—",
-                "—",
-                "-",
-                "-",
-                "-",
-                "-",
+                ("0", "0 kr", "0%", "0%", "0%", "0%", "0%", "")
+                + ("—",) * 7
+                + ("", "0", "0.0", "0.0%", "0", "0", "0.0%", "0.0%", "-", "-", "-", "-")
+                + ("—",) * 7
+                + ("Live",) * 4
+                + ("0", "0.0", "—", "—")
+                + ("-",) * 4
             )
 
-        try:
-            history_fn = getattr(storage_api, "get_event_history_dashboard", None)
-            if history_fn:
-                events = history_fn() or []
-            else:
-                events = storage_api.get_event_history() or []
-        except Exception as e:
-            logger.exception(f"Failed to load insights data: {e}")
-            return _empty_response(
-                "Could not load insights. Try refreshing.", "Insights unavailable"
-            )
-
-        if not events:
-            return _empty_response(
-                "No archived events yet. Archive your first event to unlock insights."
-            )
-
-        try:
-            live_settings = get_active_settings() or {}
-        except Exception:
-            live_settings = {}
-
-        all_events = list(events)
-
-        selected_period = selected_period or "custom"
-
-        def _as_float(v):
-            try:
-                return float(v or 0)
-            except Exception:
-                return 0.0
-
-        def _as_int(v):
-            try:
-                return int(v or 0)
-            except Exception:
-                return 0
-
-        def _norm_text(value: Any) -> str:
-            txt = unicodedata.normalize("NFKD", str(value or ""))
-            txt = "".join(ch for ch in txt if not unicodedata.combining(ch))
-            txt = re.sub(r"[^a-z0-9]+", "", txt.lower())
-            return txt
-
-        def _as_date(v):
-            if not v:
-                return None
-            if isinstance(v, datetime):
-                return v.date()
-            if isinstance(v, date):
-                return v
-            txt = str(v).strip()
-            if not txt:
-                return None
-            txt = txt.split("T")[0]
-            try:
-                return datetime.fromisoformat(txt).date()
-            except Exception:
-                return None
-
-        today = datetime.now(timezone.utc).date()
-        range_start = None
-        range_end = None
-
-        if selected_period == "day":
-            range_start = today - timedelta(days=1)
-            range_end = today
-        elif selected_period == "week":
-            range_start = today - timedelta(days=7)
-            range_end = today
-        elif selected_period == "month":
-            range_start = today - timedelta(days=30)
-            range_end = today
-        elif selected_period == "quarter":
-            range_start = today - timedelta(days=90)
-            range_end = today
-        elif selected_period == "year":
-            range_start = today - timedelta(days=365)
-            range_end = today
-        elif selected_period == "custom":
-            range_start = _as_date(custom_start_date)
-            range_end = _as_date(custom_end_date)
-
-        filtered_events = []
-        for ev in events:
-            ev_date = _as_date(ev.get("event_date"))
-            if selected_period == "all":
-                filtered_events.append(ev)
-                continue
-
-            # For ranged filters, include only events with parseable date in range.
-            if not ev_date:
-                continue
-            if range_start and ev_date < range_start:
-                continue
-            if range_end and ev_date > range_end:
-                continue
-            filtered_events.append(ev)
-
-        events = filtered_events
-
-        if not events:
-            label_map = {
-                "day": "last 24h",
-                "week": "last 7 days",
-                "month": "last 30 days",
-                "quarter": "last 90 days",
-                "year": "last 365 days",
-                "custom": "selected range",
-                "all": "all time",
-            }
-            return _empty_response(
-                f"No archived events in {label_map.get(selected_period, 'selected period')}. Try widening date range or clearing filters.",
-            )
-
-        def _event_title(ev):
-            return (ev.get("event_display_name") or ev.get("event_slug") or "").strip()
-
-        def _series_key(ev):
-            title = _event_title(ev)
-            if not title:
-                return "Other"
-            # Remove trailing numbering patterns: "#12", "12", "- 12"
-            cleaned = re.sub(r"\s*[-#]?\s*\d+\s*$", "", title).strip(" -#")
-            return cleaned or title
-
-        selected_series = selected_series or []
-
-        # Build series options from events in current period.
-        series_values = sorted({_series_key(ev) for ev in events if _series_key(ev)})
-        series_options = [{"label": s, "value": s} for s in series_values]
-        selected_series = [s for s in selected_series if s in set(series_values)]
-
-        series_scoped_events = [
-            ev for ev in events if (not selected_series) or (_series_key(ev) in selected_series)
-        ]
-
-        options = []
-        for ev in series_scoped_events:
-            slug = ev.get("event_slug")
-            if not slug:
-                continue
-            name = ev.get("event_display_name") or slug.replace("-", " ").title()
-            ev_date_str = ev.get("event_date") or ""
-            label = f"{name} ({ev_date_str})" if ev_date_str else name
-            options.append({"label": label, "value": slug})
-
-        if not options:
-            empty = _empty_response("No archived events yet")
-            return (series_options, selected_series) + empty[2:]
-
-        available_slugs = {o["value"] for o in options}
-        selected_event_slugs = [s for s in (selected_event_slugs or []) if s in available_slugs]
-
-        # Empty selection means "all events in selected period"
-        selected_events = [
-            ev
-            for ev in series_scoped_events
-            if (not selected_event_slugs) or ev.get("event_slug") in selected_event_slugs
-        ]
-        scope_event_count = len(selected_events)
-        single_event_scope = scope_event_count == 1
-        selected_single_slug = (
-            str(selected_events[0].get("event_slug") or "") if single_event_scope else ""
-        )
-        active_event_slug = str(live_settings.get("active_event_slug") or "")
-        single_active_scope = single_event_scope and selected_single_slug == active_event_slug
-
-        def _aggregate_metrics(event_rows):
-            total = 0
-            total_revenue = 0.0
-            member_count = 0
-            guest_count = 0
-            startgg_count = 0
-            startgg_account_count = 0
-            ready_count = 0
-            weighted_retention_sum = 0.0
-            weighted_retention_den = 0
-            top_game_counts = {}
-            slots = 0
-            new_players = 0
-            returning_players = 0
-            startgg_registered_total = 0
-            checked_in_total = 0
-            no_show_total = 0
-
-            for ev in event_rows:
-                ev_total = _as_int(ev.get("total_participants") or ev.get("participants"))
-                total += ev_total
-                total_revenue += _as_float(ev.get("total_revenue"))
-                member_count += _as_int(ev.get("member_count"))
-                guest_count += _as_int(ev.get("guest_count"))
-                startgg_count += _as_int(ev.get("startgg_count"))
-                new_players += _as_int(ev.get("new_players"))
-                returning_players += _as_int(ev.get("returning_players"))
-                startgg_account_count += max(
-                    _as_int(ev.get("startgg_count")) - _as_int(ev.get("guest_count")),
-                    0,
-                )
-
-                status_breakdown = ev.get("status_breakdown")
-                if isinstance(status_breakdown, dict):
-                    ready_count += _as_int(status_breakdown.get("Ready"))
-
-                retention_val = _as_float(ev.get("retention_rate"))
-                if ev_total > 0:
-                    weighted_retention_sum += retention_val * ev_total
-                    weighted_retention_den += ev_total
-
-                breakdown = ev.get("games_breakdown")
-                if isinstance(breakdown, dict):
-                    for game, count in breakdown.items():
-                        cnt = _as_int(count)
-                        if cnt <= 0:
-                            continue
-                        top_game_counts[game] = top_game_counts.get(game, 0) + cnt
-                        slots += cnt
-
-                # No-show aggregation (prefer player count, fall back to slot count)
-                reg_players = _as_int(ev.get("startgg_registered_players"))
-                reg_slots = _as_int(ev.get("startgg_registered_count"))
-                startgg_registered_total += reg_players or reg_slots
-                checked_in_total += _as_int(ev.get("checked_in_count"))
-                no_show_total += _as_int(ev.get("no_show_count"))
-
-            no_show_rate_agg = (
-                (no_show_total / startgg_registered_total * 100)
-                if startgg_registered_total > 0
-                else 0.0
-            )
-
-            return {
-                "total": total,
-                "revenue": total_revenue,
-                "member_count": member_count,
-                "guest_count": guest_count,
-                "startgg_count": startgg_count,
-                "startgg_account_count": startgg_account_count,
-                "ready_count": ready_count,
-                "new_players": new_players,
-                "returning_players": returning_players,
-                "retention": (
-                    (weighted_retention_sum / weighted_retention_den)
-                    if weighted_retention_den > 0
-                    else 0.0
-                ),
-                "top_game_counts": top_game_counts,
-                "slots": slots,
-                "startgg_registered_total": startgg_registered_total,
-                "checked_in_total": checked_in_total,
-                "no_show_total": no_show_total,
-                "no_show_rate": no_show_rate_agg,
-            }
-
-        table_rows = []
-        earnings_rows = []
-        manual_by_event: Dict[str, Dict[str, Any]] = {}
-        added_via_breakdown: List[Dict[str, Any]] = []
-        acquisition_source_breakdown: List[Dict[str, Any]] = []
-
-        selected_scope_slugs = [
-            ev.get("event_slug") for ev in selected_events if ev.get("event_slug")
-        ]
-        start_date_iso = range_start.isoformat() if range_start else None
-        end_date_iso = range_end.isoformat() if range_end else None
-        multi_game_count = 0
-        core_players = 0
-        player_lifetime = 0.0
-
-        try:
-            manual_stats_fn = getattr(storage_api, "get_event_manual_add_stats", None)
-            if manual_stats_fn:
-                manual_by_event = (
-                    manual_stats_fn(
-                        event_slugs=selected_scope_slugs or None,
-                        start_date=start_date_iso,
-                        end_date=end_date_iso,
-                    )
-                    or {}
-                )
-        except Exception as e:
-            logger.warning(f"Failed to load manual check-in stats: {e}")
-
-        try:
-            added_via_fn = getattr(storage_api, "get_added_via_breakdown", None)
-            if added_via_fn:
-                added_via_breakdown = (
-                    added_via_fn(
-                        event_slugs=selected_scope_slugs or None,
-                        start_date=start_date_iso,
-                        end_date=end_date_iso,
-                    )
-                    or []
-                )
-        except Exception as e:
-            logger.warning(f"Failed to load added_via breakdown: {e}")
-
-        try:
-            acquisition_source_fn = getattr(storage_api, "get_acquisition_source_breakdown", None)
-            if acquisition_source_fn:
-                acquisition_source_breakdown = (
-                    acquisition_source_fn(
-                        event_slugs=selected_scope_slugs or None,
-                        start_date=start_date_iso,
-                        end_date=end_date_iso,
-                    )
-                    or []
-                )
-        except Exception as e:
-            logger.warning(f"Failed to load acquisition-source breakdown: {e}")
-
-        try:
-            multi_game_fn = getattr(storage_api, "get_multi_game_count", None)
-            if multi_game_fn:
-                multi_stats = (
-                    multi_game_fn(
-                        event_slugs=selected_scope_slugs or None,
-                        start_date=start_date_iso,
-                        end_date=end_date_iso,
-                    )
-                    or {}
-                )
-                multi_game_count = _as_int(multi_stats.get("multi_game_count"))
-        except Exception as e:
-            logger.warning(f"Failed to load multi-game stats: {e}")
-
-        try:
-            community_v2_fn = getattr(storage_api, "get_community_health_v2_stats", None)
-            if community_v2_fn:
-                community_v2 = (
-                    community_v2_fn(
-                        event_slugs=selected_scope_slugs or None,
-                        start_date=start_date_iso,
-                        end_date=end_date_iso,
-                        anchor_date=end_date_iso,
-                    )
-                    or {}
-                )
-                core_players = _as_int(community_v2.get("core_players"))
-                player_lifetime = _as_float(community_v2.get("player_lifetime"))
-        except Exception as e:
-            logger.warning(f"Failed to load community health v2 stats: {e}")
-
-        for ev in selected_events:
-            ev_total = _as_int(ev.get("total_participants") or ev.get("participants"))
-            ev_checked_in = _as_int(ev.get("checked_in_count"))
-            ev_registered = _as_int(ev.get("startgg_registered_players")) or _as_int(
-                ev.get("startgg_registered_count")
-            )
-            ev_member_rate = (
-                (_as_int(ev.get("member_count")) / ev_total * 100) if ev_total > 0 else 0.0
-            )
-            ev_startgg_rate = (
-                (
-                    max(_as_int(ev.get("startgg_count")) - _as_int(ev.get("guest_count")), 0)
-                    / ev_total
-                    * 100
-                )
-                if ev_total > 0
-                else 0.0
-            )
-            ev_revenue = _as_float(ev.get("total_revenue"))
-            revenue_per_player = (ev_revenue / ev_total) if ev_total > 0 else 0.0
-            ev_no_show = _as_int(ev.get("no_show_count"))
-            ev_no_show_rate = _as_float(ev.get("no_show_rate"))
-            ev_slug = ev.get("event_slug", "")
-            manual_stats = manual_by_event.get(ev_slug, {}) if ev_slug else {}
-            manual_count = _as_int(manual_stats.get("manual_count"))
-            manual_pct = _as_float(manual_stats.get("manual_pct"))
-
-            checked_in_rate = (ev_checked_in / ev_registered * 100) if ev_registered > 0 else 0.0
-            retention_rate = _as_float(ev.get("retention_rate"))
-
-            # Local-event friendly no-show scoring (10-30 players, 1-3 no-shows is normal)
-            if ev_no_show_rate <= 10:
-                no_show_score = 100.0
-            elif ev_no_show_rate <= 20:
-                no_show_score = 100.0 - ((ev_no_show_rate - 10.0) * 2.5)  # 100 -> 75
-            elif ev_no_show_rate <= 30:
-                no_show_score = 75.0 - ((ev_no_show_rate - 20.0) * 2.0)  # 75 -> 55
-            elif ev_no_show_rate <= 40:
-                no_show_score = 55.0 - ((ev_no_show_rate - 30.0) * 2.0)  # 55 -> 35
-            else:
-                no_show_score = max(0.0, 35.0 - ((ev_no_show_rate - 40.0) * 1.5))
-
-            manual_score = max(0.0, min(100.0, 100.0 - (manual_pct * 2.0)))
-            event_quality_score = (
-                0.30 * no_show_score
-                + 0.30 * checked_in_rate
-                + 0.20 * retention_rate
-                + 0.20 * manual_score
-            )
-            if event_quality_score >= 80:
-                quality_level, quality_rank = "Healthy", "4/4"
-            elif event_quality_score >= 65:
-                quality_level, quality_rank = "Stable", "3/4"
-            elif event_quality_score >= 45:
-                quality_level, quality_rank = "Watch", "2/4"
-            else:
-                quality_level, quality_rank = "Critical", "1/4"
-
-            table_rows.append(
-                {
-                    "event_display_name": ev.get("event_display_name") or ev.get("event_slug", ""),
-                    "event_slug": ev_slug,
-                    "event_date": ev.get("event_date") or "",
-                    "total_participants": ev_total,
-                    "no_show_rate": round(ev_no_show_rate, 1),
-                    "no_show_count": ev_no_show,
-                    "event_quality": f"{quality_level} [{quality_rank}] ({event_quality_score:.0f})",
-                    "checked_in_vs_registered": (
-                        f"{ev_checked_in}/{ev_registered}"
-                        if ev_registered > 0
-                        else "-"
-                    ),
-                    "top_game": _normalize_game_name(ev.get("most_popular_game")) or "-",
-                    "total_revenue": f"{ev_revenue:.0f} kr",
-                    "member_rate": f"{ev_member_rate:.0f}%",
-                    "startgg_rate": f"{ev_startgg_rate:.0f}%",
-                    "retention_rate": f"{retention_rate:.0f}%",
-                    "manual_count": manual_count,
-                    "manual_share": f"{manual_pct:.0f}%" if ev_total > 0 else "-",
-                }
-            )
-            earnings_rows.append(
-                {
-                    "event_display_name": ev.get("event_display_name") or ev.get("event_slug", ""),
-                    "event_date": ev.get("event_date") or "",
-                    "total_participants": ev_total,
-                    "total_revenue": f"{ev_revenue:.0f} kr",
-                    "revenue_per_player": f"{revenue_per_player:.0f} kr",
-                }
-            )
+        try:
+            live_settings = get_active_settings() or {}
+        except Exception:
+            live_settings = {}
 
-        if not selected_events:
-            empty = _empty_response("No events selected")
-            return (series_options, selected_series, options, []) + empty[4:]
+        single_event_scope = scope["single_event_scope"]
+        active_event_slug = str(live_settings.get("active_event_slug") or "")
+        single_active_scope = (
+            single_event_scope and scope["selected_single_slug"] == active_event_slug
+        )
 
-        metrics = _aggregate_metrics(selected_events)
+        # Every archive-backed KPI for both periods in one round-trip
+        bundle = insights_bundle(
+            scope["scope"], scope["prev_scope"], sections=INSIGHTS_KPI_SECTIONS
+        )
+        insights = bundle.get("current") or {}
+        prev_insights = bundle.get("previous")
+
+        manual_by_event = insights.get("manual_by_event") or {}
+        multi_game_count = _as_int((insights.get("multi_game") or {}).get("multi_game_count"))
+        community_v2 = insights.get("community_health") or {}
+        core_players = _as_int(community_v2.get("core_players"))
+        player_lifetime = _as_float(community_v2.get("player_lifetime"))
+
+        metrics = aggregate_insights_metrics(scope["selected_events"])
+        prev_metrics = (
+            aggregate_insights_metrics(scope["prev_events"]) if scope["prev_events"] else None
+        )
 
         ready_rate = (
             (metrics["ready_count"] / metrics["total"] * 100) if metrics["total"] > 0 else 0.0
@@ -2242,150 +2884,31 @@ def register_callbacks(app):
             (manual_total_manual / manual_total_count * 100) if manual_total_count > 0 else 0.0
         )
 
-        if metrics["top_game_counts"]:
-            top_game = max(metrics["top_game_counts"], key=metrics["top_game_counts"].get)
-            top_game_text = f"Game highlight: {top_game}"
-        else:
-            top_game_text = ""
-
-        def _fmt_delta(curr, prev, unit="count"):
-            if prev is None:
-                return "—"
-            diff = curr - prev
-            if diff > 0:
-                arrow = "↑"
-            elif diff < 0:
-                arrow = "↓"
-            else:
-                arrow = "→"
-
-            if unit == "kr":
-                return f"{arrow} {diff:+.0f} kr vs prev"
-            if unit == "pp":
-                return f"{arrow} {diff:+.1f} pp vs prev"
-            if unit == "count1":
-                return f"{arrow} {diff:+.1f} vs prev"
-            return f"{arrow} {int(diff):+d} vs prev"
-
-        # Delta against previous period (same length), disabled for all-time and specific-event selection.
-        prev_metrics = None
-        prev_start = None
-        prev_end = None
+        # Delta against previous period (scope computed above)
         prev_multi_game_count = None
         prev_manual_share = None
         prev_core_players = None
         prev_player_lifetime = None
         prev_unique_count = None
         prev_churn_rate = None
-        if selected_period != "all" and not selected_event_slugs and range_start and range_end:
-            period_days = (range_end - range_start).days + 1
-            prev_end = range_start - timedelta(days=1)
-            prev_start = prev_end - timedelta(days=period_days - 1)
-
-            prev_events = []
-            for ev in all_events:
-                ev_date = _as_date(ev.get("event_date"))
-                if not ev_date:
-                    continue
-                if ev_date < prev_start or ev_date > prev_end:
-                    continue
-                if selected_series and (_series_key(ev) not in selected_series):
-                    continue
-                prev_events.append(ev)
-
-            if prev_events:
-                prev_metrics = _aggregate_metrics(prev_events)
-                prev_scope_slugs = [
-                    ev.get("event_slug") for ev in prev_events if ev.get("event_slug")
-                ]
-                prev_start_iso = prev_start.isoformat() if prev_start else None
-                prev_end_iso = prev_end.isoformat() if prev_end else None
-
-                try:
-                    prev_multi_game_fn = getattr(storage_api, "get_multi_game_count", None)
-                    if prev_multi_game_fn:
-                        prev_multi_stats = (
-                            prev_multi_game_fn(
-                                event_slugs=prev_scope_slugs or None,
-                                start_date=prev_start_iso,
-                                end_date=prev_end_iso,
-                            )
-                            or {}
-                        )
-                        prev_multi_game_count = _as_int(prev_multi_stats.get("multi_game_count"))
-                except Exception as e:
-                    logger.warning(f"Failed to load previous multi-game stats: {e}")
-
-                try:
-                    prev_manual_fn = getattr(storage_api, "get_event_manual_add_stats", None)
-                    if prev_manual_fn:
-                        prev_manual_stats = (
-                            prev_manual_fn(
-                                event_slugs=prev_scope_slugs or None,
-                                start_date=prev_start_iso,
-                                end_date=prev_end_iso,
-                            )
-                            or {}
-                        )
-                        prev_total_count = sum(
-                            _as_int(v.get("total_count")) for v in prev_manual_stats.values()
-                        )
-                        prev_total_manual = sum(
-                            _as_int(v.get("manual_count")) for v in prev_manual_stats.values()
-                        )
-                        prev_manual_share = (
-                            (prev_total_manual / prev_total_count * 100)
-                            if prev_total_count > 0
-                            else None
-                        )
-                except Exception as e:
-                    logger.warning(f"Failed to load previous manual-share stats: {e}")
+        if prev_insights is not None:
+            prev_multi_game_count = _as_int(
+                (prev_insights.get("multi_game") or {}).get("multi_game_count")
+            )
 
-                try:
-                    prev_community_v2_fn = getattr(
-                        storage_api, "get_community_health_v2_stats", None
-                    )
-                    if prev_community_v2_fn:
-                        prev_community_v2 = (
-                            prev_community_v2_fn(
-                                event_slugs=prev_scope_slugs or None,
-                                start_date=prev_start_iso,
-                                end_date=prev_end_iso,
-                                anchor_date=prev_end_iso,
-                            )
-                            or {}
-                        )
-                        prev_core_players = _as_int(prev_community_v2.get("core_players"))
-                        prev_player_lifetime = _as_float(prev_community_v2.get("player_lifetime"))
-                except Exception as e:
-                    logger.warning(f"Failed to load previous community-v2 stats: {e}")
+            prev_manual_stats = prev_insights.get("manual_by_event") or {}
+            prev_total_count = sum(_as_int(v.get("total_count")) for v in prev_manual_stats.values())
+            prev_total_manual = sum(_as_int(v.get("manual_count")) for v in prev_manual_stats.values())
+            prev_manual_share = (
+                (prev_total_manual / prev_total_count * 100) if prev_total_count > 0 else None
+            )
 
-                try:
-                    prev_unique_fn = getattr(storage_api, "get_unique_attendee_count", None)
-                    if prev_unique_fn:
-                        prev_unique_count = prev_unique_fn(
-                            event_slugs=prev_scope_slugs or None,
-                            start_date=prev_start_iso,
-                            end_date=prev_end_iso,
-                        )
-                except Exception as e:
-                    logger.warning(f"Failed to load previous unique attendee count: {e}")
+            prev_community_v2 = prev_insights.get("community_health") or {}
+            prev_core_players = _as_int(prev_community_v2.get("core_players"))
+            prev_player_lifetime = _as_float(prev_community_v2.get("player_lifetime"))
 
-                try:
-                    prev_churn_fn = getattr(storage_api, "get_player_churn_stats", None)
-                    if prev_churn_fn:
-                        prev_churn_stats = (
-                            prev_churn_fn(
-                                event_slugs=prev_scope_slugs or None,
-                                start_date=prev_start_iso,
-                                end_date=prev_end_iso,
-                                anchor_date=prev_end_iso,
-                            )
-                            or {}
-                        )
-                        prev_churn_rate = _as_float(prev_churn_stats.get("churn_rate"))
-                except Exception as e:
-                    logger.warning(f"Failed to load previous churn stats: {e}")
+            prev_unique_count = prev_insights.get("unique_count")
+            prev_churn_rate = _as_float((prev_insights.get("churn") or {}).get("churn_rate"))
 
         total_delta = _fmt_delta(
             metrics["total"], prev_metrics["total"] if prev_metrics else None, "count"
@@ -2480,101 +3003,6 @@ def register_callbacks(app):
         if not single_active_scope:
             summary_operations += " (ops timing cards need active single-event scope)"
 
-        period_label = {
-            "day": "Last 24h",
-            "week": "Last 7 days",
-            "month": "Last 30 days",
-            "quarter": "Last 90 days",
-            "year": "Last 365 days",
-            "custom": "Year to date",
-            "all": "All time",
-        }.get(selected_period, "Selected period")
-
-        if selected_event_slugs:
-            scope_label = f"{len(selected_events)} selected events"
-        elif selected_series:
-            scope_label = f"All events in {', '.join(selected_series)}"
-        else:
-            scope_label = "All events"
-        summary_title = f"{scope_label} • {period_label}"
-
-        # Community-friendly heads-up text for no-show trend (non-alarm tone).
-        heads_up_text = ""
-        reg_total = metrics.get("startgg_registered_total", 0)
-        checked_in_total = metrics.get("checked_in_total", 0)
-        no_show_total = metrics.get("no_show_total", 0)
-        no_show_rate = metrics.get("no_show_rate", 0.0)
-        if reg_total > 0:
-            checked_rate = (checked_in_total / reg_total) * 100
-            heads_up_text = (
-                f"Player coverage: {checked_in_total}/{reg_total} ({checked_rate:.0f}%)."
-            )
-            if reg_total >= 10:
-                if no_show_rate >= 30:
-                    heads_up_text += (
-                        f" Heads-up: no-show is {no_show_rate:.0f}% "
-                        f"({no_show_total} of {reg_total} registered players) in this scope."
-                    )
-                elif no_show_rate >= 15:
-                    heads_up_text += (
-                        f" Heads-up: no-show is {no_show_rate:.0f}% "
-                        f"({no_show_total} of {reg_total} players) in this scope."
-                    )
-
-        # Added-via source summary for selected scope (archive)
-        if added_via_breakdown:
-            chunks = []
-            for row in added_via_breakdown[:3]:
-                source = str(row.get("source") or "unknown")
-                share = _as_float(row.get("share"))
-                chunks.append(f"{source}: {share:.0f}%")
-            added_via_summary = "Added via: " + " | ".join(chunks)
-        else:
-            added_via_summary = "Added via: -"
-
-        if acquisition_source_breakdown:
-            total_source_count = sum(int(r.get("count") or 0) for r in acquisition_source_breakdown)
-            unknown_source_count = sum(
-                int(r.get("count") or 0)
-                for r in acquisition_source_breakdown
-                if str(r.get("source") or "").strip().lower() == "unknown"
-            )
-            known_rows = [
-                r
-                for r in acquisition_source_breakdown
-                if str(r.get("source") or "").strip().lower() != "unknown"
-            ]
-            known_total = max(total_source_count - unknown_source_count, 0)
-
-            if known_total > 0 and known_rows:
-                known_rows_sorted = sorted(
-                    known_rows,
-                    key=lambda r: int(r.get("count") or 0),
-                    reverse=True,
-                )
-                known_chunks = []
-                for row in known_rows_sorted[:3]:
-                    source = str(row.get("source") or "other")
-                    count = int(row.get("count") or 0)
-                    share_known = (count / known_total) * 100.0 if known_total > 0 else 0.0
-                    known_chunks.append(f"{source}: {share_known:.0f}%")
-                acquisition_summary = "Acq known: " + " | ".join(known_chunks)
-            else:
-                source_chunks = []
-                for row in acquisition_source_breakdown[:3]:
-                    source = str(row.get("source") or "unknown")
-                    share = _as_float(row.get("share"))
-                    source_chunks.append(f"{source}: {share:.0f}%")
-                acquisition_summary = "Acq: " + " | ".join(source_chunks)
-
-            if total_source_count > 0 and unknown_source_count > 0:
-                unknown_share = (unknown_source_count / total_source_count) * 100.0
-                acquisition_summary += f" • missing: {unknown_share:.0f}%"
-                if unknown_share >= 40:
-                    acquisition_summary += " (legacy)"
-
-            added_via_summary = f"{added_via_summary} • {acquisition_summary}"
-
         ops_live_note = ""
         checkin_speed_value = "-"
         duration_value = "-"
@@ -2619,32 +3047,119 @@ def register_callbacks(app):
             checkin_speed_delta = "N/A (single-event metric)"
             duration_delta = "N/A (single-event metric)"
 
-        # Top attendees leaderboard for selected scope
+        # Unique attendee count (distinct player_uuid) for selected scope
+        unique_count = _as_int(insights.get("unique_count"))
+        unique_text = f"{unique_count} unique attendees" if unique_count > 0 else ""
+
+        growth_rate = None
+        if prev_unique_count is not None and prev_unique_count > 0:
+            growth_rate = ((unique_count - prev_unique_count) / prev_unique_count) * 100.0
+        growth_value = f"{growth_rate:.1f}%" if growth_rate is not None else "-"
+        growth_delta = (
+            f"From prev uniques: {prev_unique_count}" if prev_unique_count is not None else "Live"
+        )
+        if single_event_scope:
+            growth_value = "-"
+            growth_delta = "N/A (multi-event trend)"
+
+        churn_rate = _as_float((insights.get("churn") or {}).get("churn_rate"))
+        churn_value = f"{churn_rate:.1f}%"
+        churn_delta = _fmt_delta(churn_rate, prev_churn_rate, "pp")
+        if single_event_scope:
+            churn_value = "-"
+            churn_delta = "N/A (multi-event trend)"
+
+        return (
+            str(metrics["total"]),
+            f"{metrics['revenue']:.0f} kr",
+            f"{ready_rate:.0f}%",
+            f"{member_rate:.0f}%",
+            f"{guest_rate:.0f}%",
+            f"{startgg_rate:.0f}%",
+            f"{retention:.0f}%",
+            unique_text,
+            total_delta,
+            revenue_delta,
+            ready_delta,
+            member_delta,
+            guest_delta,
+            startgg_delta,
+            retention_delta,
+            ops_live_note,
+            str(slots),
+            f"{avg_games:.1f}",
+            f"{multigame_pct:.1f}%",
+            str(new_players),
+            str(returning_players),
+            f"{noshow_rate:.1f}%",
+            f"{manual_share:.1f}%",
+            checkin_speed_value,
+            duration_value,
+            growth_value,
+            churn_value,
+            slots_delta,
+            avggames_delta,
+            multigame_delta,
+            new_delta,
+            returning_delta,
+            noshow_delta,
+            manual_delta,
+            checkin_speed_delta,
+            duration_delta,
+            growth_delta,
+            churn_delta,
+            str(core_players),
+            f"{player_lifetime:.1f}",
+            coreplayers_delta,
+            lifetime_delta,
+            summary_core,
+            summary_community,
+            summary_tournament,
+            summary_operations,
+        )
+
+    # -------------------------------------------------------------------------
+    # Insights - top attendees leaderboard (Players sub-tab)
+    # -------------------------------------------------------------------------
+    @app.callback(
+        Output("insights-top-players-title", "children"),
+        Output("insights-top-players-table", "data"),
+        Input("insights-scope-store", "data"),
+        Input("insights-subtabs", "value"),
+        Input("insights-top-players-limit", "value"),
+        Input("insights-top-players-game-filter", "value"),
+        Input("insights-top-players-search", "value"),
+    )
+    def update_insights_top_players(
+        scope_store, subtab, top_players_limit, selected_player_game, top_players_search
+    ):
+        scope = insights_scope(scope_store)
+        if scope is None or subtab != "players":
+            return no_update, no_update
+        if not scope["selected_events"]:
+            return "Top attendees", []
+
+        search_query = _norm_text(top_players_search)
+        if top_players_limit == "all":
+            players_limit = 10000
+        else:
+            players_limit = _as_int(top_players_limit) or 15
+        selected_player_game = str(selected_player_game or "all").strip() or "all"
+
         top_players_rows = []
         top_players_title = "Top attendees"
-        funnel_note = ""
-        funnel_cards: List[Any] = []
         try:
-            top_players_fn = getattr(storage_api, "get_top_players_history", None)
-            if top_players_fn:
-                search_query = _norm_text(top_players_search)
-                if top_players_limit == "all":
-                    players_limit = 10000
-                else:
-                    players_limit = _as_int(top_players_limit) or 15
-                fetch_limit = 10000 if search_query else players_limit
-                selected_player_game = str(selected_player_game or "all").strip() or "all"
-                game_filter = None if selected_player_game == "all" else selected_player_game
-                top_players_rows = (
-                    top_players_fn(
-                        event_slugs=selected_scope_slugs,
-                        start_date=range_start.isoformat() if range_start else None,
-                        end_date=range_end.isoformat() if range_end else None,
-                        limit=fetch_limit,
-                        game_filter=game_filter,
-                    )
-                    or []
-                )
+            insights = (
+                insights_bundle(
+                    scope["scope"],
+                    sections=("top_players",),
+                    top_players_limit=10000 if search_query else players_limit,
+                    top_players_game=None if selected_player_game == "all" else selected_player_game,
+                ).get("current")
+                or {}
+            )
+            if "top_players" in insights:
+                top_players_rows = insights.get("top_players") or []
 
                 if search_query:
                     filtered_rows = []
@@ -2670,18 +3185,32 @@ def register_callbacks(app):
         except Exception as e:
             logger.warning(f"Failed to load top players leaderboard: {e}")
 
+        return top_players_title, top_players_rows
+
+    # -------------------------------------------------------------------------
+    # Insights - player funnel (Players sub-tab)
+    # -------------------------------------------------------------------------
+    @app.callback(
+        Output("insights-player-funnel-note", "children"),
+        Output("insights-player-funnel", "children"),
+        Input("insights-scope-store", "data"),
+        Input("insights-subtabs", "value"),
+    )
+    def update_insights_funnel(scope_store, subtab):
+        scope = insights_scope(scope_store)
+        if scope is None or subtab != "players":
+            return no_update, no_update
+        if not scope["selected_events"]:
+            return "", []
+        if scope["single_event_scope"]:
+            return "Funnel v2 visas i period/series-scope (inte single-event).", []
+
+        funnel_note = ""
+        funnel_cards: List[Any] = []
         try:
-            funnel_fn = getattr(storage_api, "get_player_funnel_stats", None)
-            if funnel_fn:
-                funnel_stats = (
-                    funnel_fn(
-                        event_slugs=selected_scope_slugs or None,
-                        start_date=range_start.isoformat() if range_start else None,
-                        end_date=range_end.isoformat() if range_end else None,
-                        anchor_date=range_end.isoformat() if range_end else None,
-                    )
-                    or {}
-                )
+            insights = insights_bundle(scope["scope"], sections=("funnel",)).get("current") or {}
+            if "funnel" in insights:
+                funnel_stats = insights.get("funnel") or {}
                 funnel_new = _as_int(funnel_stats.get("new_count"))
                 funnel_returning = _as_int(funnel_stats.get("returning_count"))
                 funnel_core = _as_int(funnel_stats.get("core_count"))
@@ -2756,99 +3285,108 @@ def register_callbacks(app):
                     "Core: 3+ distinct events in rolling 6 months | "
                     "Churned: no attendance in 8 months (global)"
                 )
-
-                if single_event_scope:
-                    funnel_cards = []
-                    funnel_note = "Funnel v2 visas i period/series-scope (inte single-event)."
         except Exception as e:
             logger.warning(f"Failed to load player funnel stats: {e}")
 
-        # Unique attendee count (distinct player_uuid) for selected scope
-        unique_count = 0
-        try:
-            unique_fn = getattr(storage_api, "get_unique_attendee_count", None)
-            if unique_fn:
-                unique_count = unique_fn(
-                    event_slugs=selected_scope_slugs or None,
-                    start_date=range_start.isoformat() if range_start else None,
-                    end_date=range_end.isoformat() if range_end else None,
+        return funnel_note, funnel_cards
+
+    # -------------------------------------------------------------------------
+    # Insights - game distribution, trend and crossover (Games sub-tab)
+    # -------------------------------------------------------------------------
+    @app.callback(
+        Output("insights-top-game", "children"),
+        Output("insights-added-via-summary", "children"),
+        Output("insights-games-title", "children"),
+        Output("insights-games-table", "data"),
+        Output("insights-game-mover", "children"),
+        Output("insights-games-trend", "figure"),
+        Output("insights-crossover-title", "children"),
+        Output("insights-crossover-table", "data"),
+        Input("insights-scope-store", "data"),
+        Input("insights-subtabs", "value"),
+    )
+    def update_insights_games(scope_store, subtab):
+        scope = insights_scope(scope_store)
+        if scope is None or subtab != "games":
+            return (no_update,) * 8
+        selected_events = scope["selected_events"]
+        if not selected_events:
+            return "Game highlight: -", "Added via: -", "Game distribution", [], "", {}, "", []
+
+        insights = (
+            insights_bundle(
+                scope["scope"],
+                sections=("added_via", "acquisition_source", "crossover"),
+                crossover_limit=20,
+            ).get("current")
+            or {}
+        )
+        added_via_breakdown = insights.get("added_via") or []
+        acquisition_source_breakdown = insights.get("acquisition_source") or []
+        metrics = aggregate_insights_metrics(selected_events)
+
+        if metrics["top_game_counts"]:
+            top_game = max(metrics["top_game_counts"], key=metrics["top_game_counts"].get)
+            top_game_text = f"Game highlight: {top_game}"
+        else:
+            top_game_text = ""
+
+        # Added-via source summary for selected scope (archive)
+        if added_via_breakdown:
+            chunks = []
+            for row in added_via_breakdown[:3]:
+                source = str(row.get("source") or "unknown")
+                share = _as_float(row.get("share"))
+                chunks.append(f"{source}: {share:.0f}%")
+            added_via_summary = "Added via: " + " | ".join(chunks)
+        else:
+            added_via_summary = "Added via: -"
+
+        if acquisition_source_breakdown:
+            total_source_count = sum(int(r.get("count") or 0) for r in acquisition_source_breakdown)
+            unknown_source_count = sum(
+                int(r.get("count") or 0)
+                for r in acquisition_source_breakdown
+                if str(r.get("source") or "").strip().lower() == "unknown"
+            )
+            known_rows = [
+                r
+                for r in acquisition_source_breakdown
+                if str(r.get("source") or "").strip().lower() != "unknown"
+            ]
+            known_total = max(total_source_count - unknown_source_count, 0)
+
+            if known_total > 0 and known_rows:
+                known_rows_sorted = sorted(
+                    known_rows,
+                    key=lambda r: int(r.get("count") or 0),
+                    reverse=True,
                 )
-        except Exception as e:
-            logger.warning(f"Failed to load unique attendee count: {e}")
-        unique_text = f"{unique_count} unique attendees" if unique_count > 0 else ""
-
-        growth_rate = None
-        if prev_unique_count is not None and prev_unique_count > 0:
-            growth_rate = ((unique_count - prev_unique_count) / prev_unique_count) * 100.0
-        growth_value = f"{growth_rate:.1f}%" if growth_rate is not None else "-"
-        growth_delta = (
-            f"From prev uniques: {prev_unique_count}" if prev_unique_count is not None else "Live"
-        )
-        if single_event_scope:
-            growth_value = "-"
-            growth_delta = "N/A (multi-event trend)"
+                known_chunks = []
+                for row in known_rows_sorted[:3]:
+                    source = str(row.get("source") or "other")
+                    count = int(row.get("count") or 0)
+                    share_known = (count / known_total) * 100.0 if known_total > 0 else 0.0
+                    known_chunks.append(f"{source}: {share_known:.0f}%")
+                acquisition_summary = "Acq known: " + " | ".join(known_chunks)
+            else:
+                source_chunks = []
+                for row in acquisition_source_breakdown[:3]:
+                    source = str(row.get("source") or "unknown")
+                    share = _as_float(row.get("share"))
+                    source_chunks.append(f"{source}: {share:.0f}%")
+                acquisition_summary = "Acq: " + " | ".join(source_chunks)
 
-        churn_count = 0
-        churn_rate = 0.0
-        try:
-            churn_fn = getattr(storage_api, "get_player_churn_stats", None)
-            if churn_fn:
-                churn_stats = (
-                    churn_fn(
-                        event_slugs=selected_scope_slugs or None,
-                        start_date=range_start.isoformat() if range_start else None,
-                        end_date=range_end.isoformat() if range_end else None,
-                        anchor_date=range_end.isoformat() if range_end else None,
-                    )
-                    or {}
-                )
-                churn_count = _as_int(churn_stats.get("churn_count"))
-                churn_rate = _as_float(churn_stats.get("churn_rate"))
-        except Exception as e:
-            logger.warning(f"Failed to load churn stats: {e}")
+            if total_source_count > 0 and unknown_source_count > 0:
+                unknown_share = (unknown_source_count / total_source_count) * 100.0
+                acquisition_summary += f" • missing: {unknown_share:.0f}%"
+                if unknown_share >= 40:
+                    acquisition_summary += " (legacy)"
 
-        churn_value = f"{churn_rate:.1f}%"
-        churn_delta = _fmt_delta(churn_rate, prev_churn_rate, "pp")
-        if single_event_scope:
-            churn_value = "-"
-            churn_delta = "N/A (multi-event trend)"
+            added_via_summary = f"{added_via_summary} • {acquisition_summary}"
 
         # Game distribution leaderboard for selected scope
-        game_counts = {}
-        configured_games: Dict[str, Dict[str, int]] = {}
-        total_entries = 0
-        for ev in selected_events:
-            breakdown = ev.get("games_breakdown")
-            if isinstance(breakdown, dict):
-                for game, count in breakdown.items():
-                    cnt = _as_int(count)
-                    if cnt <= 0:
-                        continue
-                    normalized_game = _normalize_game_name(game)
-                    if not normalized_game:
-                        continue
-                    game_counts[normalized_game] = game_counts.get(normalized_game, 0) + cnt
-                    total_entries += cnt
-
-            snapshot = ev.get("startgg_snapshot")
-            if isinstance(snapshot, dict):
-                snapshot_events = snapshot.get("events") or []
-                if isinstance(snapshot_events, list):
-                    for snap_ev in snapshot_events:
-                        if not isinstance(snap_ev, dict):
-                            continue
-                        normalized_game = _normalize_game_name(snap_ev.get("name"))
-                        if not normalized_game:
-                            continue
-                        agg = configured_games.setdefault(
-                            normalized_game,
-                            {"registered": 0, "sets": 0, "games": 0, "configured": 0},
-                        )
-                        agg["registered"] += _as_int(snap_ev.get("numEntrants"))
-                        agg["sets"] += _as_int(snap_ev.get("setCount"))
-                        agg["games"] += _as_int(snap_ev.get("gamesPlayed"))
-                        agg["configured"] += 1
-
+        game_counts, configured_games, total_entries = insights_game_totals(selected_events)
         all_games = set(game_counts) | set(configured_games)
         sorted_games = sorted(
             all_games,
@@ -2912,7 +3450,7 @@ def register_callbacks(app):
                     cnt = _as_int(count)
                     if cnt <= 0:
                         continue
-                    normalized_game = _normalize_game_name(game)
+                    normalized_game = canonical_game_name(game)
                     if not normalized_game:
                         continue
                     normalized_breakdown[normalized_game] = (
@@ -2981,7 +3519,7 @@ def register_callbacks(app):
                 breakdown = ev.get("games_breakdown")
                 if isinstance(breakdown, dict):
                     for game, count in breakdown.items():
-                        normalized_game = _normalize_game_name(game)
+                        normalized_game = canonical_game_name(game)
                         if not normalized_game:
                             continue
                         first_counts[normalized_game] = first_counts.get(
@@ -2992,7 +3530,7 @@ def register_callbacks(app):
                 breakdown = ev.get("games_breakdown")
                 if isinstance(breakdown, dict):
                     for game, count in breakdown.items():
-                        normalized_game = _normalize_game_name(game)
+                        normalized_game = canonical_game_name(game)
                         if not normalized_game:
                             continue
                         second_counts[normalized_game] = second_counts.get(
@@ -3023,21 +3561,12 @@ def register_callbacks(app):
         crossover_rows: List[Dict[str, Any]] = []
         crossover_title = "Game crossover (top pairs)"
         try:
-            crossover_fn = getattr(storage_api, "get_game_crossover_stats", None)
-            if crossover_fn:
-                crossover_stats = (
-                    crossover_fn(
-                        event_slugs=selected_scope_slugs or None,
-                        start_date=range_start.isoformat() if range_start else None,
-                        end_date=range_end.isoformat() if range_end else None,
-                        limit=20,
-                    )
-                    or []
-                )
+            if "crossover" in insights:
+                crossover_stats = insights.get("crossover") or []
                 crossover_merged: Dict[tuple, int] = {}
                 for row in crossover_stats:
-                    game_a = _normalize_game_name(row.get("game_a"))
-                    game_b = _normalize_game_name(row.get("game_b"))
+                    game_a = canonical_game_name(row.get("game_a"))
+                    game_b = canonical_game_name(row.get("game_b"))
                     if not game_a or not game_b or game_a == game_b:
                         continue
                     a, b = sorted([game_a, game_b])
@@ -3066,74 +3595,132 @@ def register_callbacks(app):
             logger.warning(f"Failed to load game crossover stats: {e}")
 
         return (
-            series_options,
-            selected_series,
-            options,
-            selected_event_slugs,
-            summary_title,
-            heads_up_text,
-            str(metrics["total"]),
-            f"{metrics['revenue']:.0f} kr",
-            f"{ready_rate:.0f}%",
-            f"{member_rate:.0f}%",
-            f"{guest_rate:.0f}%",
-            f"{startgg_rate:.0f}%",
-            f"{retention:.0f}%",
-            unique_text,
-            total_delta,
-            revenue_delta,
-            ready_delta,
-            member_delta,
-            guest_delta,
-            startgg_delta,
-            retention_delta,
             top_game_text,
             added_via_summary,
-            ops_live_note,
-            top_players_title,
-            top_players_rows,
-            funnel_note,
-            funnel_cards,
             games_title,
             games_rows,
             game_mover_text,
             games_trend_figure,
             crossover_title,
             crossover_rows,
-            table_rows,
-            earnings_rows,
-            str(slots),
-            f"{avg_games:.1f}",
-            f"{multigame_pct:.1f}%",
-            str(new_players),
-            str(returning_players),
-            f"{noshow_rate:.1f}%",
-            f"{manual_share:.1f}%",
-            checkin_speed_value,
-            duration_value,
-            growth_value,
-            churn_value,
-            slots_delta,
-            avggames_delta,
-            multigame_delta,
-            new_delta,
-            returning_delta,
-            noshow_delta,
-            manual_delta,
-            checkin_speed_delta,
-            duration_delta,
-            growth_delta,
-            churn_delta,
-            str(core_players),
-            f"{player_lifetime:.1f}",
-            coreplayers_delta,
-            lifetime_delta,
-            summary_core,
-            summary_community,
-            summary_tournament,
-            summary_operations,
         )
 
+    # -------------------------------------------------------------------------
+    # Insights - per-event overview and earnings tables (Events / Earnings sub-tabs)
+    # -------------------------------------------------------------------------
+    @app.callback(
+        Output("insights-events-table", "data"),
+        Output("insights-earnings-table", "data"),
+        Input("insights-scope-store", "data"),
+        Input("insights-subtabs", "value"),
+    )
+    def update_insights_events(scope_store, subtab):
+        scope = insights_scope(scope_store)
+        if scope is None or subtab not in ("events", "earnings"):
+            return no_update, no_update
+        if not scope["selected_events"]:
+            return [], []
+
+        insights = (
+            insights_bundle(scope["scope"], sections=("manual_by_event",)).get("current") or {}
+        )
+        manual_by_event = insights.get("manual_by_event") or {}
+
+        table_rows = []
+        earnings_rows = []
+        for ev in scope["selected_events"]:
+            ev_total = _as_int(ev.get("total_participants") or ev.get("participants"))
+            ev_checked_in = _as_int(ev.get("checked_in_count"))
+            ev_registered = _as_int(ev.get("startgg_registered_players")) or _as_int(
+                ev.get("startgg_registered_count")
+            )
+            ev_member_rate = (
+                (_as_int(ev.get("member_count")) / ev_total * 100) if ev_total > 0 else 0.0
+            )
+            ev_startgg_rate = (
+                (
+                    max(_as_int(ev.get("startgg_count")) - _as_int(ev.get("guest_count")), 0)
+                    / ev_total
+                    * 100
+                )
+                if ev_total > 0
+                else 0.0
+            )
+            ev_revenue = _as_float(ev.get("total_revenue"))
+            revenue_per_player = (ev_revenue / ev_total) if ev_total > 0 else 0.0
+            ev_no_show = _as_int(ev.get("no_show_count"))
+            ev_no_show_rate = _as_float(ev.get("no_show_rate"))
+            ev_slug = ev.get("event_slug", "")
+            manual_stats = manual_by_event.get(ev_slug, {}) if ev_slug else {}
+            manual_count = _as_int(manual_stats.get("manual_count"))
+            manual_pct = _as_float(manual_stats.get("manual_pct"))
+
+            checked_in_rate = (ev_checked_in / ev_registered * 100) if ev_registered > 0 else 0.0
+            retention_rate = _as_float(ev.get("retention_rate"))
+
+            # Local-event friendly no-show scoring (10-30 players, 1-3 no-shows is normal)
+            if ev_no_show_rate <= 10:
+                no_show_score = 100.0
+            elif ev_no_show_rate <= 20:
+                no_show_score = 100.0 - ((ev_no_show_rate - 10.0) * 2.5)  # 100 -> 75
+            elif ev_no_show_rate <= 30:
+                no_show_score = 75.0 - ((ev_no_show_rate - 20.0) * 2.0)  # 75 -> 55
+            elif ev_no_show_rate <= 40:
+                no_show_score = 55.0 - ((ev_no_show_rate - 30.0) * 2.0)  # 55 -> 35
+            else:
+                no_show_score = max(0.0, 35.0 - ((ev_no_show_rate - 40.0) * 1.5))
+
+            manual_score = max(0.0, min(100.0, 100.0 - (manual_pct * 2.0)))
+            event_quality_score = (
+                0.30 * no_show_score
+                + 0.30 * checked_in_rate
+                + 0.20 * retention_rate
+                + 0.20 * manual_score
+            )
+            if event_quality_score >= 80:
+                quality_level, quality_rank = "Healthy", "4/4"
+            elif event_quality_score >= 65:
+                quality_level, quality_rank = "Stable", "3/4"
+            elif event_quality_score >= 45:
+                quality_level, quality_rank = "Watch", "2/4"
+            else:
+                quality_level, quality_rank = "Critical", "1/4"
+
+            table_rows.append(
+                {
+                    "event_display_name": ev.get("event_display_name") or ev.get("event_slug", ""),
+                    "event_slug": ev_slug,
+                    "event_date": ev.get("event_date") or "",
+                    "total_participants": ev_total,
+                    "no_show_rate": round(ev_no_show_rate, 1),
+                    "no_show_count": ev_no_show,
+                    "event_quality": f"{quality_level} [{quality_rank}] ({event_quality_score:.0f})",
+                    "checked_in_vs_registered": (
+                        f"{ev_checked_in}/{ev_registered}"
+                        if ev_registered > 0
+                        else "-"
+                    ),
+                    "top_game": canonical_game_name(ev.get("most_popular_game")) or "-",
+                    "total_revenue": f"{ev_revenue:.0f} kr",
+                    "member_rate": f"{ev_member_rate:.0f}%",
+                    "startgg_rate": f"{ev_startgg_rate:.0f}%",
+                    "retention_rate": f"{retention_rate:.0f}%",
+                    "manual_count": manual_count,
+                    "manual_share": f"{manual_pct:.0f}%" if ev_total > 0 else "-",
+                }
+            )
+            earnings_rows.append(
+                {
+                    "event_display_name": ev.get("event_display_name") or ev.get("event_slug", ""),
+                    "event_date": ev.get("event_date") or "",
+                    "total_participants": ev_total,
+                    "total_revenue": f"{ev_revenue:.0f} kr",
+                    "revenue_per_player": f"{revenue_per_player:.0f} kr",
+                }
+            )
+
+        return table_rows, earnings_rows
+
     @app.callback(
         Output("insights-custom-range-wrap", "style"),
         Input("insights-period-dropdown", "value"),
@@ -3287,15 +3874,13 @@ def register_callbacks(app):
     @app.callback(
         Output("insights-top-players-game-filter", "options"),
         Output("insights-top-players-game-filter", "value"),
-        Input("insights-games-table", "data"),
-        Input("insights-crossover-table", "data"),
-        Input("insights-events-table", "data"),
+        Input("insights-scope-store", "data"),
         State("insights-top-players-game-filter", "value"),
     )
-    def sync_top_players_game_filter_options(games_rows, crossover_rows, events_rows, current_value):
-        games_rows = games_rows or []
-        crossover_rows = crossover_rows or []
-        events_rows = events_rows or []
+    def sync_top_players_game_filter_options(scope_store, current_value):
+        scope = insights_scope(scope_store)
+        if scope is None:
+            return no_update, no_update
         options = [{"label": "All games", "value": "all"}]
 
         seen = set()
@@ -3307,21 +3892,16 @@ def register_callbacks(app):
             seen.add(game)
             options.append({"label": game, "value": game})
 
-        for row in games_rows:
-            if not isinstance(row, dict):
-                continue
-            _add_option(row.get("game"))
-
-        for row in crossover_rows:
-            if not isinstance(row, dict):
-                continue
-            _add_option(row.get("game_a"))
-            _add_option(row.get("game_b"))
+        # Same game set as the Games sub-tab, without waiting for it to render
+        game_counts, configured_games, _total = insights_game_totals(scope["selected_events"])
+        for game in sorted(
+            set(game_counts) | set(configured_games),
+            key=lambda g: (-_as_int(game_counts.get(g)), str(g).lower()),
+        ):
+            _add_option(game)
 
-        for row in events_rows:
-            if not isinstance(row, dict):
-                continue
-            _add_option(row.get("top_game"))
+        for ev in scope["selected_events"]:
+            _add_option(canonical_game_name(ev.get("most_popular_game")))
 
         # Fallback canonical games so dropdown never collapses to only "All games".
         for fallback_game in [
@@ -4070,7 +4650,50 @@ def register_callbacks(app):
     def scan_duplicates(n_clicks):
         if not n_clicks:
             return no_update, no_update, no_update
-        return _build_candidates_list()
+        return _build_candidates_list(refresh=True)
+
+    @app.callback(
+        Output("duplicates-list", "children", allow_duplicate=True),
+        Output("duplicates-feedback", "children", allow_duplicate=True),
+        Output("duplicates-title", "children", allow_duplicate=True),
+        Output("merge-history-list", "children", allow_duplicate=True),
+        Output("duplicates-index-shown", "data"),
+        Input("insights-subtabs", "value"),
+        prevent_initial_call=True,
+    )
+    def open_duplicates_view(view_mode):
+        """Show the stored duplicate index right away; refresh_duplicates_view updates it."""
+        if (view_mode or "").strip().lower() != "duplicates":
+            return no_update, no_update, no_update, no_update, no_update
+        cards, feedback, title = _build_candidates_list()
+        return cards, feedback, title, _build_merge_history_list(), time.time()
+
+    @app.callback(
+        Output("duplicates-list", "children", allow_duplicate=True),
+        Output("duplicates-title", "children", allow_duplicate=True),
+        Input("duplicates-index-shown", "data"),
+        prevent_initial_call=True,
+    )
+    def refresh_duplicates_view(shown_at):
+        """
+        Refresh the duplicate index once the stored one is shown; re-renders only
+        if players changed. Chained after open_duplicates_view so the stored
+        (older) list can never overwrite the refreshed one.
+        """
+        if not shown_at:
+            return no_update, no_update
+        refresh_fn = getattr(storage_api, "refresh_duplicate_candidates", None)
+        if not refresh_fn:
+            return no_update, no_update
+        try:
+            result = refresh_fn() or {}
+        except Exception as e:
+            logger.warning(f"Duplicate index refresh failed: {e}")
+            return no_update, no_update
+        if not result.get("changed_players"):
+            return no_update, no_update
+        cards, _, title = _build_candidates_list()
+        return cards, title
 
     @app.callback(
         Output("merge-confirm-dialog", "displayed"),
@@ -4154,7 +4777,7 @@ def register_callbacks(app):
 
         # Auto-refresh both history and candidate list
         history_children = _build_merge_history_list()
-        candidates_list, _, candidates_title = _build_candidates_list()
+        candidates_list, _, candidates_title = _build_candidates_list(refresh=True)
 
         return feedback, history_children, candidates_list, candidates_title
 
@@ -4205,7 +4828,7 @@ def register_callbacks(app):
             )
 
         history_children = _build_merge_history_list()
-        candidates_list, _, candidates_title = _build_candidates_list()
+        candidates_list, _, candidates_title = _build_candidates_list(refresh=True)
         return feedback, history_children, candidates_list, candidates_title
 
     def _build_merge_history_list():
@@ -4292,13 +4915,24 @@ def register_callbacks(app):
 
         return items
 
-    def _build_candidates_list():
-        """Re-scan and build the candidates card list. Returns (cards, feedback, title)."""
+    def _build_candidates_list(refresh: bool = False):
+        """
+        Build the candidates card list from the stored duplicate index (brought up
+        to date first with refresh=True). Backends without the index re-scan.
+        Returns (cards, feedback, title).
+        """
         try:
-            candidates_fn = getattr(storage_api, "find_duplicate_candidates", None)
-            if not candidates_fn:
-                return [], "", "Potential duplicates"
-            candidates = candidates_fn(limit=30) or []
+            stored_fn = getattr(storage_api, "get_duplicate_candidates", None)
+            refresh_fn = getattr(storage_api, "refresh_duplicate_candidates", None)
+            if stored_fn:
+                if refresh and refresh_fn:
+                    refresh_fn()
+                candidates = stored_fn(limit=30) or []
+            else:
+                candidates_fn = getattr(storage_api, "find_duplicate_candidates", None)
+                if not candidates_fn:
+                    return [], "", "Potential duplicates"
+                candidates = candidates_fn(limit=30) or []
         except Exception:
             return [], "", "Potential duplicates"
 
@@ -4512,13 +5146,23 @@ def register_callbacks(app):
 
         a_uuid = triggered.get("a", "")
         b_uuid = triggered.get("b", "")
+        to_user = {"user_id": "", "user_name": "TO", "user_email": ""}
+
+        # Remember the decision in the duplicate index
+        persisted = False
+        try:
+            reject_fn = getattr(storage_api, "reject_duplicate_candidate", None)
+            if reject_fn:
+                persisted = bool(reject_fn(a_uuid, b_uuid, user=to_user))
+        except Exception as e:
+            logger.warning(f"Could not store duplicate dismissal: {e}")
 
         # Log the dismissal to audit_log for traceability
         try:
             log_fn = getattr(storage_api, "log_action", None)
             if log_fn:
                 log_fn(
-                    {"user_id": "", "user_name": "TO", "user_email": ""},
+                    to_user,
                     "duplicate_dismissed",
                     "players",
                     target_player=a_uuid,
@@ -4529,81 +5173,58 @@ def register_callbacks(app):
             pass  # non-critical
 
         feedback = html.Div(
-            "Dismissed pair. They will reappear on next scan (dismiss state is not persisted yet).",
+            "Dismissed pair. It will not be suggested again."
+            if persisted
+            else "Dismissed pair. They will reappear on next scan (dismiss state is not persisted).",
             style={"color": COLORS["text_secondary"], "fontSize": "0.8rem", "fontStyle": "italic"},
         )
 
-        # Re-scan (pair still shows since we don't persist dismissals yet)
         candidates_list, _, candidates_title = _build_candidates_list()
         return feedback, candidates_list, candidates_title
 
     # -------------------------------------------------------------------------
-    # Reactive Stats - update stat cards when table data changes
+    # Reactive Stats - stat cards from the check-ins summary (counts over the
+    # whole filtered event, computed in SQL by update_checkins_summary).
+    # Clientside: a pure transform of data already in the browser.
+    # Also shows/hides the needs-attention section (attention counts respect
+    # configurable requirements, Task 2.2).
     # -------------------------------------------------------------------------
-    @app.callback(
+    app.clientside_callback(
+        """
+        function(summary) {
+            summary = summary || {};
+            if (!summary.filtered) {
+                return ["0", "0", "0", "0", {display: "none"}];
+            }
+            var attention = summary.attention || 0;
+            var sectionStyle = {display: "none"};
+            if (attention > 0) {
+                sectionStyle = {
+                    backgroundColor: "#12121a",
+                    borderRadius: "12px",
+                    border: "1px solid #1e293b",
+                    padding: "1.5rem",
+                    marginBottom: "1.5rem",
+                    borderLeft: "4px solid #ef4444",
+                    display: "block"
+                };
+            }
+            return [
+                String(summary.filtered || 0),
+                String(summary.ready || 0),
+                String(summary.pending || 0),
+                String(attention),
+                sectionStyle
+            ];
+        }
+        """,
         Output("stat-total", "children"),
         Output("stat-ready", "children"),
         Output("stat-pending", "children"),
         Output("stat-attention", "children"),
         Output("needs-attention-section", "style"),
-        Input("checkins-table", "data"),
-        Input("requirements-store", "data"),  # Task 2.2: Respect requirements
+        Input("checkins-summary-store", "data"),
     )
-    def update_stats(table_data, requirements):
-        """
-        Update stats cards reactively when check-ins table data changes.
-        Also shows/hides the needs-attention section.
-        Respects configurable requirements (Task 2.2).
-        """
-        if not table_data:
-            hidden_style = {"display": "none"}
-            return "0", "0", "0", "0", hidden_style
-
-        # Get active requirements (only enabled when explicitly True)
-        requirements = requirements or {}
-        require_membership = requirements.get("require_membership") is True
-        require_payment = requirements.get("require_payment") is True
-        require_startgg = requirements.get("require_startgg") is True
-
-        # Helper to check if value indicates "OK" (includes icon ✓ or boolean true)
-        def is_ok(val):
-            return val == "✓" or val is True or str(val).lower() == "true"
-
-        total = len(table_data)
-        ready = len([d for d in table_data if d.get("status") == "Ready"])
-        pending = len([d for d in table_data if d.get("status") == "Pending"])
-
-        # Count players needing attention (only for ACTIVE requirements)
-        needs_attention = 0
-        for row in table_data:
-            missing_something = False
-            # Only check membership if required
-            if require_membership and not is_ok(row.get("member", "")):
-                missing_something = True
-            # Only check payment if required
-            if require_payment and not is_ok(row.get("payment_valid", "")):
-                missing_something = True
-            # Only check start.gg if required
-            if require_startgg and not is_ok(row.get("startgg", "")):
-                missing_something = True
-            if missing_something:
-                needs_attention += 1
-
-        # Show needs-attention section if there are players needing help
-        if needs_attention > 0:
-            visible_style = {
-                "backgroundColor": "#12121a",
-                "borderRadius": "12px",
-                "border": "1px solid #1e293b",
-                "padding": "1.5rem",
-                "marginBottom": "1.5rem",
-                "borderLeft": "4px solid #ef4444",
-                "display": "block",
-            }
-        else:
-            visible_style = {"display": "none"}
-
-        return str(total), str(ready), str(pending), str(needs_attention), visible_style
 
     # -------------------------------------------------------------------------
     # TO Toggle Fields - toggle payment_valid, startgg, is_guest by clicking cell
@@ -5249,41 +5870,50 @@ def register_callbacks(app):
     # -------------------------------------------------------------------------
     @app.callback(
         Output("recheck-startgg-feedback", "children", allow_duplicate=True),
+        Output("bulk-recheck-store", "data", allow_duplicate=True),
         Input("btn-bulk-recheck-startgg", "n_clicks"),
         State("event-dropdown", "value"),
         State("auth-store", "data"),
         prevent_initial_call=True,
     )
     def bulk_recheck_startgg(n_clicks, selected_slug, auth_state):
+        """
+        Start the backend bulk re-check job. Progress arrives over SSE
+        (bulk-recheck-store), so this returns as soon as the job is accepted.
+        """
         if not n_clicks:
-            return no_update
+            return no_update, no_update
 
         try:
             resp = requests.post(
                 "http://backend:8000/api/admin/bulk-recheck-startgg",
                 json={},
-                timeout=120,
+                timeout=15,
             )
 
+            if resp.status_code == 409:
+                data = resp.json()
+                return (
+                    html.Span(
+                        "A bulk re-check is already running.",
+                        style={"color": "#f59e0b"},
+                    ),
+                    {**data, "state": data.get("state") or "running"},
+                )
+
             if resp.status_code >= 400:
                 error_detail = resp.text[:200]
-                return html.Span(
-                    f"Bulk re-check failed: {error_detail}",
-                    style={"color": "#ef4444"},
+                return (
+                    html.Span(
+                        f"Bulk re-check failed: {error_detail}",
+                        style={"color": "#ef4444"},
+                    ),
+                    no_update,
                 )
 
             data = resp.json()
+            job_id = data.get("job_id")
             total = data.get("total", 0)
-            checked = data.get("checked", 0)
-            emails_found = data.get("emails_found", 0)
-            errors = data.get("errors", [])
-
-            parts = [
-                f"Bulk re-check done: {checked}/{total} players checked, "
-                f"{emails_found} emails found."
-            ]
-            if errors:
-                parts.append(f" ({len(errors)} errors)")
 
             try:
                 storage_api.log_action(
@@ -5295,29 +5925,103 @@ def register_callbacks(app):
                     "admin_bulk_recheck_startgg",
                     "active_event_data",
                     target_event=selected_slug or "",
-                    details=json.dumps(
-                        {"total": total, "checked": checked, "emails_found": emails_found}
-                    ),
+                    details=json.dumps({"job_id": job_id, "total": total}),
                 )
             except Exception as e:
                 logger.warning(f"Failed to write audit log for bulk recheck: {e}")
 
-            return html.Span(
-                "".join(parts),
-                style={"color": "#22c55e", "fontWeight": "600"},
+            return (
+                html.Span(
+                    f"Bulk re-check started for {total} players.",
+                    style={"color": "#a78bfa", "fontWeight": "600"},
+                ),
+                {"job_id": job_id, "state": "running", "total": total, "checked": 0,
+                 "emails_found": 0, "error_count": 0},
             )
 
-        except requests.exceptions.Timeout:
-            return html.Span(
-                "Bulk re-check timed out — too many players or Start.gg is slow.",
-                style={"color": "#f59e0b"},
-            )
         except Exception as e:
             logger.exception(f"Bulk re-check Start.gg failed: {e}")
-            return html.Span(
-                f"Bulk re-check failed: {e}",
-                style={"color": "#ef4444"},
+            return (
+                html.Span(
+                    f"Bulk re-check failed: {e}",
+                    style={"color": "#ef4444"},
+                ),
+                no_update,
+            )
+
+    @app.callback(
+        Output("bulk-recheck-progress", "children"),
+        Output("btn-bulk-recheck-cancel", "style"),
+        Input("bulk-recheck-store", "data"),
+        State("btn-bulk-recheck-cancel", "style"),
+        prevent_initial_call=True,
+    )
+    def render_bulk_recheck_progress(job, cancel_style):
+        """Progress bar for the running bulk re-check (updated by SSE)."""
+        cancel_style = dict(cancel_style or {})
+        if not job:
+            cancel_style["display"] = "none"
+            return None, cancel_style
+
+        state = job.get("state") or "running"
+        total = job.get("total") or 0
+        checked = job.get("checked") or 0
+        error_count = job.get("error_count") or 0
+        done = checked + error_count
+        running = state in ("running", "cancelling")
+        cancel_style["display"] = "inline-block" if state == "running" else "none"
+
+        if running:
+            label = f"Re-checking Start.gg: {done}/{total}"
+            if state == "cancelling":
+                label = f"Cancelling... {done}/{total}"
+            color = "#a78bfa"
+        elif state == "done":
+            label = f"Bulk re-check done: {checked}/{total} players checked, {job.get('emails_found', 0)} emails found."
+            color = "#22c55e"
+        elif state == "cancelled":
+            label = f"Bulk re-check cancelled after {done}/{total} players ({checked} saved)."
+            color = "#f59e0b"
+        else:
+            label = f"Bulk re-check failed after {done}/{total} players."
+            color = "#ef4444"
+        if error_count:
+            label += f" ({error_count} errors)"
+
+        children = [html.Span(label, style={"color": color, "fontWeight": "600"})]
+        if running:
+            children.insert(
+                0,
+                html.Progress(
+                    value=str(done),
+                    max=str(max(total, 1)),
+                    style={"width": "100%", "height": "0.6rem", "display": "block",
+                           "marginBottom": "0.3rem"},
+                ),
+            )
+        return html.Div(children), cancel_style
+
+    @app.callback(
+        Output("bulk-recheck-store", "data", allow_duplicate=True),
+        Input("btn-bulk-recheck-cancel", "n_clicks"),
+        State("bulk-recheck-store", "data"),
+        prevent_initial_call=True,
+    )
+    def cancel_bulk_recheck(n_clicks, job):
+        if not n_clicks or not (job or {}).get("job_id"):
+            return no_update
+        try:
+            resp = requests.post(
+                f"http://backend:8000/api/admin/bulk-recheck-startgg/{job['job_id']}/cancel",
+                json={},
+                timeout=10,
             )
+        except Exception as e:
+            logger.warning(f"Bulk re-check cancel failed: {e}")
+            return no_update
+        if resp.status_code >= 400:
+            return no_update
+        return {**job, "state": "cancelling"}
 
     # -------------------------------------------------------------------------
     # Delete selected player - Step 1: Show confirmation dialog
@@ -5428,6 +6132,7 @@ def register_callbacks(app):
                         target_event=selected_slug or "",
                         target_record=record_id,
                         target_player=player_name,
+                        durable=True,
                     )
                 except Exception as e:
                     logger.warning(f"Failed to write audit log for delete: {e}")
@@ -5467,17 +6172,28 @@ def register_callbacks(app):
         Output("download-guests-csv", "data"),
         Output("export-feedback", "children"),
         Input("btn-export-guests", "n_clicks"),
-        State("checkins-table", "data"),
+        State("event-dropdown", "value"),
+        State("active-filter", "data"),
+        State("search-input", "value"),
+        State("game-filter", "value"),
+        State("requirements-store", "data"),
         prevent_initial_call=True,
     )
-    def export_guests_csv(n_clicks, table_data):
+    def export_guests_csv(
+        n_clicks, selected_slug, active_filter, search_query, game_filter, requirements
+    ):
         """
         Export guests (players without Start.gg accounts) as CSV.
         Useful for TOs to bulk-add players to Start.gg.
+        Covers every check-in matching the table filters, not just the visible page.
         """
-        if not n_clicks or not table_data:
+        if not n_clicks or not selected_slug:
             return no_update, no_update
 
+        filters = checkin_filters(active_filter, search_query, game_filter, requirements)
+        rows = load_filtered_checkins(selected_slug, filters)
+        table_data = format_checkins(pd.DataFrame(rows)).to_dict("records") if rows else []
+
         # Helper to check if value indicates guest
         def is_guest(val):
             return val == "✓" or val is True or str(val).lower() == "true"
@@ -6129,17 +6845,60 @@ def register_callbacks(app):
 
         return chips
 
+    # -------------------------------------------------------------------------
+    # Admin jobs: Cancel terminates the job process (Dash cancel input); this
+    # marks its admin_jobs row so the next run of that kind can start at once.
+    # -------------------------------------------------------------------------
+    ADMIN_JOB_FEEDBACK = {
+        "archive": "archive-feedback",
+        "reopen": "reopen-feedback",
+        "recompute": "recompute-event-feedback",
+        "integrity": "scan-integrity-feedback",
+        "fetch-event": "settings-output",
+    }
+
+    def register_admin_job_cancel(prefix: str, kind: str) -> None:
+        @app.callback(
+            Output(ADMIN_JOB_FEEDBACK[prefix], "children", allow_duplicate=True),
+            Input(f"{prefix}-job-cancel", "n_clicks"),
+            prevent_initial_call=True,
+        )
+        def mark_admin_job_cancelled(n_clicks):
+            if not n_clicks:
+                return no_update
+            try:
+                job = storage_api.get_admin_job(kind=kind)
+                if job and job.get("state") == "running":
+                    storage_api.finish_admin_job(
+                        job["job_id"],
+                        "cancelled",
+                        {**(job.get("progress") or {}), "error": "cancelled from dashboard"},
+                    )
+            except Exception as e:
+                logger.warning(f"Failed to mark {kind} job as cancelled: {e}")
+            return html.Span("⏹ Cancelled.", style={"color": "#f59e0b"})
+
+    if ADMIN_JOB_MANAGER is not None and hasattr(storage_api, "get_admin_job"):
+        for job_prefix, job_kind in ADMIN_JOB_KINDS.items():
+            register_admin_job_cancel(job_prefix, job_kind)
+
     # -------------------------------------------------------------------------
     # Archive current event to event_archive + event_stats
     # -------------------------------------------------------------------------
-    @app.callback(
+    @admin_job_callback(
+        app,
+        "recompute",
         Output("recompute-event-feedback", "children"),
         Input("btn-recompute-event-stats", "n_clicks"),
         State("event-dropdown", "value"),
         State("auth-store", "data"),
         prevent_initial_call=True,
+        running=[
+            (Output("btn-recompute-event-stats", "disabled"), True, False),
+            (Output("btn-recompute-all-event-stats", "disabled"), True, False),
+        ],
     )
-    def recompute_selected_event_stats(n_clicks, selected_slug, auth_state):
+    def recompute_selected_event_stats(set_progress, n_clicks, selected_slug, auth_state):
         if not n_clicks:
             return no_update
 
@@ -6155,15 +6914,22 @@ def register_callbacks(app):
                 style={"color": "#ef4444"},
             )
 
+        user = {
+            "user_id": (auth_state or {}).get("user_id", ""),
+            "user_name": (auth_state or {}).get("user_name", "system"),
+            "user_email": (auth_state or {}).get("user_email", ""),
+        }
         try:
-            result = recompute_fn(
-                selected_slug,
-                user={
-                    "user_id": (auth_state or {}).get("user_id", ""),
-                    "user_name": (auth_state or {}).get("user_name", "system"),
-                    "user_email": (auth_state or {}).get("user_email", ""),
-                },
+            result = run_admin_job(
+                set_progress,
+                ADMIN_JOB_KINDS["recompute"],
+                f"Recomputing stats for {selected_slug}",
+                lambda: recompute_fn(selected_slug, user=user),
+                event_slug=selected_slug,
+                started_by=user["user_name"],
             )
+        except AdminJobBusy as e:
+            return html.Span(f"⏳ {e}", style={"color": "#f59e0b"})
         except Exception as e:
             logger.exception(f"Recompute failed for {selected_slug}: {e}")
             return html.Span(f"❌ Recompute failed: {e}", style={"color": "#ef4444"})
@@ -6191,14 +6957,87 @@ def register_callbacks(app):
             )
         return html.Div(children=children, style={"lineHeight": "1.5"})
 
-    @app.callback(
+    @admin_job_callback(
+        app,
+        "recompute",
+        Output("recompute-event-feedback", "children", allow_duplicate=True),
+        Input("btn-recompute-all-event-stats", "n_clicks"),
+        State("auth-store", "data"),
+        prevent_initial_call=True,
+        running=[
+            (Output("btn-recompute-event-stats", "disabled"), True, False),
+            (Output("btn-recompute-all-event-stats", "disabled"), True, False),
+        ],
+    )
+    def recompute_all_archived_event_stats(set_progress, n_clicks, auth_state):
+        if not n_clicks:
+            return no_update
+
+        recompute_fn = getattr(storage_api, "recompute_all_event_stats", None)
+        if not recompute_fn:
+            return html.Span(
+                "❌ Recompute is unavailable on current data backend.",
+                style={"color": "#ef4444"},
+            )
+
+        user = {
+            "user_id": (auth_state or {}).get("user_id", ""),
+            "user_name": (auth_state or {}).get("user_name", "system"),
+            "user_email": (auth_state or {}).get("user_email", ""),
+        }
+        try:
+            result = run_admin_job(
+                set_progress,
+                ADMIN_JOB_KINDS["recompute"],
+                "Recomputing stats for all archived events",
+                lambda: recompute_fn(user=user),
+                started_by=user["user_name"],
+            )
+        except AdminJobBusy as e:
+            return html.Span(f"⏳ {e}", style={"color": "#f59e0b"})
+        except Exception as e:
+            logger.exception(f"Recompute of all events failed: {e}")
+            return html.Span(f"❌ Recompute failed: {e}", style={"color": "#ef4444"})
+
+        children = [
+            html.Div(
+                f"✅ Recomputed stats for {result.get('events', 0)} archived events",
+                style={"color": "#10b981"},
+            ),
+            html.Div(
+                f"Participants: {result.get('participants', 0)}",
+                style={"color": "#10b981"},
+            ),
+        ]
+        skipped = result.get("skipped") or []
+        if skipped:
+            children.append(
+                html.Div(
+                    f"Skipped (no archived rows): {', '.join(skipped)}",
+                    style={"color": "#94a3b8", "marginTop": "0.25rem"},
+                )
+            )
+        warned = result.get("events_with_warnings") or []
+        if warned:
+            children.append(
+                html.Div(
+                    f"⚠ Integrity warnings in: {', '.join(warned)}",
+                    style={"color": "#f59e0b", "marginTop": "0.25rem"},
+                )
+            )
+        return html.Div(children=children, style={"lineHeight": "1.5"})
+
+    @admin_job_callback(
+        app,
+        "integrity",
         Output("scan-integrity-feedback", "children"),
         Output("integrity-scan-table", "data"),
         Input("btn-scan-event-integrity", "n_clicks"),
         State("auth-store", "data"),
         prevent_initial_call=True,
+        running=[(Output("btn-scan-event-integrity", "disabled"), True, False)],
     )
-    def scan_archived_event_integrity(n_clicks, auth_state):
+    def scan_archived_event_integrity(set_progress, n_clicks, auth_state):
         if not n_clicks:
             return no_update, no_update
 
@@ -6213,7 +7052,18 @@ def register_callbacks(app):
             )
 
         try:
-            rows = scan_fn() or []
+            rows = (
+                run_admin_job(
+                    set_progress,
+                    ADMIN_JOB_KINDS["integrity"],
+                    "Scanning archived events",
+                    scan_fn,
+                    started_by=(auth_state or {}).get("user_name", ""),
+                )
+                or []
+            )
+        except AdminJobBusy as e:
+            return html.Span(f"⏳ {e}", style={"color": "#f59e0b"}), no_update
         except Exception as e:
             logger.exception(f"Integrity scan failed: {e}")
             return html.Span(f"❌ Integrity scan failed: {e}", style={"color": "#ef4444"}), []
@@ -6256,7 +7106,9 @@ def register_callbacks(app):
             table_rows,
         )
 
-    @app.callback(
+    @admin_job_callback(
+        app,
+        "archive",
         Output("archive-feedback", "children", allow_duplicate=True),
         Output("event-dropdown", "value", allow_duplicate=True),
         Output("reopen-event-selector", "options"),
@@ -6272,7 +7124,9 @@ def register_callbacks(app):
             (Output("btn-clear-current-event", "disabled"), True, False),
         ],
     )
-    def archive_current_event(n_clicks_quick, n_clicks, selected_slug, clear_flags, auth_state):
+    def archive_current_event(
+        set_progress, n_clicks_quick, n_clicks, selected_slug, clear_flags, auth_state
+    ):
         if not n_clicks and not n_clicks_quick:
             return no_update, no_update, no_update
 
@@ -6306,7 +7160,16 @@ def register_callbacks(app):
         archive_fn = getattr(storage_api, "archive_event", None)
         if archive_fn:
             try:
-                result = archive_fn(**payload)
+                result = run_admin_job(
+                    set_progress,
+                    ADMIN_JOB_KINDS["archive"],
+                    f"Archiving {selected_slug}",
+                    lambda: archive_fn(**payload),
+                    event_slug=selected_slug,
+                    started_by=payload["user"]["user_name"],
+                )
+            except AdminJobBusy as e:
+                return html.Span(f"⏳ {e}", style={"color": "#f59e0b"}), no_update, no_update
             except Exception as e:
                 logger.exception(f"Archive failed for {selected_slug}: {e}")
                 return (
@@ -6364,6 +7227,7 @@ def register_callbacks(app):
                         "clear_active": clear_active,
                     }
                 ),
+                durable=True,
             )
         except Exception as e:
             logger.warning(f"Failed to write audit log for archive: {e}")
@@ -6373,19 +7237,7 @@ def register_callbacks(app):
             history = storage_api.get_event_history() or []
         except Exception:
             history = []
-        reopen_options = []
-        for ev in history:
-            slug = ev.get("event_slug") if isinstance(ev, dict) else None
-            if slug:
-                name = ev.get("event_display_name") or slug.replace("-", " ").title()
-                date = ev.get("event_date") or ""
-                players = ev.get("total_participants", 0)
-                label = f"{name}"
-                if date:
-                    label += f"  ({date})"
-                if players:
-                    label += f"  — {players} players"
-                reopen_options.append({"label": label, "value": slug})
+        reopen_options = reopen_event_options(history)
 
         return (
             html.Div(
@@ -6422,7 +7274,9 @@ def register_callbacks(app):
     # -------------------------------------------------------------------------
     # Reopen archived event and optionally restore active check-ins
     # -------------------------------------------------------------------------
-    @app.callback(
+    @admin_job_callback(
+        app,
+        "reopen",
         Output("reopen-feedback", "children"),
         Output("event-dropdown", "options", allow_duplicate=True),
         Output("event-dropdown", "value", allow_duplicate=True),
@@ -6432,8 +7286,9 @@ def register_callbacks(app):
         State("reopen-restore-active-toggle", "value"),
         State("auth-store", "data"),
         prevent_initial_call=True,
+        running=[(Output("btn-reopen-event", "disabled"), True, False)],
     )
-    def reopen_archived_event(n_clicks, selected_slug, restore_flags, auth_state):
+    def reopen_archived_event(set_progress, n_clicks, selected_slug, restore_flags, auth_state):
         if not n_clicks:
             return no_update, no_update, no_update, no_update
 
@@ -6462,7 +7317,21 @@ def register_callbacks(app):
         reopen_fn = getattr(storage_api, "reopen_event", None)
         if reopen_fn:
             try:
-                result = reopen_fn(**payload)
+                result = run_admin_job(
+                    set_progress,
+                    ADMIN_JOB_KINDS["reopen"],
+                    f"Reopening {selected_slug}",
+                    lambda: reopen_fn(**payload),
+                    event_slug=selected_slug,
+                    started_by=payload["user"]["user_name"],
+                )
+            except AdminJobBusy as e:
+                return (
+                    html.Span(f"⏳ {e}", style={"color": "#f59e0b"}),
+                    no_update,
+                    no_update,
+                    no_update,
+                )
             except Exception as e:
                 logger.exception(f"Reopen failed for {selected_slug}: {e}")
                 return (
@@ -6514,6 +7383,7 @@ def register_callbacks(app):
                         "restored_rows": result.get("restored_rows", 0),
                     }
                 ),
+                durable=True,
             )
         except Exception as e:
             logger.warning(f"Failed to write audit log for reopen: {e}")
@@ -6653,42 +7523,12 @@ def register_callbacks(app):
     # -------------------------------------------------------------------------
     # Audit Log - load and filter entries
     # -------------------------------------------------------------------------
-    @app.callback(
-        Output("audit-log-table", "data"),
-        Output("audit-log-table", "tooltip_data"),
-        Output("audit-log-count", "children"),
-        Output("audit-filter-action", "options"),
-        Output("audit-filter-user", "options"),
-        Input("tabs", "value"),
-        Input("btn-audit-refresh", "n_clicks"),
-        Input("audit-filter-action", "value"),
-        Input("audit-filter-user", "value"),
-    )
-    def update_audit_log(selected_tab, _refresh_clicks, filter_action, filter_user):
-        """
-        Load audit log entries when the Audit Log tab is selected.
-        Applies optional action and user filters.
-        Only fetches data when the audit tab is active (avoids unnecessary API calls).
-        """
-        if selected_tab != "tab-settings":
-            return no_update, no_update, no_update, no_update, no_update
-
-        try:
-            # Fetch with server-side filters where possible
-            entries = get_audit_log(
-                action=filter_action or None,
-                user_id=filter_user or None,
-                limit=200,
-            )
-        except Exception as e:
-            logger.error(f"Failed to load audit log: {e}")
-            return [], [], "Error loading audit log", [], []
+    AUDIT_PAGE_SIZE = 200
 
-        if not entries:
-            return [], [], "0 entries", [], []
-
-        # Format timestamps for display (keep full ISO in tooltip)
+    def _format_audit_entries(entries):
+        """Format audit entries for the table in place. Returns tooltip_data."""
         for entry in entries:
+            entry.pop("cursor", None)  # kept in audit-log-cursor instead
             raw_action = entry.get("action") or ""
             entry["_action_raw"] = raw_action
             entry["action_category"] = get_action_group(raw_action)
@@ -6702,37 +7542,6 @@ def register_callbacks(app):
                 except (ValueError, TypeError):
                     pass
 
-        # Build unique action and user options from ALL entries (unfiltered)
-        # For action options, re-fetch without action filter
-        try:
-            all_entries = get_audit_log(limit=200)
-        except Exception:
-            all_entries = entries
-
-        action_values = sorted(
-            {e.get("action") for e in all_entries if e.get("action")},
-            key=action_sort_key,
-        )
-        user_values = sorted(
-            {e.get("user_name") for e in all_entries if e.get("user_name")},
-            key=str.lower,
-        )
-
-        action_options = [
-            {"label": format_action_filter_label(a), "value": a} for a in action_values
-        ]
-        # User filter uses user_id for filtering but shows user_name
-        user_id_map = {}
-        for e in all_entries:
-            uid = e.get("user_id")
-            uname = e.get("user_name")
-            if uid and uname and uid not in user_id_map:
-                user_id_map[uid] = uname
-        user_options = [
-            {"label": name, "value": uid}
-            for uid, name in sorted(user_id_map.items(), key=lambda x: x[1].lower())
-        ]
-
         # Build tooltip data for full details on hover
         tooltip_data = []
         for entry in entries:
@@ -6748,7 +7557,130 @@ def register_callbacks(app):
             if reason:
                 row_tips["reason"] = {"value": reason, "type": "text"}
             tooltip_data.append(row_tips)
+        return tooltip_data
+
+    def _audit_filter_options():
+        """(action_options, user_options) over the whole audit log."""
+        options_fn = getattr(storage_api, "get_audit_log_filter_options", None)
+        if options_fn:
+            options = options_fn() or {}
+            action_values = options.get("actions") or []
+            user_id_map = {u["user_id"]: u["user_name"] for u in options.get("users") or []}
+        else:
+            # Backends without the lookup: derive from the latest entries
+            all_entries = get_audit_log(limit=AUDIT_PAGE_SIZE)
+            action_values = {e.get("action") for e in all_entries if e.get("action")}
+            # User filter uses user_id for filtering but shows user_name
+            user_id_map = {}
+            for e in all_entries:
+                uid = e.get("user_id")
+                uname = e.get("user_name")
+                if uid and uname and uid not in user_id_map:
+                    user_id_map[uid] = uname
+
+        action_options = [
+            {"label": format_action_filter_label(a), "value": a}
+            for a in sorted(action_values, key=action_sort_key)
+        ]
+        user_options = [
+            {"label": name, "value": uid}
+            for uid, name in sorted(user_id_map.items(), key=lambda x: x[1].lower())
+        ]
+        return action_options, user_options
+
+    @app.callback(
+        Output("audit-log-table", "data"),
+        Output("audit-log-table", "tooltip_data"),
+        Output("audit-log-count", "children"),
+        Output("audit-filter-action", "options"),
+        Output("audit-filter-user", "options"),
+        Output("audit-log-cursor", "data"),
+        Output("btn-audit-older", "disabled"),
+        Input("tabs", "value"),
+        Input("btn-audit-refresh", "n_clicks"),
+        Input("audit-filter-action", "value"),
+        Input("audit-filter-user", "value"),
+    )
+    def update_audit_log(selected_tab, _refresh_clicks, filter_action, filter_user):
+        """
+        Load the newest page of audit log entries when the Audit Log tab is selected.
+        Applies optional action and user filters; older pages come from
+        load_older_audit_entries. Filter options are only reloaded on tab
+        open / refresh, not when a filter changes.
+        Only fetches data when the audit tab is active (avoids unnecessary API calls).
+        """
+        if selected_tab != "tab-settings":
+            return (no_update,) * 7
+
+        try:
+            # Fetch with server-side filters where possible
+            entries = get_audit_log(
+                action=filter_action or None,
+                user_id=filter_user or None,
+                limit=AUDIT_PAGE_SIZE,
+            )
+        except Exception as e:
+            logger.error(f"Failed to load audit log: {e}")
+            return [], [], "Error loading audit log", [], [], None, True
+
+        if ctx.triggered_id in ("audit-filter-action", "audit-filter-user"):
+            action_options, user_options = no_update, no_update
+        else:
+            try:
+                action_options, user_options = _audit_filter_options()
+            except Exception as e:
+                logger.warning(f"Failed to load audit filter options: {e}")
+                action_options, user_options = [], []
+
+        if not entries:
+            return [], [], "0 entries", action_options, user_options, None, True
 
+        cursor = entries[-1].get("cursor")
+        tooltip_data = _format_audit_entries(entries)
         count_text = f"{len(entries)} entries"
+        has_more = len(entries) >= AUDIT_PAGE_SIZE and bool(cursor)
+
+        return entries, tooltip_data, count_text, action_options, user_options, cursor, not has_more
+
+    @app.callback(
+        Output("audit-log-table", "data", allow_duplicate=True),
+        Output("audit-log-table", "tooltip_data", allow_duplicate=True),
+        Output("audit-log-count", "children", allow_duplicate=True),
+        Output("audit-log-cursor", "data", allow_duplicate=True),
+        Output("btn-audit-older", "disabled", allow_duplicate=True),
+        Input("btn-audit-older", "n_clicks"),
+        State("audit-log-cursor", "data"),
+        State("audit-filter-action", "value"),
+        State("audit-filter-user", "value"),
+        State("audit-log-table", "data"),
+        prevent_initial_call=True,
+    )
+    def load_older_audit_entries(n_clicks, cursor, filter_action, filter_user, current_rows):
+        """Append the next (older) page of audit entries using the keyset cursor."""
+        if not n_clicks or not cursor:
+            return (no_update,) * 5
 
-        return entries, tooltip_data, count_text, action_options, user_options
+        try:
+            entries = get_audit_log(
+                action=filter_action or None,
+                user_id=filter_user or None,
+                limit=AUDIT_PAGE_SIZE,
+                before=cursor,
+            )
+        except Exception as e:
+            logger.error(f"Failed to load older audit entries: {e}")
+            return no_update, no_update, "Error loading older entries", no_update, no_update
+
+        if not entries:
+            return no_update, no_update, no_update, None, True
+
+        next_cursor = entries[-1].get("cursor")
+        tooltip_data = _format_audit_entries(entries)
+        has_more = len(entries) >= AUDIT_PAGE_SIZE and bool(next_cursor)
+
+        rows_patch = Patch()
+        rows_patch.extend(entries)
+        tooltip_patch = Patch()
+        tooltip_patch.extend(tooltip_data)
+        count_text = f"{len(current_rows or []) + len(entries)} entries"
+        return rows_patch, tooltip_patch, count_text, next_cursor, not has_more
@@ -4,16 +4,9 @@ FGC Dashboard Layout - Modern Esports Theme
 """
 import os
 import flask
+from functools import lru_cache
 from dash import html, dcc, dash_table
-from shared.storage import (
-    get_all_event_slugs,
-    get_active_slug,
-    get_checkins,
-    get_active_settings,
-    get_event_history,
-    get_session,
-)
-import pandas as pd
+from shared.storage import get_session
 import logging
 from datetime import datetime
 
@@ -154,23 +147,40 @@ STYLES = {
 }
 
 
-def _get_auth_state() -> dict:
+EMPTY_AUTH_STATE = {"logged_in": False, "user_name": "", "user_id": "", "user_email": ""}
+
+# Check-in table columns shown by default (payment/member only when required)
+DEFAULT_VISIBLE_COLUMNS = [
+    "name",
+    "tag",
+    "status",
+    "payment_valid",
+    "telephone",
+    "member",
+    "startgg",
+    "is_guest",
+    "tournament_games_registered",
+]
+
+
+def get_auth_state() -> dict:
     """
     Check current user's auth state from session cookie.
 
     Returns dict with:
         logged_in (bool), user_name (str), user_id (str), user_email (str)
 
-    Safe to call on every page load - returns empty state on any failure.
+    Called from the page-load callback (needs a Flask request context).
+    Returns empty state on any failure.
     """
     try:
         cookie = flask.request.cookies.get(SESSION_COOKIE_NAME, "")
         if not cookie:
-            return {"logged_in": False, "user_name": "", "user_id": "", "user_email": ""}
+            return dict(EMPTY_AUTH_STATE)
 
         session_data = get_session(cookie)
         if not session_data:
-            return {"logged_in": False, "user_name": "", "user_id": "", "user_email": ""}
+            return dict(EMPTY_AUTH_STATE)
 
         return {
             "logged_in": True,
@@ -184,10 +194,10 @@ def _get_auth_state() -> dict:
         }
     except Exception as e:
         logger.warning(f"Auth state check failed: {e}")
-        return {"logged_in": False, "user_name": "", "user_id": "", "user_email": ""}
+        return dict(EMPTY_AUTH_STATE)
 
 
-def _build_auth_ui(auth_state: dict) -> html.Div:
+def build_auth_ui(auth_state: dict) -> html.Div:
     """Build the login/logout component for the header."""
     login_path = "/auth/login" if IS_PROD else "/admin/auth/login"
     logout_path = "/auth/logout" if IS_PROD else "/admin/auth/logout"
@@ -240,48 +250,81 @@ def _build_auth_ui(auth_state: dict) -> html.Div:
         )
 
 
-def create_layout():
+def _hidden_by_requirements(column: str, requirements: dict) -> bool:
+    """Payment/member columns are only offered when that requirement is enabled."""
+    if column == "payment_valid":
+        return requirements.get("require_payment") is not True
+    if column == "member":
+        return requirements.get("require_membership") is not True
+    return False
+
+
+def requirements_from_settings(settings: dict) -> dict:
+    """Requirement flags for requirements-store (enabled only when explicitly True)."""
+    settings = settings or {}
+    return {
+        "require_payment": settings.get("require_payment") is True,
+        "require_membership": settings.get("require_membership") is True,
+        "require_startgg": settings.get("require_startgg") is True,
+        "collect_acquisition_source": settings.get("collect_acquisition_source") is True,
+    }
+
+
+def default_visible_columns(requirements: dict) -> list:
+    """Default check-in table columns for the given requirements."""
+    requirements = requirements or {}
+    return [c for c in DEFAULT_VISIBLE_COLUMNS if not _hidden_by_requirements(c, requirements)]
+
+
+def column_visibility_options(requirements: dict, compact: bool = False) -> list:
     """
-    Build and return the layout for the FGC Check-in Dashboard.
-    Modern esports-themed design with live stats and status tracking.
+    Options for the column selectors. compact=True gives the short labels
+    of the Manual Tools checklist; the Settings dropdown also offers UUID/Created.
     """
-    # Auth state (checked on every page load via session cookie)
-    auth_state = _get_auth_state()
-    today = datetime.now().date()
-    year_start = today.replace(month=1, day=1)
-
-    # Fetch data
-    try:
-        active_slug = get_active_slug()
-    except Exception as e:
-        logger.exception(f"Failed to fetch active slug: {e}")
-        active_slug = None
+    requirements = requirements or {}
+    options = [
+        {"label": "Name", "value": "name"},
+        {"label": "Tag", "value": "tag"},
+        {"label": "Status", "value": "status"},
+        {"label": "Pay" if compact else "Payment", "value": "payment_valid"},
+        {"label": "Phone", "value": "telephone"},
+        {"label": "Member", "value": "member"},
+        {"label": "Sgg" if compact else "Start.gg", "value": "startgg"},
+        {"label": "Guest", "value": "is_guest"},
+        {"label": "Games", "value": "tournament_games_registered"},
+        {"label": "Email", "value": "email"},
+    ]
+    if not compact:
+        options += [{"label": "UUID", "value": "UUID"}, {"label": "Created", "value": "created"}]
+    return [opt for opt in options if not _hidden_by_requirements(opt["value"], requirements)]
 
-    # Fetch settings for requirements
-    try:
-        settings = get_active_settings() or {}
-    except Exception as e:
-        logger.exception(f"Failed to fetch settings: {e}")
-        settings = {}
 
-    try:
-        event_slugs = get_all_event_slugs() or []
-    except Exception as e:
-        logger.exception(f"Failed to fetch event slugs: {e}")
-        event_slugs = []
+def event_dropdown_options(
+    event_slugs: list, active_slug=None, event_display_name: str = ""
+) -> list:
+    """
+    Options for the event dropdown. The active event uses event_display_name
+    (has proper åäö), other slugs fall back to a title-cased slug.
+    """
+    return [{"label": "🔍 All Events (Debug)", "value": "__ALL__"}] + [
+        {
+            "label": (
+                event_display_name
+                if s == active_slug and event_display_name
+                else s.replace("-", " ").title()
+            ),
+            "value": s,
+        }
+        for s in event_slugs
+    ]
 
-    try:
-        archived_events = get_event_history() or []
-    except Exception as e:
-        logger.exception(f"Failed to fetch archived events: {e}")
-        archived_events = []
 
-    archived_slugs = []
-    reopen_dropdown_options = []
-    for ev in archived_events:
+def reopen_event_options(archived_events: list) -> list:
+    """Options for the Reopen Event selector, built from event_history rows."""
+    options = []
+    for ev in archived_events or []:
         slug = ev.get("event_slug") if isinstance(ev, dict) else None
         if slug:
-            archived_slugs.append(slug)
             display_name = ev.get("event_display_name") or slug.replace("-", " ").title()
             event_date = ev.get("event_date") or ""
             participants = ev.get("total_participants", 0)
@@ -290,68 +333,86 @@ def create_layout():
                 label += f"  ({event_date})"
             if participants:
                 label += f"  — {participants} players"
-            reopen_dropdown_options.append({"label": label, "value": slug})
-    archived_slugs = sorted(set(archived_slugs))
+            options.append({"label": label, "value": slug})
+    return options
 
-    if active_slug and active_slug not in event_slugs:
-        event_slugs = [active_slug] + event_slugs
 
-    try:
-        df = pd.DataFrame(get_checkins(active_slug)) if active_slug else pd.DataFrame()
-    except Exception as e:
-        logger.exception(f"Failed to fetch initial checkins: {e}")
-        df = pd.DataFrame()
+# Status row of a background admin job (shown by the job's `running` output)
+ADMIN_JOB_STATUS_HIDDEN = {"display": "none"}
+ADMIN_JOB_STATUS_VISIBLE = {
+    "display": "flex",
+    "alignItems": "center",
+    "gap": "0.75rem",
+    "marginTop": "0.75rem",
+}
 
-    # Prepare table data
-    if df.empty:
-        columns = [{"name": "No participants yet", "id": "info"}]
-        data = []
-    else:
-        columns = [
-            {"name": str(col).replace("_", " ").title(), "id": str(col)} for col in df.columns
-        ]
-        data = df.to_dict("records")
 
-    # Format event name for display - use event_display_name if available (has proper åäö)
-    event_display_name = settings.get("event_display_name", "")
-    event_display = (
-        event_display_name
-        if event_display_name
-        else (active_slug.replace("-", " ").title() if active_slug else "No Event Selected")
+def admin_job_status(prefix: str) -> html.Div:
+    """Progress text + Cancel button for a background admin job ({prefix}-job-*)."""
+    return html.Div(
+        id=f"{prefix}-job-status",
+        style=ADMIN_JOB_STATUS_HIDDEN,
+        children=[
+            html.Span(
+                id=f"{prefix}-job-progress",
+                style={"color": COLORS["text_secondary"], "fontSize": "0.85rem"},
+            ),
+            html.Button(
+                "Cancel",
+                id=f"{prefix}-job-cancel",
+                n_clicks=0,
+                style={
+                    "backgroundColor": "transparent",
+                    "color": COLORS["accent_red"],
+                    "border": f"1px solid {COLORS['accent_red']}",
+                    "borderRadius": "8px",
+                    "padding": "0.35rem 0.8rem",
+                    "fontSize": "0.8rem",
+                    "fontWeight": "600",
+                    "cursor": "pointer",
+                },
+            ),
+        ],
     )
 
-    def _fmt_dt_local(value):
-        if not value:
-            return ""
-        if isinstance(value, datetime):
-            return value.strftime("%Y-%m-%dT%H:%M")
-        txt = str(value).strip()
-        if not txt:
-            return ""
-        txt = txt.replace("Z", "+00:00")
-        try:
-            return datetime.fromisoformat(txt).strftime("%Y-%m-%dT%H:%M")
-        except Exception:
-            return ""
 
-    checkin_opened_local = _fmt_dt_local(settings.get("checkin_opened_at"))
-    event_started_local = _fmt_dt_local(settings.get("event_started_at"))
-    event_ended_local = _fmt_dt_local(settings.get("event_ended_at"))
+def format_datetime_local(value) -> str:
+    """Format a timestamp for a datetime-local input ("" when missing/invalid)."""
+    if not value:
+        return ""
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%dT%H:%M")
+    txt = str(value).strip()
+    if not txt:
+        return ""
+    txt = txt.replace("Z", "+00:00")
+    try:
+        return datetime.fromisoformat(txt).strftime("%Y-%m-%dT%H:%M")
+    except Exception:
+        return ""
+
 
-    # Build visible columns based on active requirements
-    default_columns = [
-        "name",
-        "tag",
-        "status",
-        "telephone",
-        "startgg",
-        "is_guest",
-        "tournament_games_registered",
-    ]
-    if settings.get("require_payment") is True:
-        default_columns.insert(3, "payment_valid")
-    if settings.get("require_membership") is True:
-        default_columns.insert(4 if "payment_valid" in default_columns else 3, "member")
+def create_layout():
+    """
+    Return the layout for the FGC Check-in Dashboard.
+
+    The layout is a static skeleton with no per-user or per-event data, so
+    serving a page load runs no DB queries. Auth state, the event list and
+    settings-backed values are filled in by the page-load callbacks, and
+    Settings tab data loads the first time that tab is opened.
+    """
+    return _build_layout(datetime.now().date())
+
+
+@lru_cache(maxsize=1)
+def _build_layout(today):
+    """
+    Build the layout skeleton once per process (and per day, for the
+    Insights date defaults). Modern esports-themed design with live stats
+    and status tracking.
+    """
+    year_start = today.replace(month=1, day=1)
+    requirements = requirements_from_settings({})
 
     return html.Div(
         style=STYLES["page"],
@@ -359,24 +420,22 @@ def create_layout():
             # Data stores
             dcc.Store(id="sse-token-store", data=SSE_TOKEN),  # Token for SSE auth
             dcc.Store(id="events-map-store", data=[]),
-            dcc.Store(id="visible-columns-store", data=default_columns),
+            dcc.Location(id="page-url", refresh=False),  # Triggers the page-load callbacks
+            dcc.Store(id="visible-columns-store", data=default_visible_columns(requirements)),
             dcc.Store(
                 id="active-filter", data="all"
             ),  # Current filter: all, pending, ready, no-payment
             dcc.Store(id="sse-trigger", data=0),  # Incremented by SSE events to trigger refresh
+            dcc.Store(id="checkin-delta-store"),  # Recent checkin_delta SSE events (sse-client.js)
+            dcc.Store(id="checkin-delta-applied", data={}),  # Last applied delta {stream, seq}
+            dcc.Store(id="bulk-recheck-store"),  # Bulk Start.gg recheck progress (sse-client.js)
+            dcc.Store(id="checkins-summary-store", data={}),  # Check-in counts + Needs Attention rows
+            dcc.Store(id="insights-scope-store"),  # Resolved insights filters (period/series/events)
+            dcc.Store(id="audit-log-cursor"),  # Keyset cursor of the last loaded audit entry
             dcc.Store(id="sse-status", data="disconnected"),  # SSE connection status
-            dcc.Store(id="auth-store", data=auth_state),  # Current user auth state
-            dcc.Store(
-                id="requirements-store",
-                data={
-                    # Requirements are enabled only when explicitly True
-                    "require_payment": settings.get("require_payment") is True,
-                    "require_membership": settings.get("require_membership") is True,
-                    "require_startgg": settings.get("require_startgg") is True,
-                    "collect_acquisition_source": settings.get("collect_acquisition_source")
-                    is True,
-                },
-            ),
+            dcc.Store(id="auth-store", data=dict(EMPTY_AUTH_STATE)),  # Current user auth state
+            dcc.Store(id="requirements-store", data=requirements),
+            dcc.Store(id="settings-tab-loaded", data=False),  # Settings tab data loaded once
             dcc.Interval(
                 id="interval-refresh", interval=300 * 1000, n_intervals=0, disabled=True
             ),  # Fallback: 5 min, disabled by default
@@ -386,8 +445,9 @@ def create_layout():
                 children=[
                     # Auth UI (top left)
                     html.Div(
+                        id="auth-ui",
                         style={"position": "absolute", "top": "1.5rem", "left": "2rem"},
-                        children=[_build_auth_ui(auth_state)],
+                        children=[],
                     ),
                     # Centered logo
                     html.Div(
@@ -538,34 +598,8 @@ def create_layout():
                                                         id="event-dropdown",
                                                         className="fgc-dropdown",
                                                         placeholder="Insert slug in Settings (Fetch Event Data)",
-                                                        options=[
-                                                            {
-                                                                "label": "🔍 All Events (Debug)",
-                                                                "value": "__ALL__",
-                                                            },
-                                                        ]
-                                                        + [
-                                                            # Use event_display_name for active slug (has proper åäö), fallback to slug title
-                                                            {
-                                                                "label": (
-                                                                    event_display_name
-                                                                    if s == active_slug
-                                                                    and event_display_name
-                                                                    else s.replace("-", " ").title()
-                                                                ),
-                                                                "value": s,
-                                                            }
-                                                            for s in event_slugs
-                                                        ],
-                                                        value=(
-                                                            active_slug
-                                                            if active_slug in event_slugs
-                                                            else (
-                                                                event_slugs[0]
-                                                                if event_slugs
-                                                                else None
-                                                            )
-                                                        ),
+                                                        options=event_dropdown_options([]),
+                                                        value=None,
                                                         clearable=True,
                                                         style={
                                                             "backgroundColor": COLORS["bg_dark"]
@@ -704,7 +738,7 @@ def create_layout():
                                                 },
                                                 children=[
                                                     html.P(
-                                                        str(len(data)),
+                                                        "0",
                                                         id="stat-total",
                                                         style={
                                                             **STYLES["stat_value"],
@@ -726,15 +760,7 @@ def create_layout():
                                                 },
                                                 children=[
                                                     html.P(
-                                                        str(
-                                                            len(
-                                                                [
-                                                                    d
-                                                                    for d in data
-                                                                    if d.get("status") == "Ready"
-                                                                ]
-                                                            )
-                                                        ),
+                                                        "0",
                                                         id="stat-ready",
                                                         style={
                                                             **STYLES["stat_value"],
@@ -756,15 +782,7 @@ def create_layout():
                                                 },
                                                 children=[
                                                     html.P(
-                                                        str(
-                                                            len(
-                                                                [
-                                                                    d
-                                                                    for d in data
-                                                                    if d.get("status") == "Pending"
-                                                                ]
-                                                            )
-                                                        ),
+                                                        "0",
                                                         id="stat-pending",
                                                         style={
                                                             **STYLES["stat_value"],
@@ -926,7 +944,7 @@ def create_layout():
                                                             ),
                                                             html.Span(
                                                                 id="player-count",
-                                                                children=f"{len(data)} players",
+                                                                children="0 players",
                                                                 style={
                                                                     "color": COLORS["text_muted"],
                                                                     "fontSize": "0.875rem",
@@ -1033,11 +1051,19 @@ def create_layout():
                                                 color=COLORS["accent_blue"],
                                                 children=dash_table.DataTable(
                                                     id="checkins-table",
-                                                    columns=columns,
-                                                    data=data,
+                                                    columns=[
+                                                        {"name": "No participants yet", "id": "info"}
+                                                    ],
+                                                    data=[],
                                                     editable=False,
+                                                    # Paged, sorted and filtered in SQL (update_table)
+                                                    page_action="custom",
+                                                    page_current=0,
                                                     page_size=20,
-                                                    sort_action="native",
+                                                    page_count=0,
+                                                    sort_action="custom",
+                                                    sort_mode="single",
+                                                    sort_by=[],
                                                     row_selectable="multi",
                                                     style_table={"overflowX": "auto"},
                                                     style_header={
@@ -1371,6 +1397,22 @@ def create_layout():
                                                                     "cursor": "pointer",
                                                                 },
                                                             ),
+                                                            html.Button(
+                                                                "Cancel bulk",
+                                                                id="btn-bulk-recheck-cancel",
+                                                                n_clicks=0,
+                                                                style={
+                                                                    "display": "none",
+                                                                    "backgroundColor": "transparent",
+                                                                    "color": "#ef4444",
+                                                                    "border": "1px solid #ef4444",
+                                                                    "borderRadius": "8px",
+                                                                    "padding": "0.5rem 0.9rem",
+                                                                    "fontSize": "0.8rem",
+                                                                    "fontWeight": "600",
+                                                                    "cursor": "pointer",
+                                                                },
+                                                            ),
                                                             html.Span(
                                                                 "Select row + Re-check, or Bulk all.",
                                                                 style={
@@ -1409,94 +1451,10 @@ def create_layout():
                                                             dcc.Checklist(
                                                                 id="quick-column-toggle",
                                                                 className="quick-col-toggle",
-                                                                options=[
-                                                                    opt
-                                                                    for opt in [
-                                                                        {
-                                                                            "label": "Name",
-                                                                            "value": "name",
-                                                                        },
-                                                                        {
-                                                                            "label": "Tag",
-                                                                            "value": "tag",
-                                                                        },
-                                                                        {
-                                                                            "label": "Status",
-                                                                            "value": "status",
-                                                                        },
-                                                                        (
-                                                                            {
-                                                                                "label": "Pay",
-                                                                                "value": "payment_valid",
-                                                                            }
-                                                                            if settings.get(
-                                                                                "require_payment"
-                                                                            )
-                                                                            is True
-                                                                            else None
-                                                                        ),
-                                                                        {
-                                                                            "label": "Phone",
-                                                                            "value": "telephone",
-                                                                        },
-                                                                        (
-                                                                            {
-                                                                                "label": "Member",
-                                                                                "value": "member",
-                                                                            }
-                                                                            if settings.get(
-                                                                                "require_membership"
-                                                                            )
-                                                                            is True
-                                                                            else None
-                                                                        ),
-                                                                        {
-                                                                            "label": "Sgg",
-                                                                            "value": "startgg",
-                                                                        },
-                                                                        {
-                                                                            "label": "Guest",
-                                                                            "value": "is_guest",
-                                                                        },
-                                                                        {
-                                                                            "label": "Games",
-                                                                            "value": "tournament_games_registered",
-                                                                        },
-                                                                        {
-                                                                            "label": "Email",
-                                                                            "value": "email",
-                                                                        },
-                                                                    ]
-                                                                    if opt is not None
-                                                                ],
-                                                                value=[
-                                                                    c
-                                                                    for c in [
-                                                                        "name",
-                                                                        "tag",
-                                                                        "status",
-                                                                        "payment_valid",
-                                                                        "telephone",
-                                                                        "member",
-                                                                        "startgg",
-                                                                        "is_guest",
-                                                                        "tournament_games_registered",
-                                                                    ]
-                                                                    if not (
-                                                                        c == "payment_valid"
-                                                                        and settings.get(
-                                                                            "require_payment"
-                                                                        )
-                                                                        is not True
-                                                                    )
-                                                                    and not (
-                                                                        c == "member"
-                                                                        and settings.get(
-                                                                            "require_membership"
-                                                                        )
-                                                                        is not True
-                                                                    )
-                                                                ],
+                                                                options=column_visibility_options(
+                                                                    requirements, compact=True
+                                                                ),
+                                                                value=default_visible_columns(requirements),
                                                                 inline=True,
                                                                 style={
                                                                     "fontSize": "0.72rem",
@@ -1521,6 +1479,9 @@ def create_layout():
                                     html.Div(
                                         id="recheck-startgg-feedback", style={"marginTop": "0.5rem"}
                                     ),
+                                    html.Div(
+                                        id="bulk-recheck-progress", style={"marginTop": "0.5rem"}
+                                    ),
                                     # Feedback messages
                                     html.Div(
                                         id="payment-update-feedback", style={"marginTop": "0.5rem"}
@@ -3613,6 +3574,8 @@ def create_layout():
                                                         id="duplicates-list",
                                                         children=[],
                                                     ),
+                                                    # Set once the stored index is shown; starts the refresh
+                                                    dcc.Store(id="duplicates-index-shown"),
                                                     # Merge history section
                                                     html.Hr(
                                                         style={
@@ -3697,6 +3660,7 @@ def create_layout():
                                                 n_clicks=0,
                                                 style=STYLES["button_primary"],
                                             ),
+                                            admin_job_status("fetch-event"),
                                             html.Div(
                                                 id="settings-output",
                                                 style={
@@ -3735,12 +3699,7 @@ def create_layout():
                                                     dcc.Checklist(
                                                         id="require-payment-toggle",
                                                         options=[{"label": "", "value": True}],
-                                                        value=(
-                                                            [True]
-                                                            if settings.get("require_payment")
-                                                            is True
-                                                            else []
-                                                        ),
+                                                        value=[],
                                                         style={"display": "inline-block"},
                                                         inputStyle={
                                                             "width": "18px",
@@ -3781,12 +3740,7 @@ def create_layout():
                                                     dcc.Checklist(
                                                         id="require-membership-toggle",
                                                         options=[{"label": "", "value": True}],
-                                                        value=(
-                                                            [True]
-                                                            if settings.get("require_membership")
-                                                            is True
-                                                            else []
-                                                        ),
+                                                        value=[],
                                                         style={"display": "inline-block"},
                                                         inputStyle={
                                                             "width": "18px",
@@ -3827,12 +3781,7 @@ def create_layout():
                                                     dcc.Checklist(
                                                         id="require-startgg-toggle",
                                                         options=[{"label": "", "value": True}],
-                                                        value=(
-                                                            [True]
-                                                            if settings.get("require_startgg")
-                                                            is True
-                                                            else []
-                                                        ),
+                                                        value=[],
                                                         style={"display": "inline-block"},
                                                         inputStyle={
                                                             "width": "18px",
@@ -3880,12 +3829,7 @@ def create_layout():
                                                     dcc.Checklist(
                                                         id="offer-membership-toggle",
                                                         options=[{"label": "", "value": True}],
-                                                        value=(
-                                                            [True]
-                                                            if settings.get("offer_membership")
-                                                            is True
-                                                            else []
-                                                        ),
+                                                        value=[],
                                                         style={"display": "inline-block"},
                                                         inputStyle={
                                                             "width": "18px",
@@ -3925,14 +3869,7 @@ def create_layout():
                                                     dcc.Checklist(
                                                         id="collect-acquisition-source-toggle",
                                                         options=[{"label": "", "value": True}],
-                                                        value=(
-                                                            [True]
-                                                            if settings.get(
-                                                                "collect_acquisition_source"
-                                                            )
-                                                            is True
-                                                            else []
-                                                        ),
+                                                        value=[],
                                                         style={"display": "inline-block"},
                                                         inputStyle={
                                                             "width": "18px",
@@ -4003,9 +3940,7 @@ def create_layout():
                                                     dcc.Input(
                                                         id="input-price-per-game",
                                                         type="number",
-                                                        value=settings.get(
-                                                            "swish_expected_per_game", 25
-                                                        ),
+                                                        value=25,
                                                         min=0,
                                                         step=5,
                                                         style={
@@ -4035,9 +3970,7 @@ def create_layout():
                                                     dcc.Input(
                                                         id="input-swish-number",
                                                         type="text",
-                                                        value=settings.get(
-                                                            "swish_number", "123-456 78 90"
-                                                        ),
+                                                        value="123-456 78 90",
                                                         style={
                                                             "width": "200px",
                                                             "padding": "0.5rem",
@@ -4096,7 +4029,7 @@ def create_layout():
                                                                 id="input-checkin-opened-at",
                                                                 type="text",
                                                                 placeholder="YYYY-MM-DDTHH:MM",
-                                                                value=checkin_opened_local,
+                                                                value="",
                                                                 style={
                                                                     "width": "100%",
                                                                     "padding": "0.5rem",
@@ -4134,7 +4067,7 @@ def create_layout():
                                                                 id="input-event-started-at",
                                                                 type="text",
                                                                 placeholder="YYYY-MM-DDTHH:MM",
-                                                                value=event_started_local,
+                                                                value="",
                                                                 style={
                                                                     "width": "100%",
                                                                     "padding": "0.5rem",
@@ -4172,7 +4105,7 @@ def create_layout():
                                                                 id="input-event-ended-at",
                                                                 type="text",
                                                                 placeholder="YYYY-MM-DDTHH:MM",
-                                                                value=event_ended_local,
+                                                                value="",
                                                                 style={
                                                                     "width": "100%",
                                                                     "padding": "0.5rem",
@@ -4253,6 +4186,7 @@ def create_layout():
                                                     "fontSize": "0.82rem",
                                                 },
                                             ),
+                                            admin_job_status("archive"),
                                             html.Div(
                                                 id="archive-feedback", style={"marginTop": "1rem"}
                                             ),
@@ -4282,7 +4216,7 @@ def create_layout():
                                             ),
                                             dcc.Dropdown(
                                                 id="reopen-event-selector",
-                                                options=reopen_dropdown_options,
+                                                options=[],
                                                 placeholder="Search archived events...",
                                                 searchable=True,
                                                 clearable=True,
@@ -4313,6 +4247,7 @@ def create_layout():
                                                 n_clicks=0,
                                                 style=STYLES["button_secondary"],
                                             ),
+                                            admin_job_status("reopen"),
                                             html.Div(
                                                 id="reopen-feedback", style={"marginTop": "1rem"}
                                             ),
@@ -4346,64 +4281,8 @@ def create_layout():
                                             dcc.Dropdown(
                                                 id="column-visibility-dropdown",
                                                 className="fgc-dropdown",
-                                                options=[
-                                                    opt
-                                                    for opt in [
-                                                        {"label": "Name", "value": "name"},
-                                                        {"label": "Tag", "value": "tag"},
-                                                        {"label": "Status", "value": "status"},
-                                                        (
-                                                            {
-                                                                "label": "Payment",
-                                                                "value": "payment_valid",
-                                                            }
-                                                            if settings.get("require_payment")
-                                                            is True
-                                                            else None
-                                                        ),
-                                                        {"label": "Phone", "value": "telephone"},
-                                                        (
-                                                            {"label": "Member", "value": "member"}
-                                                            if settings.get("require_membership")
-                                                            is True
-                                                            else None
-                                                        ),
-                                                        {"label": "Start.gg", "value": "startgg"},
-                                                        {"label": "Guest", "value": "is_guest"},
-                                                        {
-                                                            "label": "Games",
-                                                            "value": "tournament_games_registered",
-                                                        },
-                                                        {"label": "Email", "value": "email"},
-                                                        {"label": "UUID", "value": "UUID"},
-                                                        {"label": "Created", "value": "created"},
-                                                    ]
-                                                    if opt is not None
-                                                ],
-                                                value=[
-                                                    c
-                                                    for c in [
-                                                        "name",
-                                                        "tag",
-                                                        "status",
-                                                        "payment_valid",
-                                                        "telephone",
-                                                        "member",
-                                                        "startgg",
-                                                        "is_guest",
-                                                        "tournament_games_registered",
-                                                    ]
-                                                    if not (
-                                                        c == "payment_valid"
-                                                        and settings.get("require_payment")
-                                                        is not True
-                                                    )
-                                                    and not (
-                                                        c == "member"
-                                                        and settings.get("require_membership")
-                                                        is not True
-                                                    )
-                                                ],
+                                                options=column_visibility_options(requirements),
+                                                value=default_visible_columns(requirements),
                                                 multi=True,
                                                 clearable=False,
                                                 style={"backgroundColor": COLORS["bg_dark"]},
@@ -4546,7 +4425,7 @@ def create_layout():
                                                                         },
                                                                     ),
                                                                     html.P(
-                                                                        "Rebuild KPI stats for selected event from archived rows (safe repair).",
+                                                                        "Rebuild KPI stats for the selected event, or all archived events after a merge/backfill, from archived rows (safe repair).",
                                                                         style={
                                                                             "color": COLORS["text_secondary"],
                                                                             "marginBottom": "0.75rem",
@@ -4565,8 +4444,15 @@ def create_layout():
                                                                                 n_clicks=0,
                                                                                 style=STYLES["button_secondary"],
                                                                             ),
+                                                                            html.Button(
+                                                                                "Recompute All Events",
+                                                                                id="btn-recompute-all-event-stats",
+                                                                                n_clicks=0,
+                                                                                style=STYLES["button_secondary"],
+                                                                            ),
                                                                         ],
                                                                     ),
+                                                                    admin_job_status("recompute"),
                                                                     html.Div(
                                                                         id="recompute-event-feedback",
                                                                         style={"marginTop": "0.75rem"},
@@ -4600,6 +4486,7 @@ def create_layout():
                                                                 n_clicks=0,
                                                                 style=STYLES["button_secondary"],
                                                             ),
+                                                            admin_job_status("integrity"),
                                                             html.Div(
                                                                 id="scan-integrity-feedback",
                                                                 style={"marginTop": "0.75rem"},
@@ -4675,21 +4562,9 @@ def create_layout():
                                                             dcc.Dropdown(
                                                                 id="delete-archive-event-dropdown",
                                                                 className="fgc-dropdown",
-                                                                options=[
-                                                                    {
-                                                                        "label": s.replace(
-                                                                            "-", " "
-                                                                        ).title(),
-                                                                        "value": s,
-                                                                    }
-                                                                    for s in archived_slugs
-                                                                ],
+                                                                options=[],
                                                                 placeholder="Select archived event to delete",
-                                                                value=(
-                                                                    archived_slugs[0]
-                                                                    if archived_slugs
-                                                                    else None
-                                                                ),
+                                                                value=None,
                                                                 clearable=False,
                                                                 style={"marginBottom": "0.75rem"},
                                                             ),
@@ -5040,6 +4915,17 @@ def create_layout():
                                                                                 },
                                                                                 children="0 entries",
                                                                             ),
+                                                                            html.Button(
+                                                                                "Load older entries",
+                                                                                id="btn-audit-older",
+                                                                                n_clicks=0,
+                                                                                disabled=True,
+                                                                                style={
+                                                                                    **STYLES["button_secondary"],
+                                                                                    "marginTop": "0.5rem",
+                                                                                    "padding": "0.4rem 1rem",
+                                                                                },
+                                                                            ),
                                                                         ],
                                                                     ),
                                                                 ],
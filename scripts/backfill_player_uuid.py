@@ -115,6 +115,10 @@ def main():
             "UPDATE event_archive SET player_uuid = %s WHERE id = %s",
             updates,
         )
+        # Keep the insights fact table in step with the relinked rows
+        from shared.postgres_api import _refresh_player_event_facts
+
+        _refresh_player_event_facts(cur, player_uuids=sorted({u for u, _ in updates}))
         conn.commit()
         print("Done. Changes committed.")
     else:
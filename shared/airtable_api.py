@@ -701,6 +701,7 @@ def log_action(
     details: str = "",
     before_state: str = "",
     after_state: str = "",
+    durable: bool = False,
 ) -> Optional[str]:
     """
     Write an entry to the audit log.
@@ -710,6 +711,7 @@ def log_action(
         action: What happened (e.g., "event_archived", "player_deleted")
         target_table: Which Airtable table was affected
         **kwargs: Optional context fields (target_event, reason, before/after state)
+        durable: Accepted for parity with postgres_api (Airtable writes are always inline)
 
     Returns:
         Record ID of the audit log entry, or None on failure.
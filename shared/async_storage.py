@@ -0,0 +1,48 @@
+"""
+Async storage facade - awaitable counterpart of shared/storage.py.
+
+Used by the FastAPI backend so that storage calls never block the event loop.
+Exposes the same public function names as shared.storage; I/O functions are
+coroutines, pure helpers (compute_requirements, compute_checkin_status, ...)
+stay synchronous.
+
+    DATA_BACKEND=postgres   -> shared.postgres_async_api (AsyncConnectionPool)
+    DATA_BACKEND=airtable   -> airtable_api functions run in a worker thread
+
+Usage:
+    from shared.async_storage import get_checkin_by_tag, update_checkin, ...
+    record = await get_checkin_by_tag(tag, slug)
+
+The sync facade (shared/storage.py) remains for the Dash dashboard and scripts.
+"""
+
+import os
+
+DATA_BACKEND = os.getenv("DATA_BACKEND", "postgres").lower().strip()
+
+if DATA_BACKEND == "postgres":
+    from shared.postgres_async_api import *  # noqa: F401,F403
+else:
+    import asyncio as _asyncio
+    import functools as _functools
+    import inspect as _inspect
+
+    import shared.airtable_api as _airtable
+
+    _PURE_HELPERS = {"compute_requirements", "compute_checkin_status", "compute_event_stats"}
+
+    def _offload(fn):
+        @_functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            return await _asyncio.to_thread(fn, *args, **kwargs)
+
+        return wrapper
+
+    for _name, _fn in _inspect.getmembers(_airtable, _inspect.isfunction):
+        if _name.startswith("_") or _fn.__module__ != _airtable.__name__:
+            continue
+        globals()[_name] = _fn if _name in _PURE_HELPERS else _offload(_fn)
+
+    async def close_pool() -> None:
+        """No-op for the Airtable backend (HTTP session only)."""
+        return None
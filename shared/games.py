@@ -0,0 +1,54 @@
+"""
+Canonical game names for FGC Check-in System.
+
+Start.gg event names and check-in form values differ per tournament
+("Super Smash Bros. Ultimate Singles", "smash singles", "SSBU" ...).
+canonical_game_name is the single normalizer: storage registers every raw
+name once as an alias of its canonical game (games / game_aliases tables),
+and the dashboard uses it for labels.
+
+Pure functions, importable from both the backend and dashboard containers.
+"""
+
+import re
+from typing import Any
+
+SSBU_SINGLES = "SSBU Singles"
+STREET_FIGHTER_6 = "STREET FIGHTER 6 TOURNAMENT"
+TEKKEN_8 = "TEKKEN 8 TOURNAMENT"
+
+
+def game_alias_key(name: Any) -> str:
+    """Lookup key for a raw game name (game_aliases.alias)."""
+    return str(name or "").strip().lower()
+
+
+def canonical_game_name(name: Any) -> str:
+    """Return the canonical name for a raw game name ("" for blank input)."""
+    raw = str(name or "").strip()
+    if not raw:
+        return ""
+    key = raw.lower()
+    compact = re.sub(r"[^a-z0-9]+", "", key)
+
+    # SSBU canonicalization
+    if (
+        "ssbu" in key
+        or "super smash bros ultimate" in key
+        or key == "smash singles"
+        or ("smash" in key and "ultimate" in key)
+    ):
+        return SSBU_SINGLES
+
+    # SF6 canonicalization
+    if (
+        compact in {"sf6", "streetfighter6", "streetfighter6tournament"}
+        or "street fighter 6" in key
+    ):
+        return STREET_FIGHTER_6
+
+    # Tekken 8 canonicalization
+    if compact in {"t8", "tekken8", "tekken8tournament"} or "tekken 8" in key:
+        return TEKKEN_8
+
+    return raw
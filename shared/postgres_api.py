@@ -8,13 +8,21 @@ Connection uses DATABASE_URL from environment, with a connection pool
 managed by psycopg3.
 """
 
-import os
-import logging
+import atexit
+import copy
+import hashlib
 import json
+import logging
+import os
+import threading
+import time
 import uuid
-from datetime import datetime, timezone, timedelta
+from collections import deque
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import List, Dict, Any, Optional
+from typing import Any, Dict, Iterable, List, Optional
+
+from shared.games import canonical_game_name, game_alias_key
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
@@ -34,13 +42,24 @@ if not DATABASE_URL:
     logger.critical("❌ Missing DATABASE_URL in .env")
     raise EnvironmentError("Missing DATABASE_URL in .env")
 
+# Tables insights read from; changing them bumps archive_generation (insights cache)
+ARCHIVE_GENERATION_TABLES = ("event_archive", "event_stats", "players", "games", "game_aliases")
+# New games/aliases only resolve rows written later (which bump themselves), and
+# _register_game_names inserts them beside a writer's open transaction
+ARCHIVE_GENERATION_INSERT_EXEMPT = ("games", "game_aliases")
+
 # Connection pool - lazy-initialized on first use
 _pool = None
+_migrations_ran = False
+# Whether idx_active_event_tag_unique exists, checked by _run_migrations. Its
+# creation is best effort; without it begin_checkin falls back to a locked
+# read-then-write per event + tag (_begin_checkin_locked).
+_checkin_tag_index_ready = False
 
 
 def _get_pool():
     """Lazy-init a connection pool (import psycopg only when Postgres backend is active)."""
-    global _pool
+    global _pool, _migrations_ran
     if _pool is None:
         import psycopg_pool  # type: ignore
 
@@ -52,14 +71,28 @@ def _get_pool():
             kwargs={"autocommit": True},
         )
         logger.info("✅ Postgres connection pool initialized")
-        _run_migrations(_pool)
+        # Once per process tree: forked job processes reopen the pool, not the schema
+        if not _migrations_ran:
+            _migrations_ran = True
+            _run_migrations(_pool)
     return _pool
 
 
-def _run_migrations(pool):
-    """Idempotent schema migrations - safe to run on every startup."""
+def _run_migrations(pool=None):
+    """Idempotent schema migrations - safe to run on every startup.
+
+    Uses a pooled connection when given a pool, otherwise a short-lived direct
+    connection (the async backend never opens the sync pool).
+    """
+    global _checkin_tag_index_ready
     try:
-        with pool.connection() as conn:
+        if pool is not None:
+            conn_ctx = pool.connection()
+        else:
+            import psycopg  # type: ignore
+
+            conn_ctx = psycopg.connect(DATABASE_URL, autocommit=True)
+        with conn_ctx as conn:
             with conn.cursor() as cur:
                 # No-show tracking columns (added 2026-02-24)
                 for col, typ in [
@@ -127,13 +160,902 @@ def _run_migrations(pool):
                 cur.execute(
                     "CREATE INDEX IF NOT EXISTS idx_merge_log_remove ON merge_log(remove_uuid)"
                 )
+
+                # Settings change notifications for the settings cache (added 2026-10-16)
+                cur.execute(
+                    f"""
+                    CREATE OR REPLACE FUNCTION notify_settings_changed() RETURNS trigger AS $$
+                    BEGIN
+                        PERFORM pg_notify('{SETTINGS_NOTIFY_CHANNEL}', TG_OP);
+                        RETURN NULL;
+                    END;
+                    $$ LANGUAGE plpgsql
+                    """
+                )
+                cur.execute(
+                    """
+                    CREATE OR REPLACE TRIGGER trg_settings_notify
+                    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON settings
+                    FOR EACH STATEMENT EXECUTE FUNCTION notify_settings_changed()
+                    """
+                )
+
+                # Session revocation notifications for the session cache (added 2026-10-16)
+                cur.execute(
+                    f"""
+                    CREATE OR REPLACE FUNCTION notify_session_revoked() RETURNS trigger AS $$
+                    BEGIN
+                        IF TG_OP = 'TRUNCATE' THEN
+                            PERFORM pg_notify('{SESSION_NOTIFY_CHANNEL}', '');
+                        ELSE
+                            PERFORM pg_notify('{SESSION_NOTIFY_CHANNEL}', OLD.session_id);
+                        END IF;
+                        RETURN NULL;
+                    END;
+                    $$ LANGUAGE plpgsql
+                    """
+                )
+                cur.execute(
+                    """
+                    CREATE OR REPLACE TRIGGER trg_sessions_notify
+                    AFTER DELETE OR UPDATE OF session_id, expires_at ON sessions
+                    FOR EACH ROW EXECUTE FUNCTION notify_session_revoked()
+                    """
+                )
+                cur.execute(
+                    """
+                    CREATE OR REPLACE TRIGGER trg_sessions_notify_truncate
+                    AFTER TRUNCATE ON sessions
+                    FOR EACH STATEMENT EXECUTE FUNCTION notify_session_revoked()
+                    """
+                )
+
+                # Row-level change feed for dashboard delta updates (added 2026-10-16).
+                # Every insert/update stamps a monotonically increasing row_version;
+                # statement triggers send the changed rows (dashboard shape) via NOTIFY.
+                cur.execute("CREATE SEQUENCE IF NOT EXISTS checkin_row_version_seq")
+                cur.execute(
+                    "ALTER TABLE active_event_data ADD COLUMN IF NOT EXISTS row_version BIGINT"
+                )
+                cur.execute(
+                    """
+                    CREATE OR REPLACE FUNCTION set_checkin_row_version() RETURNS trigger AS $$
+                    BEGIN
+                        NEW.row_version := nextval('checkin_row_version_seq');
+                        RETURN NEW;
+                    END;
+                    $$ LANGUAGE plpgsql
+                    """
+                )
+                cur.execute(
+                    """
+                    CREATE OR REPLACE TRIGGER trg_checkin_row_version
+                    BEFORE INSERT OR UPDATE ON active_event_data
+                    FOR EACH ROW EXECUTE FUNCTION set_checkin_row_version()
+                    """
+                )
+                cur.execute(
+                    f"""
+                    CREATE OR REPLACE FUNCTION notify_checkin_delta() RETURNS trigger AS $$
+                    DECLARE
+                        rows_json JSON;
+                        payload TEXT;
+                    BEGIN
+                        IF TG_OP = 'DELETE' THEN
+                            SELECT json_agg(json_build_object(
+                                'record_id', o.record_id, 'event_slug', o.event_slug))
+                            INTO rows_json FROM old_rows o;
+                        ELSE
+                            SELECT json_agg(json_build_object(
+                                'record_id', n.record_id,
+                                'row_version', n.row_version,
+                                'created', n.created,
+                                'event_slug', n.event_slug,
+                                'status', n.status,
+                                'member', n.member,
+                                'startgg', n.startgg,
+                                'is_guest', n.is_guest,
+                                'payment_amount', n.payment_amount,
+                                'payment_expected', n.payment_expected,
+                                'payment_valid', n.payment_valid,
+                                'name', n.name,
+                                'email', n.email,
+                                'tag', n.tag,
+                                'telephone', n.telephone,
+                                'tournament_games_registered', n.tournament_games_registered,
+                                'UUID', n.checkin_uuid,
+                                'startgg_event_id', n.startgg_event_id,
+                                'external_id', n.external_id,
+                                'added_via', n.added_via,
+                                'acquisition_source', n.acquisition_source
+                            ) ORDER BY n.row_version)
+                            INTO rows_json FROM new_rows n;
+                        END IF;
+                        IF rows_json IS NULL THEN
+                            RETURN NULL;
+                        END IF;
+                        payload := json_build_object('op', lower(TG_OP), 'rows', rows_json)::text;
+                        IF octet_length(payload) >= 7900 THEN
+                            -- Too large for NOTIFY (bulk statements): ask clients to reload
+                            payload := json_build_object('op', 'refresh')::text;
+                        END IF;
+                        PERFORM pg_notify('{CHECKIN_DELTA_CHANNEL}', payload);
+                        RETURN NULL;
+                    END;
+                    $$ LANGUAGE plpgsql
+                    """
+                )
+                for trg_name, trg_event, referencing in [
+                    ("trg_checkin_delta_insert", "INSERT", "NEW TABLE AS new_rows"),
+                    (
+                        "trg_checkin_delta_update",
+                        "UPDATE",
+                        "OLD TABLE AS old_rows NEW TABLE AS new_rows",
+                    ),
+                    ("trg_checkin_delta_delete", "DELETE", "OLD TABLE AS old_rows"),
+                ]:
+                    cur.execute(
+                        f"""
+                        CREATE OR REPLACE TRIGGER {trg_name}
+                        AFTER {trg_event} ON active_event_data
+                        REFERENCING {referencing}
+                        FOR EACH STATEMENT EXECUTE FUNCTION notify_checkin_delta()
+                        """
+                    )
+                cur.execute(
+                    """
+                    UPDATE active_event_data
+                    SET row_version = nextval('checkin_row_version_seq')
+                    WHERE row_version IS NULL
+                    """
+                )
+
+                # Async check-in orchestration job state (added 2026-10-16)
+                cur.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS checkin_jobs (
+                        checkin_id   TEXT PRIMARY KEY,
+                        state        TEXT NOT NULL DEFAULT 'running',
+                        result       JSONB,
+                        created_at   TIMESTAMPTZ DEFAULT now(),
+                        finished_at  TIMESTAMPTZ
+                    )
+                """
+                )
+                cur.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_checkin_jobs_created ON checkin_jobs(created_at)"
+                )
+
+                # Start.gg roster prefetch (added 2026-10-16)
+                cur.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS startgg_roster (
+                        tournament_slug  TEXT NOT NULL,
+                        participant_id   TEXT NOT NULL,
+                        gamer_tag        TEXT NOT NULL,
+                        tag_key          TEXT NOT NULL,
+                        email            TEXT,
+                        user_name        TEXT,
+                        events           JSONB DEFAULT '[]'::jsonb,
+                        updated_at       TIMESTAMPTZ DEFAULT now(),
+                        PRIMARY KEY (tournament_slug, participant_id)
+                    )
+                """
+                )
+                cur.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_startgg_roster_tag ON startgg_roster(tournament_slug, tag_key)"
+                )
+                cur.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS startgg_roster_sync (
+                        tournament_slug  TEXT PRIMARY KEY,
+                        claimed_at       TIMESTAMPTZ,
+                        synced_at        TIMESTAMPTZ,
+                        full_synced_at   TIMESTAMPTZ,
+                        attendee_count   INTEGER
+                    )
+                """
+                )
+
+                # Long-running admin jobs, e.g. bulk Start.gg recheck (added 2026-10-16)
+                cur.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS admin_jobs (
+                        job_id            TEXT PRIMARY KEY,
+                        kind              TEXT NOT NULL,
+                        event_slug        TEXT,
+                        state             TEXT NOT NULL DEFAULT 'running',
+                        progress          JSONB DEFAULT '{}'::jsonb,
+                        result            JSONB,
+                        cancel_requested  BOOLEAN DEFAULT false,
+                        created_at        TIMESTAMPTZ DEFAULT now(),
+                        updated_at        TIMESTAMPTZ DEFAULT now(),
+                        finished_at       TIMESTAMPTZ
+                    )
+                """
+                )
+                cur.execute(
+                    """
+                    CREATE UNIQUE INDEX IF NOT EXISTS idx_admin_jobs_one_running
+                    ON admin_jobs(kind) WHERE state = 'running'
+                    """
+                )
+                cur.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_admin_jobs_kind_created ON admin_jobs(kind, created_at DESC)"
+                )
+
+                # Email lookups for set-based player matching in archive_event (added 2026-10-16)
+                cur.execute("CREATE INDEX IF NOT EXISTS idx_players_email ON players(LOWER(email))")
+
+                # Archive generation + shared insights cache (added 2026-10-16).
+                # Every statement changing rows of the tables insights read from bumps
+                # the generation inside the writer's transaction; cached results are
+                # only served for the current generation.
+                cur.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS archive_generation (
+                        id          SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+                        generation  BIGINT NOT NULL DEFAULT 0
+                    )
+                """
+                )
+                cur.execute(
+                    "INSERT INTO archive_generation (id) VALUES (1) ON CONFLICT (id) DO NOTHING"
+                )
+                # Statements that touch no rows (e.g. the added_via backfill above on every
+                # start, alias registration with ON CONFLICT DO NOTHING) leave it alone.
+                cur.execute(
+                    """
+                    CREATE OR REPLACE FUNCTION bump_archive_generation() RETURNS trigger AS $$
+                    BEGIN
+                        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                            IF NOT EXISTS (SELECT 1 FROM new_rows) THEN
+                                RETURN NULL;
+                            END IF;
+                        ELSIF TG_OP = 'DELETE' THEN
+                            IF NOT EXISTS (SELECT 1 FROM old_rows) THEN
+                                RETURN NULL;
+                            END IF;
+                        END IF;
+                        UPDATE archive_generation SET generation = generation + 1 WHERE id = 1;
+                        RETURN NULL;
+                    END;
+                    $$ LANGUAGE plpgsql
+                    """
+                )
+                cur.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS insights_cache (
+                        cache_key   TEXT PRIMARY KEY,
+                        generation  BIGINT NOT NULL,
+                        payload     JSONB NOT NULL,
+                        created_at  TIMESTAMPTZ DEFAULT now(),
+                        hit_at      TIMESTAMPTZ DEFAULT now()
+                    )
+                """
+                )
+                cur.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_insights_cache_hit_at ON insights_cache(hit_at DESC)"
+                )
+
+                # One-time data backfills, see _run_backfill (added 2026-10-17)
+                cur.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS schema_backfills (
+                        name     TEXT PRIMARY KEY,
+                        done_at  TIMESTAMPTZ DEFAULT now()
+                    )
+                """
+                )
+
+                # Canonical game dimension (added 2026-10-16). Raw names are registered as
+                # aliases at ingest (_register_game_names); a trigger stores the matching
+                # game ids next to tournament_games_registered. Existing rows are
+                # backfilled once.
+                cur.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS games (
+                        id    SERIAL PRIMARY KEY,
+                        name  TEXT NOT NULL
+                    )
+                """
+                )
+                cur.execute(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS idx_games_name ON games(LOWER(name))"
+                )
+                cur.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS game_aliases (
+                        alias    TEXT PRIMARY KEY,
+                        game_id  INTEGER NOT NULL REFERENCES games(id)
+                    )
+                """
+                )
+                cur.execute(
+                    """
+                    CREATE OR REPLACE FUNCTION game_ids_for(names TEXT[]) RETURNS INTEGER[] AS $$
+                        SELECT COALESCE(array_agg(game_id ORDER BY pos), '{}')
+                        FROM (
+                            SELECT a.game_id, MIN(n.pos) AS pos
+                            FROM unnest(names) WITH ORDINALITY AS n(name, pos)
+                            JOIN game_aliases a ON a.alias = LOWER(btrim(n.name))
+                            GROUP BY a.game_id
+                        ) ids
+                    $$ LANGUAGE sql STABLE
+                    """
+                )
+                cur.execute(
+                    """
+                    CREATE OR REPLACE FUNCTION set_tournament_game_ids() RETURNS trigger AS $$
+                    BEGIN
+                        NEW.tournament_game_ids := CASE
+                            WHEN NEW.tournament_games_registered IS NULL THEN NULL
+                            ELSE game_ids_for(NEW.tournament_games_registered)
+                        END;
+                        RETURN NEW;
+                    END;
+                    $$ LANGUAGE plpgsql
+                    """
+                )
+                for table in ("active_event_data", "event_archive"):
+                    cur.execute(
+                        f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS tournament_game_ids INTEGER[]"
+                    )
+                    cur.execute(
+                        f"""
+                        CREATE OR REPLACE TRIGGER trg_{table}_game_ids
+                        BEFORE INSERT OR UPDATE OF tournament_games_registered ON {table}
+                        FOR EACH ROW EXECUTE FUNCTION set_tournament_game_ids()
+                        """
+                    )
+                _run_backfill(conn, "tournament_game_ids", _backfill_tournament_game_ids)
+
+                # Archive generation triggers (see above); games and aliases decide
+                # which canonical game an archived row counts for.
+                for table in ARCHIVE_GENERATION_TABLES:
+                    # First layout: one trigger for all events, without transition tables
+                    cur.execute(f"DROP TRIGGER IF EXISTS trg_{table}_archive_generation ON {table}")
+                    for trg_event, referencing in [
+                        ("INSERT", "REFERENCING NEW TABLE AS new_rows"),
+                        ("UPDATE", "REFERENCING NEW TABLE AS new_rows"),
+                        ("DELETE", "REFERENCING OLD TABLE AS old_rows"),
+                        ("TRUNCATE", ""),
+                    ]:
+                        if trg_event == "INSERT" and table in ARCHIVE_GENERATION_INSERT_EXEMPT:
+                            continue
+                        trigger = f"trg_{table}_archive_generation_{trg_event.lower()}"
+                        cur.execute(
+                            f"""
+                            CREATE OR REPLACE TRIGGER {trigger}
+                            AFTER {trg_event} ON {table} {referencing}
+                            FOR EACH STATEMENT EXECUTE FUNCTION bump_archive_generation()
+                            """
+                        )
+
+                # Player-event facts for insights (added 2026-10-16): one attendance row
+                # (game_id NULL) per player + event + date, plus one row per canonical game.
+                # Maintained by the archive/merge write paths; built once here.
+                cur.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS player_event_facts (
+                        player_uuid   TEXT NOT NULL,
+                        event_slug    TEXT NOT NULL,
+                        event_date    DATE,
+                        game_id       INTEGER,
+                        display_tag   TEXT,
+                        display_name  TEXT
+                    )
+                """
+                )
+                # First layout keyed facts on raw game names; switch to game ids and rebuild
+                with conn.transaction():
+                    cur.execute(
+                        "SELECT pg_advisory_xact_lock(hashtext(%s))",
+                        (_backfill_lock_key("player_event_facts"),),
+                    )
+                    cur.execute(
+                        """
+                        SELECT 1 FROM information_schema.columns
+                        WHERE table_name = 'player_event_facts' AND column_name = 'game'
+                        """
+                    )
+                    if cur.fetchone():
+                        cur.execute("DROP INDEX IF EXISTS idx_pef_event")
+                        cur.execute("DROP INDEX IF EXISTS idx_pef_game")
+                        cur.execute(
+                            "ALTER TABLE player_event_facts DROP COLUMN game, ADD COLUMN game_id INTEGER"
+                        )
+                        cur.execute(
+                            "DELETE FROM schema_backfills WHERE name = 'player_event_facts'"
+                        )
+                cur.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_pef_event ON player_event_facts(event_slug, game_id)"
+                )
+                cur.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_pef_player_date ON player_event_facts(player_uuid, event_date)"
+                )
+                cur.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_pef_date_player ON player_event_facts(event_date, player_uuid)"
+                )
+                cur.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_pef_game
+                    ON player_event_facts(game_id, event_date) WHERE game_id IS NOT NULL
+                    """
+                )
+                _run_backfill(conn, "player_event_facts", _backfill_player_event_facts)
+
+                # Persisted duplicate-candidate index (added 2026-10-16). Triggers queue players
+                # whose identity fields change; refresh_duplicate_candidates compares only those.
+                # Once, every player is queued and earlier decisions are carried over
+                # (dismissals from audit_log, merges from merge_log).
+                cur.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS duplicate_candidates (
+                        uuid_a      TEXT NOT NULL,
+                        uuid_b      TEXT NOT NULL,
+                        reasons     TEXT[] NOT NULL DEFAULT '{}',
+                        confidence  TEXT,
+                        state       TEXT NOT NULL DEFAULT 'open',
+                        found_at    TIMESTAMPTZ DEFAULT now(),
+                        decided_at  TIMESTAMPTZ,
+                        decided_by  TEXT,
+                        PRIMARY KEY (uuid_a, uuid_b),
+                        CHECK (uuid_a < uuid_b),
+                        CHECK (state IN ('open', 'rejected', 'merged'))
+                    )
+                """
+                )
+                cur.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_duplicate_candidates_b ON duplicate_candidates(uuid_b)"
+                )
+                cur.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS duplicate_scan_queue (
+                        player_uuid  TEXT PRIMARY KEY,
+                        queued_at    TIMESTAMPTZ DEFAULT now()
+                    )
+                """
+                )
+                cur.execute(
+                    """
+                    CREATE OR REPLACE FUNCTION queue_duplicate_scan() RETURNS trigger AS $$
+                    BEGIN
+                        IF TG_OP = 'DELETE' THEN
+                            DELETE FROM duplicate_candidates
+                            WHERE state = 'open' AND (uuid_a = OLD.uuid OR uuid_b = OLD.uuid);
+                            DELETE FROM duplicate_scan_queue WHERE player_uuid = OLD.uuid;
+                        ELSE
+                            INSERT INTO duplicate_scan_queue (player_uuid) VALUES (NEW.uuid)
+                            ON CONFLICT (player_uuid) DO NOTHING;
+                        END IF;
+                        RETURN NULL;
+                    END;
+                    $$ LANGUAGE plpgsql
+                    """
+                )
+                cur.execute(
+                    """
+                    CREATE OR REPLACE TRIGGER trg_players_duplicate_scan_insert
+                    AFTER INSERT ON players
+                    FOR EACH ROW EXECUTE FUNCTION queue_duplicate_scan()
+                    """
+                )
+                cur.execute(
+                    """
+                    CREATE OR REPLACE TRIGGER trg_players_duplicate_scan_update
+                    AFTER UPDATE OF name, tag, telephone ON players
+                    FOR EACH ROW
+                    WHEN (OLD.name IS DISTINCT FROM NEW.name
+                          OR OLD.tag IS DISTINCT FROM NEW.tag
+                          OR OLD.telephone IS DISTINCT FROM NEW.telephone)
+                    EXECUTE FUNCTION queue_duplicate_scan()
+                    """
+                )
+                cur.execute(
+                    """
+                    CREATE OR REPLACE TRIGGER trg_players_duplicate_scan_delete
+                    AFTER DELETE ON players
+                    FOR EACH ROW EXECUTE FUNCTION queue_duplicate_scan()
+                    """
+                )
+                _run_backfill(conn, "duplicate_candidates", _backfill_duplicate_candidates)
+
+                # One live check-in per event + tag; begin_checkin upserts on it (added 2026-10-16).
+                # Duplicates left by the old read-then-insert path are merged first.
+                try:
+                    _ensure_checkin_tag_index(conn)
+                except Exception as e:
+                    logger.warning(
+                        f"⚠️ Unique event + tag index not created, retried on next start: {e}"
+                    )
+                cur.execute("SELECT to_regclass('idx_active_event_tag_unique')")
+                _checkin_tag_index_ready = cur.fetchone()[0] is not None
+                if not _checkin_tag_index_ready:
+                    logger.warning("⚠️ begin_checkin falls back to locked read-then-write by tag")
+
+                # Server-side paging/filtering of the dashboard check-ins table (added 2026-10-16):
+                # newest-first pages per event, game containment and name/tag substring search.
+                # Without pg_trgm the search still works, only unindexed.
+                cur.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_active_slug_created "
+                    "ON active_event_data(event_slug, created DESC, id DESC)"
+                )
+                cur.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_active_game_ids "
+                    "ON active_event_data USING gin (tournament_game_ids)"
+                )
+                try:
+                    cur.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+                    for col in ("name", "tag"):
+                        cur.execute(
+                            f"CREATE INDEX IF NOT EXISTS idx_active_{col}_trgm "
+                            f"ON active_event_data USING gin ({col} gin_trgm_ops)"
+                        )
+                except Exception as e:
+                    logger.warning(f"⚠️ pg_trgm unavailable, check-in search is unindexed: {e}")
+
+                # Monthly range partitions for audit_log (added 2026-10-16).
+                # A plain audit_log is converted once (rows copied, id sequence kept);
+                # partitions for the coming months are created on every startup.
+                cur.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass('audit_log')")
+                row = cur.fetchone()
+                if row and row[0] == "r":
+                    with conn.transaction():
+                        _partition_audit_log(cur)
+                _ensure_audit_partitions(conn)
         logger.info(
-            "✅ Schema migrations checked (no-show + player_uuid + added_via + acquisition source + live ops timestamps + merge_log)"
+            "✅ Schema migrations checked (no-show + player_uuid + added_via + acquisition source + live ops timestamps + merge_log + settings notify + session notify + checkin delta feed + checkin_jobs + startgg_roster + admin_jobs + unique event tag + players email index + insights cache + games + player_event_facts + duplicate index + audit_log partitions + checkin paging indexes)"
         )
     except Exception as e:
         logger.warning(f"⚠️ Migration check failed (non-fatal): {e}")
 
 
+def _backfill_lock_key(name: str) -> str:
+    return f"schema_backfill:{name}"
+
+
+def _run_backfill(conn, name: str, backfill) -> bool:
+    """
+    Run the one-time data backfill `name` (serialized across processes).
+
+    backfill(cur) runs in one transaction under an advisory lock, and
+    completion is recorded in schema_backfills in that same transaction: a
+    crash or error leaves nothing half done and the next start runs it again,
+    a concurrent start waits and then skips it. Failures are logged, so the
+    remaining migrations still run. Returns True once the backfill is done.
+    """
+    try:
+        with conn.transaction():
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT pg_advisory_xact_lock(hashtext(%s))", (_backfill_lock_key(name),)
+                )
+                cur.execute("SELECT 1 FROM schema_backfills WHERE name = %s", (name,))
+                if cur.fetchone():
+                    return True
+                backfill(cur)
+                cur.execute("INSERT INTO schema_backfills (name) VALUES (%s)", (name,))
+        return True
+    except Exception as e:
+        logger.warning(f"⚠️ Backfill {name} failed, retried on next start: {e}")
+        return False
+
+
+def _backfill_player_event_facts(cur) -> None:
+    built = _refresh_player_event_facts(cur)
+    logger.info(f"📦 Built player_event_facts ({built} rows)")
+
+
+def _backfill_tournament_game_ids(cur) -> None:
+    """Register every stored game name and resolve tournament_game_ids of existing rows."""
+    cur.execute(
+        """
+        SELECT DISTINCT unnest(tournament_games_registered) FROM event_archive
+        UNION
+        SELECT DISTINCT unnest(tournament_games_registered) FROM active_event_data
+        """
+    )
+    # Not via _register_game_names: its process cache would outlive a rollback here
+    pending: Dict[str, str] = {}
+    for (name,) in cur.fetchall():
+        key = game_alias_key(name)
+        if key and key not in pending:
+            pending[key] = canonical_game_name(name)
+    aliases = list(pending)
+    canonicals = [pending[a] for a in aliases]
+    cur.execute(_REGISTER_GAMES_SQL, (canonicals,))
+    cur.execute(_REGISTER_GAME_ALIASES_SQL, (aliases, canonicals))
+    for table in ("active_event_data", "event_archive"):
+        cur.execute(
+            f"""
+            UPDATE {table}
+            SET tournament_game_ids = game_ids_for(tournament_games_registered)
+            WHERE tournament_games_registered IS NOT NULL
+            """
+        )
+        logger.info(f"🎮 Backfilled tournament_game_ids on {table} ({cur.rowcount} rows)")
+
+
+def _backfill_duplicate_candidates(cur) -> None:
+    """Queue every player and carry over earlier merges (merge_log) and dismissals (audit_log)."""
+    cur.execute(
+        "INSERT INTO duplicate_scan_queue (player_uuid) "
+        "SELECT uuid FROM players ON CONFLICT DO NOTHING"
+    )
+    cur.execute(
+        """
+        INSERT INTO duplicate_candidates (uuid_a, uuid_b, state, decided_at, decided_by)
+        SELECT LEAST(keep_uuid, remove_uuid), GREATEST(keep_uuid, remove_uuid),
+               'merged', MAX(merged_at), MAX(user_name)
+        FROM merge_log
+        WHERE NOT COALESCE(undone, false) AND keep_uuid <> remove_uuid
+        GROUP BY 1, 2
+        ON CONFLICT (uuid_a, uuid_b) DO NOTHING
+        """
+    )
+    cur.execute(
+        """
+        SELECT details, timestamp, user_name FROM audit_log
+        WHERE action = 'duplicate_dismissed'
+        ORDER BY timestamp
+        """
+    )
+    dismissed = {}
+    for details, ts, user_name in cur.fetchall():
+        try:
+            pair = json.loads(details or "{}").get("pair") or []
+        except (ValueError, AttributeError):
+            continue
+        if len(pair) == 2 and pair[0] and pair[1] and pair[0] != pair[1]:
+            dismissed[tuple(sorted(pair))] = (ts, user_name)
+    if dismissed:
+        cur.executemany(
+            """
+            INSERT INTO duplicate_candidates (uuid_a, uuid_b, state, decided_at, decided_by)
+            VALUES (%s, %s, 'rejected', %s, %s)
+            ON CONFLICT (uuid_a, uuid_b) DO NOTHING
+            """,
+            [(a, b, ts, user_name) for (a, b), (ts, user_name) in dismissed.items()],
+        )
+
+
+def _ensure_checkin_tag_index(conn) -> None:
+    """
+    Create idx_active_event_tag_unique (serialized across processes).
+
+    Blank tags are cleared and duplicate check-ins merged in the same
+    transaction, so a failure leaves the data untouched and the next start
+    tries again.
+    """
+    with conn.transaction():
+        with conn.cursor() as cur:
+            cur.execute("SELECT pg_advisory_xact_lock(hashtext('idx_active_event_tag_unique'))")
+            cur.execute("SELECT to_regclass('idx_active_event_tag_unique')")
+            if cur.fetchone()[0] is not None:
+                return
+            cur.execute(
+                "UPDATE active_event_data SET tag = NULL WHERE tag IS NOT NULL AND btrim(tag) = ''"
+            )
+            merged = _merge_duplicate_checkins(cur)
+            if merged:
+                logger.warning(
+                    f"⚠️ Merged {merged} duplicate check-in(s) (same event + tag), see audit_log"
+                )
+            cur.execute(
+                """
+                CREATE UNIQUE INDEX idx_active_event_tag_unique
+                ON active_event_data(event_slug, LOWER(tag))
+                WHERE tag IS NOT NULL AND tag <> ''
+                """
+            )
+
+
+def _merge_duplicate_checkins(cur) -> int:
+    """
+    Fold check-ins sharing event + tag into the newest one (the row begin_checkin
+    used to update). Member, Start.gg and payment flags are OR-ed, missing contact
+    fields filled in from the older rows, and each merge is written to audit_log
+    with the removed rows. Returns the number of rows removed. Call in a transaction.
+    """
+    cur.execute(
+        """
+        SELECT event_slug, MIN(tag),
+               array_agg(record_id ORDER BY COALESCE(created, '-infinity') DESC, id DESC),
+               json_agg(to_jsonb(a) ORDER BY COALESCE(created, '-infinity') DESC, id DESC)
+        FROM active_event_data a
+        WHERE tag IS NOT NULL AND tag <> ''
+        GROUP BY event_slug, LOWER(tag)
+        HAVING COUNT(*) > 1
+        """
+    )
+    groups = cur.fetchall()
+    removed = 0
+    for event_slug, tag, record_ids, snapshots in groups:
+        keep, duplicates = record_ids[0], record_ids[1:]
+        cur.execute(
+            """
+            UPDATE active_event_data k
+            SET member = d.member,
+                startgg = d.startgg,
+                payment_valid = d.payment_valid,
+                is_guest = COALESCE(k.is_guest, false) AND NOT d.startgg,
+                payment_amount = GREATEST(k.payment_amount, d.payment_amount),
+                email = COALESCE(k.email, d.email),
+                telephone = COALESCE(k.telephone, d.telephone),
+                player_uuid = COALESCE(k.player_uuid, d.player_uuid)
+            FROM (
+                SELECT COALESCE(bool_or(member), false) AS member,
+                       COALESCE(bool_or(startgg), false) AS startgg,
+                       COALESCE(bool_or(payment_valid), false) AS payment_valid,
+                       MAX(payment_amount) AS payment_amount,
+                       MAX(email) AS email,
+                       MAX(telephone) AS telephone,
+                       MAX(player_uuid) AS player_uuid
+                FROM active_event_data
+                WHERE record_id = ANY(%s)
+            ) d
+            WHERE k.record_id = %s
+            RETURNING to_jsonb(k)
+            """,
+            (record_ids, keep),
+        )
+        merged_row = cur.fetchone()[0]
+        cur.execute("DELETE FROM active_event_data WHERE record_id = ANY(%s)", (duplicates,))
+        removed += cur.rowcount
+        cur.execute(
+            *_audit_insert_sql(
+                _audit_fields(
+                    {"user_id": "system", "user_name": "migration", "user_email": ""},
+                    "checkin_duplicates_merged",
+                    "active_event_data",
+                    target_event=event_slug,
+                    target_record=keep,
+                    reason="unique event + tag index",
+                    details=json.dumps({"tag": tag, "merged_record_ids": duplicates}),
+                    before_state={"kept": snapshots[0], "removed": snapshots[1:]},
+                    after_state=merged_row,
+                )
+            )
+        )
+    return removed
+
+
+def _partition_audit_log(cur) -> None:
+    """Replace a plain audit_log with the partitioned layout from init.sql (in a transaction)."""
+    cur.execute("LOCK TABLE audit_log IN ACCESS EXCLUSIVE MODE")
+    cur.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass('audit_log')")
+    if cur.fetchone()[0] != "r":
+        return  # another process converted it while we waited for the lock
+
+    cur.execute("SELECT pg_get_serial_sequence('audit_log', 'id')")
+    id_seq = cur.fetchone()[0]
+    cur.execute("SELECT min(timestamp) FROM audit_log")
+    oldest = cur.fetchone()[0]
+
+    cur.execute("ALTER TABLE audit_log RENAME TO audit_log_unpartitioned")
+    cur.execute(
+        "ALTER TABLE audit_log_unpartitioned RENAME CONSTRAINT audit_log_pkey TO audit_log_unpartitioned_pkey"
+    )
+    cur.execute("DROP INDEX IF EXISTS idx_audit_timestamp, idx_audit_action, idx_audit_user")
+    cur.execute(f"ALTER SEQUENCE {id_seq} OWNED BY NONE")
+    cur.execute(
+        f"""
+        CREATE TABLE audit_log (
+            id              INTEGER NOT NULL DEFAULT nextval('{id_seq}'),
+            timestamp       TIMESTAMPTZ NOT NULL DEFAULT now(),
+            user_id         TEXT,
+            user_name       TEXT,
+            user_email      TEXT,
+            action          TEXT NOT NULL,
+            target_table    TEXT,
+            target_event    TEXT,
+            target_record   TEXT,
+            target_player   TEXT,
+            reason          TEXT,
+            details         TEXT,
+            before_state    JSONB,
+            after_state     JSONB,
+            PRIMARY KEY (id, timestamp)
+        ) PARTITION BY RANGE (timestamp)
+    """
+    )
+    cur.execute(f"ALTER SEQUENCE {id_seq} OWNED BY audit_log.id")
+    cur.execute("CREATE TABLE audit_log_default PARTITION OF audit_log DEFAULT")
+    cur.execute("CREATE INDEX idx_audit_timestamp ON audit_log(timestamp, id)")
+    cur.execute("CREATE INDEX idx_audit_action ON audit_log(action, timestamp, id)")
+    cur.execute("CREATE INDEX idx_audit_user ON audit_log(user_id, timestamp, id)")
+    _create_audit_partitions(cur, oldest or datetime.now(timezone.utc))
+
+    columns = ", ".join(("id",) + _AUDIT_COLUMNS)
+    cur.execute(
+        f"""
+        INSERT INTO audit_log ({columns})
+        SELECT id, COALESCE(timestamp, now()), {", ".join(_AUDIT_COLUMNS[1:])}
+        FROM audit_log_unpartitioned
+    """
+    )
+    logger.info(f"🗂️ audit_log converted to monthly partitions ({cur.rowcount} rows)")
+    cur.execute("DROP TABLE audit_log_unpartitioned")
+
+
+def _month_start(value: datetime, months: int = 0) -> datetime:
+    """First instant (UTC) of the month `months` after the one containing `value`."""
+    value = value.astimezone(timezone.utc)
+    index = value.year * 12 + value.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def _audit_partitions(cur) -> Dict[str, datetime]:
+    """Existing monthly audit_log partitions: name -> month start."""
+    cur.execute(
+        """
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'audit_log'::regclass
+    """
+    )
+    partitions = {}
+    for (name,) in cur.fetchall():
+        if name.startswith("audit_log_p"):
+            year, month = name[len("audit_log_p") :].split("_")
+            partitions[name] = datetime(int(year), int(month), 1, tzinfo=timezone.utc)
+    return partitions
+
+
+def _create_audit_partitions(cur, start: datetime) -> int:
+    """
+    Create the missing monthly partitions from `start` up to AUDIT_PARTITIONS_AHEAD
+    months ahead. Rows that already landed in audit_log_default are moved in.
+    Call in a transaction.
+    """
+    from psycopg import sql  # type: ignore
+
+    existing = set(_audit_partitions(cur))
+    month = _month_start(start)
+    last = _month_start(datetime.now(timezone.utc), AUDIT_PARTITIONS_AHEAD)
+    created = 0
+    while month <= last:
+        upper = _month_start(month, 1)
+        name = f"audit_log_p{month:%Y_%m}"
+        if name not in existing:
+            cur.execute(
+                sql.SQL("CREATE TABLE {} (LIKE audit_log INCLUDING DEFAULTS)").format(
+                    sql.Identifier(name)
+                )
+            )
+            cur.execute(
+                sql.SQL(
+                    """
+                    WITH moved AS (
+                        DELETE FROM audit_log_default
+                        WHERE timestamp >= %s AND timestamp < %s
+                        RETURNING *
+                    )
+                    INSERT INTO {} SELECT * FROM moved
+                    """
+                ).format(sql.Identifier(name)),
+                (month, upper),
+            )
+            cur.execute(
+                sql.SQL(
+                    "ALTER TABLE audit_log ATTACH PARTITION {} FOR VALUES FROM ({}) TO ({})"
+                ).format(sql.Identifier(name), sql.Literal(month), sql.Literal(upper))
+            )
+            created += 1
+        month = upper
+    return created
+
+
+def _ensure_audit_partitions(conn) -> int:
+    """Create upcoming audit_log partitions (serialized across processes)."""
+    with conn.transaction():
+        with conn.cursor() as cur:
+            cur.execute("SELECT pg_advisory_xact_lock(hashtext('audit_log_partitions'))")
+            return _create_audit_partitions(cur, datetime.now(timezone.utc))
+
+
 def _coerce_jsonb(value: Any) -> Any:
     if value in (None, ""):
         return None
@@ -258,11 +1180,125 @@ def compute_checkin_status(
     }
 
 
+# =============================================
+# Settings cache (LISTEN/NOTIFY invalidated)
+# =============================================
+# The active settings row is read several times per check-in and on every
+# dashboard refresh. Each process keeps one copy in memory; a statement trigger
+# on `settings` sends pg_notify and a per-process listener thread drops the copy,
+# so a TO saving requirements is visible to every backend/dashboard worker at once.
+# The cache is only served while the listener connection is up - if it drops,
+# reads go straight to the database until it has reconnected.
+# The same listener drops revoked sessions from the session cache (see Sessions).
+SETTINGS_CACHE_ENABLED = os.getenv("SETTINGS_CACHE_ENABLED", "true").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+SETTINGS_NOTIFY_CHANNEL = "fgc_settings_changed"
+SESSION_NOTIFY_CHANNEL = "fgc_session_revoked"
+# Row-level active_event_data changes (see notify_checkin_delta trigger)
+CHECKIN_DELTA_CHANNEL = "fgc_checkin_delta"
+
+_settings_cache_lock = threading.Lock()
+_settings_cache_row: Optional[Dict[str, Any]] = None
+# Cached "no active settings row" (before an event is selected, the dashboard
+# auth middleware asks for the active slug on every request)
+_SETTINGS_ROW_MISSING: Dict[str, Any] = {}
+_settings_cache_generation = 0
+_settings_listener_thread: Optional[threading.Thread] = None
+_settings_listener_ready = threading.Event()
+
+
+def invalidate_settings_cache() -> None:
+    """Drop the cached settings row in this process."""
+    global _settings_cache_row, _settings_cache_generation
+    with _settings_cache_lock:
+        _settings_cache_row = None
+        _settings_cache_generation += 1
+
+
+def _settings_listener_loop() -> None:
+    """LISTEN for settings changes and revoked sessions; reconnects with backoff, never exits."""
+    import psycopg  # type: ignore
+
+    backoff = 1
+    while True:
+        try:
+            with psycopg.connect(
+                DATABASE_URL, autocommit=True, keepalives=1, keepalives_idle=30
+            ) as conn:
+                conn.execute(f"LISTEN {SETTINGS_NOTIFY_CHANNEL}")
+                conn.execute(f"LISTEN {SESSION_NOTIFY_CHANNEL}")
+                # Changes may have been missed while disconnected
+                invalidate_settings_cache()
+                invalidate_session_cache()
+                _settings_listener_ready.set()
+                logger.info("👂 Settings cache listener connected")
+                backoff = 1
+                for notify in conn.notifies():
+                    if notify.channel == SESSION_NOTIFY_CHANNEL:
+                        invalidate_session_cache(notify.payload or None)
+                    else:
+                        invalidate_settings_cache()
+        except Exception as e:
+            logger.warning(f"⚠️ Settings cache listener disconnected: {e}")
+        finally:
+            _settings_listener_ready.clear()
+            invalidate_settings_cache()
+            invalidate_session_cache()
+        time.sleep(backoff)
+        backoff = min(backoff * 2, 30)
+
+
+def _ensure_settings_listener() -> None:
+    global _settings_listener_thread
+    if _settings_listener_thread is not None:
+        return
+    with _settings_cache_lock:
+        if _settings_listener_thread is None:
+            _settings_listener_thread = threading.Thread(
+                target=_settings_listener_loop, name="settings-cache-listener", daemon=True
+            )
+            _settings_listener_thread.start()
+
+
+def _settings_cache_lookup() -> tuple:
+    """Return (cached row copy or None, generation) - generation is None when caching is off."""
+    if not SETTINGS_CACHE_ENABLED:
+        return None, None
+    _ensure_settings_listener()
+    if not _settings_listener_ready.is_set():
+        return None, None
+    with _settings_cache_lock:
+        if _settings_cache_row is _SETTINGS_ROW_MISSING:
+            return _SETTINGS_ROW_MISSING, _settings_cache_generation
+        if _settings_cache_row is not None:
+            return copy.deepcopy(_settings_cache_row), _settings_cache_generation
+        return None, _settings_cache_generation
+
+
+def _settings_cache_store(row: Optional[Dict[str, Any]], generation: Optional[int]) -> None:
+    """Cache a freshly fetched row (None = no active row) unless it was invalidated while the query ran."""
+    global _settings_cache_row
+    if generation is None or not _settings_listener_ready.is_set():
+        return
+    with _settings_cache_lock:
+        if generation == _settings_cache_generation:
+            _settings_cache_row = _SETTINGS_ROW_MISSING if row is None else copy.deepcopy(row)
+
+
 # =============================================
 # Settings
 # =============================================
-def get_active_settings() -> Optional[Dict[str, Any]]:
-    """Return fields from the active settings row (is_active = true)."""
+def _fetch_active_settings_row() -> Optional[Dict[str, Any]]:
+    """Return the full active settings row (including id), served from the cache when possible."""
+    cached, generation = _settings_cache_lookup()
+    if cached is _SETTINGS_ROW_MISSING:
+        return None
+    if cached is not None:
+        return cached
+
     columns = None
     row = None
     with _get_pool().connection() as conn:
@@ -281,10 +1317,21 @@ def get_active_settings() -> Optional[Dict[str, Any]]:
                 columns = [desc[0] for desc in cur.description]
 
     if not row or not columns:
-        logger.warning("⚠️ No active settings row found.")
+        _settings_cache_store(None, generation)
         return None
 
     data = _row_to_dict(columns, row)
+    _settings_cache_store(data, generation)
+    return data
+
+
+def get_active_settings() -> Optional[Dict[str, Any]]:
+    """Return fields from the active settings row (is_active = true)."""
+    data = _fetch_active_settings_row()
+    if data is None:
+        logger.warning("⚠️ No active settings row found.")
+        return None
+
     data.pop("id", None)
     return data
 
@@ -302,28 +1349,11 @@ def get_active_slug() -> Optional[str]:
 
 def get_active_settings_with_id() -> Optional[Dict[str, Any]]:
     """Return the active settings row with its record_id included."""
-    columns = None
-    row = None
-    with _get_pool().connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT *
-                FROM settings
-                WHERE is_active = true
-                ORDER BY id DESC
-                LIMIT 1
-                """
-            )
-            row = cur.fetchone()
-            if row:
-                columns = [desc[0] for desc in cur.description]
-
-    if not row or not columns:
+    data = _fetch_active_settings_row()
+    if data is None:
         logger.warning("⚠️ No active settings row found.")
         return None
 
-    data = _row_to_dict(columns, row)
     record_id = data.pop("id", None)
     return {"record_id": str(record_id) if record_id is not None else None, "fields": data}
 
@@ -361,6 +1391,9 @@ def update_settings(record_id: str, fields: Dict[str, Any]) -> Optional[Dict[str
             if row:
                 columns_out = [desc[0] for desc in cur.description]
 
+    # Don't wait for our own NOTIFY round-trip before the next read
+    invalidate_settings_cache()
+
     if not row or not columns_out:
         return None
 
@@ -374,84 +1407,166 @@ def update_settings(record_id: str, fields: Dict[str, Any]) -> Optional[Dict[str
 # =============================================
 # Checkins (active_event_data)
 # =============================================
-def get_checkins(
-    slug: Optional[str] = None, include_all: bool = False
-) -> List[Dict[str, Any]]:  # type: ignore[assignment]
-    """Return check-ins for a given event_slug from active_event_data."""
-    if not slug and not include_all:
-        return []
+_CHECKIN_SELECT_COLUMNS = """
+    record_id, created, event_slug, status, member, startgg, is_guest,
+    payment_amount, payment_expected, payment_valid,
+    name, email, tag, telephone,
+    tournament_games_registered, checkin_uuid, startgg_event_id, external_id,
+    added_via, acquisition_source, row_version
+"""
 
-    params: List[Any] = []
-    where_sql = ""
-    if not include_all:
-        where_sql = "WHERE event_slug = %s"
-        params.append(slug)
+# Dashboard column id -> ORDER BY expression for get_checkins(sort_by=...)
+CHECKIN_SORT_COLUMNS = {
+    "name": "LOWER(name)",
+    "tag": "LOWER(tag)",
+    "status": "status",
+    "telephone": "telephone",
+    "email": "LOWER(email)",
+    "member": "member",
+    "startgg": "startgg",
+    "payment_valid": "payment_valid",
+    "is_guest": "is_guest",
+    "tournament_games_registered": "tournament_games_registered",
+    "UUID": "checkin_uuid",
+    "created": "created",
+}
+
+# Requirement columns a check-in can be missing (Needs Attention)
+CHECKIN_REQUIREMENT_COLUMNS = ("member", "payment_valid", "startgg")
+
+
+def _like_pattern(text: str) -> str:
+    """ILIKE pattern matching text anywhere (LIKE wildcards in text are literal)."""
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _checkin_scope_sql(slug: Optional[str], include_all: bool) -> tuple:
+    """WHERE clause + params for the event scope (all events for include_all)."""
+    if include_all:
+        return "TRUE", []
+    return "event_slug = %s", [slug]
 
+
+def _checkin_filter_sql(
+    search: Optional[str] = None,
+    status: Optional[str] = None,
+    payment_valid: Optional[bool] = None,
+    game: Optional[str] = None,
+    missing: Optional[Iterable[str]] = None,
+) -> tuple:
+    """
+    Condition + params for the check-ins table filters:
+    search - substring of name or tag (case-insensitive)
+    status - exact status ("Ready", "Pending")
+    payment_valid - False matches unpaid rows (NULL counts as unpaid)
+    game - canonical game name, matched against tournament_game_ids
+    missing - requirement columns; rows missing at least one of them
+    """
+    clauses: List[str] = []
+    params: List[Any] = []
+    search = (search or "").strip()
+    if search:
+        clauses.append("(name ILIKE %s OR tag ILIKE %s)")
+        params += [_like_pattern(search)] * 2
+    if status:
+        clauses.append("status = %s")
+        params.append(status)
+    if payment_valid is not None:
+        clauses.append("payment_valid IS TRUE" if payment_valid else "payment_valid IS NOT TRUE")
+    if game:
+        clauses.append(
+            "tournament_game_ids @> ARRAY[(SELECT id FROM games WHERE LOWER(name) = LOWER(%s))]"
+        )
+        params.append(canonical_game_name(game))
+    missing_cols = [c for c in (missing or []) if c in CHECKIN_REQUIREMENT_COLUMNS]
+    if missing_cols:
+        clauses.append("(" + " OR ".join(f"{c} IS NOT TRUE" for c in missing_cols) + ")")
+    return (" AND ".join(clauses) or "TRUE"), params
+
+
+def _checkin_order_sql(sort_by: Optional[List[Dict[str, Any]]]) -> str:
+    """ORDER BY for DataTable sort_by entries; newest first breaks ties (stable pages)."""
+    order = []
+    for entry in sort_by or []:
+        expr = CHECKIN_SORT_COLUMNS.get((entry or {}).get("column_id"))
+        if expr:
+            direction = "DESC" if entry.get("direction") == "desc" else "ASC"
+            order.append(f"{expr} {direction} NULLS LAST")
+    return ", ".join(order + ["created DESC", "id DESC"])
+
+
+def _checkins_select_sql(
+    slug: Optional[str],
+    include_all: bool,
+    filters: Dict[str, Any],
+    sort_by: Optional[List[Dict[str, Any]]] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    with_total: bool = False,
+) -> tuple:
+    """SELECT for get_checkins / get_checkins_page; with_total adds the matching row count."""
+    scope_sql, params = _checkin_scope_sql(slug, include_all)
+    filter_sql, filter_params = _checkin_filter_sql(**filters)
+    params = params + filter_params
+    total_sql = ", count(*) OVER () AS total_count" if with_total else ""
+    page_sql = ""
+    if limit is not None:
+        page_sql = "LIMIT %s OFFSET %s"
+        params += [max(int(limit), 0), max(int(offset or 0), 0)]
     query = f"""
-        SELECT record_id, created, event_slug, status, member, startgg, is_guest,
-               payment_amount, payment_expected, payment_valid,
-               name, email, tag, telephone,
-               tournament_games_registered, checkin_uuid, startgg_event_id, external_id,
-               added_via, acquisition_source
+        SELECT {_CHECKIN_SELECT_COLUMNS}{total_sql}
         FROM active_event_data
-        {where_sql}
-        ORDER BY created DESC
+        WHERE {scope_sql} AND {filter_sql}
+        ORDER BY {_checkin_order_sql(sort_by)}
+        {page_sql}
+    """
+    return query, params
+
+
+def _checkin_row_dict(columns: List[str], row) -> Dict[str, Any]:
+    data = _row_to_dict(columns, row)
+    data.pop("total_count", None)
+    created = data.get("created")
+    data["created"] = created.isoformat() if created else None
+    data["UUID"] = data.pop("checkin_uuid")
+    return data
+
+
+def get_checkins(
+    slug: Optional[str] = None,
+    include_all: bool = False,
+    *,
+    search: Optional[str] = None,
+    status: Optional[str] = None,
+    payment_valid: Optional[bool] = None,
+    game: Optional[str] = None,
+    missing: Optional[Iterable[str]] = None,
+    sort_by: Optional[List[Dict[str, Any]]] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> List[Dict[str, Any]]:  # type: ignore[assignment]
+    """
+    Return check-ins for a given event_slug from active_event_data, newest first.
+
+    Optional filters (see _checkin_filter_sql), sort_by (DataTable sort_by
+    entries) and limit/offset are applied in SQL.
     """
+    if not slug and not include_all:
+        return []
+
+    filters = dict(
+        search=search, status=status, payment_valid=payment_valid, game=game, missing=missing
+    )
+    query, params = _checkins_select_sql(slug, include_all, filters, sort_by, limit, offset)
 
     with _get_pool().connection() as conn:
         with conn.cursor() as cur:
             cur.execute(query, params)
+            columns = [desc[0] for desc in cur.description]
             rows = cur.fetchall()
 
-    result: List[Dict[str, Any]] = []
-    for row in rows:
-        (
-            record_id,
-            created,
-            event_slug,
-            status,
-            member,
-            startgg,
-            is_guest,
-            payment_amount,
-            payment_expected,
-            payment_valid,
-            name,
-            email,
-            tag,
-            telephone,
-            tournament_games_registered,
-            checkin_uuid,
-            startgg_event_id,
-            external_id,
-            added_via,
-            acquisition_source,
-        ) = row
-
-        result.append(
-            {
-                "record_id": record_id,
-                "created": created.isoformat() if created else None,
-                "event_slug": event_slug,
-                "status": status,
-                "member": member,
-                "startgg": startgg,
-                "is_guest": is_guest,
-                "payment_amount": payment_amount,
-                "payment_expected": payment_expected,
-                "payment_valid": payment_valid,
-                "name": name,
-                "email": email,
-                "tag": tag,
-                "telephone": telephone,
-                "tournament_games_registered": tournament_games_registered,
-                "UUID": checkin_uuid,
-                "startgg_event_id": startgg_event_id,
-                "external_id": external_id,
-                "added_via": added_via,
-                "acquisition_source": acquisition_source,
-            }
-        )
+    result = [_checkin_row_dict(columns, row) for row in rows]
 
     if include_all:
         logger.info(f"📥 Found {len(result)} checkins (ALL events)")
@@ -460,6 +1575,177 @@ def get_checkins(
     return result
 
 
+def get_checkins_page(
+    slug: Optional[str] = None,
+    include_all: bool = False,
+    *,
+    page: int = 0,
+    page_size: int = 20,
+    sort_by: Optional[List[Dict[str, Any]]] = None,
+    **filters: Any,
+) -> Dict[str, Any]:
+    """
+    One page of check-ins for the dashboard table (custom paging).
+
+    Returns {"rows": [...], "total": rows matching the filters}. filters are
+    the get_checkins filters (search, status, payment_valid, game, missing).
+    """
+    if not slug and not include_all:
+        return {"rows": [], "total": 0}
+
+    page_size = max(int(page_size or 20), 1)
+    offset = max(int(page or 0), 0) * page_size
+    query, params = _checkins_select_sql(
+        slug, include_all, filters, sort_by, page_size, offset, with_total=True
+    )
+
+    with _get_pool().connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(query, params)
+            columns = [desc[0] for desc in cur.description]
+            rows = cur.fetchall()
+            if rows:
+                total = rows[0][columns.index("total_count")]
+            elif offset:
+                # Past the last page - the window count needs at least one row
+                scope_sql, count_params = _checkin_scope_sql(slug, include_all)
+                filter_sql, filter_params = _checkin_filter_sql(**filters)
+                cur.execute(
+                    f"SELECT count(*) FROM active_event_data WHERE {scope_sql} AND {filter_sql}",
+                    count_params + filter_params,
+                )
+                total = cur.fetchone()[0]
+            else:
+                total = 0
+
+    return {"rows": [_checkin_row_dict(columns, row) for row in rows], "total": total}
+
+
+def get_checkins_summary(
+    slug: Optional[str] = None,
+    include_all: bool = False,
+    *,
+    attention: Optional[Iterable[str]] = None,
+    **filters: Any,
+) -> Dict[str, int]:
+    """
+    Counts for the check-ins view in one pass over the event: total rows,
+    rows matching the filters, and Ready / Pending / needing attention
+    (missing one of the `attention` requirement columns) among the matching rows.
+    """
+    summary = {"total": 0, "filtered": 0, "ready": 0, "pending": 0, "attention": 0}
+    if not slug and not include_all:
+        return summary
+
+    scope_sql, scope_params = _checkin_scope_sql(slug, include_all)
+    filter_sql, filter_params = _checkin_filter_sql(**filters)
+    attention_sql, _ = _checkin_filter_sql(missing=attention)
+    if attention_sql == "TRUE":
+        attention_sql = "FALSE"  # no enabled requirements - nobody needs attention
+
+    with _get_pool().connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT count(*),
+                       count(*) FILTER (WHERE {filter_sql}),
+                       count(*) FILTER (WHERE {filter_sql} AND status = 'Ready'),
+                       count(*) FILTER (WHERE {filter_sql} AND status = 'Pending'),
+                       count(*) FILTER (WHERE {filter_sql} AND {attention_sql})
+                FROM active_event_data
+                WHERE {scope_sql}
+                """,
+                filter_params * 4 + scope_params,
+            )
+            row = cur.fetchone()
+
+    return dict(zip(summary, row))
+
+
+def get_checkin_games(slug: Optional[str] = None, include_all: bool = False) -> List[str]:
+    """Canonical names of the games registered by the event's check-ins."""
+    if not slug and not include_all:
+        return []
+
+    scope_sql, params = _checkin_scope_sql(slug, include_all)
+    with _get_pool().connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT g.name
+                FROM games g
+                WHERE g.id IN (
+                    SELECT DISTINCT unnest(tournament_game_ids)
+                    FROM active_event_data
+                    WHERE {scope_sql}
+                )
+                ORDER BY LOWER(g.name)
+                """,
+                params,
+            )
+            return [row[0] for row in cur.fetchall()]
+
+
+def find_duplicate_checkins(
+    slug: Optional[str] = None, include_all: bool = False, limit: int = 4
+) -> Dict[str, Any]:
+    """
+    Likely duplicate check-ins: rows sharing at least two of name / tag / phone
+    (name and tag compared case- and whitespace-insensitively, phone by digits).
+
+    Returns {"count": flagged rows, "rows": newest `limit` flagged rows with
+    record_id, name, tag and the matching "reasons"}.
+    """
+    if not slug and not include_all:
+        return {"count": 0, "rows": []}
+
+    scope_sql, params = _checkin_scope_sql(slug, include_all)
+    with _get_pool().connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                f"""
+                WITH keys AS (
+                    SELECT id, record_id, name, tag, created,
+                           NULLIF(LOWER(btrim(regexp_replace(name, '\\s+', ' ', 'g'))), '') AS n,
+                           NULLIF(LOWER(btrim(regexp_replace(tag, '\\s+', ' ', 'g'))), '') AS t,
+                           NULLIF(regexp_replace(telephone, '\\D', '', 'g'), '') AS p
+                    FROM active_event_data
+                    WHERE {scope_sql}
+                ), pairs AS (
+                    SELECT *,
+                           n IS NOT NULL AND t IS NOT NULL
+                               AND count(*) OVER (PARTITION BY n, t) > 1 AS name_tag,
+                           n IS NOT NULL AND p IS NOT NULL
+                               AND count(*) OVER (PARTITION BY n, p) > 1 AS name_phone,
+                           t IS NOT NULL AND p IS NOT NULL
+                               AND count(*) OVER (PARTITION BY t, p) > 1 AS tag_phone
+                    FROM keys
+                )
+                SELECT record_id, name, tag, name_tag, name_phone, tag_phone, count(*) OVER ()
+                FROM pairs
+                WHERE name_tag OR name_phone OR tag_phone
+                ORDER BY created DESC, id DESC
+                LIMIT %s
+                """,
+                params + [max(int(limit), 0)],
+            )
+            rows = cur.fetchall()
+
+    flagged = []
+    for record_id, name, tag, name_tag, name_phone, tag_phone, _ in rows:
+        reasons = [
+            reason
+            for reason, hit in (
+                ("name + phone", name_phone),
+                ("name + tag", name_tag),
+                ("tag + phone", tag_phone),
+            )
+            if hit
+        ]
+        flagged.append({"record_id": record_id, "name": name, "tag": tag, "reasons": reasons})
+    return {"count": rows[0][-1] if rows else 0, "rows": flagged}
+
+
 def get_all_event_slugs() -> List[str]:
     """Collect unique event_slug values from active_event_data only.
 
@@ -638,6 +1924,68 @@ def get_checkin_by_record_id(record_id: str) -> Optional[Dict[str, Any]]:
     return {"record_id": row_dict.get("record_id"), "fields": _checkin_fields_from_row(row_dict)}
 
 
+# Alias keys known to be in game_aliases (this process); registration is a no-op for them
+_known_game_aliases: set = set()
+_known_game_aliases_lock = threading.Lock()
+
+_REGISTER_GAMES_SQL = """
+    INSERT INTO games (name)
+    SELECT DISTINCT ON (LOWER(canonical)) canonical
+    FROM unnest(%s::text[]) AS t(canonical)
+    ON CONFLICT (LOWER(name)) DO NOTHING
+"""
+_REGISTER_GAME_ALIASES_SQL = """
+    INSERT INTO game_aliases (alias, game_id)
+    SELECT t.alias, g.id
+    FROM unnest(%s::text[], %s::text[]) AS t(alias, canonical)
+    JOIN games g ON LOWER(g.name) = LOWER(t.canonical)
+    ON CONFLICT (alias) DO NOTHING
+"""
+
+
+def _pending_game_aliases(names: Optional[Iterable[Any]]) -> Dict[str, str]:
+    """Alias key -> canonical name for raw names not yet registered by this process."""
+    if isinstance(names, str):
+        names = [names]
+    pending: Dict[str, str] = {}
+    with _known_game_aliases_lock:
+        for name in names or []:
+            key = game_alias_key(name)
+            if key and key not in _known_game_aliases and key not in pending:
+                pending[key] = canonical_game_name(name)
+    return pending
+
+
+def _remember_game_aliases(aliases: Iterable[str]) -> None:
+    with _known_game_aliases_lock:
+        _known_game_aliases.update(aliases)
+
+
+def _register_game_names(names: Optional[Iterable[Any]], cur=None) -> None:
+    """
+    Register raw game names as aliases of their canonical game.
+
+    Must run before a row carrying the names is written: the
+    tournament_game_ids trigger only resolves registered aliases. Uses its own
+    autocommit connection unless given a cursor, so aliases are visible to a
+    writer's open transaction and survive its rollback.
+    """
+    pending = _pending_game_aliases(names)
+    if not pending:
+        return
+    aliases = list(pending)
+    canonicals = [pending[a] for a in aliases]
+    if cur is None:
+        with _get_pool().connection() as conn:
+            with conn.cursor() as own_cur:
+                own_cur.execute(_REGISTER_GAMES_SQL, (canonicals,))
+                own_cur.execute(_REGISTER_GAME_ALIASES_SQL, (aliases, canonicals))
+    else:
+        cur.execute(_REGISTER_GAMES_SQL, (canonicals,))
+        cur.execute(_REGISTER_GAME_ALIASES_SQL, (aliases, canonicals))
+    _remember_game_aliases(aliases)
+
+
 def update_checkin(
     record_id: str, fields: Dict[str, Any], typecast: bool = False
 ) -> Optional[Dict[str, Any]]:
@@ -654,6 +2002,8 @@ def update_checkin(
 
     if not update_fields:
         return None
+    if "tournament_games_registered" in update_fields:
+        _register_game_names(update_fields["tournament_games_registered"])
 
     set_sql = ", ".join([f"{k} = %s" for k in update_fields.keys()])
     params = list(update_fields.values())
@@ -689,129 +2039,206 @@ def delete_checkin(record_id: str) -> bool:
             return cur.rowcount > 0
 
 
-def begin_checkin(event_slug: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Create or update a check-in attempt and return checkin_id.
-
-    Dedupe strategy (backend-owned):
-    - event_slug + tag (case-insensitive) if tag exists
-    - else event_slug + name (case-insensitive) if name exists
-    """
-    if not event_slug:
-        raise ValueError("event_slug is required")
-
-    payload = payload or {}
-    tag = (payload.get("tag") or "").strip() or None
-    name = (payload.get("name") or "").strip() or None
+# Columns begin_checkin writes (player_uuid is matched in the statement itself)
+_BEGIN_CHECKIN_COLUMNS = (
+    "event_slug",
+    "external_id",
+    "name",
+    "tag",
+    "email",
+    "telephone",
+    "status",
+    "member",
+    "startgg",
+    "payment_valid",
+    "payment_amount",
+    "payment_expected",
+    "tournament_games_registered",
+    "checkin_uuid",
+    "startgg_event_id",
+    "is_guest",
+    "added_via",
+    "acquisition_source",
+)
 
-    existing = None
-    if tag:
-        existing = get_checkin_by_tag(tag, event_slug)
-    elif name:
-        existing = get_checkin_by_name(name, event_slug)
 
+def _begin_checkin_fields(event_slug: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Column values for begin_checkin, keyed like _BEGIN_CHECKIN_COLUMNS."""
     games = payload.get("tournament_games_registered")
     if isinstance(games, str):
         games = [g.strip() for g in games.split(",") if g.strip()]
     if not isinstance(games, list):
         games = []
 
-    # Resolve player_uuid early (match-only, no creation)
-    matched_player_uuid = None
-    if CANONICAL_PLAYER_ID_ENABLED:
-        try:
-            matched_player_uuid = _find_player_uuid(tag, payload.get("email"))
-        except Exception as exc:
-            logger.warning(f"⚠️ Player UUID lookup failed (non-blocking): {exc}")
-
-    fields: Dict[str, Any] = {
+    return {
         "event_slug": event_slug,
+        "external_id": payload.get("external_id"),
         "name": payload.get("name"),
-        "tag": payload.get("tag"),
+        "tag": (payload.get("tag") or "").strip() or None,
         "email": payload.get("email"),
         "telephone": payload.get("telephone"),
         "status": payload.get("status") or "Pending",
         "member": bool(payload.get("member", False)),
         "startgg": bool(payload.get("startgg", False)),
-        "is_guest": bool(payload.get("is_guest", False)),
         "payment_valid": bool(payload.get("payment_valid", False)),
         "payment_amount": payload.get("payment_amount") or 0,
         "payment_expected": payload.get("payment_expected") or 0,
         "tournament_games_registered": games,
-        "UUID": payload.get("UUID") or payload.get("checkin_uuid"),
+        "checkin_uuid": payload.get("UUID") or payload.get("checkin_uuid"),
         "startgg_event_id": payload.get("startgg_event_id"),
-        "external_id": payload.get("external_id"),
+        "is_guest": bool(payload.get("is_guest", False)),
         "added_via": _normalize_added_via(payload.get("added_via")),
-        "player_uuid": matched_player_uuid,
+        "acquisition_source": _normalize_acquisition_source(payload.get("acquisition_source")),
     }
 
-    normalized_source = _normalize_acquisition_source(payload.get("acquisition_source"))
-    if normalized_source is not None:
-        fields["acquisition_source"] = normalized_source
 
-    if existing and existing.get("record_id"):
-        checkin_id = existing["record_id"]
-        updated = update_checkin(checkin_id, fields)
-        if not updated:
-            raise RuntimeError("Failed to update existing checkin")
-        return {
-            "checkin_id": checkin_id,
-            "record_id": checkin_id,
-            "event_slug": event_slug,
-            "created": False,
-            "player_uuid": matched_player_uuid,
-        }
+def _begin_checkin_player_sql() -> str:
+    """player_uuid match with the _find_player_uuid priority (tag, then email)."""
+    if not CANONICAL_PLAYER_ID_ENABLED:
+        return "NULL"
+    return """COALESCE(
+                (SELECT uuid FROM players WHERE LOWER(tag) = LOWER(%(tag)s) LIMIT 1),
+                (SELECT uuid FROM players WHERE LOWER(email) = LOWER(%(email)s) LIMIT 1)
+            )"""
+
+
+def _begin_checkin_updates(new_value) -> str:
+    """SET list for a repeated check-in; new_value(col) is the SQL of a column's new value."""
+    updates = [
+        f"{col} = {new_value(col)}"
+        for col in _BEGIN_CHECKIN_COLUMNS
+        if col not in ("event_slug", "acquisition_source")
+    ]
+    # acquisition_source is only overwritten when the payload carries one
+    updates.append(
+        f"acquisition_source = COALESCE({new_value('acquisition_source')}, active_event_data.acquisition_source)"
+    )
+    updates.append(f"player_uuid = {new_value('player_uuid')}")
+    return ", ".join(updates)
+
+
+def _begin_checkin_sql(upsert: bool) -> str:
+    """
+    INSERT statement for begin_checkin (named params from _begin_checkin_fields).
+
+    player_uuid is resolved in the same statement with the _find_player_uuid
+    priority (tag, then email). With upsert, an existing row for the same
+    event_slug + LOWER(tag) is updated in place via idx_active_event_tag_unique,
+    so concurrent check-ins of one tag cannot create duplicates.
+    RETURNING gives record_id, player_uuid and created (xmax = 0 on insert).
+    """
+    columns = ", ".join(_BEGIN_CHECKIN_COLUMNS)
+    values = ", ".join(f"%({col})s" for col in _BEGIN_CHECKIN_COLUMNS)
+    sql = f"""
+        INSERT INTO active_event_data ({columns}, player_uuid)
+        VALUES ({values}, {_begin_checkin_player_sql()})
+    """
+    if upsert:
+        sql += f"""
+        ON CONFLICT (event_slug, LOWER(tag)) WHERE tag IS NOT NULL AND tag <> ''
+        DO UPDATE SET {_begin_checkin_updates(lambda col: f"EXCLUDED.{col}")}
+        """
+    return sql + "RETURNING record_id, player_uuid, (xmax = 0) AS created"
+
+
+# begin_checkin without idx_active_event_tag_unique (_begin_checkin_locked): under a
+# transaction-scoped advisory lock per event + tag, update the newest row or insert.
+_BEGIN_CHECKIN_LOCK_SQL = """
+    SELECT pg_advisory_xact_lock(
+        hashtext('begin_checkin:' || %(event_slug)s || ':' || LOWER(%(tag)s))
+    )
+"""
+_BEGIN_CHECKIN_FIND_SQL = """
+    SELECT record_id FROM active_event_data
+    WHERE event_slug = %(event_slug)s AND LOWER(tag) = LOWER(%(tag)s)
+    ORDER BY created DESC NULLS LAST, id DESC
+    LIMIT 1
+"""
+
+
+def _begin_checkin_update_sql() -> str:
+    """UPDATE of an existing check-in (record_id param) with the begin_checkin upsert's values."""
+
+    def new_value(col):
+        return _begin_checkin_player_sql() if col == "player_uuid" else f"%({col})s"
+
+    return f"""
+        UPDATE active_event_data SET {_begin_checkin_updates(new_value)}
+        WHERE record_id = %(record_id)s
+        RETURNING record_id, player_uuid, false AS created
+    """
+
+
+def _begin_checkin_locked(conn, fields: Dict[str, Any]) -> tuple:
+    """begin_checkin's write for a tagged check-in while the unique index is missing."""
+    with conn.transaction():
+        with conn.cursor() as cur:
+            cur.execute(_BEGIN_CHECKIN_LOCK_SQL, fields)
+            cur.execute(_BEGIN_CHECKIN_FIND_SQL, fields)
+            existing = cur.fetchone()
+            if existing:
+                cur.execute(_begin_checkin_update_sql(), {**fields, "record_id": existing[0]})
+            else:
+                cur.execute(_begin_checkin_sql(upsert=False), fields)
+            return cur.fetchone()
+
+
+def begin_checkin(event_slug: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Create or update a check-in attempt and return checkin_id.
+
+    Dedupe strategy (backend-owned):
+    - event_slug + tag (case-insensitive) if tag exists: one INSERT ... ON CONFLICT
+      round-trip, safe under concurrent check-ins (a locked read-then-write while
+      idx_active_event_tag_unique is missing)
+    - else event_slug + name (case-insensitive) if name exists
+    """
+    if not event_slug:
+        raise ValueError("event_slug is required")
+
+    payload = payload or {}
+    fields = _begin_checkin_fields(event_slug, payload)
+    name = (payload.get("name") or "").strip() or None
+
+    if not fields["tag"] and name:
+        existing = get_checkin_by_name(name, event_slug)
+        if existing and existing.get("record_id"):
+            checkin_id = existing["record_id"]
+            matched_player_uuid = None
+            if CANONICAL_PLAYER_ID_ENABLED:
+                try:
+                    matched_player_uuid = _find_player_uuid(None, fields["email"])
+                except Exception as exc:
+                    logger.warning(f"⚠️ Player UUID lookup failed (non-blocking): {exc}")
+            update_fields = {
+                k: v for k, v in fields.items() if k != "acquisition_source" or v is not None
+            }
+            update_fields["player_uuid"] = matched_player_uuid
+            if not update_checkin(checkin_id, update_fields):
+                raise RuntimeError("Failed to update existing checkin")
+            return {
+                "checkin_id": checkin_id,
+                "record_id": checkin_id,
+                "event_slug": event_slug,
+                "created": False,
+                "player_uuid": matched_player_uuid,
+            }
 
     with _get_pool().connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO active_event_data (
-                    event_slug, external_id,
-                    name, tag, email, telephone,
-                    status, member, startgg, payment_valid,
-                    payment_amount, payment_expected,
-                    tournament_games_registered, checkin_uuid,
-                    startgg_event_id, is_guest, added_via, acquisition_source, player_uuid
-                ) VALUES (
-                    %s, %s,
-                    %s, %s, %s, %s,
-                    %s, %s, %s, %s,
-                    %s, %s,
-                    %s, %s,
-                    %s, %s, %s, %s, %s
-                )
-                RETURNING record_id
-                """,
-                (
-                    event_slug,
-                    fields["external_id"],
-                    fields["name"],
-                    fields["tag"],
-                    fields["email"],
-                    fields["telephone"],
-                    fields["status"],
-                    fields["member"],
-                    fields["startgg"],
-                    fields["payment_valid"],
-                    fields["payment_amount"],
-                    fields["payment_expected"],
-                    fields["tournament_games_registered"],
-                    fields.get("checkin_uuid") or fields.get("UUID"),
-                    fields["startgg_event_id"],
-                    fields["is_guest"],
-                    fields["added_via"],
-                    fields.get("acquisition_source"),
-                    matched_player_uuid,
-                ),
-            )
-            checkin_id = cur.fetchone()[0]
+            _register_game_names(fields["tournament_games_registered"], cur=cur)
+        if fields["tag"] and not _checkin_tag_index_ready:
+            checkin_id, matched_player_uuid, created = _begin_checkin_locked(conn, fields)
+        else:
+            with conn.cursor() as cur:
+                cur.execute(_begin_checkin_sql(upsert=bool(fields["tag"])), fields)
+                checkin_id, matched_player_uuid, created = cur.fetchone()
 
     return {
         "checkin_id": checkin_id,
         "record_id": checkin_id,
         "event_slug": event_slug,
-        "created": True,
+        "created": bool(created),
         "player_uuid": matched_player_uuid,
     }
 
@@ -891,6 +2318,205 @@ def apply_integration_result(
     }
 
 
+# =============================================
+# Check-in jobs (async orchestration)
+# =============================================
+CHECKIN_JOB_RETENTION = timedelta(days=2)
+# Running admin jobs without a progress update for this long are considered dead
+ADMIN_JOB_STALE_AFTER = timedelta(minutes=10)
+
+
+def start_checkin_job(checkin_id: str) -> None:
+    """Mark a check-in orchestration job as running (re-submits restart it)."""
+    with _get_pool().connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO checkin_jobs (checkin_id, state, result, created_at, finished_at)
+                VALUES (%s, 'running', NULL, now(), NULL)
+                ON CONFLICT (checkin_id) DO UPDATE
+                SET state = 'running', result = NULL, created_at = now(), finished_at = NULL
+                """,
+                (checkin_id,),
+            )
+            # Opportunistic cleanup - jobs are only polled for a few minutes
+            cur.execute(
+                "DELETE FROM checkin_jobs WHERE created_at < %s",
+                (datetime.now(timezone.utc) - CHECKIN_JOB_RETENTION,),
+            )
+
+
+def finish_checkin_job(checkin_id: str, state: str, result: Dict[str, Any]) -> None:
+    """Store the final result of a check-in orchestration job ('done' or 'failed')."""
+    from psycopg.types.json import Json  # type: ignore
+
+    with _get_pool().connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE checkin_jobs
+                SET state = %s, result = %s, finished_at = now()
+                WHERE checkin_id = %s
+                """,
+                (state, Json(result), checkin_id),
+            )
+
+
+def settle_checkin_job(checkin_id: str, result: Dict[str, Any]) -> bool:
+    """
+    Mark a still running job 'done' with result (its worker died).
+
+    Returns False if the job had already finished, e.g. another poll settled
+    it first - only the caller that gets True should announce the result.
+    """
+    from psycopg.types.json import Json  # type: ignore
+
+    with _get_pool().connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE checkin_jobs
+                SET state = 'done', result = %s, finished_at = now()
+                WHERE checkin_id = %s AND state = 'running'
+                RETURNING checkin_id
+                """,
+                (Json(result), checkin_id),
+            )
+            return cur.fetchone() is not None
+
+
+def get_checkin_job(checkin_id: str) -> Optional[Dict[str, Any]]:
+    """Return {checkin_id, state, result, created_at, finished_at} or None."""
+    with _get_pool().connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT checkin_id, state, result, created_at, finished_at
+                FROM checkin_jobs
+                WHERE checkin_id = %s
+                """,
+                (checkin_id,),
+            )
+            row = cur.fetchone()
+            if not row:
+                return None
+            columns = [desc[0] for desc in cur.description]
+    return _row_to_dict(columns, row)
+
+
+# =============================================
+# Admin jobs (long-running dashboard operations)
+# =============================================
+_ADMIN_JOB_COLUMNS = (
+    "job_id, kind, event_slug, state, progress, result, cancel_requested, "
+    "created_at, updated_at, finished_at"
+)
+
+
+def start_admin_job(
+    kind: str, job_id: str, event_slug: str = "", progress: Optional[Dict[str, Any]] = None
+) -> bool:
+    """
+    Register a running job. Returns False if another job of the same kind is
+    still running (jobs without progress for ADMIN_JOB_STALE_AFTER are failed first).
+    """
+    from psycopg import errors as pg_errors  # type: ignore
+    from psycopg.types.json import Json  # type: ignore
+
+    with _get_pool().connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE admin_jobs
+                SET state = 'failed', finished_at = now(),
+                    result = '{"error": "job stopped reporting progress"}'::jsonb
+                WHERE kind = %s AND state = 'running' AND updated_at < %s
+                """,
+                (kind, datetime.now(timezone.utc) - ADMIN_JOB_STALE_AFTER),
+            )
+            try:
+                cur.execute(
+                    """
+                    INSERT INTO admin_jobs (job_id, kind, event_slug, state, progress)
+                    VALUES (%s, %s, %s, 'running', %s)
+                    """,
+                    (job_id, kind, event_slug or None, Json(progress or {})),
+                )
+            except pg_errors.UniqueViolation:
+                return False
+    return True
+
+
+def update_admin_job(job_id: str, progress: Dict[str, Any]) -> bool:
+    """Store progress for a running job. Returns True if cancellation was requested."""
+    from psycopg.types.json import Json  # type: ignore
+
+    with _get_pool().connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE admin_jobs
+                SET progress = %s, updated_at = now()
+                WHERE job_id = %s
+                RETURNING cancel_requested
+                """,
+                (Json(progress), job_id),
+            )
+            row = cur.fetchone()
+    return bool(row and row[0])
+
+
+def finish_admin_job(job_id: str, state: str, result: Dict[str, Any]) -> bool:
+    """
+    Store the final state ('done', 'cancelled' or 'failed') and result of a job.
+
+    Returns False if the job had already finished (e.g. it was cancelled first).
+    """
+    from psycopg.types.json import Json  # type: ignore
+
+    with _get_pool().connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE admin_jobs
+                SET state = %s, result = %s, updated_at = now(), finished_at = now()
+                WHERE job_id = %s AND state = 'running'
+                """,
+                (state, Json(result), job_id),
+            )
+            return cur.rowcount > 0
+
+
+def get_admin_job(
+    job_id: Optional[str] = None, kind: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """Return a job by id, or the most recent job of kind."""
+    if job_id:
+        where_sql, params = "job_id = %s", (job_id,)
+    elif kind:
+        where_sql, params = "kind = %s", (kind,)
+    else:
+        return None
+
+    with _get_pool().connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT {_ADMIN_JOB_COLUMNS}
+                FROM admin_jobs
+                WHERE {where_sql}
+                ORDER BY created_at DESC
+                LIMIT 1
+                """,
+                params,
+            )
+            row = cur.fetchone()
+            if not row:
+                return None
+            columns = [desc[0] for desc in cur.description]
+    return _row_to_dict(columns, row)
+
+
 # =============================================
 # Players
 # =============================================
@@ -1049,27 +2675,42 @@ def get_event_history_dashboard() -> List[Dict[str, Any]]:
     return result
 
 
-def get_event_manual_add_stats(
-    event_slugs: Optional[List[str]] = None,
-    start_date: Optional[str] = None,
-    end_date: Optional[str] = None,
-) -> Dict[str, Dict[str, Any]]:
-    """Return per-event manual check-in stats from event_archive.added_via."""
-    conditions: List[str] = []
+def _archive_scope_where(
+    event_slugs: Optional[List[str]],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    base: Optional[List[str]] = None,
+    alias: str = "",
+) -> tuple:
+    """WHERE clause + params for the usual (event_slugs, start_date, end_date) scope."""
+    prefix = f"{alias}." if alias else ""
+    conditions: List[str] = list(base or [])
     params: List[Any] = []
 
     if event_slugs:
-        conditions.append("event_slug = ANY(%s)")
+        conditions.append(f"{prefix}event_slug = ANY(%s)")
         params.append(event_slugs)
     if start_date:
-        conditions.append("event_date >= %s")
+        conditions.append(f"{prefix}event_date >= %s")
         params.append(start_date)
     if end_date:
-        conditions.append("event_date <= %s")
+        conditions.append(f"{prefix}event_date <= %s")
         params.append(end_date)
 
     where_sql = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return where_sql, params
 
+
+def _fetch_insights_rows(query: tuple) -> List[tuple]:
+    sql, params = query
+    with _get_pool().connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(sql, params)
+            return cur.fetchall()
+
+
+def _manual_add_stats_query(event_slugs, start_date, end_date) -> tuple:
+    where_sql, params = _archive_scope_where(event_slugs, start_date, end_date)
     query = f"""
         SELECT
             event_slug,
@@ -1079,13 +2720,11 @@ def get_event_manual_add_stats(
         {where_sql}
         GROUP BY event_slug
     """
+    return query, params
 
-    out: Dict[str, Dict[str, Any]] = {}
-    with _get_pool().connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(query, params)
-            rows = cur.fetchall()
 
+def _parse_manual_add_stats(rows: List[tuple]) -> Dict[str, Dict[str, Any]]:
+    out: Dict[str, Dict[str, Any]] = {}
     for slug, total_count, manual_count in rows:
         total_i = int(total_count or 0)
         manual_i = int(manual_count or 0)
@@ -1095,31 +2734,21 @@ def get_event_manual_add_stats(
             "manual_count": manual_i,
             "manual_pct": manual_pct,
         }
-
     return out
 
 
-def get_added_via_breakdown(
+def get_event_manual_add_stats(
     event_slugs: Optional[List[str]] = None,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
-) -> List[Dict[str, Any]]:
-    """Return added_via source distribution for archived rows in scope."""
-    conditions: List[str] = []
-    params: List[Any] = []
-
-    if event_slugs:
-        conditions.append("event_slug = ANY(%s)")
-        params.append(event_slugs)
-    if start_date:
-        conditions.append("event_date >= %s")
-        params.append(start_date)
-    if end_date:
-        conditions.append("event_date <= %s")
-        params.append(end_date)
+) -> Dict[str, Dict[str, Any]]:
+    """Return per-event manual check-in stats from event_archive.added_via."""
+    rows = _fetch_insights_rows(_manual_add_stats_query(event_slugs, start_date, end_date))
+    return _parse_manual_add_stats(rows)
 
-    where_sql = f"WHERE {' AND '.join(conditions)}" if conditions else ""
 
+def _added_via_breakdown_query(event_slugs, start_date, end_date) -> tuple:
+    where_sql, params = _archive_scope_where(event_slugs, start_date, end_date)
     query = f"""
         SELECT
             COALESCE(NULLIF(added_via, ''), 'unknown') AS source,
@@ -1129,43 +2758,31 @@ def get_added_via_breakdown(
         GROUP BY source
         ORDER BY cnt DESC, source ASC
     """
+    return query, params
 
-    result: List[Dict[str, Any]] = []
-    with _get_pool().connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(query, params)
-            rows = cur.fetchall()
 
+def _parse_source_breakdown(rows: List[tuple]) -> List[Dict[str, Any]]:
+    result: List[Dict[str, Any]] = []
     total = sum(int(r[1] or 0) for r in rows)
     for source, cnt in rows:
         count_i = int(cnt or 0)
         share = (count_i / total * 100.0) if total > 0 else 0.0
         result.append({"source": source, "count": count_i, "share": share})
-
     return result
 
 
-def get_multi_game_count(
+def get_added_via_breakdown(
     event_slugs: Optional[List[str]] = None,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
-) -> Dict[str, int]:
-    """Count rows with 2+ registered games in archived check-ins."""
-    conditions: List[str] = []
-    params: List[Any] = []
-
-    if event_slugs:
-        conditions.append("event_slug = ANY(%s)")
-        params.append(event_slugs)
-    if start_date:
-        conditions.append("event_date >= %s")
-        params.append(start_date)
-    if end_date:
-        conditions.append("event_date <= %s")
-        params.append(end_date)
+) -> List[Dict[str, Any]]:
+    """Return added_via source distribution for archived rows in scope."""
+    rows = _fetch_insights_rows(_added_via_breakdown_query(event_slugs, start_date, end_date))
+    return _parse_source_breakdown(rows)
 
-    where_sql = f"WHERE {' AND '.join(conditions)}" if conditions else ""
 
+def _multi_game_count_query(event_slugs, start_date, end_date) -> tuple:
+    where_sql, params = _archive_scope_where(event_slugs, start_date, end_date)
     query = f"""
         SELECT
             COUNT(*) FILTER (
@@ -1175,84 +2792,79 @@ def get_multi_game_count(
         FROM event_archive
         {where_sql}
     """
+    return query, params
 
-    with _get_pool().connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(query, params)
-            row = cur.fetchone()
 
-    if not row:
+def _parse_multi_game_count(rows: List[tuple]) -> Dict[str, int]:
+    if not rows:
         return {"multi_game_count": 0, "total_count": 0}
-
+    row = rows[0]
     return {
         "multi_game_count": int(row[0] or 0),
         "total_count": int(row[1] or 0),
     }
 
 
-def get_community_health_v2_stats(
+def get_multi_game_count(
     event_slugs: Optional[List[str]] = None,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
-    anchor_date: Optional[str] = None,
-    recent_months: int = 6,
-) -> Dict[str, float]:
-    """Return Core Players (rolling window) and Player Lifetime stats."""
-
-    scope_conditions: List[str] = []
-    scope_params: List[Any] = []
-
-    if event_slugs:
-        scope_conditions.append("event_slug = ANY(%s)")
-        scope_params.append(event_slugs)
-    if start_date:
-        scope_conditions.append("event_date >= %s")
-        scope_params.append(start_date)
-    if end_date:
-        scope_conditions.append("event_date <= %s")
-        scope_params.append(end_date)
+) -> Dict[str, int]:
+    """Count rows with 2+ registered games in archived check-ins."""
+    rows = _fetch_insights_rows(_multi_game_count_query(event_slugs, start_date, end_date))
+    return _parse_multi_game_count(rows)
 
-    scope_where = f"WHERE {' AND '.join(scope_conditions)}" if scope_conditions else ""
 
-    # Core players is always defined on a rolling recent window.
-    anchor = anchor_date or end_date
-    core_conditions: List[str] = ["ea.player_uuid IS NOT NULL"]
+def _core_players_where(event_slugs, anchor: Optional[str], recent_months: int) -> tuple:
+    """Rolling-window conditions (on player_event_facts f) for core players (3+ distinct events)."""
+    core_conditions: List[str] = ["f.game_id IS NULL"]
     core_params: List[Any] = []
 
     if event_slugs:
-        core_conditions.append("ea.event_slug = ANY(%s)")
+        core_conditions.append("f.event_slug = ANY(%s)")
         core_params.append(event_slugs)
 
     if anchor:
-        core_conditions.append("ea.event_date <= %s::date")
+        core_conditions.append("f.event_date <= %s::date")
         core_params.append(anchor)
-        core_conditions.append("ea.event_date >= (%s::date - (%s || ' months')::interval)")
+        core_conditions.append("f.event_date >= (%s::date - (%s || ' months')::interval)")
         core_params.append(anchor)
         core_params.append(max(int(recent_months), 1))
     else:
-        core_conditions.append("ea.event_date >= (CURRENT_DATE - (%s || ' months')::interval)")
+        core_conditions.append("f.event_date >= (CURRENT_DATE - (%s || ' months')::interval)")
         core_params.append(max(int(recent_months), 1))
 
-    core_where = f"WHERE {' AND '.join(core_conditions)}"
+    return f"WHERE {' AND '.join(core_conditions)}", core_params
 
-    core_query = f"""
+
+def _core_players_query(event_slugs, end_date, anchor_date, recent_months: int = 6) -> tuple:
+    # Core players is always defined on a rolling recent window.
+    core_where, core_params = _core_players_where(
+        event_slugs, anchor_date or end_date, recent_months
+    )
+    query = f"""
         SELECT COUNT(*)
         FROM (
-            SELECT ea.player_uuid
-            FROM event_archive ea
+            SELECT f.player_uuid
+            FROM player_event_facts f
             {core_where}
-            GROUP BY ea.player_uuid
-            HAVING COUNT(DISTINCT ea.event_slug) >= 3
+            GROUP BY f.player_uuid
+            HAVING COUNT(DISTINCT f.event_slug) >= 3
         ) core
     """
+    return query, core_params
 
-    if scope_conditions:
-        lifetime_query = f"""
+
+def _player_lifetime_query(event_slugs, start_date, end_date) -> tuple:
+    scope_where, scope_params = _archive_scope_where(
+        event_slugs, start_date, end_date, base=["game_id IS NULL"]
+    )
+    if scope_params:
+        query = f"""
             WITH scoped_players AS (
                 SELECT DISTINCT player_uuid
-                FROM event_archive
+                FROM player_event_facts
                 {scope_where}
-                  AND player_uuid IS NOT NULL
             )
             SELECT AVG(p.total_events)::float
             FROM players p
@@ -1260,84 +2872,68 @@ def get_community_health_v2_stats(
             WHERE p.total_events > 0
         """
     else:
-        lifetime_query = """
+        query = """
             SELECT AVG(total_events)::float
             FROM players
             WHERE total_events > 0
         """
+    return query, scope_params
 
-    with _get_pool().connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(core_query, core_params)
-            core_row = cur.fetchone()
-
-            cur.execute(lifetime_query, scope_params)
-            lifetime_row = cur.fetchone()
 
+def _parse_community_health(core_rows: List[tuple], lifetime_rows: List[tuple]) -> Dict[str, float]:
+    core_row = core_rows[0] if core_rows else None
+    lifetime_row = lifetime_rows[0] if lifetime_rows else None
     return {
         "core_players": int((core_row[0] if core_row else 0) or 0),
         "player_lifetime": float((lifetime_row[0] if lifetime_row else 0.0) or 0.0),
     }
 
 
-def get_player_funnel_stats(
+def get_community_health_v2_stats(
     event_slugs: Optional[List[str]] = None,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     anchor_date: Optional[str] = None,
     recent_months: int = 6,
-    churn_months: int = 8,
-) -> Dict[str, int]:
-    """Return New -> Returning -> Core funnel counts for selected scope."""
-
-    scope_conditions: List[str] = ["player_uuid IS NOT NULL"]
-    scope_params: List[Any] = []
-
-    if event_slugs:
-        scope_conditions.append("event_slug = ANY(%s)")
-        scope_params.append(event_slugs)
-    if start_date:
-        scope_conditions.append("event_date >= %s")
-        scope_params.append(start_date)
-    if end_date:
-        scope_conditions.append("event_date <= %s")
-        scope_params.append(end_date)
+) -> Dict[str, float]:
+    """Return Core Players (rolling window) and Player Lifetime stats."""
+    core_sql, core_params = _core_players_query(event_slugs, end_date, anchor_date, recent_months)
+    lifetime_sql, lifetime_params = _player_lifetime_query(event_slugs, start_date, end_date)
 
-    scope_where = f"WHERE {' AND '.join(scope_conditions)}"
+    with _get_pool().connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(core_sql, core_params)
+            core_rows = cur.fetchall()
 
-    anchor = anchor_date or end_date
-    core_conditions: List[str] = ["ea.player_uuid IS NOT NULL"]
-    core_params: List[Any] = []
+            cur.execute(lifetime_sql, lifetime_params)
+            lifetime_rows = cur.fetchall()
 
-    if event_slugs:
-        core_conditions.append("ea.event_slug = ANY(%s)")
-        core_params.append(event_slugs)
+    return _parse_community_health(core_rows, lifetime_rows)
 
-    if anchor:
-        core_conditions.append("ea.event_date <= %s::date")
-        core_params.append(anchor)
-        core_conditions.append("ea.event_date >= (%s::date - (%s || ' months')::interval)")
-        core_params.append(anchor)
-        core_params.append(max(int(recent_months), 1))
-    else:
-        core_conditions.append("ea.event_date >= (CURRENT_DATE - (%s || ' months')::interval)")
-        core_params.append(max(int(recent_months), 1))
 
-    core_where = f"WHERE {' AND '.join(core_conditions)}"
+def _player_funnel_query(
+    event_slugs, start_date, end_date, anchor_date, recent_months: int = 6, churn_months: int = 8
+) -> tuple:
+    scope_where, scope_params = _archive_scope_where(
+        event_slugs, start_date, end_date, base=["game_id IS NULL"]
+    )
+    core_where, core_params = _core_players_where(
+        event_slugs, anchor_date or end_date, recent_months
+    )
 
     query = f"""
         WITH scoped_players AS (
             SELECT DISTINCT player_uuid
-            FROM event_archive
+            FROM player_event_facts
             {scope_where}
         ),
         core_players AS (
-            SELECT ea.player_uuid
-            FROM event_archive ea
-            JOIN scoped_players sp ON sp.player_uuid = ea.player_uuid
+            SELECT f.player_uuid
+            FROM player_event_facts f
+            JOIN scoped_players sp ON sp.player_uuid = f.player_uuid
             {core_where}
-            GROUP BY ea.player_uuid
-            HAVING COUNT(DISTINCT ea.event_slug) >= 3
+            GROUP BY f.player_uuid
+            HAVING COUNT(DISTINCT f.event_slug) >= 3
         ),
         churned_players AS (
             SELECT p.uuid
@@ -1353,55 +2949,47 @@ def get_player_funnel_stats(
         FROM scoped_players sp
         JOIN players p ON p.uuid = sp.player_uuid
     """
+    return query, scope_params + core_params + [max(int(churn_months), 1)]
 
-    with _get_pool().connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(query, scope_params + core_params + [max(int(churn_months), 1)])
-            row = cur.fetchone()
 
-    if not row:
+def _parse_player_funnel(rows: List[tuple]) -> Dict[str, int]:
+    if not rows:
         return {"new_count": 0, "returning_count": 0, "core_count": 0, "churned_count": 0}
-
+    row = rows[0]
     return {
         "new_count": int(row[0] or 0),
         "returning_count": int(row[1] or 0),
         "core_count": int(row[2] or 0),
-        "churned_count": int(row[3] or 0),
-    }
-
-
-def get_game_crossover_stats(
-    event_slugs: Optional[List[str]] = None,
-    start_date: Optional[str] = None,
-    end_date: Optional[str] = None,
-    limit: int = 20,
-) -> List[Dict[str, Any]]:
-    """Return game-pair crossover counts (distinct players per pair)."""
-
-    conditions: List[str] = ["ea.player_uuid IS NOT NULL"]
-    params: List[Any] = []
-
-    if event_slugs:
-        conditions.append("ea.event_slug = ANY(%s)")
-        params.append(event_slugs)
-    if start_date:
-        conditions.append("ea.event_date >= %s")
-        params.append(start_date)
-    if end_date:
-        conditions.append("ea.event_date <= %s")
-        params.append(end_date)
+        "churned_count": int(row[3] or 0),
+    }
+
+
+def get_player_funnel_stats(
+    event_slugs: Optional[List[str]] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    anchor_date: Optional[str] = None,
+    recent_months: int = 6,
+    churn_months: int = 8,
+) -> Dict[str, int]:
+    """Return New -> Returning -> Core funnel counts for selected scope."""
+    rows = _fetch_insights_rows(
+        _player_funnel_query(
+            event_slugs, start_date, end_date, anchor_date, recent_months, churn_months
+        )
+    )
+    return _parse_player_funnel(rows)
 
-    where_sql = f"WHERE {' AND '.join(conditions)}"
 
+def _game_crossover_query(event_slugs, start_date, end_date, limit: int = 20) -> tuple:
+    where_sql, params = _archive_scope_where(
+        event_slugs, start_date, end_date, base=["game_id IS NOT NULL"]
+    )
     query = f"""
         WITH player_games AS (
-            SELECT DISTINCT
-                ea.player_uuid,
-                game.value AS game
-            FROM event_archive ea
-            JOIN LATERAL unnest(
-                COALESCE(ea.tournament_games_registered, ARRAY[]::text[])
-            ) AS game(value) ON TRUE
+            SELECT DISTINCT f.player_uuid, f.game_id, g.name AS game
+            FROM player_event_facts f
+            JOIN games g ON g.id = f.game_id
             {where_sql}
         )
         SELECT
@@ -1416,12 +3004,10 @@ def get_game_crossover_stats(
         ORDER BY shared_players DESC, game_a ASC, game_b ASC
         LIMIT %s
     """
+    return query, params + [max(int(limit), 1)]
 
-    with _get_pool().connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(query, params + [max(int(limit), 1)])
-            rows = cur.fetchall()
 
+def _parse_game_crossover(rows: List[tuple]) -> List[Dict[str, Any]]:
     result: List[Dict[str, Any]] = []
     for game_a, game_b, shared_players in rows:
         result.append(
@@ -1434,27 +3020,19 @@ def get_game_crossover_stats(
     return result
 
 
-def get_acquisition_source_breakdown(
+def get_game_crossover_stats(
     event_slugs: Optional[List[str]] = None,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
+    limit: int = 20,
 ) -> List[Dict[str, Any]]:
-    """Return acquisition_source distribution for archived rows in scope."""
-    conditions: List[str] = []
-    params: List[Any] = []
-
-    if event_slugs:
-        conditions.append("event_slug = ANY(%s)")
-        params.append(event_slugs)
-    if start_date:
-        conditions.append("event_date >= %s")
-        params.append(start_date)
-    if end_date:
-        conditions.append("event_date <= %s")
-        params.append(end_date)
+    """Return game-pair crossover counts (distinct players per pair)."""
+    rows = _fetch_insights_rows(_game_crossover_query(event_slugs, start_date, end_date, limit))
+    return _parse_game_crossover(rows)
 
-    where_sql = f"WHERE {' AND '.join(conditions)}" if conditions else ""
 
+def _acquisition_source_breakdown_query(event_slugs, start_date, end_date) -> tuple:
+    where_sql, params = _archive_scope_where(event_slugs, start_date, end_date)
     query = f"""
         SELECT
             CASE
@@ -1472,45 +3050,27 @@ def get_acquisition_source_breakdown(
         GROUP BY source
         ORDER BY cnt DESC, source ASC
     """
-
-    result: List[Dict[str, Any]] = []
-    with _get_pool().connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(query, params)
-            rows = cur.fetchall()
-
-    total = sum(int(r[1] or 0) for r in rows)
-    for source, cnt in rows:
-        count_i = int(cnt or 0)
-        share = (count_i / total * 100.0) if total > 0 else 0.0
-        result.append({"source": source, "count": count_i, "share": share})
-
-    return result
+    return query, params
 
 
-def get_player_churn_stats(
+def get_acquisition_source_breakdown(
     event_slugs: Optional[List[str]] = None,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
-    anchor_date: Optional[str] = None,
-    churn_months: int = 3,
-) -> Dict[str, float]:
-    """Return churn count/rate for players in selected scope."""
-
-    conditions: List[str] = ["ea.player_uuid IS NOT NULL"]
-    params: List[Any] = []
+) -> List[Dict[str, Any]]:
+    """Return acquisition_source distribution for archived rows in scope."""
+    rows = _fetch_insights_rows(
+        _acquisition_source_breakdown_query(event_slugs, start_date, end_date)
+    )
+    return _parse_source_breakdown(rows)
 
-    if event_slugs:
-        conditions.append("ea.event_slug = ANY(%s)")
-        params.append(event_slugs)
-    if start_date:
-        conditions.append("ea.event_date >= %s")
-        params.append(start_date)
-    if end_date:
-        conditions.append("ea.event_date <= %s")
-        params.append(end_date)
 
-    where_sql = f"WHERE {' AND '.join(conditions)}"
+def _player_churn_query(
+    event_slugs, start_date, end_date, anchor_date, churn_months: int = 3
+) -> tuple:
+    where_sql, params = _archive_scope_where(
+        event_slugs, start_date, end_date, base=["game_id IS NULL"]
+    )
     anchor = anchor_date or end_date
     months = max(int(churn_months), 1)
 
@@ -1523,8 +3083,8 @@ def get_player_churn_stats(
 
     query = f"""
         WITH scoped_players AS (
-            SELECT DISTINCT ea.player_uuid
-            FROM event_archive ea
+            SELECT DISTINCT player_uuid
+            FROM player_event_facts
             {where_sql}
         )
         SELECT
@@ -1533,17 +3093,15 @@ def get_player_churn_stats(
         FROM scoped_players sp
         JOIN players p ON p.uuid = sp.player_uuid
     """
+    return query, params + churn_params
 
-    with _get_pool().connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(query, params + churn_params)
-            row = cur.fetchone()
 
-    if not row:
+def _parse_player_churn(rows: List[tuple]) -> Dict[str, float]:
+    if not rows:
         return {"churn_count": 0, "scoped_players": 0, "churn_rate": 0.0}
 
-    churn_count = int(row[0] or 0)
-    scoped_players = int(row[1] or 0)
+    churn_count = int(rows[0][0] or 0)
+    scoped_players = int(rows[0][1] or 0)
     churn_rate = (churn_count / scoped_players * 100.0) if scoped_players > 0 else 0.0
 
     return {
@@ -1553,90 +3111,53 @@ def get_player_churn_stats(
     }
 
 
-def get_top_players_history(
+def get_player_churn_stats(
     event_slugs: Optional[List[str]] = None,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
-    limit: int = 15,
-    game_filter: Optional[str] = None,
-) -> List[Dict[str, Any]]:
-    """Return top participants by archived event attendance count."""
-    conditions: List[str] = []
-    params: List[Any] = []
-
-    if event_slugs:
-        conditions.append("event_slug = ANY(%s)")
-        params.append(event_slugs)
+    anchor_date: Optional[str] = None,
+    churn_months: int = 3,
+) -> Dict[str, float]:
+    """Return churn count/rate for players in selected scope."""
+    rows = _fetch_insights_rows(
+        _player_churn_query(event_slugs, start_date, end_date, anchor_date, churn_months)
+    )
+    return _parse_player_churn(rows)
 
-    if start_date:
-        conditions.append("event_date >= %s")
-        params.append(start_date)
 
-    if end_date:
-        conditions.append("event_date <= %s")
-        params.append(end_date)
+def _top_players_query(
+    event_slugs, start_date, end_date, limit: int = 15, game_filter=None
+) -> tuple:
+    # Attendance rows, or with a game filter the rows of that canonical game
+    selected_game = canonical_game_name(game_filter)
+    where_sql, params = _archive_scope_where(
+        event_slugs,
+        start_date,
+        end_date,
+        base=["game_id IS NOT NULL" if selected_game else "game_id IS NULL"],
+    )
 
-    selected_game = str(game_filter or "").strip()
     if selected_game:
-        game_sql = """
-            EXISTS (
-                SELECT 1
-                FROM unnest(COALESCE(tournament_games_registered, ARRAY[]::TEXT[])) AS g(game_name)
-                WHERE (
-                    (%s = 'SSBU Singles' AND (
-                        LOWER(g.game_name) LIKE '%%ssbu%%'
-                        OR LOWER(g.game_name) LIKE '%%super smash bros ultimate%%'
-                        OR LOWER(g.game_name) = 'smash singles'
-                        OR (LOWER(g.game_name) LIKE '%%smash%%' AND LOWER(g.game_name) LIKE '%%ultimate%%')
-                    ))
-                    OR (%s = 'STREET FIGHTER 6 TOURNAMENT' AND (
-                        LOWER(g.game_name) LIKE '%%street fighter 6%%'
-                        OR LOWER(g.game_name) LIKE '%%sf6%%'
-                        OR regexp_replace(LOWER(g.game_name), '[^a-z0-9]+', '', 'g') IN (
-                            'streetfighter6',
-                            'streetfighter6tournament',
-                            'sf6'
-                        )
-                    ))
-                    OR (%s = 'TEKKEN 8 TOURNAMENT' AND (
-                        LOWER(g.game_name) LIKE '%%tekken 8%%'
-                        OR LOWER(g.game_name) LIKE '%%t8%%'
-                        OR regexp_replace(LOWER(g.game_name), '[^a-z0-9]+', '', 'g') IN (
-                            'tekken8',
-                            'tekken8tournament',
-                            't8'
-                        )
-                    ))
-                    OR (%s NOT IN ('SSBU Singles', 'STREET FIGHTER 6 TOURNAMENT', 'TEKKEN 8 TOURNAMENT')
-                        AND LOWER(g.game_name) = LOWER(%s)
-                    )
-                )
-            )
-        """
-        conditions.append(game_sql)
-        params.extend([selected_game, selected_game, selected_game, selected_game, selected_game])
-
-    where_sql = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        where_sql = (
+            f"{where_sql} AND game_id = (SELECT id FROM games WHERE LOWER(name) = LOWER(%s))"
+        )
+        params.append(selected_game)
 
     query = f"""
         SELECT
-            MAX(COALESCE(NULLIF(tag, ''), NULLIF(name, ''), 'Unknown')) AS display_tag,
-            MAX(COALESCE(NULLIF(name, ''), NULLIF(tag, ''), 'Unknown')) AS display_name,
-            COUNT(DISTINCT event_slug) AS events_attended
-        FROM event_archive
+            MAX(f.display_tag) AS top_tag,
+            MAX(f.display_name) AS top_name,
+            COUNT(DISTINCT f.event_slug) AS events_attended
+        FROM player_event_facts f
         {where_sql}
-        GROUP BY player_uuid
-        HAVING player_uuid IS NOT NULL
-        ORDER BY events_attended DESC, display_name ASC
+        GROUP BY f.player_uuid
+        ORDER BY events_attended DESC, top_name ASC
         LIMIT %s
     """
-    params.append(limit)
+    return query, params + [limit]
 
-    with _get_pool().connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(query, params)
-            rows = cur.fetchall()
 
+def _parse_top_players(rows: List[tuple]) -> List[Dict[str, Any]]:
     result = []
     for idx, row in enumerate(rows, start=1):
         display_tag, display_name, events_attended = row
@@ -1648,39 +3169,302 @@ def get_top_players_history(
                 "events_attended": int(events_attended or 0),
             }
         )
-
     return result
 
 
+def get_top_players_history(
+    event_slugs: Optional[List[str]] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    limit: int = 15,
+    game_filter: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Return top participants by archived event attendance count."""
+    rows = _fetch_insights_rows(
+        _top_players_query(event_slugs, start_date, end_date, limit, game_filter)
+    )
+    return _parse_top_players(rows)
+
+
+def _unique_attendee_count_query(event_slugs, start_date, end_date) -> tuple:
+    where_sql, params = _archive_scope_where(
+        event_slugs, start_date, end_date, base=["game_id IS NULL"]
+    )
+    return f"SELECT COUNT(DISTINCT player_uuid) FROM player_event_facts {where_sql}", params
+
+
+def _parse_unique_attendee_count(rows: List[tuple]) -> int:
+    return int(rows[0][0]) if rows else 0
+
+
 def get_unique_attendee_count(
     event_slugs: Optional[List[str]] = None,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
 ) -> int:
     """Return the number of distinct players (by player_uuid) in the given scope."""
-    conditions: List[str] = ["player_uuid IS NOT NULL"]
-    params: List[Any] = []
+    rows = _fetch_insights_rows(_unique_attendee_count_query(event_slugs, start_date, end_date))
+    return _parse_unique_attendee_count(rows)
+
+
+def _insights_scope_queries(
+    scope: Dict[str, Any], full: bool, sections: Optional[List[str]] = None, **options
+) -> Dict[str, tuple]:
+    """{key: (query, parse)} for one insights period (see get_insights_bundle)."""
+    slugs = scope.get("event_slugs") or None
+    start = scope.get("start_date")
+    end = scope.get("end_date")
+    anchor = scope.get("anchor_date") or end
+
+    queries: Dict[str, tuple] = {
+        "manual_by_event": (_manual_add_stats_query(slugs, start, end), _parse_manual_add_stats),
+        "multi_game": (_multi_game_count_query(slugs, start, end), _parse_multi_game_count),
+        "core_players": (_core_players_query(slugs, end, anchor), None),
+        "player_lifetime": (_player_lifetime_query(slugs, start, end), None),
+        "unique_count": (
+            _unique_attendee_count_query(slugs, start, end),
+            _parse_unique_attendee_count,
+        ),
+        "churn": (_player_churn_query(slugs, start, end, anchor), _parse_player_churn),
+    }
+    if full:
+        queries.update(
+            {
+                "added_via": (
+                    _added_via_breakdown_query(slugs, start, end),
+                    _parse_source_breakdown,
+                ),
+                "acquisition_source": (
+                    _acquisition_source_breakdown_query(slugs, start, end),
+                    _parse_source_breakdown,
+                ),
+                "top_players": (
+                    _top_players_query(
+                        slugs,
+                        start,
+                        end,
+                        options.get("top_players_limit", 15),
+                        options.get("top_players_game"),
+                    ),
+                    _parse_top_players,
+                ),
+                "funnel": (_player_funnel_query(slugs, start, end, anchor), _parse_player_funnel),
+                "crossover": (
+                    _game_crossover_query(slugs, start, end, options.get("crossover_limit", 20)),
+                    _parse_game_crossover,
+                ),
+            }
+        )
+    if sections is not None:
+        # community_health is parsed from the core_players + player_lifetime rows
+        wanted = set(sections)
+        if "community_health" in wanted:
+            wanted.update({"core_players", "player_lifetime"})
+        queries = {key: query for key, query in queries.items() if key in wanted}
+    return queries
+
+
+# =============================================
+# Insights cache (archive generation)
+# =============================================
+# Insights only change when archived data does. Statement triggers on the
+# ARCHIVE_GENERATION_TABLES bump archive_generation inside the writer's
+# transaction when rows changed (archive/reopen/delete, stats recompute,
+# merge/undo, renamed or removed games and aliases).
+# Results are cached in insights_cache, shared by every dashboard worker and
+# keyed by (kind, scope, filters); an entry is only served while its generation
+# is current. The generation is read before computing, so a result computed
+# while a write commits is stored under the old generation and never served.
+INSIGHTS_CACHE_ENABLED = os.getenv("INSIGHTS_CACHE_ENABLED", "true").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+INSIGHTS_CACHE_MAX_ENTRIES = int(os.getenv("INSIGHTS_CACHE_MAX_ENTRIES", "256"))
+# hit_at (LRU eviction order) is rewritten at most this often per entry
+INSIGHTS_CACHE_HIT_INTERVAL_SECONDS = float(os.getenv("INSIGHTS_CACHE_HIT_INTERVAL_SECONDS", "300"))
 
-    if event_slugs:
-        conditions.append("event_slug = ANY(%s)")
-        params.append(event_slugs)
-    if start_date:
-        conditions.append("event_date >= %s")
-        params.append(start_date)
-    if end_date:
-        conditions.append("event_date <= %s")
-        params.append(end_date)
 
-    where_sql = f"WHERE {' AND '.join(conditions)}"
+def _insights_cache_key(kind: str, params: Dict[str, Any]) -> str:
+    raw = json.dumps({"kind": kind, "params": params}, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
+
+def _insights_cache_lookup(cache_key: str) -> tuple:
+    """
+    Return (cached payload or None, current generation). A hit refreshes
+    hit_at once it is older than INSIGHTS_CACHE_HIT_INTERVAL_SECONDS, so
+    repeat reads do not write.
+    """
     with _get_pool().connection() as conn:
         with conn.cursor() as cur:
             cur.execute(
-                f"SELECT COUNT(DISTINCT player_uuid) FROM event_archive {where_sql}",
-                params,
+                """
+                WITH g AS (
+                    SELECT generation FROM archive_generation WHERE id = 1
+                ),
+                hit AS (
+                    SELECT c.payload FROM insights_cache c, g
+                    WHERE c.cache_key = %(key)s AND c.generation = g.generation
+                ),
+                touch AS (
+                    UPDATE insights_cache c
+                    SET hit_at = now()
+                    FROM g
+                    WHERE c.cache_key = %(key)s AND c.generation = g.generation
+                      AND c.hit_at < now() - make_interval(secs => %(interval)s)
+                )
+                SELECT (SELECT generation FROM g), (SELECT payload FROM hit)
+                """,
+                {"key": cache_key, "interval": INSIGHTS_CACHE_HIT_INTERVAL_SECONDS},
             )
             row = cur.fetchone()
-    return int(row[0]) if row else 0
+    if not row:
+        return None, None
+    return row[1], row[0]
+
+
+def _insights_cache_store(cache_key: str, generation: int, payload: Any) -> None:
+    """Store a result and evict stale generations + least recently hit entries."""
+    from psycopg.types.json import Json  # type: ignore
+
+    with _get_pool().connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO insights_cache (cache_key, generation, payload)
+                VALUES (%s, %s, %s)
+                ON CONFLICT (cache_key) DO UPDATE
+                SET generation = EXCLUDED.generation,
+                    payload = EXCLUDED.payload,
+                    created_at = now(),
+                    hit_at = now()
+                WHERE insights_cache.generation <= EXCLUDED.generation
+                """,
+                (cache_key, generation, Json(payload)),
+            )
+            cur.execute(
+                """
+                DELETE FROM insights_cache
+                WHERE generation < %s
+                   OR cache_key IN (
+                        SELECT cache_key FROM insights_cache
+                        ORDER BY hit_at DESC
+                        OFFSET %s
+                   )
+                """,
+                (generation, max(INSIGHTS_CACHE_MAX_ENTRIES, 1)),
+            )
+
+
+def _cached_insights(kind: str, params: Dict[str, Any], compute) -> Any:
+    """Serve compute() from the shared insights cache; cache errors fall back to computing."""
+    if not INSIGHTS_CACHE_ENABLED:
+        return compute()
+
+    cache_key = _insights_cache_key(kind, params)
+    generation = None
+    try:
+        cached, generation = _insights_cache_lookup(cache_key)
+        if cached is not None:
+            return cached
+    except Exception as e:
+        logger.warning(f"⚠️ Insights cache lookup failed: {e}")
+
+    result = compute()
+    if generation is not None:
+        try:
+            _insights_cache_store(cache_key, generation, result)
+        except Exception as e:
+            logger.warning(f"⚠️ Insights cache store failed: {e}")
+    return result
+
+
+def get_insights_bundle(
+    scope: Dict[str, Any],
+    compare_scope: Optional[Dict[str, Any]] = None,
+    *,
+    sections: Optional[Iterable[str]] = None,
+    top_players_limit: int = 15,
+    top_players_game: Optional[str] = None,
+    crossover_limit: int = 20,
+) -> Dict[str, Any]:
+    """
+    Every scoped insights KPI for one dashboard view in a single round-trip.
+
+    scope / compare_scope: {"event_slugs", "start_date", "end_date", "anchor_date"}
+    (anchor defaults to end_date), same meaning as the get_* functions above.
+    All queries are sent in one pipeline on one pooled connection; repeat
+    views are answered from the insights cache until archived data changes.
+
+    Returns {"current": {...}, "previous": {...} or None}. Both periods hold
+    manual_by_event, multi_game, community_health, unique_count and churn;
+    "current" also holds added_via, acquisition_source, top_players, funnel and
+    crossover. Values have the shapes of the matching get_* functions.
+
+    sections limits "current" to those keys (default: all of them), so each
+    dashboard section only runs - and caches - its own queries.
+    """
+    options = {
+        "sections": sorted(set(sections)) if sections is not None else None,
+        "top_players_limit": top_players_limit,
+        "top_players_game": top_players_game,
+        "crossover_limit": crossover_limit,
+    }
+    return _cached_insights(
+        "insights_bundle",
+        {"scope": scope, "compare_scope": compare_scope, **options},
+        lambda: _compute_insights_bundle(scope, compare_scope, **options),
+    )
+
+
+def _compute_insights_bundle(
+    scope: Dict[str, Any],
+    compare_scope: Optional[Dict[str, Any]],
+    sections: Optional[List[str]],
+    top_players_limit: int,
+    top_players_game: Optional[str],
+    crossover_limit: int,
+) -> Dict[str, Any]:
+    periods = {
+        "current": _insights_scope_queries(
+            scope,
+            True,
+            sections,
+            top_players_limit=top_players_limit,
+            top_players_game=top_players_game,
+            crossover_limit=crossover_limit,
+        )
+    }
+    if compare_scope is not None:
+        periods["previous"] = _insights_scope_queries(compare_scope, False)
+
+    cursors: Dict[tuple, Any] = {}
+    raw: Dict[tuple, List[tuple]] = {}
+    with _get_pool().connection() as conn:
+        with conn.pipeline():
+            for period, queries in periods.items():
+                for key, ((sql, params), _) in queries.items():
+                    cur = conn.cursor()
+                    cur.execute(sql, params)
+                    cursors[(period, key)] = cur
+        for key, cur in cursors.items():
+            raw[key] = cur.fetchall()
+            cur.close()
+
+    result: Dict[str, Any] = {"current": None, "previous": None}
+    for period, queries in periods.items():
+        values = {
+            key: parse(raw[(period, key)])
+            for key, (_, parse) in queries.items()
+            if parse is not None
+        }
+        if "core_players" in queries:
+            values["community_health"] = _parse_community_health(
+                raw[(period, "core_players")], raw[(period, "player_lifetime")]
+            )
+        result[period] = values
+    return result
 
 
 # =============================================
@@ -1798,11 +3582,74 @@ def _build_event_stats_integrity_warnings(
     return warnings
 
 
-def recompute_event_stats(event_slug: str, *, user: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    """Recompute event_stats for one archived event_slug from event_archive rows."""
-    if not event_slug:
-        raise ValueError("event_slug is required")
+def _event_funnel_counts(cur, event_dates: Dict[str, Any]) -> Dict[str, tuple]:
+    """
+    New vs returning players for each event_slug in event_dates ({slug: date}).
+
+    A check-in is returning when the same player_uuid has an archive row for
+    another event dated before the event; check-ins without player_uuid count
+    as neither. One windowed pass over event_archive per call: per player, the
+    two earliest (date, slug) entries give the earliest *other* event for any
+    slug (the first one, unless the slug is the first itself).
+
+    Returns:
+        {event_slug: (new_players, returning_players)}
+    """
+    if not event_dates:
+        return {}
+
+    slugs = list(event_dates.keys())
+    cur.execute(
+        """
+        WITH targets AS (
+            SELECT * FROM unnest(%s::text[], %s::date[]) AS t(event_slug, event_date)
+        ),
+        per_slug AS (
+            SELECT player_uuid, event_slug, MIN(event_date) AS slug_date
+            FROM event_archive
+            WHERE player_uuid IN (
+                SELECT a.player_uuid FROM event_archive a JOIN targets t USING (event_slug)
+            )
+            GROUP BY player_uuid, event_slug
+        ),
+        ranked AS (
+            SELECT player_uuid, event_slug,
+                   ROW_NUMBER() OVER w AS rn,
+                   FIRST_VALUE(slug_date) OVER w AS first_date,
+                   NTH_VALUE(slug_date, 2) OVER w AS second_date
+            FROM per_slug
+            WINDOW w AS (
+                PARTITION BY player_uuid ORDER BY slug_date, event_slug
+                ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+            )
+        )
+        SELECT a.event_slug,
+               COUNT(*) FILTER (
+                   WHERE CASE WHEN r.rn = 1 THEN r.second_date ELSE r.first_date END < t.event_date
+               ) AS returning_players,
+               COUNT(*) AS matched
+        FROM event_archive a
+        JOIN targets t ON t.event_slug = a.event_slug
+        JOIN ranked r ON r.player_uuid = a.player_uuid AND r.event_slug = a.event_slug
+        WHERE a.player_uuid <> ''
+        GROUP BY a.event_slug
+        """,
+        (slugs, [event_dates[slug] for slug in slugs]),
+    )
+    counts = {slug: (0, 0) for slug in slugs}
+    for slug, returning, matched in cur.fetchall():
+        counts[slug] = (matched - returning, returning)
+    return counts
 
+
+def _recompute_event_stats(cur, event_slugs: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Rebuild event_stats rows from event_archive (all events when event_slugs is None).
+
+    One read of event_stats, one ordered pass over event_archive and one funnel
+    query for the whole batch. Events without archive rows are returned with
+    skipped=True and left untouched.
+    """
     from psycopg.types.json import Json as _Json  # type: ignore
 
     def _to_iso_date(value: Any) -> Optional[str]:
@@ -1824,181 +3671,206 @@ def recompute_event_stats(event_slug: str, *, user: Optional[Dict[str, Any]] = N
         except Exception:
             if len(text) >= 10:
                 return text[:10]
-            return None
-
-    with _get_pool().connection() as conn:
-        with conn.transaction():
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    SELECT id, event_date, event_display_name, archived_at, startgg_snapshot
-                    FROM event_stats
-                    WHERE event_slug = %s
-                    LIMIT 1
-                    """,
-                    (event_slug,),
-                )
-                stats_row = cur.fetchone()
-                if not stats_row:
-                    raise ValueError(f"No event_stats row found for '{event_slug}'")
-
-                _, stats_event_date, stats_display_name, stats_archived_at, startgg_snapshot = stats_row
-
-                cur.execute(
-                    """
-                    SELECT name, tag, email, telephone, status,
-                           member, startgg, payment_valid,
-                           payment_amount, payment_expected,
-                           tournament_games_registered, checkin_uuid,
-                           external_id, startgg_event_id, is_guest,
-                           player_uuid, event_date, event_display_name
-                    FROM event_archive
-                    WHERE event_slug = %s
-                    ORDER BY id ASC
-                    """,
-                    (event_slug,),
-                )
-                cols = [d[0] for d in cur.description]
-                rows = cur.fetchall()
+            return None
 
-                if not rows:
-                    raise ValueError(f"No event_archive rows found for '{event_slug}'")
+    where_sql = ""
+    params: List[Any] = []
+    if event_slugs is not None:
+        where_sql = "WHERE event_slug = ANY(%s)"
+        params.append(list(event_slugs))
+
+    cur.execute(
+        f"""
+        SELECT event_slug, event_date, event_display_name, archived_at, startgg_snapshot
+        FROM event_stats
+        {where_sql}
+        ORDER BY event_slug
+        """,
+        params,
+    )
+    stats_rows = {row[0]: row[1:] for row in cur.fetchall()}
+
+    cur.execute(
+        f"""
+        SELECT event_slug, name, tag, email, telephone, status,
+               member, startgg, payment_valid,
+               payment_amount, payment_expected,
+               tournament_games_registered, checkin_uuid,
+               external_id, startgg_event_id, is_guest,
+               player_uuid, event_date, event_display_name
+        FROM event_archive
+        {where_sql}
+        ORDER BY event_slug, id ASC
+        """,
+        params,
+    )
+    cols = [d[0] for d in cur.description]
+    archive: Dict[str, List[Dict[str, Any]]] = {}
+    for r in cur.fetchall():
+        row = _row_to_dict(cols, r)
+        archive.setdefault(row["event_slug"], []).append(row)
+
+    event_dates: Dict[str, Any] = {}
+    for slug in stats_rows:
+        checkins = archive.get(slug)
+        if not checkins:
+            continue
+        event_date_val = _to_iso_date(stats_rows[slug][0])
+        if not event_date_val:
+            event_date_val = (
+                _to_iso_date(checkins[0].get("event_date"))
+                or datetime.now(timezone.utc).date().isoformat()
+            )
+        event_dates[slug] = datetime.fromisoformat(event_date_val).date()
+
+    funnel = _event_funnel_counts(cur, event_dates)
+
+    results: List[Dict[str, Any]] = []
+    updates: List[tuple] = []
+    for slug, (_, stats_display_name, stats_archived_at, startgg_snapshot) in stats_rows.items():
+        if slug not in event_dates:
+            results.append({"event_slug": slug, "skipped": True})
+            continue
+
+        checkins = archive[slug]
+        stats = compute_event_stats(checkins)
+        new_players, returning_players = funnel[slug]
+
+        total = int(stats.get("total_participants") or 0)
+        retention_rate = (
+            (Decimal(returning_players) / Decimal(total) * 100).quantize(Decimal("0.01"))
+            if total > 0
+            else Decimal("0")
+        )
 
-                checkins = [_row_to_dict(cols, r) for r in rows]
-                stats = compute_event_stats(checkins)
+        # No-show recompute from snapshot
+        startgg_registered_count = 0
+        startgg_registered_players = 0
+        if isinstance(startgg_snapshot, dict):
+            startgg_registered_count = int(startgg_snapshot.get("tournament_entrants") or 0)
+            startgg_registered_players = int(
+                startgg_snapshot.get("tournament_entrants_players") or 0
+            )
+        elif isinstance(startgg_snapshot, list):
+            startgg_registered_count = sum(
+                int(e.get("numEntrants") or 0) for e in startgg_snapshot if isinstance(e, dict)
+            )
 
-                event_date_val = _to_iso_date(stats_event_date)
-                if not event_date_val:
-                    sample_date = checkins[0].get("event_date")
-                    event_date_val = _to_iso_date(sample_date) or datetime.now(timezone.utc).date().isoformat()
+        checked_in_count = total
+        no_show_base = startgg_registered_players or startgg_registered_count
+        no_show_count = max(no_show_base - checked_in_count, 0)
+        no_show_rate = (
+            (Decimal(no_show_count) / Decimal(no_show_base) * 100).quantize(Decimal("0.01"))
+            if no_show_base > 0
+            else Decimal("0")
+        )
 
-                parsed_event_date = datetime.fromisoformat(event_date_val).date()
+        payment_valid_count = sum(1 for c in checkins if bool(c.get("payment_valid")))
+        paid_amount_count = sum(
+            1 for c in checkins if Decimal(str(c.get("payment_amount") or 0)) > 0
+        )
+        integrity_warnings = _build_event_stats_integrity_warnings(
+            total_participants=total,
+            new_players=new_players,
+            returning_players=returning_players,
+            checked_in_count=checked_in_count,
+            no_show_base=no_show_base,
+            no_show_count=no_show_count,
+            no_show_rate=no_show_rate,
+            games_breakdown=stats.get("games_breakdown") or {},
+            payment_valid_count=payment_valid_count,
+            paid_amount_count=paid_amount_count,
+        )
 
-                # Funnel recompute from archive history (per player_uuid)
-                new_players = 0
-                returning_players = 0
-                for c in checkins:
-                    p_uuid = c.get("player_uuid")
-                    if not p_uuid:
-                        continue
-                    cur.execute(
-                        """
-                        SELECT EXISTS(
-                            SELECT 1
-                            FROM event_archive prev
-                            WHERE prev.player_uuid = %s
-                              AND prev.event_slug <> %s
-                              AND prev.event_date < %s
-                        )
-                        """,
-                        (p_uuid, event_slug, parsed_event_date),
-                    )
-                    had_prev = bool(cur.fetchone()[0])
-                    if had_prev:
-                        returning_players += 1
-                    else:
-                        new_players += 1
+        updates.append(
+            (
+                event_dates[slug].isoformat(),
+                stats_display_name or (checkins[0].get("event_display_name") or slug),
+                stats_archived_at,
+                total,
+                stats["total_revenue"],
+                stats["avg_payment"],
+                stats["member_count"],
+                stats["member_percentage"],
+                stats["guest_count"],
+                stats["startgg_count"],
+                new_players,
+                returning_players,
+                retention_rate,
+                _Json(stats["games_breakdown"]),
+                stats["most_popular_game"],
+                _Json(stats["status_breakdown"]),
+                startgg_registered_count,
+                startgg_registered_players,
+                checked_in_count,
+                no_show_count,
+                no_show_rate,
+                slug,
+            )
+        )
+        results.append(
+            {
+                "event_slug": slug,
+                "participants": total,
+                "new_players": new_players,
+                "returning_players": returning_players,
+                "total_revenue": float(stats["total_revenue"]),
+                "integrity_warnings": integrity_warnings,
+            }
+        )
 
-                total = int(stats.get("total_participants") or 0)
-                retention_rate = (
-                    (Decimal(returning_players) / Decimal(total) * 100).quantize(Decimal("0.01"))
-                    if total > 0
-                    else Decimal("0")
-                )
+    if updates:
+        cur.executemany(
+            """
+            UPDATE event_stats
+            SET event_date = %s,
+                event_display_name = %s,
+                archived_at = %s,
+                total_participants = %s,
+                total_revenue = %s,
+                avg_payment = %s,
+                member_count = %s,
+                member_percentage = %s,
+                guest_count = %s,
+                startgg_count = %s,
+                new_players = %s,
+                returning_players = %s,
+                retention_rate = %s,
+                games_breakdown = %s,
+                most_popular_game = %s,
+                status_breakdown = %s,
+                startgg_registered_count = %s,
+                startgg_registered_players = %s,
+                checked_in_count = %s,
+                no_show_count = %s,
+                no_show_rate = %s
+            WHERE event_slug = %s
+            """,
+            updates,
+        )
 
-                # No-show recompute from snapshot
-                startgg_registered_count = 0
-                startgg_registered_players = 0
-                if isinstance(startgg_snapshot, dict):
-                    startgg_registered_count = int(startgg_snapshot.get("tournament_entrants") or 0)
-                    startgg_registered_players = int(
-                        startgg_snapshot.get("tournament_entrants_players") or 0
-                    )
-                elif isinstance(startgg_snapshot, list):
-                    startgg_registered_count = sum(
-                        int(e.get("numEntrants") or 0)
-                        for e in startgg_snapshot
-                        if isinstance(e, dict)
-                    )
+    return results
 
-                checked_in_count = total
-                no_show_base = startgg_registered_players or startgg_registered_count
-                no_show_count = max(no_show_base - checked_in_count, 0)
-                no_show_rate = (
-                    (Decimal(no_show_count) / Decimal(no_show_base) * 100).quantize(Decimal("0.01"))
-                    if no_show_base > 0
-                    else Decimal("0")
-                )
 
-                payment_valid_count = sum(1 for c in checkins if bool(c.get("payment_valid")))
-                paid_amount_count = sum(
-                    1 for c in checkins if Decimal(str(c.get("payment_amount") or 0)) > 0
-                )
-                integrity_warnings = _build_event_stats_integrity_warnings(
-                    total_participants=total,
-                    new_players=new_players,
-                    returning_players=returning_players,
-                    checked_in_count=checked_in_count,
-                    no_show_base=no_show_base,
-                    no_show_count=no_show_count,
-                    no_show_rate=no_show_rate,
-                    games_breakdown=stats.get("games_breakdown") or {},
-                    payment_valid_count=payment_valid_count,
-                    paid_amount_count=paid_amount_count,
-                )
+def recompute_event_stats(
+    event_slug: str, *, user: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Recompute event_stats for one archived event_slug from event_archive rows."""
+    if not event_slug:
+        raise ValueError("event_slug is required")
 
-                cur.execute(
-                    """
-                    UPDATE event_stats
-                    SET event_date = %s,
-                        event_display_name = %s,
-                        archived_at = %s,
-                        total_participants = %s,
-                        total_revenue = %s,
-                        avg_payment = %s,
-                        member_count = %s,
-                        member_percentage = %s,
-                        guest_count = %s,
-                        startgg_count = %s,
-                        new_players = %s,
-                        returning_players = %s,
-                        retention_rate = %s,
-                        games_breakdown = %s,
-                        most_popular_game = %s,
-                        status_breakdown = %s,
-                        startgg_registered_count = %s,
-                        startgg_registered_players = %s,
-                        checked_in_count = %s,
-                        no_show_count = %s,
-                        no_show_rate = %s
-                    WHERE event_slug = %s
-                    """,
-                    (
-                        event_date_val,
-                        stats_display_name or (checkins[0].get("event_display_name") or event_slug),
-                        stats_archived_at,
-                        total,
-                        stats["total_revenue"],
-                        stats["avg_payment"],
-                        stats["member_count"],
-                        stats["member_percentage"],
-                        stats["guest_count"],
-                        stats["startgg_count"],
-                        new_players,
-                        returning_players,
-                        retention_rate,
-                        _Json(stats["games_breakdown"]),
-                        stats["most_popular_game"],
-                        _Json(stats["status_breakdown"]),
-                        startgg_registered_count,
-                        startgg_registered_players,
-                        checked_in_count,
-                        no_show_count,
-                        no_show_rate,
-                        event_slug,
-                    ),
-                )
+    with _get_pool().connection() as conn:
+        with conn.transaction():
+            with conn.cursor() as cur:
+                results = _recompute_event_stats(cur, [event_slug])
+
+    if not results:
+        raise ValueError(f"No event_stats row found for '{event_slug}'")
+    result = results[0]
+    if result.get("skipped"):
+        raise ValueError(f"No event_archive rows found for '{event_slug}'")
 
+    integrity_warnings = result["integrity_warnings"]
     if integrity_warnings:
         logger.warning(
             "event_stats integrity warnings for '%s': %s",
@@ -2015,9 +3887,9 @@ def recompute_event_stats(event_slug: str, *, user: Optional[Dict[str, Any]] = N
             target_event=event_slug,
             details=json.dumps(
                 {
-                    "participants": total,
-                    "new_players": new_players,
-                    "returning_players": returning_players,
+                    "participants": result["participants"],
+                    "new_players": result["new_players"],
+                    "returning_players": result["returning_players"],
                     "integrity_warnings": integrity_warnings,
                 }
             ),
@@ -2025,13 +3897,53 @@ def recompute_event_stats(event_slug: str, *, user: Optional[Dict[str, Any]] = N
     except Exception:
         pass
 
+    return result
+
+
+def recompute_all_event_stats(*, user: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Recompute every event_stats row from event_archive in one transaction.
+
+    Used after player merges/backfills, where per-event recomputes would scale
+    with events x players. Events without archive rows are skipped.
+    """
+    with _get_pool().connection() as conn:
+        with conn.transaction():
+            with conn.cursor() as cur:
+                results = _recompute_event_stats(cur)
+
+    recomputed = [r for r in results if not r.get("skipped")]
+    skipped = [r["event_slug"] for r in results if r.get("skipped")]
+    warned = {
+        r["event_slug"]: r["integrity_warnings"] for r in recomputed if r["integrity_warnings"]
+    }
+    for slug, warnings in warned.items():
+        logger.warning("event_stats integrity warnings for '%s': %s", slug, "; ".join(warnings))
+
+    recompute_user = user or {"user_id": "", "user_name": "system", "user_email": ""}
+    try:
+        log_action(
+            recompute_user,
+            "event_stats_recomputed_all",
+            "event_stats",
+            details=json.dumps(
+                {
+                    "events": len(recomputed),
+                    "skipped": skipped,
+                    "events_with_warnings": sorted(warned),
+                }
+            ),
+        )
+    except Exception:
+        pass
+
+    logger.info(f"♻️ Recomputed event_stats for {len(recomputed)} events ({len(skipped)} skipped)")
     return {
-        "event_slug": event_slug,
-        "participants": total,
-        "new_players": new_players,
-        "returning_players": returning_players,
-        "total_revenue": float(stats["total_revenue"]),
-        "integrity_warnings": integrity_warnings,
+        "events": len(recomputed),
+        "skipped": skipped,
+        "participants": sum(r["participants"] for r in recomputed),
+        "events_with_warnings": sorted(warned),
+        "results": recomputed,
     }
 
 
@@ -2368,6 +4280,243 @@ def _match_or_create_player(
         return (new_uuid, True)
 
 
+def _match_or_create_players_bulk(
+    cur,
+    event_slug: str,
+    event_date: str,
+    now: datetime,
+) -> Optional[List[tuple]]:
+    """
+    Set-based _match_or_create_player for every row staged in _archive_checkins.
+
+    Matches (tag > email, lowest players.id on ties), creates missing players and
+    merges games/game_counts/events/timeline in SQL. The results are the same as
+    running _match_or_create_player row by row in `ord` order, as long as no two
+    check-ins share a lookup key or a matched player (otherwise an earlier row
+    could re-key a player a later row looks up). In that case nothing is
+    written and None is returned so the caller can fall back to the row loop.
+
+    Returns:
+        [(player_uuid, is_new), ...] in ord order, or None.
+    """
+    cur.execute(
+        """
+        UPDATE _archive_checkins c SET player_uuid = COALESCE(
+            CASE WHEN c.tag <> '' THEN (
+                SELECT p.uuid FROM players p
+                WHERE LOWER(p.tag) = LOWER(c.tag) ORDER BY p.id LIMIT 1
+            ) END,
+            CASE WHEN c.email <> '' THEN (
+                SELECT p.uuid FROM players p
+                WHERE LOWER(p.email) = LOWER(c.email) ORDER BY p.id LIMIT 1
+            ) END
+        )
+        """
+    )
+
+    # Keys each row looks up or may overwrite on its matched player
+    cur.execute(
+        """
+        WITH keys AS (
+            SELECT ord, 't:' || LOWER(tag) AS k FROM _archive_checkins WHERE tag <> ''
+            UNION SELECT ord, 'e:' || LOWER(email) FROM _archive_checkins WHERE email <> ''
+            UNION SELECT ord, 'p:' || player_uuid FROM _archive_checkins WHERE player_uuid IS NOT NULL
+            UNION SELECT c.ord, 't:' || LOWER(p.tag)
+                  FROM _archive_checkins c JOIN players p ON p.uuid = c.player_uuid
+                  WHERE p.tag <> ''
+            UNION SELECT c.ord, 'e:' || LOWER(p.email)
+                  FROM _archive_checkins c JOIN players p ON p.uuid = c.player_uuid
+                  WHERE p.email <> ''
+        )
+        SELECT EXISTS (SELECT 1 FROM keys GROUP BY k HAVING COUNT(*) > 1)
+        """
+    )
+    if cur.fetchone()[0]:
+        cur.execute("UPDATE _archive_checkins SET player_uuid = NULL")
+        return None
+
+    cur.execute(
+        """
+        UPDATE _archive_checkins c
+        SET is_new_event = NOT COALESCE(
+            jsonb_typeof(p.events_list) = 'array' AND p.events_list @> to_jsonb(%s::text),
+            false
+        )
+        FROM players p
+        WHERE p.uuid = c.player_uuid
+        """,
+        (event_slug,),
+    )
+    cur.execute(
+        """
+        UPDATE _archive_checkins
+        SET player_uuid = gen_random_uuid()::text, is_new_player = true
+        WHERE player_uuid IS NULL
+        """
+    )
+
+    # Merged game_counts + favorite per row. Key order follows the Python merge:
+    # existing keys in stored order, then new games by first occurrence
+    # (favorite = first key with the highest count).
+    cur.execute(
+        """
+        CREATE TEMP TABLE _archive_game_counts ON COMMIT DROP AS
+        WITH new_games AS (
+            SELECT c.ord, COALESCE(g.game, 'null') AS game, COUNT(*) AS n, MIN(g.pos) AS pos
+            FROM _archive_checkins c
+            CROSS JOIN LATERAL unnest(c.tournament_games_registered) WITH ORDINALITY AS g(game, pos)
+            GROUP BY c.ord, COALESCE(g.game, 'null')
+        ),
+        old_counts AS (
+            SELECT c.ord, e.key AS game, e.value, e.pos
+            FROM _archive_checkins c
+            JOIN players p ON p.uuid = c.player_uuid AND NOT c.is_new_player
+            CROSS JOIN LATERAL jsonb_each(
+                CASE WHEN jsonb_typeof(p.game_counts) = 'object' THEN p.game_counts ELSE '{}'::jsonb END
+            ) WITH ORDINALITY AS e(key, value, pos)
+        ),
+        merged AS (
+            SELECT COALESCE(o.ord, n.ord) AS ord,
+                   COALESCE(o.game, n.game) AS game,
+                   CASE WHEN n.n IS NULL THEN o.value
+                        ELSE to_jsonb(COALESCE((o.value #>> '{}')::numeric, 0) + n.n)
+                   END AS value,
+                   o.ord IS NULL AS added,
+                   COALESCE(o.pos, n.pos) AS pos
+            FROM old_counts o
+            FULL JOIN new_games n ON n.ord = o.ord AND n.game = o.game
+        )
+        SELECT ord,
+               jsonb_object_agg(game, value) AS game_counts,
+               (array_agg(game ORDER BY (value #>> '{}')::numeric DESC NULLS LAST, added, pos))[1] AS favorite_game
+        FROM merged
+        GROUP BY ord
+        """
+    )
+
+    cur.execute(
+        """
+        UPDATE players p SET
+            tag = COALESCE(c.tag, p.tag),
+            email = COALESCE(c.email, p.email),
+            name = COALESCE(c.name, p.name),
+            telephone = COALESCE(c.telephone, p.telephone),
+            games_played = ARRAY(
+                SELECT DISTINCT unnest(
+                    COALESCE(p.games_played, '{}') || COALESCE(c.tournament_games_registered, '{}')
+                )
+            ),
+            game_counts = COALESCE(gc.game_counts, '{}'::jsonb),
+            favorite_game = gc.favorite_game,
+            total_events = COALESCE(p.total_events, 0) + CASE WHEN c.is_new_event THEN 1 ELSE 0 END,
+            total_paid = p.total_paid + CASE WHEN c.is_new_event THEN COALESCE(c.payment_amount, 0) ELSE 0 END,
+            last_seen = CASE
+                WHEN c.is_new_event AND (p.last_seen IS NULL OR %(event_date)s::date >= p.last_seen::date)
+                THEN %(event_date)s::date
+                ELSE p.last_seen::date
+            END,
+            last_event = CASE
+                WHEN c.is_new_event AND (p.last_seen IS NULL OR %(event_date)s::date >= p.last_seen::date)
+                THEN %(event_slug)s
+                ELSE p.last_event
+            END,
+            events_list = CASE
+                WHEN c.is_new_event THEN
+                    (CASE WHEN jsonb_typeof(p.events_list) = 'array' THEN p.events_list ELSE '[]'::jsonb END)
+                    || jsonb_build_array(%(event_slug)s::text)
+                ELSE p.events_list
+            END,
+            is_member = COALESCE(c.member, p.is_member),
+            updated_at = %(now)s
+        FROM _archive_checkins c
+        LEFT JOIN _archive_game_counts gc ON gc.ord = c.ord
+        WHERE p.uuid = c.player_uuid AND NOT c.is_new_player
+        """,
+        {"event_slug": event_slug, "event_date": event_date, "now": now},
+    )
+
+    cur.execute(
+        """
+        INSERT INTO players (
+            uuid, name, tag, email, telephone,
+            games_played, game_counts, favorite_game,
+            total_events, total_paid,
+            first_seen, last_seen, first_event, last_event,
+            events_list, is_member, created_at, updated_at
+        )
+        SELECT
+            c.player_uuid, c.name, c.tag, c.email, c.telephone,
+            COALESCE(c.tournament_games_registered, '{}'),
+            COALESCE(gc.game_counts, '{}'::jsonb),
+            gc.favorite_game,
+            1, COALESCE(c.payment_amount, 0),
+            %(event_date)s::date, %(event_date)s::date, %(event_slug)s, %(event_slug)s,
+            jsonb_build_array(%(event_slug)s::text), COALESCE(c.member, false), %(now)s, %(now)s
+        FROM _archive_checkins c
+        LEFT JOIN _archive_game_counts gc ON gc.ord = c.ord
+        WHERE c.is_new_player
+        ORDER BY c.ord
+        """,
+        {"event_slug": event_slug, "event_date": event_date, "now": now},
+    )
+
+    cur.execute("SELECT player_uuid, is_new_player FROM _archive_checkins ORDER BY ord")
+    return [(row[0], row[1]) for row in cur.fetchall()]
+
+
+def _refresh_player_event_facts(
+    cur,
+    event_slugs: Optional[List[str]] = None,
+    player_uuids: Optional[List[str]] = None,
+) -> int:
+    """
+    Rebuild player_event_facts from event_archive for the given events and/or
+    players (all rows when neither is given). Runs on the caller's cursor so it
+    commits with the archive write. Returns the number of fact rows written.
+
+    Per (player_uuid, event_slug, event_date): one attendance row with game_id
+    NULL and one row per distinct canonical game; display_tag/display_name are the
+    MAX over the archive rows behind each fact (what top players reports).
+    """
+    conditions: List[str] = []
+    params: List[Any] = []
+    if event_slugs is not None:
+        conditions.append("event_slug = ANY(%s)")
+        params.append(list(event_slugs))
+    if player_uuids is not None:
+        conditions.append("player_uuid = ANY(%s)")
+        params.append(list(player_uuids))
+
+    where_sql = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    cur.execute(f"DELETE FROM player_event_facts {where_sql}", params)
+
+    archive_where = " AND ".join(["ea.player_uuid IS NOT NULL"] + [f"ea.{c}" for c in conditions])
+    cur.execute(
+        f"""
+        INSERT INTO player_event_facts (
+            player_uuid, event_slug, event_date, game_id, display_tag, display_name
+        )
+        SELECT
+            ea.player_uuid,
+            ea.event_slug,
+            ea.event_date,
+            g.game_id,
+            MAX(COALESCE(NULLIF(ea.tag, ''), NULLIF(ea.name, ''), 'Unknown')),
+            MAX(COALESCE(NULLIF(ea.name, ''), NULLIF(ea.tag, ''), 'Unknown'))
+        FROM event_archive ea
+        CROSS JOIN LATERAL (
+            SELECT NULL::integer AS game_id
+            UNION
+            SELECT unnest(ea.tournament_game_ids)
+        ) g
+        WHERE {archive_where}
+        GROUP BY ea.player_uuid, ea.event_slug, ea.event_date, g.game_id
+        """,
+        params,
+    )
+    return cur.rowcount or 0
+
+
 def archive_event(
     event_slug: str,
     *,
@@ -2583,19 +4732,49 @@ def archive_event(
                     )
                     replaced_rows = cur.rowcount or 0
 
-                # 1. Read active checkins for this slug
+                # 1. Stage active checkins for this slug (ord = processing order)
                 cur.execute(
                     """
-                    SELECT name, tag, email, telephone, status,
+                    CREATE TEMP TABLE _archive_checkins ON COMMIT DROP AS
+                    SELECT 0::bigint AS ord,
+                           name, tag, email, telephone, status,
                            member, startgg, payment_valid,
                            payment_amount, payment_expected,
                            tournament_games_registered, checkin_uuid,
-                           external_id, startgg_event_id, is_guest, added_via, acquisition_source
+                           external_id, startgg_event_id, is_guest, added_via, acquisition_source,
+                           NULL::text AS player_uuid,
+                           false AS is_new_player,
+                           true AS is_new_event
+                    FROM active_event_data
+                    WITH NO DATA
+                    """
+                )
+                cur.execute(
+                    """
+                    INSERT INTO _archive_checkins
+                    SELECT row_number() OVER (ORDER BY id),
+                           name, tag, email, telephone, status,
+                           member, startgg, payment_valid,
+                           payment_amount, payment_expected,
+                           tournament_games_registered, checkin_uuid,
+                           external_id, startgg_event_id, is_guest, added_via, acquisition_source,
+                           NULL, false, true
                     FROM active_event_data
                     WHERE event_slug = %s
                     """,
                     (event_slug,),
                 )
+                cur.execute(
+                    """
+                    SELECT name, tag, email, telephone, status,
+                           member, startgg, payment_valid,
+                           payment_amount, payment_expected,
+                           tournament_games_registered, checkin_uuid,
+                           external_id, startgg_event_id, is_guest, added_via, acquisition_source
+                    FROM _archive_checkins
+                    ORDER BY ord
+                    """
+                )
                 columns = [desc[0] for desc in cur.description]
                 raw_rows = cur.fetchall()
 
@@ -2605,14 +4784,27 @@ def archive_event(
 
                 checkins = [_row_to_dict(columns, row) for row in raw_rows]
 
-                # 2. Match/create players (returns uuid + new/returning flag)
-                player_results = []
-                for c in checkins:
-                    p_uuid, is_new = _match_or_create_player(cur, c, event_slug, event_date, now)
-                    player_results.append((p_uuid, is_new))
+                # 2. Match/create players (returns uuid + new/returning flag).
+                # Set-based in one pass; row by row if check-ins share a lookup key.
+                player_results = _match_or_create_players_bulk(cur, event_slug, event_date, now)
+                if player_results is None:
+                    player_results = []
+                    for c in checkins:
+                        p_uuid, is_new = _match_or_create_player(
+                            cur, c, event_slug, event_date, now
+                        )
+                        player_results.append((p_uuid, is_new))
+                    cur.executemany(
+                        "UPDATE _archive_checkins SET player_uuid = %s WHERE ord = %s",
+                        [(p_uuid, i + 1) for i, (p_uuid, _) in enumerate(player_results)],
+                    )
 
-                # 3. Insert into event_archive (with player_uuid)
-                cur.executemany(
+                # 3. Copy into event_archive (with player_uuid); the trigger resolves
+                # tournament_game_ids, so every staged game name must be registered
+                _register_game_names(
+                    name for c in checkins for name in (c.get("tournament_games_registered") or [])
+                )
+                cur.execute(
                     """
                     INSERT INTO event_archive (
                         event_slug, event_date, event_display_name,
@@ -2623,46 +4815,22 @@ def archive_event(
                         tournament_games_registered, checkin_uuid,
                         external_id, startgg_event_id, is_guest, added_via, acquisition_source,
                         archived_at, player_uuid
-                    ) VALUES (
-                        %s, %s, %s,
-                        %s, %s, %s, %s, %s,
+                    )
+                    SELECT
                         %s, %s, %s,
-                        %s, %s,
+                        name, tag, email, telephone, status,
+                        member, startgg, payment_valid,
+                        payment_amount, payment_expected,
                         %s,
-                        %s, %s,
-                        %s, %s, %s, %s, %s,
-                        %s, %s
-                    )
+                        tournament_games_registered, checkin_uuid,
+                        external_id, startgg_event_id, is_guest, added_via, acquisition_source,
+                        %s, player_uuid
+                    FROM _archive_checkins
+                    ORDER BY ord
                     """,
-                    [
-                        (
-                            event_slug,
-                            event_date,
-                            event_display_name,
-                            c.get("name"),
-                            c.get("tag"),
-                            c.get("email"),
-                            c.get("telephone"),
-                            c.get("status"),
-                            c.get("member"),
-                            c.get("startgg"),
-                            c.get("payment_valid"),
-                            c.get("payment_amount"),
-                            c.get("payment_expected"),
-                            swish_expected_per_game,
-                            c.get("tournament_games_registered"),
-                            c.get("checkin_uuid"),
-                            c.get("external_id"),
-                            c.get("startgg_event_id"),
-                            c.get("is_guest"),
-                            c.get("added_via"),
-                            c.get("acquisition_source"),
-                            now,
-                            player_results[i][0],
-                        )
-                        for i, c in enumerate(checkins)
-                    ],
+                    (event_slug, event_date, event_display_name, swish_expected_per_game, now),
                 )
+                _refresh_player_event_facts(cur, event_slugs=[event_slug])
 
                 # 4. Compute stats + retention from player matching results
                 stats = compute_event_stats(checkins)
@@ -2829,6 +4997,9 @@ def archive_event(
                         (event_slug,),
                     )
 
+    if clear_active:
+        invalidate_settings_cache()
+
     # 7. Audit log (after commit, best-effort)
     archive_user = user or {"user_id": "", "user_name": "system", "user_email": ""}
     audit_action = "event_rearchived" if replaced_rows > 0 else "event_archived"
@@ -2848,6 +5019,7 @@ def archive_event(
                 "integrity_warnings": integrity_warnings,
             }
         ),
+        durable=True,
     )
 
     logger.info(
@@ -2976,8 +5148,16 @@ def reopen_event(
                     active_count = cur.fetchone()[0] or 0
 
                     if active_count == 0:
+                        # Skip archived duplicates of a tag (without the index they are
+                        # merged when it is created)
+                        on_conflict = (
+                            "ON CONFLICT (event_slug, LOWER(tag)) WHERE tag IS NOT NULL AND tag <> '' "
+                            "DO NOTHING"
+                            if _checkin_tag_index_ready
+                            else ""
+                        )
                         cur.execute(
-                            """
+                            f"""
                             INSERT INTO active_event_data (
                                 record_id, event_slug, external_id,
                                 name, tag, email, telephone,
@@ -3011,11 +5191,14 @@ def reopen_event(
                                 %s
                             FROM event_archive
                             WHERE event_slug = %s
+                            {on_conflict}
                             """,
                             (now, event_slug),
                         )
                         restored_rows = cur.rowcount or 0
 
+    invalidate_settings_cache()
+
     reopen_user = user or {"user_id": "", "user_name": "system", "user_email": ""}
     log_action(
         reopen_user,
@@ -3023,6 +5206,7 @@ def reopen_event(
         "settings",
         target_event=event_slug,
         details=json.dumps({"restore_active": restore_active, "restored_rows": restored_rows}),
+        durable=True,
     )
 
     logger.info(f"🔓 Reopened event '{event_slug}' (restored_rows={restored_rows})")
@@ -3067,6 +5251,7 @@ def delete_archived_event(
 
                 cur.execute("DELETE FROM event_archive WHERE event_slug = %s", (event_slug,))
                 deleted_archive_rows = cur.rowcount or 0
+                cur.execute("DELETE FROM player_event_facts WHERE event_slug = %s", (event_slug,))
 
                 cur.execute("DELETE FROM event_stats WHERE event_slug = %s", (event_slug,))
                 deleted_stats_rows = cur.rowcount or 0
@@ -3084,6 +5269,7 @@ def delete_archived_event(
                 "deleted_stats_rows": deleted_stats_rows,
             }
         ),
+        durable=True,
     )
 
     logger.info(
@@ -3140,27 +5326,86 @@ def create_session(user_info: dict, access_token: str) -> Optional[str]:
     return session_id
 
 
+# Session cache: the dashboard auth middleware reads the session on every
+# request, including each Dash callback. Session rows are cached per process
+# for SESSION_CACHE_TTL_SECONDS, only while the settings listener is connected;
+# a trigger on sessions NOTIFYs deletes (logout, expiry, cleanup) so every
+# worker drops the session at once. last_active is written at most once per
+# SESSION_ACTIVITY_WRITE_INTERVAL_SECONDS per session - far below the idle timeout.
+SESSION_CACHE_TTL_SECONDS = float(os.getenv("SESSION_CACHE_TTL_SECONDS", "30"))
+SESSION_ACTIVITY_WRITE_INTERVAL_SECONDS = float(
+    os.getenv("SESSION_ACTIVITY_WRITE_INTERVAL_SECONDS", "60")
+)
+
+_session_cache_lock = threading.Lock()
+_session_cache: Dict[str, tuple] = {}  # session_id -> (cached_at monotonic, row)
+_session_cache_generation = 0
+_session_activity_written: Dict[str, float] = {}  # session_id -> monotonic time of last write
+
+
+def invalidate_session_cache(session_id: Optional[str] = None) -> None:
+    """Drop one cached session (or all of them) in this process."""
+    global _session_cache_generation
+    with _session_cache_lock:
+        if session_id:
+            _session_cache.pop(session_id, None)
+            _session_activity_written.pop(session_id, None)
+        else:
+            _session_cache.clear()
+            _session_activity_written.clear()
+        _session_cache_generation += 1
+
+
+def _session_cache_lookup(session_id: str) -> tuple:
+    """Return (cached row or None, generation) - generation is None when caching is off."""
+    if SESSION_CACHE_TTL_SECONDS <= 0:
+        return None, None
+    _ensure_settings_listener()
+    if not _settings_listener_ready.is_set():
+        return None, None
+    with _session_cache_lock:
+        entry = _session_cache.get(session_id)
+        if entry is not None:
+            cached_at, row = entry
+            if time.monotonic() - cached_at < SESSION_CACHE_TTL_SECONDS:
+                return row, _session_cache_generation
+            del _session_cache[session_id]
+        return None, _session_cache_generation
+
+
+def _session_cache_store(session_id: str, row: tuple, generation: Optional[int]) -> None:
+    """Cache a freshly fetched row unless a session was revoked while the query ran."""
+    if generation is None or not _settings_listener_ready.is_set():
+        return
+    with _session_cache_lock:
+        if generation == _session_cache_generation:
+            _session_cache[session_id] = (time.monotonic(), row)
+
+
 def get_session(session_id: str) -> Optional[Dict[str, Any]]:
     """Retrieve and validate a session (checks absolute + idle timeout)."""
     if not session_id:
         return None
 
-    with _get_pool().connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT id, session_id, user_id, user_name, user_email, access_token,
-                       created_at, expires_at, last_active
-                FROM sessions
-                WHERE session_id = %s
-                LIMIT 1
-                """,
-                (session_id,),
-            )
-            row = cur.fetchone()
+    row, generation = _session_cache_lookup(session_id)
+    if row is None:
+        with _get_pool().connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT id, session_id, user_id, user_name, user_email, access_token,
+                           created_at, expires_at, last_active
+                    FROM sessions
+                    WHERE session_id = %s
+                    LIMIT 1
+                    """,
+                    (session_id,),
+                )
+                row = cur.fetchone()
 
-    if not row:
-        return None
+        if not row:
+            return None
+        _session_cache_store(session_id, row, generation)
 
     (
         record_id,
@@ -3200,10 +5445,11 @@ def get_session(session_id: str) -> Optional[Dict[str, Any]]:
 
 
 def delete_session(session_id: str) -> bool:
-    """Delete a session (logout)."""
+    """Delete a session (logout). Other workers drop it via the sessions trigger."""
     if not session_id:
         return False
 
+    invalidate_session_cache(session_id)
     with _get_pool().connection() as conn:
         with conn.cursor() as cur:
             cur.execute("DELETE FROM sessions WHERE session_id = %s", (session_id,))
@@ -3211,18 +5457,43 @@ def delete_session(session_id: str) -> bool:
 
 
 def update_session_activity(session_id: str) -> None:
-    """Touch the last_active timestamp on a session."""
+    """Touch the last_active timestamp on a session (at most once per write interval)."""
     if not session_id:
         return
 
+    now_mono = time.monotonic()
+    with _session_cache_lock:
+        last_write = _session_activity_written.get(session_id)
+        if (
+            last_write is not None
+            and now_mono - last_write < SESSION_ACTIVITY_WRITE_INTERVAL_SECONDS
+        ):
+            return
+        _session_activity_written[session_id] = now_mono
+        if len(_session_activity_written) > 1024:
+            for sid, written in list(_session_activity_written.items()):
+                if now_mono - written >= SESSION_ACTIVITY_WRITE_INTERVAL_SECONDS:
+                    del _session_activity_written[sid]
+
     now = datetime.now(timezone.utc)
     with _get_pool().connection() as conn:
         with conn.cursor() as cur:
+            # Other workers may have just written it
             cur.execute(
-                "UPDATE sessions SET last_active = %s WHERE session_id = %s",
-                (now, session_id),
+                """
+                UPDATE sessions SET last_active = %s
+                WHERE session_id = %s
+                  AND (last_active IS NULL OR last_active < %s)
+                """,
+                (now, session_id, now - timedelta(seconds=SESSION_ACTIVITY_WRITE_INTERVAL_SECONDS)),
             )
 
+    with _session_cache_lock:
+        entry = _session_cache.get(session_id)
+        if entry is not None:
+            cached_at, row = entry
+            _session_cache[session_id] = (cached_at, row[:8] + (now,))
+
 
 def cleanup_expired_sessions() -> int:
     """Delete all sessions past their absolute expiry. Returns count deleted."""
@@ -3239,7 +5510,59 @@ def cleanup_expired_sessions() -> int:
 # =============================================
 # Audit Log
 # =============================================
-def log_action(
+# Most audit entries (integration results, dashboard edits, logins) are written
+# behind: log_action queues them in memory and one writer thread per process
+# COPYs them into audit_log in batches, so a check-in or a bulk recheck does not
+# wait on an INSERT per entry. The queue is bounded; when it is full (database
+# down or slow) the entry is written inline as before. Pending entries are
+# flushed on shutdown (close_pool / atexit) and before get_audit_log reads.
+# Destructive admin actions (archive, reopen, delete, merge, undo) pass
+# durable=True and are written before returning.
+AUDIT_WRITE_BEHIND = os.getenv("AUDIT_WRITE_BEHIND", "true").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+AUDIT_QUEUE_MAX = int(os.getenv("AUDIT_QUEUE_MAX", "10000"))
+AUDIT_FLUSH_INTERVAL_SECONDS = float(os.getenv("AUDIT_FLUSH_INTERVAL_SECONDS", "0.5"))
+AUDIT_BATCH_SIZE = 500
+# A rejected entry (e.g. no partition for its timestamp) is retried this often,
+# then logged in full and dropped so it cannot hold up the queue
+AUDIT_MAX_ATTEMPTS = 5
+# Retention (maintain_audit_log): whole monthly partitions are dropped after
+# AUDIT_RETENTION_MONTHS (opt-in, the log is kept by default); integration_result
+# payloads are trimmed to source/ok after AUDIT_DETAILS_RETENTION_MONTHS.
+# 0 keeps everything.
+AUDIT_RETENTION_MONTHS = int(os.getenv("AUDIT_RETENTION_MONTHS", "0"))
+AUDIT_DETAILS_RETENTION_MONTHS = int(os.getenv("AUDIT_DETAILS_RETENTION_MONTHS", "3"))
+AUDIT_PARTITIONS_AHEAD = 2
+
+_AUDIT_COLUMNS = (
+    "timestamp",
+    "user_id",
+    "user_name",
+    "user_email",
+    "action",
+    "target_table",
+    "target_event",
+    "target_record",
+    "target_player",
+    "reason",
+    "details",
+    "before_state",
+    "after_state",
+)
+
+_audit_cond = threading.Condition()
+# (row, failed attempts) per queued entry, row in _AUDIT_COLUMNS order
+_audit_queue: "deque[tuple]" = deque()
+_audit_in_flight = 0
+_audit_flush_waiters = 0
+_audit_closed = False
+_audit_writer_thread: Optional[threading.Thread] = None
+
+
+def _audit_fields(
     user: Dict[str, Any],
     action: str,
     target_table: str,
@@ -3251,13 +5574,11 @@ def log_action(
     details: str = "",
     before_state: str = "",
     after_state: str = "",
-) -> Optional[str]:
-    """Write an entry to the audit log. Returns record ID or None."""
-    now = datetime.now(timezone.utc)
+) -> Dict[str, Any]:
+    """audit_log column values for one entry (None = NULL / column default)."""
     user = user or {}
-
-    fields = {
-        "timestamp": now,
+    return {
+        "timestamp": datetime.now(timezone.utc),
         "user_id": user.get("user_id", ""),
         "user_name": user.get("user_name", "system"),
         "user_email": user.get("user_email", ""),
@@ -3272,27 +5593,270 @@ def log_action(
         "after_state": _coerce_jsonb(after_state),
     }
 
-    columns = [k for k, v in fields.items() if v is not None]
-    values = [fields[k] for k in columns]
 
+def _audit_insert_sql(fields: Dict[str, Any]) -> tuple:
+    """(INSERT ... RETURNING id, params) for a single entry, skipping NULL columns."""
     from psycopg.types.json import Json  # type: ignore
 
-    values = [Json(v) if isinstance(v, (dict, list)) else v for v in values]
-
+    columns = [k for k, v in fields.items() if v is not None]
+    values = [
+        Json(fields[k]) if isinstance(fields[k], (dict, list)) else fields[k] for k in columns
+    ]
     placeholders = ", ".join(["%s"] * len(columns))
     col_sql = ", ".join(columns)
+    return f"INSERT INTO audit_log ({col_sql}) VALUES ({placeholders}) RETURNING id", values
+
+
+def _enqueue_audit_entry(fields: Dict[str, Any]) -> bool:
+    """Queue an entry for the writer thread. False if write-behind is off or the queue is full."""
+    global _audit_writer_thread
+    if not AUDIT_WRITE_BEHIND:
+        return False
+    from psycopg.types.json import Json  # type: ignore
+
+    row = tuple(
+        Json(fields[c]) if isinstance(fields[c], (dict, list)) else fields[c]
+        for c in _AUDIT_COLUMNS
+    )
+    with _audit_cond:
+        if _audit_closed or len(_audit_queue) >= AUDIT_QUEUE_MAX:
+            return False
+        _audit_queue.append((row, 0))
+        if _audit_writer_thread is None:
+            _audit_writer_thread = threading.Thread(
+                target=_audit_writer_loop, name="audit-writer", daemon=True
+            )
+            _audit_writer_thread.start()
+        if len(_audit_queue) >= AUDIT_BATCH_SIZE:
+            _audit_cond.notify_all()
+    return True
+
+
+def _write_audit_rows(conn, rows: List[tuple]) -> None:
+    """COPY a batch of queued entries into audit_log (one transaction)."""
+    col_sql = ", ".join(_AUDIT_COLUMNS)
+    with conn.transaction():
+        with conn.cursor() as cur:
+            with cur.copy(f"COPY audit_log ({col_sql}) FROM STDIN") as copy:
+                for row in rows:
+                    copy.write_row(row)
+
+
+def _write_audit_batch(conn, batch: List[tuple]) -> List[tuple]:
+    """
+    Write queued (row, attempts) items and return the items whose rows were rejected.
+
+    A rejected batch is bisected, so the other rows are still written.
+    Connection errors are raised (the whole batch is retried).
+    """
+    import psycopg  # type: ignore
+
+    try:
+        _write_audit_rows(conn, [row for row, _ in batch])
+        return []
+    except psycopg.OperationalError:
+        raise
+    except Exception as e:
+        if conn.closed or conn.broken:
+            raise
+        if len(batch) == 1:
+            action = batch[0][0][_AUDIT_COLUMNS.index("action")]
+            logger.warning(f"⚠️ Audit entry rejected ({action}): {e}")
+            return batch
+    middle = len(batch) // 2
+    return _write_audit_batch(conn, batch[:middle]) + _write_audit_batch(conn, batch[middle:])
+
+
+def _audit_writer_loop() -> None:
+    """
+    Drain the audit queue in batches on a dedicated connection. Failed batches
+    are retried with backoff; rejected entries are dropped after AUDIT_MAX_ATTEMPTS.
+    """
+    global _audit_in_flight
+    import psycopg  # type: ignore
+
+    conn = None
+    backoff = AUDIT_FLUSH_INTERVAL_SECONDS
+    while True:
+        with _audit_cond:
+            while not _audit_queue and not _audit_closed:
+                _audit_cond.wait()
+            if not _audit_queue:
+                break
+            # Give a burst a moment to fill the batch, unless someone is waiting
+            deadline = time.monotonic() + AUDIT_FLUSH_INTERVAL_SECONDS
+            while (
+                len(_audit_queue) < AUDIT_BATCH_SIZE
+                and not _audit_closed
+                and not _audit_flush_waiters
+            ):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                _audit_cond.wait(remaining)
+            batch = [
+                _audit_queue.popleft() for _ in range(min(AUDIT_BATCH_SIZE, len(_audit_queue)))
+            ]
+            _audit_in_flight = len(batch)
+
+        try:
+            if conn is None or conn.closed:
+                conn = psycopg.connect(DATABASE_URL, autocommit=True)
+            rejected = _write_audit_batch(conn, batch)
+            failed = False
+        except Exception as e:
+            logger.warning(f"⚠️ Audit writer failed ({len(batch)} entries, retrying): {e}")
+            failed = True
+            if conn is not None:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+                conn = None
+
+        retry = batch
+        if not failed:
+            retry = []
+            for row, attempts in rejected:
+                if attempts + 1 >= AUDIT_MAX_ATTEMPTS:
+                    entry = dict(zip(_AUDIT_COLUMNS, row))
+                    logger.error(f"❌ Dropping audit entry after {attempts + 1} attempts: {entry}")
+                else:
+                    retry.append((row, attempts + 1))
+
+        with _audit_cond:
+            _audit_in_flight = 0
+            if retry:
+                if _audit_closed:
+                    dropped = len(retry) + len(_audit_queue)
+                    logger.error(f"❌ Audit writer giving up on {dropped} entries at shutdown")
+                    _audit_queue.clear()
+                else:
+                    _audit_queue.extendleft(reversed(retry))
+            _audit_cond.notify_all()
+            if retry and not _audit_closed:
+                _audit_cond.wait(backoff)
+                backoff = min(backoff * 2, 30)
+            elif not retry:
+                backoff = AUDIT_FLUSH_INTERVAL_SECONDS
+
+    if conn is not None:
+        conn.close()
+
+
+def flush_audit_log(timeout: Optional[float] = 10.0) -> bool:
+    """Wait until queued audit entries are written. Returns False on timeout."""
+    global _audit_flush_waiters
+    with _audit_cond:
+        if not _audit_queue and not _audit_in_flight:
+            return True
+        _audit_flush_waiters += 1
+        _audit_cond.notify_all()
+        try:
+            return _audit_cond.wait_for(lambda: not _audit_queue and not _audit_in_flight, timeout)
+        finally:
+            _audit_flush_waiters -= 1
+
+
+def close_audit_writer(timeout: float = 10.0) -> None:
+    """Flush pending audit entries and stop the writer thread (process shutdown)."""
+    global _audit_closed
+    with _audit_cond:
+        _audit_closed = True
+        _audit_cond.notify_all()
+        thread = _audit_writer_thread
+    if thread is not None:
+        thread.join(timeout)
+
+
+atexit.register(close_audit_writer)
+
+
+# Pools inherited by forked children; kept referenced so they are never closed
+# or collected there (that would terminate the parent's connections).
+_inherited_pools: list = []
+
 
+def _reset_after_fork() -> None:
+    """
+    Forked child (e.g. a dashboard background job process): drop the parent's
+    pool, listener and audit writer state. Threads do not survive fork and the
+    pooled sockets belong to the parent, so the child opens its own on demand.
+    """
+    global _pool, _settings_cache_lock, _settings_cache_row, _settings_listener_thread
+    global _settings_listener_ready, _known_game_aliases_lock, _session_cache_lock
+    global _audit_cond, _audit_queue, _audit_in_flight, _audit_flush_waiters
+    global _audit_writer_thread
+
+    if _pool is not None:
+        _inherited_pools.append(_pool)
+        _pool = None
+    _settings_cache_lock = threading.Lock()
+    _settings_cache_row = None
+    _settings_listener_thread = None
+    _settings_listener_ready = threading.Event()
+    _known_game_aliases_lock = threading.Lock()
+    _session_cache_lock = threading.Lock()
+    _session_cache.clear()
+    # Entries queued by the parent are written by the parent's writer thread
+    _audit_cond = threading.Condition()
+    _audit_queue = deque()
+    _audit_in_flight = 0
+    _audit_flush_waiters = 0
+    _audit_writer_thread = None
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def log_action(
+    user: Dict[str, Any],
+    action: str,
+    target_table: str,
+    *,
+    target_event: str = "",
+    target_record: str = "",
+    target_player: str = "",
+    reason: str = "",
+    details: str = "",
+    before_state: str = "",
+    after_state: str = "",
+    durable: bool = False,
+) -> Optional[str]:
+    """
+    Write an entry to the audit log.
+
+    Queued for the background writer unless durable=True (or the queue is
+    full), in which case it is inserted before returning. Returns the record
+    ID for inline writes, None when queued or on failure.
+    """
+    fields = _audit_fields(
+        user,
+        action,
+        target_table,
+        target_event=target_event,
+        target_record=target_record,
+        target_player=target_player,
+        reason=reason,
+        details=details,
+        before_state=before_state,
+        after_state=after_state,
+    )
+    user_name = (user or {}).get("user_name", "?")
+
+    if not durable and _enqueue_audit_entry(fields):
+        logger.info(f"📋 Audit (queued): {user_name} -> {action} on {target_table}")
+        return None
+
+    sql, values = _audit_insert_sql(fields)
     with _get_pool().connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(
-                f"INSERT INTO audit_log ({col_sql}) VALUES ({placeholders}) RETURNING id",
-                values,
-            )
+            cur.execute(sql, values)
             row = cur.fetchone()
 
     if row:
         record_id = str(row[0])
-        logger.info(f"📋 Audit: {user.get('user_name', '?')} -> {action} on {target_table}")
+        logger.info(f"📋 Audit: {user_name} -> {action} on {target_table}")
         return record_id
 
     logger.error(f"❌ Failed to write audit log: {action}")
@@ -3305,11 +5869,24 @@ def get_audit_log(
     target_event: Optional[str] = None,
     user_id: Optional[str] = None,
     limit: int = 100,
+    before: Optional[List[Any]] = None,
 ) -> List[Dict[str, Any]]:
-    """Retrieve audit log entries with optional filters, newest first."""
+    """
+    Retrieve audit log entries with optional filters, newest first.
+
+    Keyset pagination: pass the "cursor" of the last entry of a page as
+    `before` to get the next (older) page.
+    """
+    flush_audit_log(timeout=2.0)
+
     conditions = []
     params: List[Any] = []
 
+    if before:
+        before_ts, before_id = before
+        conditions.append("(timestamp, id) < (%s::timestamptz, %s)")
+        params.extend([before_ts, int(before_id)])
+
     if action:
         conditions.append("action = %s")
         params.append(action)
@@ -3332,7 +5909,7 @@ def get_audit_log(
                reason, details, before_state, after_state
         FROM audit_log
         {where_sql}
-        ORDER BY timestamp DESC
+        ORDER BY timestamp DESC, id DESC
         LIMIT %s
     """
 
@@ -3376,6 +5953,7 @@ def get_audit_log(
                 "details": row_details,
                 "before_state": row_before_state,
                 "after_state": row_after_state,
+                "cursor": [timestamp.isoformat(), record_id],
             }
         )
 
@@ -3383,11 +5961,138 @@ def get_audit_log(
     return result
 
 
+def get_audit_log_filter_options() -> Dict[str, Any]:
+    """
+    Distinct actions and users in the whole audit log, for filter dropdowns.
+
+    Skip scans over the action / user_id indexes: one index probe per
+    distinct value instead of reading the log.
+
+    Returns {"actions": [action, ...], "users": [{"user_id", "user_name"}, ...]}.
+    """
+    with _get_pool().connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                WITH RECURSIVE actions AS (
+                    (SELECT action FROM audit_log ORDER BY action LIMIT 1)
+                    UNION ALL
+                    SELECT (
+                        SELECT a.action FROM audit_log a
+                        WHERE a.action > actions.action
+                        ORDER BY a.action LIMIT 1
+                    )
+                    FROM actions WHERE actions.action IS NOT NULL
+                )
+                SELECT action FROM actions WHERE action IS NOT NULL
+                """
+            )
+            actions = [row[0] for row in cur.fetchall()]
+            cur.execute(
+                """
+                WITH RECURSIVE users AS (
+                    (SELECT user_id FROM audit_log WHERE user_id > '' ORDER BY user_id LIMIT 1)
+                    UNION ALL
+                    SELECT (
+                        SELECT a.user_id FROM audit_log a
+                        WHERE a.user_id > users.user_id
+                        ORDER BY a.user_id LIMIT 1
+                    )
+                    FROM users WHERE users.user_id IS NOT NULL
+                )
+                SELECT u.user_id, latest.user_name
+                FROM users u
+                CROSS JOIN LATERAL (
+                    SELECT a.user_name FROM audit_log a
+                    WHERE a.user_id = u.user_id
+                    ORDER BY a.timestamp DESC, a.id DESC
+                    LIMIT 1
+                ) latest
+                WHERE u.user_id IS NOT NULL
+                """
+            )
+            users = [
+                {"user_id": user_id, "user_name": user_name}
+                for user_id, user_name in cur.fetchall()
+                if user_name
+            ]
+    return {"actions": actions, "users": users}
+
+
+def maintain_audit_log() -> Dict[str, Any]:
+    """
+    Audit log retention, safe to run from any number of workers.
+
+    - creates the coming months' partitions
+    - trims integration_result payloads older than AUDIT_DETAILS_RETENTION_MONTHS
+      to {"source", "ok"}
+    - drops partitions older than AUDIT_RETENTION_MONTHS (when set)
+
+    Returns {"skipped"} if another process is running it, else
+    {"created", "compacted_rows", "dropped"}.
+    """
+    from psycopg import sql  # type: ignore
+
+    flush_audit_log(timeout=2.0)
+    now = datetime.now(timezone.utc)
+    with _get_pool().connection() as conn:
+        with conn.transaction():
+            with conn.cursor() as cur:
+                cur.execute("SELECT pg_try_advisory_xact_lock(hashtext('audit_log_maintenance'))")
+                if not cur.fetchone()[0]:
+                    return {"skipped": True}
+                cur.execute("SELECT pg_advisory_xact_lock(hashtext('audit_log_partitions'))")
+                created = _create_audit_partitions(cur, now)
+                partitions = _audit_partitions(cur)
+
+                compacted = 0
+                if AUDIT_DETAILS_RETENTION_MONTHS > 0:
+                    cutoff = _month_start(now, -AUDIT_DETAILS_RETENTION_MONTHS)
+                    for name, month in sorted(partitions.items(), key=lambda item: item[1]):
+                        if _month_start(month, 1) > cutoff:
+                            continue
+                        cur.execute(
+                            sql.SQL(
+                                """
+                                UPDATE {}
+                                SET details = jsonb_build_object(
+                                    'source', details::jsonb -> 'source',
+                                    'ok', details::jsonb -> 'ok'
+                                )::text
+                                WHERE action = 'integration_result'
+                                  AND length(details) > 64
+                                  AND details IS JSON OBJECT
+                                """
+                            ).format(sql.Identifier(name))
+                        )
+                        compacted += cur.rowcount
+
+                dropped = []
+                if AUDIT_RETENTION_MONTHS > 0:
+                    cutoff = _month_start(now, -AUDIT_RETENTION_MONTHS)
+                    for name, month in sorted(partitions.items(), key=lambda item: item[1]):
+                        if _month_start(month, 1) <= cutoff:
+                            cur.execute(sql.SQL("DROP TABLE {}").format(sql.Identifier(name)))
+                            dropped.append(name)
+                    cur.execute("DELETE FROM audit_log_default WHERE timestamp < %s", (cutoff,))
+
+    if created or compacted or dropped:
+        logger.info(
+            f"🧹 Audit log maintenance: {created} partitions created, "
+            f"{compacted} payloads trimmed, dropped {dropped or 'none'}"
+        )
+    return {"created": created, "compacted_rows": compacted, "dropped": dropped}
+
+
 # =============================================
 # Player Merge Engine
 # =============================================
 
 
+# Edit distance up to which tags/names count as similar
+DUPLICATE_MAX_EDIT_DISTANCE = 2
+
+
 def find_duplicate_candidates(limit: int = 50) -> List[Dict[str, Any]]:
     """
     Detect potential duplicate player pairs.
@@ -3397,25 +6102,50 @@ def find_duplicate_candidates(limit: int = 50) -> List[Dict[str, Any]]:
     2. Similar tag  (Levenshtein distance <= 2, case-insensitive)
     3. Similar name (Levenshtein distance <= 2, case-insensitive)
 
+    Only pairs sharing a phone number or a tag/name block are compared
+    (_similar_string_pairs), so a scan grows with the number of players
+    instead of the number of pairs. Pairs are taken in the order of a full
+    pairwise scan over players sorted by total_events DESC, name.
+
+    Full scan on every call; the Merge tab reads the persisted index instead
+    (get_duplicate_candidates / refresh_duplicate_candidates).
+
     Returns list of candidate pairs with match reason and confidence level.
     """
     candidates: List[Dict[str, Any]] = []
 
     with _get_pool().connection() as conn:
         with conn.cursor() as cur:
-            # Load all players
-            cur.execute(
-                """
-                SELECT uuid, name, tag, email, telephone, total_events
-                FROM players
-                ORDER BY total_events DESC, name
-            """
-            )
-            players = cur.fetchall()
+            player_list = _load_duplicate_scan_players(cur)
+
+    for i, j, reasons, confidence in _duplicate_pairs(player_list):
+        candidates.append(
+            {
+                "player_a": player_list[i],
+                "player_b": player_list[j],
+                "reasons": reasons,
+                "confidence": confidence,
+            }
+        )
+        if len(candidates) >= limit:
+            break
+
+    _sort_duplicate_candidates(candidates)
+    logger.info(f"🔍 Found {len(candidates)} duplicate candidates")
+    return candidates
+
 
-    # Build lookup structures
+def _load_duplicate_scan_players(cur) -> List[Dict[str, Any]]:
+    """All players in duplicate-scan order (total_events DESC, name), fields stripped."""
+    cur.execute(
+        """
+        SELECT uuid, name, tag, email, telephone, total_events
+        FROM players
+        ORDER BY total_events DESC, name
+    """
+    )
     player_list = []
-    for row in players:
+    for row in cur.fetchall():
         p_uuid, name, tag, email, telephone, total_events = row
         player_list.append(
             {
@@ -3427,89 +6157,348 @@ def find_duplicate_candidates(limit: int = 50) -> List[Dict[str, Any]]:
                 "total_events": total_events or 0,
             }
         )
+    return player_list
 
-    seen_pairs = set()
 
-    for i, a in enumerate(player_list):
-        for b in player_list[i + 1 :]:
-            pair_key = tuple(sorted([a["uuid"], b["uuid"]]))
-            if pair_key in seen_pairs:
-                continue
+def _duplicate_pairs(player_list: List[Dict[str, Any]], changed: Optional[List[int]] = None):
+    """
+    Yield (i, j, reasons, confidence) for matching players i < j, in scan order.
 
-            reasons = []
-            confidence = "low"
-
-            # 1. Phone match (strongest signal)
-            if a["telephone"] and b["telephone"] and a["telephone"] == b["telephone"]:
-                reasons.append("same_phone")
-                confidence = "high"
-
-            # 2. Tag similarity (case-insensitive)
-            if a["tag"] and b["tag"]:
-                tag_a = a["tag"].lower()
-                tag_b = b["tag"].lower()
-                if tag_a == tag_b:
-                    # Exact case-insensitive match — should have been caught by _match_or_create
-                    reasons.append("exact_tag")
-                    confidence = "high"
-                elif _levenshtein(tag_a, tag_b) <= 2:
-                    reasons.append("similar_tag")
-                    if confidence != "high":
-                        confidence = "medium"
-
-            # 3. Name similarity (case-insensitive)
-            if a["name"] and b["name"]:
-                name_a = a["name"].lower()
-                name_b = b["name"].lower()
-                if name_a == name_b:
-                    reasons.append("exact_name")
-                    if confidence != "high":
-                        confidence = "medium"
-                elif _levenshtein(name_a, name_b) <= 2:
-                    reasons.append("similar_name")
-
-            if reasons:
-                seen_pairs.add(pair_key)
-                candidates.append(
-                    {
-                        "player_a": a,
-                        "player_b": b,
-                        "reasons": reasons,
-                        "confidence": confidence,
-                    }
-                )
+    With `changed` (indexes into player_list), only pairs involving one of
+    those players are considered.
+    """
+    pairs = _equal_value_pairs([p["telephone"] for p in player_list], changed)
+    pairs |= _similar_string_pairs(
+        [p["tag"].lower() for p in player_list], DUPLICATE_MAX_EDIT_DISTANCE, changed
+    )
+    pairs |= _similar_string_pairs(
+        [p["name"].lower() for p in player_list], DUPLICATE_MAX_EDIT_DISTANCE, changed
+    )
+    for i, j in sorted(pairs):
+        reasons, confidence = _duplicate_reasons(player_list[i], player_list[j])
+        if reasons:
+            yield i, j, reasons, confidence
 
-            if len(candidates) >= limit:
-                break
-        if len(candidates) >= limit:
-            break
 
-    # Sort by confidence (high first), then by number of reasons
+def _sort_duplicate_candidates(candidates: List[Dict[str, Any]]) -> None:
+    """Sort by confidence (high first), then by number of reasons (stable)."""
     conf_order = {"high": 0, "medium": 1, "low": 2}
     candidates.sort(key=lambda c: (conf_order.get(c["confidence"], 3), -len(c["reasons"])))
 
-    logger.info(f"🔍 Found {len(candidates)} duplicate candidates")
+
+def refresh_duplicate_candidates() -> Dict[str, Any]:
+    """
+    Bring the persisted duplicate_candidates index up to date.
+
+    Players queued in duplicate_scan_queue (inserted, or name/tag/telephone
+    changed — by archive_event, merge_players, undo_merge or anything else)
+    are compared against all players; their open pairs are replaced by the
+    new matches. Rejected and merged pairs keep their decision. Concurrent
+    refreshes split the queue (SKIP LOCKED) instead of waiting for each other.
+
+    Returns {"changed_players", "open_pairs"}.
+    """
+    with _get_pool().connection() as conn:
+        with conn.transaction():
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    DELETE FROM duplicate_scan_queue
+                    WHERE player_uuid IN (
+                        SELECT player_uuid FROM duplicate_scan_queue FOR UPDATE SKIP LOCKED
+                    )
+                    RETURNING player_uuid
+                    """
+                )
+                changed_uuids = {row[0] for row in cur.fetchall()}
+                if changed_uuids:
+                    player_list = _load_duplicate_scan_players(cur)
+                    changed = [i for i, p in enumerate(player_list) if p["uuid"] in changed_uuids]
+                    rows = []
+                    for i, j, reasons, confidence in _duplicate_pairs(player_list, changed):
+                        uuid_a, uuid_b = sorted((player_list[i]["uuid"], player_list[j]["uuid"]))
+                        rows.append((uuid_a, uuid_b, reasons, confidence))
+
+                    cur.execute(
+                        """
+                        DELETE FROM duplicate_candidates
+                        WHERE state = 'open' AND (uuid_a = ANY(%s) OR uuid_b = ANY(%s))
+                        """,
+                        (list(changed_uuids), list(changed_uuids)),
+                    )
+                    if rows:
+                        cur.executemany(
+                            """
+                            INSERT INTO duplicate_candidates (uuid_a, uuid_b, reasons, confidence)
+                            VALUES (%s, %s, %s, %s)
+                            ON CONFLICT (uuid_a, uuid_b) DO UPDATE
+                            SET reasons = EXCLUDED.reasons, confidence = EXCLUDED.confidence
+                            """,
+                            rows,
+                        )
+                cur.execute("SELECT COUNT(*) FROM duplicate_candidates WHERE state = 'open'")
+                open_pairs = cur.fetchone()[0] or 0
+
+    if changed_uuids:
+        logger.info(
+            f"🔍 Duplicate index refreshed ({len(changed_uuids)} changed players, {open_pairs} open pairs)"
+        )
+    return {"changed_players": len(changed_uuids), "open_pairs": open_pairs}
+
+
+def get_duplicate_candidates(limit: int = 50) -> List[Dict[str, Any]]:
+    """
+    Open pairs from the persisted duplicate index, same shape and order as
+    find_duplicate_candidates (current player fields, scan order, then
+    confidence). Does not rescan; see refresh_duplicate_candidates.
+    """
+    with _get_pool().connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                WITH ranked AS (
+                    SELECT uuid, name, tag, email, telephone, total_events,
+                           row_number() OVER (ORDER BY total_events DESC, name) AS pos
+                    FROM players
+                )
+                SELECT a.uuid, a.name, a.tag, a.email, a.telephone, a.total_events, a.pos,
+                       b.uuid, b.name, b.tag, b.email, b.telephone, b.total_events, b.pos,
+                       dc.reasons, dc.confidence
+                FROM duplicate_candidates dc
+                JOIN ranked a ON a.uuid = dc.uuid_a
+                JOIN ranked b ON b.uuid = dc.uuid_b
+                WHERE dc.state = 'open'
+                ORDER BY LEAST(a.pos, b.pos), GREATEST(a.pos, b.pos)
+                LIMIT %s
+                """,
+                (limit,),
+            )
+            rows = cur.fetchall()
+
+    def _player(fields: tuple) -> Dict[str, Any]:
+        p_uuid, name, tag, email, telephone, total_events = fields
+        return {
+            "uuid": p_uuid,
+            "name": (name or "").strip(),
+            "tag": (tag or "").strip(),
+            "email": (email or "").strip(),
+            "telephone": (telephone or "").strip(),
+            "total_events": total_events or 0,
+        }
+
+    candidates: List[Dict[str, Any]] = []
+    for row in rows:
+        first, second = (row[0:6], row[7:13]) if row[6] < row[13] else (row[7:13], row[0:6])
+        candidates.append(
+            {
+                "player_a": _player(first),
+                "player_b": _player(second),
+                "reasons": list(row[14] or []),
+                "confidence": row[15] or "low",
+            }
+        )
+    _sort_duplicate_candidates(candidates)
     return candidates
 
 
-def _levenshtein(s1: str, s2: str) -> int:
-    """Simple Levenshtein distance for short strings (player names/tags)."""
+def reject_duplicate_candidate(
+    uuid_a: str, uuid_b: str, *, user: Optional[Dict[str, Any]] = None
+) -> bool:
+    """Remember that two players are not the same; the pair is not offered again."""
+    if not uuid_a or not uuid_b or uuid_a == uuid_b:
+        return False
+    uuid_a, uuid_b = sorted((uuid_a, uuid_b))
+    with _get_pool().connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO duplicate_candidates (uuid_a, uuid_b, state, decided_at, decided_by)
+                VALUES (%s, %s, 'rejected', now(), %s)
+                ON CONFLICT (uuid_a, uuid_b) DO UPDATE
+                SET state = 'rejected', decided_at = now(), decided_by = EXCLUDED.decided_by
+                """,
+                (uuid_a, uuid_b, (user or {}).get("user_name", "")),
+            )
+    return True
+
+
+def _duplicate_reasons(a: Dict[str, Any], b: Dict[str, Any]) -> tuple:
+    """(reasons, confidence) for two players from find_duplicate_candidates."""
+    reasons = []
+    confidence = "low"
+
+    # 1. Phone match (strongest signal)
+    if a["telephone"] and b["telephone"] and a["telephone"] == b["telephone"]:
+        reasons.append("same_phone")
+        confidence = "high"
+
+    # 2. Tag similarity (case-insensitive)
+    if a["tag"] and b["tag"]:
+        tag_a = a["tag"].lower()
+        tag_b = b["tag"].lower()
+        if tag_a == tag_b:
+            # Exact case-insensitive match — should have been caught by _match_or_create
+            reasons.append("exact_tag")
+            confidence = "high"
+        elif _within_edit_distance(tag_a, tag_b, DUPLICATE_MAX_EDIT_DISTANCE):
+            reasons.append("similar_tag")
+            if confidence != "high":
+                confidence = "medium"
+
+    # 3. Name similarity (case-insensitive)
+    if a["name"] and b["name"]:
+        name_a = a["name"].lower()
+        name_b = b["name"].lower()
+        if name_a == name_b:
+            reasons.append("exact_name")
+            if confidence != "high":
+                confidence = "medium"
+        elif _within_edit_distance(name_a, name_b, DUPLICATE_MAX_EDIT_DISTANCE):
+            reasons.append("similar_name")
+
+    return reasons, confidence
+
+
+def _equal_value_pairs(values: List[str], changed: Optional[List[int]] = None) -> set:
+    """Index pairs (i < j) with the same non-blank value (involving `changed` when given)."""
+    groups: Dict[str, List[int]] = {}
+    for i, value in enumerate(values):
+        if value:
+            groups.setdefault(value, []).append(i)
+    pairs = {
+        (i, j) for group in groups.values() for n, i in enumerate(group) for j in group[n + 1 :]
+    }
+    if changed is not None:
+        changed_set = set(changed)
+        pairs = {(i, j) for i, j in pairs if i in changed_set or j in changed_set}
+    return pairs
+
+
+def _segments(length: int, parts: int) -> List[tuple]:
+    """(start, length) of `parts` contiguous, near-equal segments of a string of `length`."""
+    base, extra = divmod(length, parts)
+    result = []
+    start = 0
+    for n in range(parts):
+        size = base + (1 if n >= parts - extra else 0)
+        result.append((start, size))
+        start += size
+    return result
+
+
+def _similar_string_pairs(
+    values: List[str], max_distance: int, changed: Optional[List[int]] = None
+) -> set:
+    """
+    Index pairs (i < j) of non-blank values that may be within max_distance edits.
+
+    With `changed`, only pairs involving one of those indexes are returned
+    (changed values are joined against all values in both directions).
+    Callers verify pairs with _within_edit_distance.
+    """
+    everyone = [i for i, value in enumerate(values) if value]
+    if changed is None:
+        return _segment_join(values, everyone, everyone, max_distance)
+    changed = [i for i in changed if values[i]]
+    return _segment_join(values, everyone, changed, max_distance) | _segment_join(
+        values, changed, everyone, max_distance
+    )
+
+
+def _segment_join(
+    values: List[str], indexed: List[int], probes: List[int], max_distance: int
+) -> set:
+    """
+    Pairs of an indexed and a probe value that may be within max_distance edits.
+
+    Pigeonhole blocking (PassJoin): split a value into max_distance + 1
+    segments and at least one of them survives the edits unchanged near its
+    original position. Indexed values are keyed by (length, segment number,
+    segment); every probe looks up its substrings at the candidate positions
+    of each shorter-or-equal indexed length, so the work per probe depends on
+    block sizes rather than the player count. Indexed values too short to
+    split are paired with every probe of a reachable length. Pairs where the
+    probe is the shorter value are only complete when the join also runs with
+    the roles swapped (or indexed == probes).
+    """
+    parts = max_distance + 1
+    index: Dict[tuple, List[int]] = {}
+    indexed_lengths = set()
+    short: List[int] = []
+    for i in indexed:
+        value = values[i]
+        length = len(value)
+        indexed_lengths.add(length)
+        if length < parts:
+            short.append(i)
+            continue
+        for seg_no, (start, size) in enumerate(_segments(length, parts)):
+            index.setdefault((length, seg_no, value[start : start + size]), []).append(i)
+
+    pairs = set()
+    if short:
+        probes_by_length: Dict[int, List[int]] = {}
+        for i in probes:
+            probes_by_length.setdefault(len(values[i]), []).append(i)
+        for i in short:
+            for length in range(1, len(values[i]) + max_distance + 1):
+                for j in probes_by_length.get(length, ()):
+                    if j != i:
+                        pairs.add((i, j) if i < j else (j, i))
+
+    for i in probes:
+        value = values[i]
+        m = len(value)
+        for length in range(max(parts, m - max_distance), m + 1):
+            if length not in indexed_lengths:
+                continue
+            delta = m - length
+            for seg_no, (start, size) in enumerate(_segments(length, parts)):
+                # Multi-match-aware window: edits before / after the segment
+                first = max(0, start - seg_no, start + delta - (max_distance - seg_no))
+                last = min(m - size, start + seg_no, start + delta + (max_distance - seg_no))
+                for pos in range(first, last + 1):
+                    for j in index.get((length, seg_no, value[pos : pos + size]), ()):
+                        if j != i:
+                            pairs.add((i, j) if i < j else (j, i))
+    return pairs
+
+
+def _within_edit_distance(s1: str, s2: str, max_distance: int) -> bool:
+    """
+    True when the Levenshtein distance of s1 and s2 is <= max_distance.
+
+    Only the diagonal band |i - j| <= max_distance is computed (cells outside
+    it are already over the bound), and the scan stops as soon as a whole row
+    exceeds max_distance.
+    """
+    if abs(len(s1) - len(s2)) > max_distance:
+        return False
     if len(s1) < len(s2):
-        return _levenshtein(s2, s1)
-    if len(s2) == 0:
-        return len(s1)
-
-    prev_row = list(range(len(s2) + 1))
-    for i, c1 in enumerate(s1):
-        curr_row = [i + 1]
-        for j, c2 in enumerate(s2):
-            insertions = prev_row[j + 1] + 1
-            deletions = curr_row[j] + 1
-            substitutions = prev_row[j] + (c1 != c2)
-            curr_row.append(min(insertions, deletions, substitutions))
+        s1, s2 = s2, s1
+
+    over = max_distance + 1
+    width = len(s2)
+    prev_row = [j if j <= max_distance else over for j in range(width + 1)]
+    for i, c1 in enumerate(s1, start=1):
+        curr_row = [over] * (width + 1)
+        if i <= max_distance:
+            curr_row[0] = i
+        row_min = curr_row[0]
+        for j in range(max(1, i - max_distance), min(width, i + max_distance) + 1):
+            cost = min(
+                prev_row[j] + 1,  # deletion
+                curr_row[j - 1] + 1,  # insertion
+                prev_row[j - 1] + (c1 != s2[j - 1]),  # substitution
+            )
+            curr_row[j] = cost if cost < over else over
+            if cost < row_min:
+                row_min = cost
+        if row_min > max_distance:
+            return False
         prev_row = curr_row
 
-    return prev_row[-1]
+    return prev_row[width] <= max_distance
 
 
 def merge_players(
@@ -3577,6 +6566,7 @@ def merge_players(
                     (keep_uuid, remove_uuid),
                 )
                 archive_updated = cur.rowcount or 0
+                _refresh_player_event_facts(cur, player_uuids=[keep_uuid, remove_uuid])
 
                 # 4. Re-point active_event_data rows
                 cur.execute(
@@ -3685,8 +6675,23 @@ def merge_players(
                     ),
                 )
 
-                # 6. Delete the removed player
+                # 6. Delete the removed player (its open duplicate pairs go with it)
                 cur.execute("DELETE FROM players WHERE uuid = %s", (remove_uuid,))
+                cur.execute(
+                    """
+                    INSERT INTO duplicate_candidates (uuid_a, uuid_b, state, decided_at, decided_by)
+                    VALUES (LEAST(%s, %s), GREATEST(%s, %s), 'merged', now(), %s)
+                    ON CONFLICT (uuid_a, uuid_b) DO UPDATE
+                    SET state = 'merged', decided_at = now(), decided_by = EXCLUDED.decided_by
+                    """,
+                    (
+                        keep_uuid,
+                        remove_uuid,
+                        keep_uuid,
+                        remove_uuid,
+                        merge_user.get("user_name", "system"),
+                    ),
+                )
 
                 # 7. Write to merge_log
                 cur.execute(
@@ -3728,6 +6733,7 @@ def merge_players(
                 "active_rows_updated": active_updated,
             }
         ),
+        durable=True,
     )
 
     logger.info(
@@ -3843,6 +6849,7 @@ def undo_merge(
                         (remove_uuid, keep_uuid, remove_events),
                     )
                     archive_reverted = cur.rowcount or 0
+                    _refresh_player_event_facts(cur, player_uuids=[keep_uuid, remove_uuid])
 
                 # 4. Revert active_event_data (use tag match as heuristic)
                 active_reverted = 0
@@ -3858,11 +6865,18 @@ def undo_merge(
                     )
                     active_reverted = cur.rowcount or 0
 
-                # 5. Mark as undone
+                # 5. Mark as undone; the pair is re-evaluated by the next duplicate refresh
                 cur.execute(
                     "UPDATE merge_log SET undone = true, undone_at = now() WHERE id = %s",
                     (merge_id,),
                 )
+                cur.execute(
+                    """
+                    DELETE FROM duplicate_candidates
+                    WHERE uuid_a = LEAST(%s, %s) AND uuid_b = GREATEST(%s, %s) AND state = 'merged'
+                    """,
+                    (keep_uuid, remove_uuid, keep_uuid, remove_uuid),
+                )
 
     # Audit
     log_action(
@@ -3879,6 +6893,7 @@ def undo_merge(
                 "active_reverted": active_reverted,
             }
         ),
+        durable=True,
     )
 
     logger.info(
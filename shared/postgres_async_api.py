@@ -0,0 +1,1337 @@
+"""
+Async Postgres storage backend for the FastAPI backend.
+
+Mirrors the public functions of postgres_api.py, backed by a
+psycopg_pool.AsyncConnectionPool so that request handlers never stall the
+event loop (SSE streams, other check-ins) while a query runs.
+
+- Hot-path reads/writes (settings, check-ins, integration results, players,
+  audit log) are native async.
+- Long admin transactions (archive, reopen, merge, recompute, insights) reuse
+  the sync implementation in postgres_api.py and run in a worker thread.
+
+Pure helpers (compute_requirements, compute_checkin_status, compute_event_stats)
+are re-exported unchanged.
+
+The sync API in postgres_api.py stays the primary backend for the Dash
+dashboard and scripts.
+"""
+
+import asyncio
+import functools
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+import shared.postgres_api as _sync
+from shared.postgres_api import (  # noqa: F401 - re-exported pure helpers
+    _ADMIN_JOB_COLUMNS,
+    _BEGIN_CHECKIN_FIND_SQL,
+    _BEGIN_CHECKIN_LOCK_SQL,
+    _REGISTER_GAME_ALIASES_SQL,
+    _REGISTER_GAMES_SQL,
+    _SETTINGS_ROW_MISSING,
+    ADMIN_JOB_STALE_AFTER,
+    CANONICAL_PLAYER_ID_ENABLED,
+    CHECKIN_DELTA_CHANNEL,
+    CHECKIN_JOB_RETENTION,
+    CHECKIN_REQUIREMENT_COLUMNS,
+    CHECKIN_SORT_COLUMNS,
+    DATABASE_URL,
+    SESSION_ABSOLUTE_TIMEOUT,
+    SESSION_IDLE_TIMEOUT,
+    _audit_fields,
+    _audit_insert_sql,
+    _begin_checkin_fields,
+    _begin_checkin_sql,
+    _begin_checkin_update_sql,
+    _checkin_fields_from_row,
+    _checkin_row_dict,
+    _checkins_select_sql,
+    _coerce_jsonb,
+    _enqueue_audit_entry,
+    _normalize_acquisition_source,
+    _normalize_added_via,
+    _pending_game_aliases,
+    _remember_game_aliases,
+    _row_to_dict,
+    _settings_cache_lookup,
+    _settings_cache_store,
+    _settings_value,
+    compute_checkin_status,
+    compute_event_stats,
+    compute_requirements,
+    invalidate_session_cache,
+    invalidate_settings_cache,
+)
+
+logger = logging.getLogger(__name__)
+
+# Async connection pool - lazy-initialized on first use (bound to the running loop)
+_async_pool = None
+_async_pool_lock: Optional[asyncio.Lock] = None
+
+
+async def _get_async_pool():
+    """Lazy-init the async pool (runs schema migrations once before opening)."""
+    global _async_pool, _async_pool_lock
+    if _async_pool is not None:
+        return _async_pool
+
+    if _async_pool_lock is None:
+        _async_pool_lock = asyncio.Lock()
+
+    async with _async_pool_lock:
+        if _async_pool is None:
+            import psycopg_pool  # type: ignore
+
+            await asyncio.to_thread(_sync._run_migrations)
+            pool = psycopg_pool.AsyncConnectionPool(
+                conninfo=DATABASE_URL,
+                min_size=2,
+                max_size=10,
+                open=False,
+                kwargs={"autocommit": True},
+            )
+            await pool.open()
+            _async_pool = pool
+            logger.info("✅ Async Postgres connection pool initialized")
+    return _async_pool
+
+
+async def close_pool() -> None:
+    """Flush queued audit entries and close the async pool (call from the app shutdown hook)."""
+    global _async_pool
+    await asyncio.to_thread(_sync.close_audit_writer)
+    if _async_pool is not None:
+        await _async_pool.close()
+        _async_pool = None
+        logger.info("🔌 Async Postgres connection pool closed")
+
+
+def _offload(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Expose a sync postgres_api function as a coroutine running in a worker thread."""
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    return wrapper
+
+
+_CHECKIN_LOOKUP_COLUMNS = [
+    "record_id",
+    "name",
+    "tag",
+    "email",
+    "telephone",
+    "status",
+    "member",
+    "startgg",
+    "payment_valid",
+    "payment_amount",
+    "payment_expected",
+    "tournament_games_registered",
+    "checkin_uuid",
+    "event_slug",
+    "startgg_event_id",
+    "external_id",
+    "is_guest",
+    "added_via",
+    "acquisition_source",
+    "created",
+]
+_CHECKIN_LOOKUP_SQL = ", ".join(_CHECKIN_LOOKUP_COLUMNS)
+
+
+async def _fetch_checkin(
+    where_sql: str, params: List[Any], order_sql: str = ""
+) -> Optional[Dict[str, Any]]:
+    query = f"""
+        SELECT {_CHECKIN_LOOKUP_SQL}
+        FROM active_event_data
+        WHERE {where_sql}
+        {order_sql}
+        LIMIT 1
+    """
+    pool = await _get_async_pool()
+    async with pool.connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(query, params)
+            row = await cur.fetchone()
+
+    if not row:
+        return None
+
+    row_dict = _row_to_dict(_CHECKIN_LOOKUP_COLUMNS, row)
+    return {"record_id": row_dict.get("record_id"), "fields": _checkin_fields_from_row(row_dict)}
+
+
+# =============================================
+# Settings (shares the process-wide cache in postgres_api)
+# =============================================
+async def _fetch_active_settings_row() -> Optional[Dict[str, Any]]:
+    """Return the full active settings row (including id), served from the cache when possible."""
+    cached, generation = _settings_cache_lookup()
+    if cached is _SETTINGS_ROW_MISSING:
+        return None
+    if cached is not None:
+        return cached
+
+    columns = None
+    row = None
+    pool = await _get_async_pool()
+    async with pool.connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(
+                """
+                SELECT *
+                FROM settings
+                WHERE is_active = true
+                ORDER BY id DESC
+                LIMIT 1
+                """
+            )
+            row = await cur.fetchone()
+            if row:
+                columns = [desc[0] for desc in cur.description]
+
+    if not row or not columns:
+        _settings_cache_store(None, generation)
+        return None
+
+    data = _row_to_dict(columns, row)
+    _settings_cache_store(data, generation)
+    return data
+
+
+async def get_active_settings() -> Optional[Dict[str, Any]]:
+    """Return fields from the active settings row (is_active = true)."""
+    data = await _fetch_active_settings_row()
+    if data is None:
+        logger.warning("⚠️ No active settings row found.")
+        return None
+
+    data.pop("id", None)
+    return data
+
+
+async def get_active_slug() -> Optional[str]:
+    """Return active_event_slug from the active settings row."""
+    settings = await get_active_settings() or {}
+    slug = settings.get("active_event_slug")
+    if slug:
+        logger.info(f"🎯 Active slug: {slug}")
+    else:
+        logger.warning("⚠️ active_event_slug missing on active settings row.")
+    return slug
+
+
+async def get_active_settings_with_id() -> Optional[Dict[str, Any]]:
+    """Return the active settings row with its record_id included."""
+    data = await _fetch_active_settings_row()
+    if data is None:
+        logger.warning("⚠️ No active settings row found.")
+        return None
+
+    record_id = data.pop("id", None)
+    return {"record_id": str(record_id) if record_id is not None else None, "fields": data}
+
+
+async def update_settings(record_id: str, fields: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Update fields on a settings record."""
+    if not record_id:
+        return None
+
+    try:
+        record_id_int: int = int(record_id)
+    except (TypeError, ValueError):
+        return None
+
+    columns = []
+    values: List[Any] = []
+    for key, value in (fields or {}).items():
+        columns.append(f"{key} = %s")
+        values.append(_settings_value(key, value))
+
+    if not columns:
+        return None
+
+    values.append(record_id_int)
+
+    columns_out = None
+    row = None
+    pool = await _get_async_pool()
+    async with pool.connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(
+                f"UPDATE settings SET {', '.join(columns)} WHERE id = %s RETURNING *",
+                values,
+            )
+            row = await cur.fetchone()
+            if row:
+                columns_out = [desc[0] for desc in cur.description]
+
+    # Don't wait for our own NOTIFY round-trip before the next read
+    invalidate_settings_cache()
+
+    if not row or not columns_out:
+        return None
+
+    data = _row_to_dict(columns_out, row)
+    return {
+        "record_id": str(data.get("id")),
+        "fields": {k: v for k, v in data.items() if k != "id"},
+    }
+
+
+# =============================================
+# Checkins (active_event_data)
+# =============================================
+async def get_checkins(
+    slug: Optional[str] = None,
+    include_all: bool = False,
+    *,
+    search: Optional[str] = None,
+    status: Optional[str] = None,
+    payment_valid: Optional[bool] = None,
+    game: Optional[str] = None,
+    missing: Optional[Iterable[str]] = None,
+    sort_by: Optional[List[Dict[str, Any]]] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> List[Dict[str, Any]]:
+    """Return check-ins for a given event_slug from active_event_data, newest first."""
+    if not slug and not include_all:
+        return []
+
+    filters = dict(
+        search=search, status=status, payment_valid=payment_valid, game=game, missing=missing
+    )
+    query, params = _checkins_select_sql(slug, include_all, filters, sort_by, limit, offset)
+
+    pool = await _get_async_pool()
+    async with pool.connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(query, params)
+            columns = [desc[0] for desc in cur.description]
+            rows = await cur.fetchall()
+
+    result = [_checkin_row_dict(columns, row) for row in rows]
+
+    if include_all:
+        logger.info(f"📥 Found {len(result)} checkins (ALL events)")
+    else:
+        logger.info(f"📥 Found {len(result)} checkins for slug '{slug}'")
+    return result
+
+
+async def get_all_event_slugs() -> List[str]:
+    """Collect unique event_slug values from active_event_data only."""
+    pool = await _get_async_pool()
+    async with pool.connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(
+                "SELECT DISTINCT event_slug FROM active_event_data WHERE event_slug IS NOT NULL"
+            )
+            rows = await cur.fetchall()
+
+    out = sorted({row[0] for row in rows if row and row[0]})
+    logger.info(f"📚 Retrieved {len(out)} unique event slugs from active data.")
+    return out
+
+
+async def get_checkin_by_name(name: str, slug: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Find a checkin record by name (case-insensitive)."""
+    if not name:
+        return None
+
+    params: List[Any] = [name]
+    where_sql = "LOWER(name) = LOWER(%s)"
+    if slug:
+        where_sql += " AND event_slug = %s"
+        params.append(slug)
+
+    return await _fetch_checkin(where_sql, params, "ORDER BY created DESC")
+
+
+async def get_checkin_by_tag(tag: str, slug: str) -> Optional[Dict[str, Any]]:
+    """Find a checkin record by tag + event_slug (case-insensitive tag match)."""
+    if not tag or not slug:
+        return None
+
+    return await _fetch_checkin(
+        "LOWER(tag) = LOWER(%s) AND event_slug = %s", [tag, slug], "ORDER BY created DESC"
+    )
+
+
+async def get_checkin_by_record_id(record_id: str) -> Optional[Dict[str, Any]]:
+    """Find a checkin record by its record_id (primary key)."""
+    if not record_id:
+        return None
+
+    return await _fetch_checkin("record_id = %s", [record_id])
+
+
+async def _register_game_names(names, cur) -> None:
+    """Async counterpart of postgres_api._register_game_names (on the caller's cursor)."""
+    pending = _pending_game_aliases(names)
+    if not pending:
+        return
+    aliases = list(pending)
+    canonicals = [pending[a] for a in aliases]
+    await cur.execute(_REGISTER_GAMES_SQL, (canonicals,))
+    await cur.execute(_REGISTER_GAME_ALIASES_SQL, (aliases, canonicals))
+    _remember_game_aliases(aliases)
+
+
+async def update_checkin(
+    record_id: str, fields: Dict[str, Any], typecast: bool = False
+) -> Optional[Dict[str, Any]]:
+    """Update fields on a checkin record."""
+    if not record_id:
+        return None
+
+    update_fields = {}
+    for key, value in (fields or {}).items():
+        if key == "UUID":
+            update_fields["checkin_uuid"] = value
+        else:
+            update_fields[key] = value
+
+    if not update_fields:
+        return None
+
+    set_sql = ", ".join([f"{k} = %s" for k in update_fields.keys()])
+    params = list(update_fields.values())
+    params.append(record_id)
+
+    columns = None
+    row = None
+    pool = await _get_async_pool()
+    async with pool.connection() as conn:
+        async with conn.cursor() as cur:
+            if "tournament_games_registered" in update_fields:
+                await _register_game_names(update_fields["tournament_games_registered"], cur)
+            await cur.execute(
+                f"UPDATE active_event_data SET {set_sql} WHERE record_id = %s RETURNING *",
+                params,
+            )
+            row = await cur.fetchone()
+            if row:
+                columns = [desc[0] for desc in cur.description]
+
+    if not row or not columns:
+        return None
+
+    row_dict = _row_to_dict(columns, row)
+    return {"record_id": row_dict.get("record_id"), "fields": _checkin_fields_from_row(row_dict)}
+
+
+async def delete_checkin(record_id: str) -> bool:
+    """Delete a checkin record."""
+    if not record_id:
+        return False
+
+    pool = await _get_async_pool()
+    async with pool.connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute("DELETE FROM active_event_data WHERE record_id = %s", (record_id,))
+            return cur.rowcount > 0
+
+
+async def _find_player_uuid(tag: Optional[str], email: Optional[str]) -> Optional[str]:
+    """Async counterpart of postgres_api._find_player_uuid (match only, no creation)."""
+    if not tag and not email:
+        return None
+
+    pool = await _get_async_pool()
+    async with pool.connection() as conn:
+        async with conn.cursor() as cur:
+            if tag:
+                await cur.execute(
+                    "SELECT uuid FROM players WHERE LOWER(tag) = LOWER(%s) LIMIT 1",
+                    (tag,),
+                )
+                row = await cur.fetchone()
+                if row:
+                    return row[0]
+
+            if email:
+                await cur.execute(
+                    "SELECT uuid FROM players WHERE LOWER(email) = LOWER(%s) LIMIT 1",
+                    (email,),
+                )
+                row = await cur.fetchone()
+                if row:
+                    return row[0]
+
+    return None
+
+
+async def _begin_checkin_locked(conn, fields: Dict[str, Any]) -> tuple:
+    """Async counterpart of postgres_api._begin_checkin_locked (unique index missing)."""
+    async with conn.transaction():
+        async with conn.cursor() as cur:
+            await cur.execute(_BEGIN_CHECKIN_LOCK_SQL, fields)
+            await cur.execute(_BEGIN_CHECKIN_FIND_SQL, fields)
+            existing = await cur.fetchone()
+            if existing:
+                await cur.execute(_begin_checkin_update_sql(), {**fields, "record_id": existing[0]})
+            else:
+                await cur.execute(_begin_checkin_sql(upsert=False), fields)
+            return await cur.fetchone()
+
+
+async def begin_checkin(event_slug: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Create or update a check-in attempt and return checkin_id.
+
+    Same dedupe strategy as postgres_api.begin_checkin:
+    - event_slug + tag (case-insensitive) if tag exists: one INSERT ... ON CONFLICT
+      round-trip, safe under concurrent check-ins (a locked read-then-write while
+      idx_active_event_tag_unique is missing)
+    - else event_slug + name (case-insensitive) if name exists
+    """
+    if not event_slug:
+        raise ValueError("event_slug is required")
+
+    payload = payload or {}
+    fields = _begin_checkin_fields(event_slug, payload)
+    name = (payload.get("name") or "").strip() or None
+
+    if not fields["tag"] and name:
+        existing = await get_checkin_by_name(name, event_slug)
+        if existing and existing.get("record_id"):
+            checkin_id = existing["record_id"]
+            matched_player_uuid = None
+            if CANONICAL_PLAYER_ID_ENABLED:
+                try:
+                    matched_player_uuid = await _find_player_uuid(None, fields["email"])
+                except Exception as exc:
+                    logger.warning(f"⚠️ Player UUID lookup failed (non-blocking): {exc}")
+            update_fields = {
+                k: v for k, v in fields.items() if k != "acquisition_source" or v is not None
+            }
+            update_fields["player_uuid"] = matched_player_uuid
+            if not await update_checkin(checkin_id, update_fields):
+                raise RuntimeError("Failed to update existing checkin")
+            return {
+                "checkin_id": checkin_id,
+                "record_id": checkin_id,
+                "event_slug": event_slug,
+                "created": False,
+                "player_uuid": matched_player_uuid,
+            }
+
+    pool = await _get_async_pool()
+    async with pool.connection() as conn:
+        async with conn.cursor() as cur:
+            await _register_game_names(fields["tournament_games_registered"], cur)
+        if fields["tag"] and not _sync._checkin_tag_index_ready:
+            checkin_id, matched_player_uuid, created = await _begin_checkin_locked(conn, fields)
+        else:
+            async with conn.cursor() as cur:
+                await cur.execute(_begin_checkin_sql(upsert=bool(fields["tag"])), fields)
+                checkin_id, matched_player_uuid, created = await cur.fetchone()
+
+    return {
+        "checkin_id": checkin_id,
+        "record_id": checkin_id,
+        "event_slug": event_slug,
+        "created": bool(created),
+        "player_uuid": matched_player_uuid,
+    }
+
+
+async def apply_integration_result(
+    checkin_id: str,
+    source: str,
+    ok: bool,
+    data: Optional[Dict[str, Any]] = None,
+    error: Optional[Dict[str, Any]] = None,
+    fetched_at: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Apply integration result to a checkin record and write audit log."""
+    if not checkin_id:
+        raise ValueError("checkin_id is required")
+    if not source:
+        raise ValueError("source is required")
+
+    data = data or {}
+    update_fields: Dict[str, Any] = {}
+
+    src = source.lower().strip()
+    if src == "startgg":
+        registered = bool(ok and data.get("registered", True))
+        update_fields["startgg"] = registered
+        update_fields["is_guest"] = not registered
+        if isinstance(data.get("events"), list):
+            update_fields["tournament_games_registered"] = data.get("events")
+        if data.get("startgg_event_id"):
+            update_fields["startgg_event_id"] = str(data.get("startgg_event_id"))
+        if data.get("email"):
+            update_fields["email"] = data["email"]
+    elif src == "ebas":
+        update_fields["member"] = bool(ok and data.get("member", True))
+    elif src in ("swish", "stripe"):
+        if data.get("payment_amount") is not None:
+            update_fields["payment_amount"] = data.get("payment_amount")
+        if data.get("payment_expected") is not None:
+            update_fields["payment_expected"] = data.get("payment_expected")
+        if data.get("payment_valid") is not None:
+            update_fields["payment_valid"] = bool(data.get("payment_valid"))
+        else:
+            update_fields["payment_valid"] = bool(ok)
+
+    updated = await update_checkin(checkin_id, update_fields) if update_fields else None
+    if update_fields and not updated:
+        raise RuntimeError("Failed to update checkin from integration result")
+
+    fields = (updated or {}).get("fields", {})
+    event_slug = fields.get("event_slug") if isinstance(fields, dict) else None
+
+    await log_action(
+        {"user_id": "integration", "user_name": f"n8n:{src}", "user_email": ""},
+        "integration_result",
+        "active_event_data",
+        target_event=event_slug,
+        target_record=checkin_id,
+        details=json.dumps(
+            {
+                "source": src,
+                "ok": ok,
+                "data": data,
+                "error": error,
+                "fetched_at": fetched_at,
+            }
+        ),
+    )
+
+    return {
+        "checkin_id": checkin_id,
+        "source": src,
+        "ok": ok,
+        "updated": bool(update_fields),
+    }
+
+
+# =============================================
+# Check-in jobs (async orchestration)
+# =============================================
+async def start_checkin_job(checkin_id: str) -> None:
+    """Mark a check-in orchestration job as running (re-submits restart it)."""
+    pool = await _get_async_pool()
+    async with pool.connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(
+                """
+                INSERT INTO checkin_jobs (checkin_id, state, result, created_at, finished_at)
+                VALUES (%s, 'running', NULL, now(), NULL)
+                ON CONFLICT (checkin_id) DO UPDATE
+                SET state = 'running', result = NULL, created_at = now(), finished_at = NULL
+                """,
+                (checkin_id,),
+            )
+            # Opportunistic cleanup - jobs are only polled for a few minutes
+            await cur.execute(
+                "DELETE FROM checkin_jobs WHERE created_at < %s",
+                (datetime.now(timezone.utc) - CHECKIN_JOB_RETENTION,),
+            )
+
+
+async def finish_checkin_job(checkin_id: str, state: str, result: Dict[str, Any]) -> None:
+    """Store the final result of a check-in orchestration job ('done' or 'failed')."""
+    from psycopg.types.json import Json  # type: ignore
+
+    pool = await _get_async_pool()
+    async with pool.connection() as conn:
+        await conn.execute(
+            """
+            UPDATE checkin_jobs
+            SET state = %s, result = %s, finished_at = now()
+            WHERE checkin_id = %s
+            """,
+            (state, Json(result), checkin_id),
+        )
+
+
+async def settle_checkin_job(checkin_id: str, result: Dict[str, Any]) -> bool:
+    """
+    Mark a still running job 'done' with result (its worker died).
+
+    Returns False if the job had already finished, e.g. another poll settled
+    it first - only the caller that gets True should announce the result.
+    """
+    from psycopg.types.json import Json  # type: ignore
+
+    pool = await _get_async_pool()
+    async with pool.connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(
+                """
+                UPDATE checkin_jobs
+                SET state = 'done', result = %s, finished_at = now()
+                WHERE checkin_id = %s AND state = 'running'
+                RETURNING checkin_id
+                """,
+                (Json(result), checkin_id),
+            )
+            return await cur.fetchone() is not None
+
+
+async def get_checkin_job(checkin_id: str) -> Optional[Dict[str, Any]]:
+    """Return {checkin_id, state, result, created_at, finished_at} or None."""
+    pool = await _get_async_pool()
+    async with pool.connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(
+                """
+                SELECT checkin_id, state, result, created_at, finished_at
+                FROM checkin_jobs
+                WHERE checkin_id = %s
+                """,
+                (checkin_id,),
+            )
+            row = await cur.fetchone()
+            if not row:
+                return None
+            columns = [desc[0] for desc in cur.description]
+    return _row_to_dict(columns, row)
+
+
+# =============================================
+# Admin jobs (long-running dashboard operations)
+# =============================================
+
+
+async def start_admin_job(
+    kind: str, job_id: str, event_slug: str = "", progress: Optional[Dict[str, Any]] = None
+) -> bool:
+    """
+    Register a running job. Returns False if another job of the same kind is
+    still running (jobs without progress for ADMIN_JOB_STALE_AFTER are failed first).
+    """
+    from psycopg import errors as pg_errors  # type: ignore
+    from psycopg.types.json import Json  # type: ignore
+
+    pool = await _get_async_pool()
+    async with pool.connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(
+                """
+                UPDATE admin_jobs
+                SET state = 'failed', finished_at = now(),
+                    result = '{"error": "job stopped reporting progress"}'::jsonb
+                WHERE kind = %s AND state = 'running' AND updated_at < %s
+                """,
+                (kind, datetime.now(timezone.utc) - ADMIN_JOB_STALE_AFTER),
+            )
+            try:
+                await cur.execute(
+                    """
+                    INSERT INTO admin_jobs (job_id, kind, event_slug, state, progress)
+                    VALUES (%s, %s, %s, 'running', %s)
+                    """,
+                    (job_id, kind, event_slug or None, Json(progress or {})),
+                )
+            except pg_errors.UniqueViolation:
+                return False
+    return True
+
+
+async def update_admin_job(job_id: str, progress: Dict[str, Any]) -> bool:
+    """Store progress for a running job. Returns True if cancellation was requested."""
+    from psycopg.types.json import Json  # type: ignore
+
+    pool = await _get_async_pool()
+    async with pool.connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(
+                """
+                UPDATE admin_jobs
+                SET progress = %s, updated_at = now()
+                WHERE job_id = %s
+                RETURNING cancel_requested
+                """,
+                (Json(progress), job_id),
+            )
+            row = await cur.fetchone()
+    return bool(row and row[0])
+
+
+async def finish_admin_job(job_id: str, state: str, result: Dict[str, Any]) -> bool:
+    """
+    Store the final state ('done', 'cancelled' or 'failed') and result of a job.
+
+    Returns False if the job had already finished (e.g. it was cancelled first).
+    """
+    from psycopg.types.json import Json  # type: ignore
+
+    pool = await _get_async_pool()
+    async with pool.connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(
+                """
+                UPDATE admin_jobs
+                SET state = %s, result = %s, updated_at = now(), finished_at = now()
+                WHERE job_id = %s AND state = 'running'
+                """,
+                (state, Json(result), job_id),
+            )
+            return cur.rowcount > 0
+
+
+async def cancel_admin_job(job_id: str) -> bool:
+    """Request cancellation of a running job. Returns False if it is not running."""
+    pool = await _get_async_pool()
+    async with pool.connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(
+                """
+                UPDATE admin_jobs SET cancel_requested = true
+                WHERE job_id = %s AND state = 'running'
+                """,
+                (job_id,),
+            )
+            return cur.rowcount > 0
+
+
+async def get_admin_job(
+    job_id: Optional[str] = None, kind: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """Return a job by id, or the most recent job of kind."""
+    if job_id:
+        where_sql, params = "job_id = %s", (job_id,)
+    elif kind:
+        where_sql, params = "kind = %s", (kind,)
+    else:
+        return None
+
+    pool = await _get_async_pool()
+    async with pool.connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(
+                f"""
+                SELECT {_ADMIN_JOB_COLUMNS}
+                FROM admin_jobs
+                WHERE {where_sql}
+                ORDER BY created_at DESC
+                LIMIT 1
+                """,
+                params,
+            )
+            row = await cur.fetchone()
+            if not row:
+                return None
+            columns = [desc[0] for desc in cur.description]
+    return _row_to_dict(columns, row)
+
+
+# =============================================
+# Start.gg roster (prefetched entrants)
+# =============================================
+async def claim_startgg_roster_sync(
+    slug: str, min_interval_seconds: float
+) -> Optional[Dict[str, Any]]:
+    """
+    Take the sync lease for slug if nobody took it in the last min_interval_seconds.
+
+    Returns the sync state {synced_at, full_synced_at, attendee_count} when
+    claimed (this worker should talk to Start.gg), else None.
+    """
+    pool = await _get_async_pool()
+    async with pool.connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(
+                """
+                INSERT INTO startgg_roster_sync AS s (tournament_slug, claimed_at)
+                VALUES (%s, now())
+                ON CONFLICT (tournament_slug) DO UPDATE
+                SET claimed_at = now()
+                WHERE s.claimed_at IS NULL
+                   OR s.claimed_at < now() - make_interval(secs => %s)
+                RETURNING synced_at, full_synced_at, attendee_count
+                """,
+                (slug, float(min_interval_seconds)),
+            )
+            row = await cur.fetchone()
+            if not row:
+                return None
+            columns = [desc[0] for desc in cur.description]
+    return _row_to_dict(columns, row)
+
+
+async def get_startgg_roster_state(slug: str) -> Optional[Dict[str, Any]]:
+    """Return {synced_at, full_synced_at, attendee_count} for slug, or None."""
+    pool = await _get_async_pool()
+    async with pool.connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(
+                """
+                SELECT synced_at, full_synced_at, attendee_count
+                FROM startgg_roster_sync
+                WHERE tournament_slug = %s
+                """,
+                (slug,),
+            )
+            row = await cur.fetchone()
+            if not row:
+                return None
+            columns = [desc[0] for desc in cur.description]
+    return _row_to_dict(columns, row)
+
+
+async def get_startgg_roster(slug: str) -> List[Dict[str, Any]]:
+    """Return all roster entries for slug: {participant_id, gamer_tag, email, user_name, events}."""
+    pool = await _get_async_pool()
+    async with pool.connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(
+                """
+                SELECT participant_id, gamer_tag, email, user_name, events
+                FROM startgg_roster
+                WHERE tournament_slug = %s
+                """,
+                (slug,),
+            )
+            rows = await cur.fetchall()
+            columns = [desc[0] for desc in cur.description]
+    entries = []
+    for row in rows:
+        entry = _row_to_dict(columns, row)
+        entry["events"] = _coerce_jsonb(entry.get("events")) or []
+        entries.append(entry)
+    return entries
+
+
+async def save_startgg_roster(
+    slug: str,
+    entries: List[Dict[str, Any]],
+    complete: bool = False,
+    attendee_count: Optional[int] = None,
+) -> Dict[str, int]:
+    """
+    Upsert roster entries for slug in one transaction; unchanged rows are not rewritten.
+
+    complete=True means entries is the full roster: participants missing from
+    it are deleted and the sync state is stamped (synced_at, full_synced_at,
+    attendee_count). Returns {"changed": n, "deleted": n}.
+    """
+    from psycopg.types.json import Json  # type: ignore
+
+    changed = 0
+    deleted = 0
+    pool = await _get_async_pool()
+    async with pool.connection() as conn:
+        async with conn.transaction():
+            async with conn.cursor() as cur:
+                for entry in entries:
+                    gamer_tag = (entry.get("gamer_tag") or "").strip()
+                    if not entry.get("participant_id") or not gamer_tag:
+                        continue
+                    await cur.execute(
+                        """
+                        INSERT INTO startgg_roster AS r (
+                            tournament_slug, participant_id, gamer_tag, tag_key,
+                            email, user_name, events, updated_at
+                        )
+                        VALUES (%s, %s, %s, %s, %s, %s, %s, now())
+                        ON CONFLICT (tournament_slug, participant_id) DO UPDATE
+                        SET gamer_tag = EXCLUDED.gamer_tag,
+                            tag_key = EXCLUDED.tag_key,
+                            email = EXCLUDED.email,
+                            user_name = EXCLUDED.user_name,
+                            events = EXCLUDED.events,
+                            updated_at = now()
+                        WHERE (r.gamer_tag, r.email, r.user_name, r.events)
+                              IS DISTINCT FROM
+                              (EXCLUDED.gamer_tag, EXCLUDED.email, EXCLUDED.user_name, EXCLUDED.events)
+                        """,
+                        (
+                            slug,
+                            str(entry["participant_id"]),
+                            gamer_tag,
+                            gamer_tag.casefold(),
+                            entry.get("email") or None,
+                            entry.get("user_name") or None,
+                            Json(list(entry.get("events") or [])),
+                        ),
+                    )
+                    changed += cur.rowcount
+
+                if complete:
+                    keep_ids = [
+                        str(e["participant_id"]) for e in entries if e.get("participant_id")
+                    ]
+                    await cur.execute(
+                        """
+                        DELETE FROM startgg_roster
+                        WHERE tournament_slug = %s AND NOT (participant_id = ANY(%s))
+                        """,
+                        (slug, keep_ids),
+                    )
+                    deleted = cur.rowcount
+                    await cur.execute(
+                        """
+                        INSERT INTO startgg_roster_sync AS s (
+                            tournament_slug, synced_at, full_synced_at, attendee_count
+                        )
+                        VALUES (%s, now(), now(), %s)
+                        ON CONFLICT (tournament_slug) DO UPDATE
+                        SET synced_at = now(), full_synced_at = now(),
+                            attendee_count = COALESCE(EXCLUDED.attendee_count, s.attendee_count)
+                        """,
+                        (slug, attendee_count),
+                    )
+    return {"changed": changed, "deleted": deleted}
+
+
+async def apply_startgg_results(
+    results: List[Dict[str, Any]],
+    requirements: Dict[str, bool],
+    per_game: float = 0,
+) -> int:
+    """
+    Apply many Start.gg check results in one transaction (bulk recheck).
+
+    Each result is {record_id, registered, events, email}. Sets startgg /
+    is_guest / tournament_games_registered / email, recomputes status from
+    requirements (READY formula) and payment_expected (events * per_game),
+    and writes one integration_result audit row per check-in.
+    Returns the number of check-ins updated.
+    """
+    if not results:
+        return 0
+
+    from psycopg.types.json import Jsonb  # type: ignore
+
+    rows = [
+        {
+            "record_id": r["record_id"],
+            "registered": bool(r.get("registered")),
+            "events": r.get("events") if isinstance(r.get("events"), list) else None,
+            "email": r.get("email") or None,
+        }
+        for r in results
+        if r.get("record_id")
+    ]
+    pool = await _get_async_pool()
+    async with pool.connection() as conn:
+        # Outside the transaction, so registered aliases persist even on rollback
+        async with conn.cursor() as cur:
+            await _register_game_names((name for r in rows for name in (r["events"] or [])), cur)
+        async with conn.transaction():
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    """
+                    UPDATE active_event_data a
+                    SET startgg = r.registered,
+                        is_guest = NOT r.registered,
+                        tournament_games_registered = CASE
+                            WHEN r.events IS NULL THEN a.tournament_games_registered
+                            ELSE ARRAY(SELECT jsonb_array_elements_text(r.events))
+                        END,
+                        email = COALESCE(r.email, a.email),
+                        status = CASE
+                            WHEN (NOT %(require_payment)s OR COALESCE(a.payment_valid, false))
+                             AND (NOT %(require_membership)s OR COALESCE(a.member, false))
+                             AND (NOT %(require_startgg)s OR r.registered)
+                            THEN 'Ready' ELSE 'Pending'
+                        END,
+                        payment_expected = CASE
+                            WHEN %(per_game)s > 0 AND r.events IS NOT NULL
+                            THEN jsonb_array_length(r.events) * %(per_game)s
+                            ELSE a.payment_expected
+                        END
+                    FROM jsonb_to_recordset(%(rows)s)
+                         AS r(record_id TEXT, registered BOOLEAN, events JSONB, email TEXT)
+                    WHERE a.record_id = r.record_id
+                    """,
+                    {
+                        "rows": Jsonb(rows),
+                        "require_payment": bool(requirements.get("require_payment")),
+                        "require_membership": bool(requirements.get("require_membership")),
+                        "require_startgg": bool(requirements.get("require_startgg")),
+                        "per_game": float(per_game or 0),
+                    },
+                )
+                updated = cur.rowcount
+                await cur.execute(
+                    """
+                    INSERT INTO audit_log (
+                        timestamp, user_id, user_name, user_email, action,
+                        target_table, target_event, target_record, details
+                    )
+                    SELECT now(), 'integration', 'bulk:startgg', '', 'integration_result',
+                           'active_event_data', a.event_slug, a.record_id,
+                           json_build_object('source', 'startgg', 'ok', r.registered,
+                                             'data', json_build_object('registered', r.registered,
+                                                                       'events', r.events,
+                                                                       'email', r.email))::text
+                    FROM jsonb_to_recordset(%s)
+                         AS r(record_id TEXT, registered BOOLEAN, events JSONB, email TEXT)
+                    JOIN active_event_data a ON a.record_id = r.record_id
+                    """,
+                    (Jsonb(rows),),
+                )
+    return updated
+
+
+async def touch_startgg_roster(slug: str) -> None:
+    """Mark the stored roster for slug as current without a full sync."""
+    pool = await _get_async_pool()
+    async with pool.connection() as conn:
+        await conn.execute(
+            "UPDATE startgg_roster_sync SET synced_at = now() WHERE tournament_slug = %s",
+            (slug,),
+        )
+
+
+# =============================================
+# Players / Event history
+# =============================================
+async def get_players() -> List[Dict[str, Any]]:
+    """Return all player profiles."""
+    pool = await _get_async_pool()
+    async with pool.connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(
+                """
+                SELECT uuid, name, email, tag, telephone, created_at
+                FROM players
+                ORDER BY created_at DESC NULLS LAST
+                """
+            )
+            rows = await cur.fetchall()
+
+    result = []
+    for uuid_val, name, email, tag, telephone, created_at in rows:
+        result.append(
+            {
+                "id": uuid_val,
+                "name": name,
+                "email": email,
+                "tag": tag,
+                "telephone": telephone,
+                "created": created_at.isoformat() if created_at else None,
+            }
+        )
+
+    logger.info(f"👥 Retrieved {len(result)} players.")
+    return result
+
+
+async def get_event_history() -> List[Dict[str, Any]]:
+    """Return archived event rows."""
+    pool = await _get_async_pool()
+    async with pool.connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(
+                """
+                SELECT event_slug, event_date, event_display_name, archived_at,
+                       total_participants, total_revenue, avg_payment
+                FROM event_stats
+                ORDER BY archived_at DESC NULLS LAST
+                """
+            )
+            rows = await cur.fetchall()
+
+    result = []
+    for (
+        event_slug,
+        event_date,
+        event_display_name,
+        archived_at,
+        total_participants,
+        total_revenue,
+        avg_payment,
+    ) in rows:
+        result.append(
+            {
+                "event_slug": event_slug,
+                "event_date": event_date.isoformat() if event_date else None,
+                "event_display_name": event_display_name,
+                "participants": total_participants,
+                "total_participants": total_participants,
+                "total_revenue": total_revenue,
+                "avg_payment": avg_payment,
+                "created": archived_at.isoformat() if archived_at else None,
+                "archived_at": archived_at.isoformat() if archived_at else None,
+                "status": None,
+            }
+        )
+
+    logger.info(f"📦 Retrieved {len(result)} historical rows.")
+    return result
+
+
+# =============================================
+# Audit Log
+# =============================================
+async def log_action(
+    user: Dict[str, Any],
+    action: str,
+    target_table: str,
+    *,
+    target_event: str = "",
+    target_record: str = "",
+    target_player: str = "",
+    reason: str = "",
+    details: str = "",
+    before_state: str = "",
+    after_state: str = "",
+    durable: bool = False,
+) -> Optional[str]:
+    """
+    Write an entry to the audit log.
+
+    Queued for the shared write-behind writer (postgres_api) unless
+    durable=True or the queue is full. Returns the record ID for inline
+    writes, None when queued or on failure.
+    """
+    fields = _audit_fields(
+        user,
+        action,
+        target_table,
+        target_event=target_event,
+        target_record=target_record,
+        target_player=target_player,
+        reason=reason,
+        details=details,
+        before_state=before_state,
+        after_state=after_state,
+    )
+    user_name = (user or {}).get("user_name", "?")
+
+    if not durable and _enqueue_audit_entry(fields):
+        logger.info(f"📋 Audit (queued): {user_name} -> {action} on {target_table}")
+        return None
+
+    sql, values = _audit_insert_sql(fields)
+    pool = await _get_async_pool()
+    async with pool.connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(sql, values)
+            row = await cur.fetchone()
+
+    if row:
+        logger.info(f"📋 Audit: {user_name} -> {action} on {target_table}")
+        return str(row[0])
+
+    logger.error(f"❌ Failed to write audit log: {action}")
+    return None
+
+
+# =============================================
+# Notifications (LISTEN/NOTIFY)
+# Cross-process pub/sub, e.g. SSE fan-out between uvicorn workers.
+# =============================================
+# Postgres rejects NOTIFY payloads of 8000 bytes or more
+NOTIFY_PAYLOAD_LIMIT = 7900
+
+
+async def publish_notification(channel: str, payload: str) -> bool:
+    """Send payload on channel via pg_notify. Returns False if it could not be sent."""
+    if len(payload.encode("utf-8")) > NOTIFY_PAYLOAD_LIMIT:
+        logger.warning(f"⚠️ NOTIFY payload too large for '{channel}' ({len(payload)} chars)")
+        return False
+    try:
+        pool = await _get_async_pool()
+        async with pool.connection() as conn:
+            await conn.execute("SELECT pg_notify(%s, %s)", (channel, payload))
+        return True
+    except Exception as e:
+        logger.warning(f"⚠️ NOTIFY on '{channel}' failed: {e}")
+        return False
+
+
+async def listen_notifications(
+    channel: str,
+    on_message: Callable[[str], Awaitable[None]],
+    ready: Optional[asyncio.Event] = None,
+    on_connect: Optional[Callable[[], Awaitable[None]]] = None,
+) -> None:
+    """
+    Hold one dedicated LISTEN connection on channel and await on_message(payload)
+    for every notification. Reconnects with backoff; runs until cancelled.
+
+    `ready` is set while the connection is listening and cleared when it drops.
+    `on_connect` is awaited after every (re)connect - notifications sent while
+    disconnected are lost, so callers can resync there.
+    """
+    import psycopg  # type: ignore
+
+    backoff = 1
+    while True:
+        try:
+            await _get_async_pool()  # make sure migrations have run
+            async with await psycopg.AsyncConnection.connect(
+                DATABASE_URL, autocommit=True, keepalives=1, keepalives_idle=30
+            ) as conn:
+                await conn.execute(f"LISTEN {channel}")
+                if ready is not None:
+                    ready.set()
+                logger.info(f"👂 Listening on '{channel}'")
+                backoff = 1
+                if on_connect is not None:
+                    await on_connect()
+                async for notify in conn.notifies():
+                    try:
+                        await on_message(notify.payload)
+                    except Exception as e:
+                        logger.warning(f"⚠️ Handler for '{channel}' failed: {e}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"⚠️ LISTEN '{channel}' disconnected: {e}")
+        finally:
+            if ready is not None:
+                ready.clear()
+        await asyncio.sleep(backoff)
+        backoff = min(backoff * 2, 30)
+
+
+# =============================================
+# Offloaded to the sync implementation (worker thread)
+# Long multi-statement transactions and dashboard-only reads.
+# =============================================
+get_checkins_page = _offload(_sync.get_checkins_page)
+get_checkins_summary = _offload(_sync.get_checkins_summary)
+get_checkin_games = _offload(_sync.get_checkin_games)
+find_duplicate_checkins = _offload(_sync.find_duplicate_checkins)
+get_event_history_dashboard = _offload(_sync.get_event_history_dashboard)
+get_event_manual_add_stats = _offload(_sync.get_event_manual_add_stats)
+get_added_via_breakdown = _offload(_sync.get_added_via_breakdown)
+get_multi_game_count = _offload(_sync.get_multi_game_count)
+get_community_health_v2_stats = _offload(_sync.get_community_health_v2_stats)
+get_player_funnel_stats = _offload(_sync.get_player_funnel_stats)
+get_game_crossover_stats = _offload(_sync.get_game_crossover_stats)
+get_acquisition_source_breakdown = _offload(_sync.get_acquisition_source_breakdown)
+get_player_churn_stats = _offload(_sync.get_player_churn_stats)
+get_top_players_history = _offload(_sync.get_top_players_history)
+get_unique_attendee_count = _offload(_sync.get_unique_attendee_count)
+get_insights_bundle = _offload(_sync.get_insights_bundle)
+recompute_event_stats = _offload(_sync.recompute_event_stats)
+recompute_all_event_stats = _offload(_sync.recompute_all_event_stats)
+scan_event_stats_integrity = _offload(_sync.scan_event_stats_integrity)
+archive_event = _offload(_sync.archive_event)
+reopen_event = _offload(_sync.reopen_event)
+delete_archived_event = _offload(_sync.delete_archived_event)
+create_session = _offload(_sync.create_session)
+get_session = _offload(_sync.get_session)
+delete_session = _offload(_sync.delete_session)
+update_session_activity = _offload(_sync.update_session_activity)
+cleanup_expired_sessions = _offload(_sync.cleanup_expired_sessions)
+get_audit_log = _offload(_sync.get_audit_log)
+flush_audit_log = _offload(_sync.flush_audit_log)
+get_audit_log_filter_options = _offload(_sync.get_audit_log_filter_options)
+maintain_audit_log = _offload(_sync.maintain_audit_log)
+find_duplicate_candidates = _offload(_sync.find_duplicate_candidates)
+get_duplicate_candidates = _offload(_sync.get_duplicate_candidates)
+refresh_duplicate_candidates = _offload(_sync.refresh_duplicate_candidates)
+reject_duplicate_candidate = _offload(_sync.reject_duplicate_candidate)
+merge_players = _offload(_sync.merge_players)
+undo_merge = _offload(_sync.undo_merge)
+get_merge_history = _offload(_sync.get_merge_history)
@@ -0,0 +1,152 @@
+# conftest.py
+"""
+Shared test fixtures.
+
+`http_stand_in` runs a local JSON-over-HTTP server in a thread so tests of the
+Start.gg / eBas clients exercise the real httpx client, request bodies and
+response parsing against a per-test responder.
+
+`postgres_db` gives database tests a fresh schema (db/init.sql + startup
+migrations) in TEST_DATABASE_URL, a scratch database that is wiped per test:
+
+    TEST_DATABASE_URL=postgresql://postgres@localhost/fgc_test pytest tests/ -v
+
+Without TEST_DATABASE_URL those tests are skipped. shared.postgres_api needs a
+DATABASE_URL to import; a placeholder is set so its pure helpers can be tested
+without a server (the pool is only opened on first use).
+"""
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+# Add repo root to path (shared.*)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+if TEST_DATABASE_URL:
+    os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+else:
+    os.environ.setdefault("DATABASE_URL", "postgresql://localhost/fgc_test")
+
+INIT_SQL = os.path.join(os.path.dirname(__file__), '..', 'db', 'init.sql')
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Records each POST and answers with server.respond(server, path, body)."""
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)))
+        self.server.requests.append(
+            {"path": self.path, "headers": dict(self.headers), "body": body}
+        )
+
+        status, payload = self.server.respond(self.server, self.path, body)
+        if payload is None:
+            self.send_response(status)
+            self.end_headers()
+            return
+
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def http_stand_in():
+    """
+    Factory fixture: http_stand_in(respond) starts a server and returns it.
+
+    respond(server, path, body) returns (status, payload); payload None sends an
+    empty body. The server exposes `requests` (recorded POSTs) and `base_url`;
+    tests may hang their own state on it. Servers are shut down on teardown.
+    """
+    servers = []
+
+    def start(respond):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+        server.respond = respond
+        server.requests = []
+        server.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        thread = threading.Thread(
+            target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        thread.start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def _init_sql(conn) -> str:
+    """db/init.sql without the extensions this server does not ship (e.g. pg_trgm)."""
+    cur = conn.execute("SELECT name FROM pg_available_extensions")
+    available = {row[0] for row in cur.fetchall()}
+    lines = []
+    for line in open(INIT_SQL, encoding="utf-8"):
+        if "_trgm" in line and "pg_trgm" not in available:
+            continue
+        if "pgcrypto" in line and "pgcrypto" not in available:
+            continue
+        lines.append(line)
+    return "".join(lines)
+
+
+def _reset_storage(pg) -> None:
+    """Close the pool and forget per-process state cached from the old schema."""
+    pg.flush_audit_log()
+    if pg._pool is not None:
+        pg._pool.close()
+    pg._pool = None
+    pg._migrations_ran = False
+    pg._settings_cache_row = None
+    pg._session_cache.clear()
+    pg._session_activity_written.clear()
+    pg._known_game_aliases.clear()
+
+
+def _rebuild_schema(pg) -> None:
+    import psycopg  # type: ignore
+
+    _reset_storage(pg)
+    with psycopg.connect(TEST_DATABASE_URL, autocommit=True) as conn:
+        conn.execute("DROP SCHEMA public CASCADE")
+        conn.execute("CREATE SCHEMA public")
+        conn.execute(_init_sql(conn))
+
+
+@pytest.fixture
+def postgres_db():
+    """
+    Fresh schema in TEST_DATABASE_URL; yields shared.postgres_api.
+
+    The module's pool is reopened per test, so the startup migrations run
+    against the new schema on first use, like on a deploy.
+    """
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL not set")
+    pytest.importorskip("psycopg")
+    pytest.importorskip("psycopg_pool")
+    from shared import postgres_api as pg
+
+    _rebuild_schema(pg)
+    yield pg
+    _reset_storage(pg)
+
+
+@pytest.fixture
+def postgres_reset(postgres_db):
+    """Callable that starts over with a fresh schema within one test (A/B comparisons)."""
+    return lambda: _rebuild_schema(postgres_db)
@@ -0,0 +1,402 @@
+# test_async_checkin.py
+"""
+Tests for async check-in orchestration in backend/main.py: choosing the
+202 path (_wants_async_checkin), the background job (_run_checkin_job), the
+poll endpoint with its stale-job settle (_load_checkin_job) and the
+per-check-in SSE stream.
+
+Storage is an in-memory stand-in for the checkin_jobs functions and
+sse_manager records broadcasts and subscriptions; both write to one call log.
+
+Run with: pytest tests/test_async_checkin.py -v
+"""
+import asyncio
+import json
+import os
+import sys
+import types
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+BACKEND = os.path.join(os.path.dirname(__file__), '..', 'backend')
+sys.path.insert(0, BACKEND)
+
+from fastapi.testclient import TestClient  # noqa: E402
+from starlette.requests import Request  # noqa: E402
+
+EVENT = "weekly-1"
+CHECKIN_ID = "c-1"
+
+
+@pytest.fixture(scope="module")
+def main():
+    # main mounts static/ and templates/ relative to the working directory
+    cwd = os.getcwd()
+    os.chdir(BACKEND)
+    try:
+        import main
+    finally:
+        os.chdir(cwd)
+    return main
+
+
+# ============================================================================
+# Stand-ins
+# ============================================================================
+
+
+class _FakeStorage:
+    """checkin_jobs in a dict plus one check-in row written by the integrations."""
+
+    def __init__(self, log):
+        self.log = log
+        self.jobs = {}
+        self.status_updates = []
+        self.fields = {
+            "tag": "Viktor",
+            "name": "Viktor Ek",
+            "event_slug": EVENT,
+            "member": True,
+            "payment_valid": False,
+            "startgg": True,
+        }
+
+    async def begin_checkin(self, slug, fields):
+        return {"checkin_id": CHECKIN_ID, "created": True}
+
+    async def start_checkin_job(self, checkin_id):
+        self.jobs[checkin_id] = {
+            "checkin_id": checkin_id,
+            "state": "running",
+            "result": None,
+            "created_at": datetime.now(timezone.utc),
+        }
+
+    async def finish_checkin_job(self, checkin_id, state, result):
+        self.jobs[checkin_id].update(state=state, result=result)
+
+    async def settle_checkin_job(self, checkin_id, result):
+        # Same check-and-set as the conditional UPDATE
+        job = self.jobs[checkin_id]
+        if job["state"] != "running":
+            return False
+        job.update(state="done", result=result)
+        return True
+
+    async def get_checkin_job(self, checkin_id):
+        self.log.append("get_checkin_job")
+        job = self.jobs.get(checkin_id)
+        job = dict(job) if job else None
+        await asyncio.sleep(0)  # a query: concurrent polls interleave here
+        return job
+
+    async def get_checkin_by_record_id(self, record_id):
+        return {"record_id": record_id, "fields": dict(self.fields)}
+
+    async def get_active_settings(self):
+        return {"active_event_slug": EVENT, "require_membership": True, "require_payment": True}
+
+    async def update_checkin(self, record_id, fields):
+        self.status_updates.append((record_id, fields))
+        return True
+
+    def api(self):
+        """The storage_api module as main sees it (functions can be removed)."""
+        return types.SimpleNamespace(
+            **{
+                name: getattr(self, name)
+                for name in (
+                    "begin_checkin",
+                    "start_checkin_job",
+                    "finish_checkin_job",
+                    "settle_checkin_job",
+                    "get_checkin_job",
+                    "get_checkin_by_record_id",
+                )
+            }
+        )
+
+
+class _FakeSSE:
+    """Records broadcasts; on_watch(queue) runs when a check-in is subscribed."""
+
+    def __init__(self, log):
+        self.log = log
+        self.broadcasts = []
+        self.on_watch = None
+
+    async def broadcast(self, event, data):
+        self.broadcasts.append((event, data))
+
+    async def watch_checkin(self, checkin_id):
+        self.log.append("watch")
+        queue = asyncio.Queue()
+        if self.on_watch:
+            self.on_watch(queue)
+        return queue
+
+    async def unwatch_checkin(self, checkin_id, queue):
+        self.log.append("unwatch")
+
+
+@pytest.fixture
+def log():
+    return []
+
+
+@pytest.fixture
+def storage(main, monkeypatch, log):
+    storage = _FakeStorage(log)
+    monkeypatch.setattr(main, "storage_api", storage.api())
+    monkeypatch.setattr(main, "storage_get_active_settings", storage.get_active_settings)
+    monkeypatch.setattr(main, "update_checkin", storage.update_checkin)
+    return storage
+
+
+@pytest.fixture
+def sse(main, monkeypatch, log):
+    sse = _FakeSSE(log)
+    monkeypatch.setattr(main, "sse_manager", sse)
+    return sse
+
+
+@pytest.fixture
+def integrations(main, monkeypatch):
+    """Integrations stand-in; set .error to make them raise."""
+    runs = types.SimpleNamespace(calls=[], error=None)
+
+    async def run(checkin_id, tag, slug, personnummer, name):
+        runs.calls.append(checkin_id)
+        if runs.error:
+            raise runs.error
+
+    monkeypatch.setattr(main, "_run_checkin_integrations", run)
+    return runs
+
+
+@pytest.fixture
+def client(main, storage, sse, integrations):
+    return TestClient(main.app)
+
+
+def _request(query="", prefer=None):
+    headers = [(b"prefer", prefer.encode())] if prefer else []
+    return Request({"type": "http", "query_string": query.encode(), "headers": headers})
+
+
+def _events(broadcasts, event):
+    return [data for name, data in broadcasts if name == event]
+
+
+# ============================================================================
+# _wants_async_checkin / orchestrate
+# ============================================================================
+
+
+class TestWantsAsyncCheckin:
+
+    @pytest.mark.parametrize(
+        "query,prefer,mode,expected",
+        [
+            ("mode=async", None, "sync", True),
+            ("mode=sync", "respond-async", "async", False),
+            ("mode=ASYNC", None, "sync", True),
+            ("", "respond-async, wait=5", "sync", True),
+            ("", None, "async", True),
+            ("", None, "sync", False),
+            ("mode=later", None, "async", True),
+            ("mode=later", "respond-async", "sync", True),
+        ],
+    )
+    def test_query_then_prefer_header_then_setting(
+        self, main, monkeypatch, query, prefer, mode, expected
+    ):
+        monkeypatch.setattr(main, "CHECKIN_ORCHESTRATION_MODE", mode)
+
+        assert main._wants_async_checkin(_request(query, prefer)) is expected
+
+
+class TestOrchestrate:
+
+    BODY = {"namn": "Viktor Ek", "tag": "Viktor"}
+
+    def test_async_request_starts_a_job(self, main, client, storage, monkeypatch):
+        started = []
+
+        def run_job(*args):
+            started.append(args)
+            return asyncio.sleep(0)
+
+        monkeypatch.setattr(main, "_run_checkin_job", run_job)
+
+        response = client.post("/api/checkin/orchestrate?mode=async", json=self.BODY)
+
+        assert response.status_code == 202
+        assert response.json()["result_url"] == f"/api/checkin/{CHECKIN_ID}/result"
+        assert storage.jobs[CHECKIN_ID]["state"] == "running"
+        assert [args[:3] for args in started] == [(CHECKIN_ID, "Viktor", EVENT)]
+
+    @pytest.mark.parametrize(
+        "missing",
+        ["start_checkin_job", "finish_checkin_job", "settle_checkin_job", "get_checkin_job"],
+    )
+    def test_without_job_storage_runs_sync(self, main, client, storage, integrations, missing):
+        delattr(main.storage_api, missing)
+
+        response = client.post("/api/checkin/orchestrate?mode=async", json=self.BODY)
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "Pending"
+        assert integrations.calls == [CHECKIN_ID]
+        assert storage.jobs == {}
+        assert client.get(f"/api/checkin/{CHECKIN_ID}/result").status_code == 501
+
+
+# ============================================================================
+# _run_checkin_job
+# ============================================================================
+
+
+class TestRunCheckinJob:
+
+    def _run(self, main, storage):
+        async def run():
+            await storage.start_checkin_job(CHECKIN_ID)
+            await main._run_checkin_job(
+                CHECKIN_ID,
+                "Viktor",
+                EVENT,
+                "",
+                "Viktor Ek",
+                {
+                    "require_payment": True,
+                    "require_membership": True,
+                    "require_startgg": False,
+                },
+            )
+
+        asyncio.run(run())
+        return storage.jobs[CHECKIN_ID]
+
+    def test_done_job_stores_and_pushes_the_result(self, main, storage, sse, integrations):
+        job = self._run(main, storage)
+
+        assert job["state"] == "done"
+        assert job["result"]["status"] == "Pending"
+        assert job["result"]["missing"] == ["Payment"]
+        assert [e["status"] for e in _events(sse.broadcasts, "checkin")] == ["Pending"]
+        assert _events(sse.broadcasts, "checkin_result") == [{"state": "done", **job["result"]}]
+
+    def test_failed_job_stores_and_pushes_the_error(self, main, storage, sse, integrations):
+        integrations.error = RuntimeError("eBas down")
+
+        job = self._run(main, storage)
+
+        assert job["state"] == "failed"
+        assert job["result"] == {
+            "checkin_id": CHECKIN_ID,
+            "slug": EVENT,
+            "name": "Viktor Ek",
+            "tag": "Viktor",
+            "error": "eBas down",
+        }
+        assert _events(sse.broadcasts, "checkin") == []
+        assert _events(sse.broadcasts, "checkin_result") == [{"state": "failed", **job["result"]}]
+        assert storage.status_updates == []
+
+
+# ============================================================================
+# GET /api/checkin/{checkin_id}/result
+# ============================================================================
+
+
+class TestCheckinJobResult:
+
+    def test_running_job(self, client, storage):
+        asyncio.run(storage.start_checkin_job(CHECKIN_ID))
+
+        response = client.get(f"/api/checkin/{CHECKIN_ID}/result")
+
+        assert response.json() == {"checkin_id": CHECKIN_ID, "state": "running"}
+
+    def test_finished_job(self, client, storage):
+        asyncio.run(storage.start_checkin_job(CHECKIN_ID))
+        asyncio.run(storage.finish_checkin_job(CHECKIN_ID, "done", {"status": "Ready"}))
+
+        response = client.get(f"/api/checkin/{CHECKIN_ID}/result")
+
+        assert response.json() == {"checkin_id": CHECKIN_ID, "state": "done", "status": "Ready"}
+
+    def test_unknown_checkin_id(self, client, storage):
+        assert client.get("/api/checkin/unknown/result").status_code == 404
+
+    def test_stale_job_is_settled_by_one_poll(self, main, storage, sse):
+        asyncio.run(storage.start_checkin_job(CHECKIN_ID))
+        storage.jobs[CHECKIN_ID]["created_at"] -= timedelta(hours=1)
+
+        async def two_polls():
+            return await asyncio.gather(
+                main.checkin_job_result(CHECKIN_ID), main.checkin_job_result(CHECKIN_ID)
+            )
+
+        first, second = asyncio.run(two_polls())
+
+        assert first == second
+        assert (first["state"], first["status"], first["tag"]) == ("done", "Pending", "Viktor")
+        assert len(_events(sse.broadcasts, "checkin")) == 1
+        assert storage.jobs[CHECKIN_ID]["result"]["missing"] == ["Payment"]
+
+    def test_recent_running_job_is_left_alone(self, main, storage, sse):
+        asyncio.run(storage.start_checkin_job(CHECKIN_ID))
+        storage.jobs[CHECKIN_ID]["created_at"] -= timedelta(
+            seconds=main.EBAS_REGISTER_TIMEOUT_SECONDS
+        )
+
+        assert asyncio.run(main.checkin_job_result(CHECKIN_ID))["state"] == "running"
+        assert sse.broadcasts == []
+
+
+# ============================================================================
+# GET /api/checkin/{checkin_id}/events
+# ============================================================================
+
+
+class TestCheckinJobEvents:
+
+    def _result(self, response):
+        assert response.status_code == 200
+        event, data = response.text.strip().split("\n")
+        assert event == "event: result"
+        return json.loads(data.removeprefix("data: "))
+
+    def test_result_published_before_subscribing_is_not_missed(self, client, storage, sse, log):
+        asyncio.run(storage.start_checkin_job(CHECKIN_ID))
+
+        def finish_before_subscribed(queue):
+            # The job's checkin_result went out just before this stream subscribed
+            storage.jobs[CHECKIN_ID].update(state="done", result={"status": "Ready"})
+
+        sse.on_watch = finish_before_subscribed
+
+        response = client.get(f"/api/checkin/{CHECKIN_ID}/events")
+
+        assert self._result(response) == {
+            "checkin_id": CHECKIN_ID,
+            "state": "done",
+            "status": "Ready",
+        }
+        assert log == ["get_checkin_job", "watch", "get_checkin_job", "unwatch"]
+
+    def test_result_pushed_while_waiting(self, client, storage, sse):
+        asyncio.run(storage.start_checkin_job(CHECKIN_ID))
+        pushed = {"checkin_id": CHECKIN_ID, "state": "failed", "error": "eBas down"}
+        sse.on_watch = lambda queue: queue.put_nowait(pushed)
+
+        response = client.get(f"/api/checkin/{CHECKIN_ID}/events")
+
+        assert self._result(response) == pushed
+
+    def test_unknown_checkin_id(self, client, storage, sse, log):
+        assert client.get("/api/checkin/unknown/events").status_code == 404
+        assert "watch" not in log
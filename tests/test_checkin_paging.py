@@ -0,0 +1,574 @@
+# test_checkin_paging.py
+"""
+Tests for the server-side check-ins table: the SQL filter/sort builders in
+shared/postgres_api.py (_like_pattern, _checkin_filter_sql,
+_checkin_order_sql, get_checkins_page), the dashboard filter mapping
+(callbacks.checkin_filters), the in-memory fallback used by storage
+backends without paging (Airtable), which must return what the SQL returns,
+and the SSE delta patching of the table page (callbacks.apply_checkin_delta).
+
+The database tests need a scratch database (see conftest.py) and are
+skipped without one.
+
+Run with: TEST_DATABASE_URL=postgresql://... pytest tests/test_checkin_paging.py -v
+"""
+import itertools
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from dash import no_update
+
+from fgt_dashboard import callbacks
+from shared import postgres_api as pg
+
+EVENT = "weekly-1"
+
+REQUIRE_PAYMENT = {"require_payment": True}
+
+
+def _ids(rows):
+    return [r["record_id"] for r in rows]
+
+
+# ============================================================================
+# SQL builders
+# ============================================================================
+
+
+class TestLikePattern:
+
+    @pytest.mark.parametrize(
+        "text,pattern",
+        [
+            ("viktor", "%viktor%"),
+            ("100%", "%100\\%%"),
+            ("a_b", "%a\\_b%"),
+            ("back\\slash", "%back\\\\slash%"),
+        ],
+    )
+    def test_wildcards_are_literal(self, text, pattern):
+        assert pg._like_pattern(text) == pattern
+
+
+class TestCheckinFilterSql:
+
+    def test_no_filters(self):
+        assert pg._checkin_filter_sql() == ("TRUE", [])
+        assert pg._checkin_filter_sql(search="   ", missing=[]) == ("TRUE", [])
+
+    def test_search_matches_name_or_tag(self):
+        sql, params = pg._checkin_filter_sql(search="  Vik_ ")
+
+        assert sql == "(name ILIKE %s OR tag ILIKE %s)"
+        assert params == ["%Vik\\_%", "%Vik\\_%"]
+
+    def test_unpaid_includes_null(self):
+        assert pg._checkin_filter_sql(payment_valid=False) == ("payment_valid IS NOT TRUE", [])
+        assert pg._checkin_filter_sql(payment_valid=True) == ("payment_valid IS TRUE", [])
+
+    def test_game_is_canonicalized(self):
+        sql, params = pg._checkin_filter_sql(game="tekken 8")
+
+        assert "tournament_game_ids @>" in sql
+        assert params == [pg.canonical_game_name("tekken 8")]
+
+    def test_missing_only_accepts_requirement_columns(self):
+        sql, params = pg._checkin_filter_sql(missing=["member", "name; DROP TABLE x", "startgg"])
+
+        assert sql == "(member IS NOT TRUE OR startgg IS NOT TRUE)"
+        assert params == []
+
+    def test_filters_are_combined(self):
+        sql, params = pg._checkin_filter_sql(search="a", status="Ready", payment_valid=False)
+
+        assert (
+            sql == "(name ILIKE %s OR tag ILIKE %s) AND status = %s AND payment_valid IS NOT TRUE"
+        )
+        assert params == ["%a%", "%a%", "Ready"]
+
+
+class TestCheckinOrderSql:
+
+    def test_default_is_newest_first(self):
+        assert pg._checkin_order_sql(None) == "created DESC, id DESC"
+
+    def test_whitelisted_columns_and_direction(self):
+        order = pg._checkin_order_sql(
+            [
+                {"column_id": "name", "direction": "desc"},
+                {"column_id": "member", "direction": "asc"},
+            ]
+        )
+
+        assert order == "LOWER(name) DESC NULLS LAST, member ASC NULLS LAST, created DESC, id DESC"
+
+    def test_unknown_columns_are_ignored(self):
+        order = pg._checkin_order_sql(
+            [{"column_id": "name); DROP TABLE players; --", "direction": "asc"}, None, {}]
+        )
+
+        assert order == "created DESC, id DESC"
+
+    def test_uuid_column_maps_to_checkin_uuid(self):
+        assert pg._checkin_order_sql([{"column_id": "UUID"}]).startswith("checkin_uuid ASC")
+
+
+# ============================================================================
+# Dashboard filter mapping
+# ============================================================================
+
+
+class TestCheckinFilters:
+
+    def test_empty(self):
+        assert callbacks.checkin_filters(None, None, None, None) == {}
+        assert callbacks.checkin_filters("all", "  ", "", {}) == {}
+
+    def test_search_and_game(self):
+        assert callbacks.checkin_filters("all", " viktor ", "Tekken 8", {}) == {
+            "search": "viktor",
+            "game": "Tekken 8",
+        }
+
+    @pytest.mark.parametrize("quick,status", [("pending", "Pending"), ("ready", "Ready")])
+    def test_status_quick_filters(self, quick, status):
+        assert callbacks.checkin_filters(quick, "", None, {}) == {"status": status}
+
+    def test_no_payment_only_while_payment_is_required(self):
+        assert callbacks.checkin_filters("no-payment", "", None, REQUIRE_PAYMENT) == {
+            "payment_valid": False
+        }
+        assert callbacks.checkin_filters("no-payment", "", None, {"require_payment": False}) == {}
+        assert callbacks.checkin_filters("no-payment", "", None, None) == {}
+
+
+# ============================================================================
+# In-memory fallback (storage without get_checkins_page)
+# ============================================================================
+
+
+ROWS = [
+    {
+        "record_id": "r1",
+        "name": "Viktor",
+        "tag": "Logisticuz",
+        "status": "Ready",
+        "payment_valid": True,
+        "member": True,
+        "tournament_games_registered": ["Tekken 8"],
+    },
+    {
+        "record_id": "r2",
+        "name": "Anna",
+        "tag": "100%",
+        "status": "Pending",
+        "payment_valid": None,
+        "member": False,
+        "tournament_games_registered": "Street Fighter 6",
+    },
+    {
+        "record_id": "r3",
+        "name": "Olle",
+        "tag": None,
+        "status": "Pending",
+        "payment_valid": "false",
+        "member": "true",
+        "tournament_games_registered": ["tekken 8", "Street Fighter 6"],
+    },
+]
+
+
+@pytest.fixture
+def airtable_like(monkeypatch):
+    """callbacks against a storage backend with only get_checkins (newest first)."""
+    for name in ("get_checkins_page", "get_checkins_summary"):
+        monkeypatch.delattr(callbacks.storage_api, name, raising=False)
+    monkeypatch.setattr(callbacks, "get_checkins", lambda slug, include_all=False: list(ROWS))
+
+
+class TestInMemoryFallback:
+
+    def test_search_is_literal_substring(self):
+        assert _ids(callbacks._filter_checkins_in_memory(ROWS, search="OG")) == ["r1"]
+        assert _ids(callbacks._filter_checkins_in_memory(ROWS, search="100%")) == ["r2"]
+        assert _ids(callbacks._filter_checkins_in_memory(ROWS, search="%")) == ["r2"]
+
+    def test_unpaid_includes_missing_values(self):
+        assert _ids(callbacks._filter_checkins_in_memory(ROWS, payment_valid=False)) == [
+            "r2",
+            "r3",
+        ]
+
+    def test_game_matches_canonical_names(self):
+        assert _ids(callbacks._filter_checkins_in_memory(ROWS, game="TEKKEN 8")) == ["r1", "r3"]
+        assert _ids(callbacks._filter_checkins_in_memory(ROWS, game="street fighter 6")) == [
+            "r2",
+            "r3",
+        ]
+
+    def test_missing_requirements(self):
+        assert _ids(callbacks._filter_checkins_in_memory(ROWS, missing=["member"])) == ["r2"]
+        assert _ids(
+            callbacks._filter_checkins_in_memory(ROWS, missing=["member", "payment_valid"])
+        ) == ["r2", "r3"]
+
+    def test_sort_puts_missing_values_last(self):
+        rows = callbacks._sort_checkins_in_memory(ROWS, [{"column_id": "tag", "direction": "desc"}])
+        assert _ids(rows) == ["r1", "r2", "r3"]
+        rows = callbacks._sort_checkins_in_memory(ROWS, [{"column_id": "tag", "direction": "asc"}])
+        assert _ids(rows) == ["r2", "r1", "r3"]
+
+    def test_load_checkins_page(self, airtable_like):
+        page = callbacks.load_checkins_page(
+            EVENT, {"status": "Pending"}, [{"column_id": "name", "direction": "asc"}], 0, 1
+        )
+
+        assert page["total"] == 2
+        assert _ids(page["rows"]) == ["r2"]
+        page = callbacks.load_checkins_page(EVENT, {"status": "Pending"}, None, 5, 1)
+        assert page == {"rows": [], "total": 2}
+
+    def test_load_checkins_summary(self, airtable_like):
+        summary = callbacks.load_checkins_summary(EVENT, {"game": "Tekken 8"}, REQUIRE_PAYMENT)
+
+        assert {k: summary[k] for k in ("total", "filtered", "ready", "pending", "attention")} == {
+            "total": 3,
+            "filtered": 2,
+            "ready": 1,
+            "pending": 1,
+            "attention": 1,
+        }
+        assert [r["record_id"] for r in summary["attention_rows"]] == ["r3"]
+
+
+# ============================================================================
+# SSE delta patching (callbacks.apply_checkin_delta)
+# ============================================================================
+
+
+class _CallbackApp:
+    """Stands in for the Dash app: keeps the registered callbacks by name."""
+
+    def __init__(self):
+        self.callbacks = {}
+
+    def callback(self, *args, **kwargs):
+        def register(fn):
+            self.callbacks[fn.__name__] = fn
+            return fn
+
+        return register
+
+    def clientside_callback(self, *args, **kwargs):
+        pass
+
+
+@pytest.fixture(scope="module")
+def apply_checkin_delta():
+    app = _CallbackApp()
+    callbacks.register_callbacks(app)
+    return app.callbacks["apply_checkin_delta"]
+
+
+def _table_row(record_id, tag, row_version=1):
+    return {
+        "record_id": record_id,
+        "row_version": row_version,
+        "name": tag.title(),
+        "tag": tag,
+        "member": "✗",
+        "status": "Pending",
+    }
+
+
+def _delta_row(record_id, tag, row_version=2, event_slug=EVENT, member=True):
+    return {
+        "record_id": record_id,
+        "row_version": row_version,
+        "event_slug": event_slug,
+        "name": tag.title(),
+        "tag": tag,
+        "member": member,
+        "status": "Ready",
+    }
+
+
+def _assigned(patch):
+    """{row index: new row} of a Patch of the table data."""
+    return {
+        op["location"][0]: op["params"]["value"]
+        for op in patch.to_plotly_json()["operations"]
+        if op["operation"] == "Assign"
+    }
+
+
+class TestApplyCheckinDelta:
+
+    TABLE = [_table_row("r1", "viktor"), _table_row("r2", "anna")]
+    COLUMNS = ["name", "tag", "member", "status"]
+
+    def _apply(
+        self,
+        fn,
+        deltas,
+        applied=None,
+        stream="w1",
+        since=0,
+        active_filter="all",
+        search="",
+        sort_by=None,
+        slug=EVENT,
+    ):
+        batch = {"stream": stream, "since": since, "deltas": deltas}
+        return fn(
+            batch,
+            applied,
+            [dict(row) for row in self.TABLE],
+            3,
+            slug,
+            self.COLUMNS,
+            active_filter,
+            search,
+            None,
+            {"require_membership": True},
+            sort_by,
+        )
+
+    def test_update_on_the_page_is_patched_in_place(self, apply_checkin_delta):
+        deltas = [{"seq": 1, "op": "update", "rows": [_delta_row("r2", "anna")]}]
+
+        patch, applied, trigger = self._apply(apply_checkin_delta, deltas)
+
+        assert _assigned(patch) == {
+            1: {
+                "record_id": "r2",
+                "row_version": 2,
+                "name": "Anna",
+                "tag": "anna",
+                "member": "✓",
+                "status": "Ready",
+            }
+        }
+        assert applied == {"stream": "w1", "seq": 1}
+        assert trigger is no_update
+
+    def test_older_row_version_is_not_applied(self, apply_checkin_delta):
+        deltas = [{"seq": 1, "op": "update", "rows": [_delta_row("r1", "viktor", row_version=1)]}]
+
+        patch, applied, trigger = self._apply(apply_checkin_delta, deltas)
+
+        assert _assigned(patch) == {}
+        assert trigger is no_update
+
+    def test_already_applied_deltas_are_skipped(self, apply_checkin_delta):
+        deltas = [{"seq": 1, "op": "update", "rows": [_delta_row("r1", "viktor")]}]
+
+        result = self._apply(apply_checkin_delta, deltas, applied={"stream": "w1", "seq": 1})
+
+        assert result == (no_update, no_update, no_update)
+
+    def test_rows_elsewhere_only_advance_the_seq(self, apply_checkin_delta):
+        deltas = [
+            {"seq": 1, "op": "update", "rows": [_delta_row("r9", "other page")]},
+            {"seq": 2, "op": "insert", "rows": [_delta_row("r8", "x", event_slug="weekly-2")]},
+        ]
+
+        result = self._apply(apply_checkin_delta, deltas)
+
+        assert result == (no_update, {"stream": "w1", "seq": 2}, no_update)
+
+    @pytest.mark.parametrize("op", ["insert", "delete"])
+    def test_insert_or_delete_reloads_the_page(self, apply_checkin_delta, op):
+        deltas = [{"seq": 1, "op": op, "rows": [_delta_row("r3", "new")]}]
+
+        assert self._apply(apply_checkin_delta, deltas) == (
+            no_update,
+            {"stream": "w1", "seq": 1},
+            4,
+        )
+
+    @pytest.mark.parametrize(
+        "view",
+        [
+            {"search": "vik"},
+            {"active_filter": "pending"},
+            {"sort_by": [{"column_id": "tag", "direction": "asc"}]},
+        ],
+    )
+    def test_filtered_or_sorted_view_reloads_the_page(self, apply_checkin_delta, view):
+        deltas = [{"seq": 1, "op": "update", "rows": [_delta_row("r1", "viktor")]}]
+
+        table, _, trigger = self._apply(apply_checkin_delta, deltas, **view)
+
+        assert (table, trigger) == (no_update, 4)
+
+    def test_seq_gap_reloads_the_page(self, apply_checkin_delta):
+        deltas = [{"seq": 3, "op": "update", "rows": [_delta_row("r1", "viktor")]}]
+
+        result = self._apply(apply_checkin_delta, deltas, applied={"stream": "w1", "seq": 1})
+
+        assert result == (no_update, {"stream": "w1", "seq": 3}, 4)
+
+    def test_new_stream_starts_at_its_handshake_seq(self, apply_checkin_delta):
+        # Reconnected to another worker: its stream was at seq 7 at the handshake
+        deltas = [{"seq": 8, "op": "update", "rows": [_delta_row("r1", "viktor")]}]
+
+        patch, applied, trigger = self._apply(
+            apply_checkin_delta, deltas, applied={"stream": "w1", "seq": 2}, stream="w2", since=7
+        )
+
+        assert list(_assigned(patch)) == [0]
+        assert (applied, trigger) == ({"stream": "w2", "seq": 8}, no_update)
+
+
+# ============================================================================
+# get_checkins_page against the database
+# ============================================================================
+
+
+def _insert_checkins(pg, rows):
+    """rows: dicts of active_event_data columns (event_slug defaults to EVENT)."""
+    pg._register_game_names(g for r in rows for g in r.get("tournament_games_registered") or [])
+    with pg._get_pool().connection() as conn:
+        for r in rows:
+            r = {"event_slug": EVENT, **r}
+            conn.execute(
+                f"INSERT INTO active_event_data ({', '.join(r)}) "
+                f"VALUES ({', '.join(['%s'] * len(r))})",
+                list(r.values()),
+            )
+
+
+class TestCheckinsPage:
+
+    START = datetime(2026, 10, 1, 18, 0, tzinfo=timezone.utc)
+
+    def _row(self, n, **fields):
+        row = {"record_id": f"r{n}", "created": self.START + timedelta(minutes=n)}
+        row.update(fields)
+        return row
+
+    def _page(self, pg, page=0, page_size=20, sort_by=None, **filters):
+        return pg.get_checkins_page(
+            EVENT, page=page, page_size=page_size, sort_by=sort_by, **filters
+        )
+
+    def test_search_escapes_like_wildcards(self, postgres_db):
+        pg = postgres_db
+        _insert_checkins(
+            pg,
+            [
+                self._row(1, name="Anna", tag="100%"),
+                self._row(2, name="Olle", tag="1000"),
+                self._row(3, name="Under_score", tag="x"),
+                self._row(4, name="Underscore", tag="y"),
+            ],
+        )
+
+        assert _ids(self._page(pg, search="100%")["rows"]) == ["r1"]
+        assert _ids(self._page(pg, search="under_")["rows"]) == ["r3"]
+
+    def test_unpaid_includes_null(self, postgres_db):
+        pg = postgres_db
+        _insert_checkins(
+            pg,
+            [
+                self._row(1, payment_valid=True),
+                self._row(2, payment_valid=False),
+                self._row(3, payment_valid=None),
+            ],
+        )
+
+        assert _ids(self._page(pg, payment_valid=False)["rows"]) == ["r3", "r2"]
+        assert _ids(self._page(pg, payment_valid=True)["rows"]) == ["r1"]
+
+    def test_game_containment(self, postgres_db):
+        pg = postgres_db
+        _insert_checkins(
+            pg,
+            [
+                self._row(1, tournament_games_registered=["Tekken 8"]),
+                self._row(2, tournament_games_registered=["tekken 8 ", "Street Fighter 6"]),
+                self._row(3, tournament_games_registered=["Street Fighter 6"]),
+                self._row(4, tournament_games_registered=None),
+            ],
+        )
+
+        assert _ids(self._page(pg, game="TEKKEN 8")["rows"]) == ["r2", "r1"]
+        assert self._page(pg, game="Unknown Game")["total"] == 0
+
+    def test_sort_whitelist_and_nulls_last(self, postgres_db):
+        pg = postgres_db
+        _insert_checkins(
+            pg,
+            [self._row(1, tag="b"), self._row(2, tag=None), self._row(3, tag="A")],
+        )
+
+        asc = self._page(pg, sort_by=[{"column_id": "tag", "direction": "asc"}])
+        desc = self._page(pg, sort_by=[{"column_id": "tag", "direction": "desc"}])
+        ignored = self._page(pg, sort_by=[{"column_id": "created; DROP TABLE x"}])
+
+        assert _ids(asc["rows"]) == ["r3", "r1", "r2"]
+        assert _ids(desc["rows"]) == ["r1", "r3", "r2"]
+        assert _ids(ignored["rows"]) == ["r3", "r2", "r1"]
+
+    def test_page_past_the_end_still_counts(self, postgres_db):
+        pg = postgres_db
+        _insert_checkins(pg, [self._row(n, status="Ready") for n in range(5)])
+
+        assert self._page(pg, page=2, page_size=2)["total"] == 5
+        assert len(self._page(pg, page=2, page_size=2)["rows"]) == 1
+        assert self._page(pg, page=9, page_size=2) == {"rows": [], "total": 5}
+        assert self._page(pg, page=9, page_size=2, status="Pending") == {"rows": [], "total": 0}
+
+    def test_matches_in_memory_fallback(self, postgres_db):
+        pg = postgres_db
+        rng = random.Random(5)
+        games = ["Tekken 8", "Street Fighter 6", "Mortal Kombat 1"]
+        rows = [
+            self._row(
+                n,
+                name=rng.choice(["anna", "olle", "viktor", "newbie"]) + str(n % 3),
+                tag=rng.choice([f"logisticuz{n}", f"100%{n}", f"a_b{n}", None]),
+                status=rng.choice(["Ready", "Pending"]),
+                member=rng.choice([True, False]),
+                payment_valid=rng.choice([True, False, None]),
+                tournament_games_registered=rng.sample(games, rng.randint(0, 2)),
+            )
+            for n in range(40)
+        ]
+        _insert_checkins(pg, rows)
+        all_rows = pg.get_checkins(EVENT)
+
+        filter_options = [
+            {},
+            {"search": "0"},
+            {"search": "100%"},
+            {"search": "a_"},
+            {"status": "Pending"},
+            {"payment_valid": False},
+            {"game": "tekken 8"},
+            {"missing": ["member", "payment_valid"]},
+            {"status": "Ready", "game": "Street Fighter 6", "payment_valid": False},
+        ]
+        sort_options = [
+            None,
+            [{"column_id": "name", "direction": "asc"}],
+            [{"column_id": "member", "direction": "desc"}],
+            [
+                {"column_id": "status", "direction": "asc"},
+                {"column_id": "name", "direction": "desc"},
+            ],
+        ]
+        for filters, sort_by in itertools.product(filter_options, sort_options):
+            expected = callbacks._sort_checkins_in_memory(
+                callbacks._filter_checkins_in_memory(all_rows, **filters), sort_by
+            )
+            for page in (0, 1):
+                result = self._page(pg, page, 7, sort_by, **filters)
+                assert result["total"] == len(expected), (filters, sort_by)
+                assert _ids(result["rows"]) == _ids(expected[page * 7 : page * 7 + 7]), (
+                    filters,
+                    sort_by,
+                )
@@ -0,0 +1,199 @@
+# test_duplicate_detection.py
+"""
+Tests for the duplicate-player blocking in shared/postgres_api.py: segment
+split (_segments), pigeonhole join (_segment_join via _similar_string_pairs)
+and the banded edit distance (_within_edit_distance), checked against a
+brute-force pairwise scan. Pure functions, no database needed.
+
+Run with: pytest tests/test_duplicate_detection.py -v
+"""
+import itertools
+import random
+
+import pytest
+
+from shared import postgres_api as pg
+
+
+def _levenshtein(s1, s2):
+    prev = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1, start=1):
+        curr = [i]
+        for j, c2 in enumerate(s2, start=1):
+            curr.append(min(prev[j] + 1, curr[j - 1] + 1, prev[j - 1] + (c1 != c2)))
+        prev = curr
+    return prev[-1]
+
+
+def _random_values(rng, count, alphabet="abc", max_length=8):
+    """Short strings over a small alphabet, so many pairs are within a few edits."""
+    values = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, max_length)))]
+    while len(values) < count:
+        if rng.random() < 0.5:
+            # A near copy of an earlier value
+            value = list(rng.choice(values))
+            for _ in range(rng.randint(1, 3)):
+                pos = rng.randint(0, len(value))
+                op = rng.choice("isd")
+                if op == "i":
+                    value.insert(pos, rng.choice(alphabet))
+                elif value and pos < len(value):
+                    if op == "s":
+                        value[pos] = rng.choice(alphabet)
+                    else:
+                        del value[pos]
+            values.append("".join(value))
+        else:
+            length = rng.randint(0, max_length)
+            values.append("".join(rng.choice(alphabet) for _ in range(length)))
+    return values
+
+
+def _true_pairs(values, max_distance, changed=None):
+    pairs = {
+        (i, j)
+        for i, j in itertools.combinations(range(len(values)), 2)
+        if values[i] and values[j] and _levenshtein(values[i], values[j]) <= max_distance
+    }
+    if changed is not None:
+        pairs = {(i, j) for i, j in pairs if i in changed or j in changed}
+    return pairs
+
+
+# ============================================================================
+# _segments
+# ============================================================================
+
+
+class TestSegments:
+
+    @pytest.mark.parametrize("length,parts", [(0, 1), (3, 3), (7, 3), (8, 3), (10, 4), (5, 1)])
+    def test_contiguous_near_equal_cover(self, length, parts):
+        segments = pg._segments(length, parts)
+
+        assert len(segments) == parts
+        assert segments[0][0] == 0
+        for (start, size), (next_start, _) in zip(segments, segments[1:]):
+            assert next_start == start + size
+        assert sum(size for _, size in segments) == length
+        sizes = [size for _, size in segments]
+        assert max(sizes) - min(sizes) <= 1
+        assert sizes == sorted(sizes)  # the longer segments come last
+
+    def test_examples(self):
+        assert pg._segments(7, 3) == [(0, 2), (2, 2), (4, 3)]
+        assert pg._segments(6, 3) == [(0, 2), (2, 2), (4, 2)]
+
+
+# ============================================================================
+# _within_edit_distance
+# ============================================================================
+
+
+class TestWithinEditDistance:
+
+    @pytest.mark.parametrize(
+        "s1,s2,max_distance,expected",
+        [
+            ("logisticuz", "logisticuz", 0, True),
+            ("logisticuz", "logistikuz", 1, True),
+            ("logisticuz", "logistcuz", 1, True),
+            ("logisticuz", "logisticus", 0, False),
+            ("abc", "", 2, False),
+            ("ab", "", 2, True),
+            ("", "", 0, True),
+            ("kitten", "sitting", 2, False),
+            ("kitten", "sitting", 3, True),
+        ],
+    )
+    def test_examples(self, s1, s2, max_distance, expected):
+        assert pg._within_edit_distance(s1, s2, max_distance) is expected
+        assert pg._within_edit_distance(s2, s1, max_distance) is expected
+
+    @pytest.mark.parametrize("max_distance", [0, 1, 2, 3])
+    def test_matches_levenshtein(self, max_distance):
+        rng = random.Random(max_distance)
+        values = _random_values(rng, 60)
+        for s1, s2 in itertools.combinations(values, 2):
+            expected = _levenshtein(s1, s2) <= max_distance
+            assert pg._within_edit_distance(s1, s2, max_distance) is expected, (s1, s2)
+
+
+# ============================================================================
+# _similar_string_pairs / _segment_join
+# ============================================================================
+
+
+class TestSimilarStringPairs:
+
+    @pytest.mark.parametrize("seed", range(5))
+    @pytest.mark.parametrize("max_distance", [1, 2, 3])
+    def test_finds_every_pair_within_distance(self, seed, max_distance):
+        rng = random.Random(seed * 10 + max_distance)
+        values = _random_values(rng, 80)
+
+        candidates = pg._similar_string_pairs(values, max_distance)
+
+        assert _true_pairs(values, max_distance) <= candidates
+        assert all(i < j and values[i] and values[j] for i, j in candidates)
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_changed_subset(self, seed):
+        rng = random.Random(100 + seed)
+        values = _random_values(rng, 80)
+        changed = rng.sample(range(len(values)), 10)
+
+        candidates = pg._similar_string_pairs(values, 2, changed)
+
+        assert _true_pairs(values, 2, set(changed)) <= candidates
+        assert all(i in changed or j in changed for i, j in candidates)
+
+    def test_short_values_pair_with_reachable_lengths(self):
+        # "ab" has fewer characters than segments at distance 2
+        values = ["ab", "b", "abcd", "abcde", ""]
+
+        candidates = pg._similar_string_pairs(values, 2)
+
+        assert {(0, 1), (0, 2)} <= candidates
+        assert (0, 3) not in candidates  # 3 edits apart by length alone
+        assert not any(4 in pair for pair in candidates)
+
+    def test_segment_join_needs_both_directions_for_shorter_probes(self):
+        values = ["logisticuz", "logisticu"]
+
+        # Probe shorter than the indexed value: only found with roles swapped
+        assert pg._segment_join(values, [0], [1], 1) == set()
+        assert pg._segment_join(values, [1], [0], 1) == {(0, 1)}
+
+
+# ============================================================================
+# _duplicate_pairs
+# ============================================================================
+
+
+class TestDuplicatePairs:
+
+    def _players(self, rng, count):
+        tags = _random_values(rng, count, alphabet="abcd")
+        names = _random_values(rng, count, alphabet="xyz")
+        phones = [rng.choice(["", "", "0701", "0702"]) for _ in range(count)]
+        return [
+            {"uuid": str(i), "tag": tag, "name": name, "email": "", "telephone": phone}
+            for i, (tag, name, phone) in enumerate(zip(tags, names, phones))
+        ]
+
+    def test_matches_pairwise_scan(self):
+        rng = random.Random(7)
+        players = self._players(rng, 60)
+
+        expected = []
+        for i, j in itertools.combinations(range(len(players)), 2):
+            reasons, confidence = pg._duplicate_reasons(players[i], players[j])
+            if reasons:
+                expected.append((i, j, reasons, confidence))
+
+        assert list(pg._duplicate_pairs(players)) == expected
+        changed = [3, 17, 42]
+        assert list(pg._duplicate_pairs(players, changed)) == [
+            pair for pair in expected if pair[0] in changed or pair[1] in changed
+        ]
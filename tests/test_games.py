@@ -0,0 +1,66 @@
+# test_games.py
+"""
+Tests for canonical game names (shared/games.py).
+
+Run with: pytest tests/test_games.py -v
+"""
+import os
+import sys
+
+import pytest
+
+# Add repo root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from shared.games import (  # noqa: E402
+    SSBU_SINGLES,
+    STREET_FIGHTER_6,
+    TEKKEN_8,
+    canonical_game_name,
+    game_alias_key,
+)
+
+
+class TestCanonicalGameName:
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            "SSBU Singles",
+            "ssbu",
+            "Super Smash Bros Ultimate Singles",
+            "smash singles",
+            "Smash Ultimate Doubles",
+        ],
+    )
+    def test_ssbu_variants(self, raw):
+        assert canonical_game_name(raw) == SSBU_SINGLES
+
+    @pytest.mark.parametrize(
+        "raw", ["Street Fighter 6", "SF6", "sf-6", "STREET FIGHTER 6 TOURNAMENT"]
+    )
+    def test_street_fighter_6_variants(self, raw):
+        assert canonical_game_name(raw) == STREET_FIGHTER_6
+
+    @pytest.mark.parametrize("raw", ["Tekken 8", "T8", "tekken8 tournament", "TEKKEN 8 TOURNAMENT"])
+    def test_tekken_8_variants(self, raw):
+        assert canonical_game_name(raw) == TEKKEN_8
+
+    def test_other_games_keep_their_name(self):
+        assert canonical_game_name("  Guilty Gear Strive ") == "Guilty Gear Strive"
+        assert canonical_game_name("Street Fighter 5") == "Street Fighter 5"
+
+    def test_blank_is_empty(self):
+        assert canonical_game_name(None) == ""
+        assert canonical_game_name("   ") == ""
+
+    def test_canonical_names_are_fixed_points(self):
+        for name in (SSBU_SINGLES, STREET_FIGHTER_6, TEKKEN_8, "Granblue"):
+            assert canonical_game_name(canonical_game_name(name)) == canonical_game_name(name)
+
+
+class TestGameAliasKey:
+
+    def test_case_and_whitespace_insensitive(self):
+        assert game_alias_key(" Tekken 8 ") == game_alias_key("tekken 8") == "tekken 8"
+        assert game_alias_key(None) == ""
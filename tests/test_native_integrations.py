@@ -0,0 +1,306 @@
+# test_native_integrations.py
+"""
+Tests for the native integration engine (backend/integrations.py).
+
+Start.gg and eBas are replaced by a local stand-in HTTP server (conftest.py) so the real
+httpx client, request bodies and response parsing are exercised.
+
+Run with: pytest tests/test_native_integrations.py -v
+"""
+import asyncio
+import os
+import sys
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import integrations  # noqa: E402
+
+# ============================================================================
+# Stand-in servers
+# ============================================================================
+
+STARTGG_PLAYERS = {
+    "logisticuz": {
+        "id": 1,
+        "gamerTag": "logisticuz",
+        "email": "viktor@example.com",
+        "user": {"name": "Viktor"},
+        "events": [{"id": 10, "name": "Street Fighter 6"}, {"id": 11, "name": "Tekken 8"}],
+    },
+}
+EBAS_MEMBERS = {"199001011234"}
+
+
+def _respond(server, path, body):
+    """Answer like Start.gg GraphQL or eBas confirm_membership."""
+    if server.fail:
+        return 500, None
+
+    if path == "/gql/alpha":
+        variables = body["variables"]
+        if variables["slug"] == "missing-tournament":
+            return 200, {"data": {"tournament": None}}
+        player = STARTGG_PLAYERS.get(variables["tag"].lower())
+        return 200, {
+            "data": {
+                "tournament": {
+                    "id": 99,
+                    "name": "FGC Trollhättan Weekly",
+                    "participants": {"nodes": [player] if player else []},
+                }
+            }
+        }
+
+    pnr = body["request"]["socialsecuritynumber"]
+    return 200, {"response": {"member_found": pnr in EBAS_MEMBERS}}
+
+
+@pytest.fixture
+def stand_in(http_stand_in, monkeypatch):
+    """One local server for both APIs; integrations is pointed at it."""
+    server = http_stand_in(_respond)
+    server.fail = False
+
+    base = server.base_url
+    monkeypatch.setattr(integrations, "startgg_limiter", integrations.TokenBucket(1000.0, 1000))
+    monkeypatch.setattr(integrations, "STARTGG_API_URL", f"{base}/gql/alpha")
+    monkeypatch.setattr(integrations, "EBAS_API_URL", f"{base}/apis/confirm_membership.json")
+    monkeypatch.setattr(integrations, "STARTGG_TOKEN", "sgg-token")
+    monkeypatch.setattr(integrations, "EBAS_ASSOC", "F161215-9")
+    monkeypatch.setattr(integrations, "EBAS_API_KEY", "ebas-key")
+    return server
+
+
+def _run(coro_fn):
+    """Run coro_fn(client) on a fresh loop with a real httpx client."""
+
+    async def main():
+        async with httpx.AsyncClient() as client:
+            return await coro_fn(client)
+
+    return asyncio.run(main())
+
+
+class _RecordingApply:
+    """Stand-in for storage apply_integration_result."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        return {"checkin_id": kwargs["checkin_id"], "source": kwargs["source"], "ok": kwargs["ok"]}
+
+    def by_source(self):
+        return {c["source"]: c for c in self.calls}
+
+
+# ============================================================================
+# Personnummer normalization
+# ============================================================================
+
+
+class TestNormalizePersonnummer:
+
+    def test_twelve_digits_kept(self):
+        assert integrations.normalize_personnummer("199001011234") == "199001011234"
+
+    def test_ten_digits_with_dash_gets_century(self):
+        assert integrations.normalize_personnummer("900101-1234") == "199001011234"
+        assert integrations.normalize_personnummer("0501011234") == "200501011234"
+
+    def test_too_short_is_invalid(self):
+        assert integrations.normalize_personnummer("12345") is None
+        assert integrations.normalize_personnummer(None) is None
+
+
+# ============================================================================
+# Start.gg rate limiter
+# ============================================================================
+
+
+class TestTokenBucket:
+
+    def test_burst_is_immediate(self):
+        bucket = integrations.TokenBucket(rate_per_second=1.0, burst=3)
+        assert [bucket._reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+    def test_waiters_are_spaced_by_rate(self):
+        bucket = integrations.TokenBucket(rate_per_second=10.0, burst=1)
+        waits = [bucket._reserve() for _ in range(4)]
+        assert waits[0] == 0.0
+        assert waits[1] == pytest.approx(0.1, abs=0.01)
+        assert waits[3] == pytest.approx(0.3, abs=0.01)
+
+    def test_concurrent_acquire_respects_rate(self):
+        bucket = integrations.TokenBucket(rate_per_second=50.0, burst=2)
+
+        async def main():
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await asyncio.gather(*(bucket.acquire() for _ in range(7)))
+            return loop.time() - start
+
+        # 2 immediate, 5 more at 50/s
+        assert asyncio.run(main()) >= 0.09
+
+
+# ============================================================================
+# Start.gg check
+# ============================================================================
+
+
+class TestStartggCheck:
+
+    def test_registered_player(self, stand_in):
+        result = _run(lambda c: integrations.startgg_check(c, "logisticuz", "fgc-weekly"))
+
+        assert result["isRegistered"] is True
+        assert result["events"] == ["Street Fighter 6", "Tekken 8"]
+        assert result["eventCount"] == 2
+        assert result["email"] == "viktor@example.com"
+
+        req = stand_in.requests[0]
+        assert req["headers"]["Authorization"] == "Bearer sgg-token"
+        assert req["body"]["variables"] == {"slug": "fgc-weekly", "tag": "logisticuz"}
+
+    def test_unregistered_player(self, stand_in):
+        result = _run(lambda c: integrations.startgg_check(c, "nobody", "fgc-weekly"))
+        assert result["isRegistered"] is False
+        assert not result.get("error")
+
+    def test_missing_tournament(self, stand_in):
+        result = _run(lambda c: integrations.startgg_check(c, "logisticuz", "missing-tournament"))
+        assert result["isRegistered"] is False
+        assert result["error"] is True
+
+    def test_missing_tag_skips_request(self, stand_in):
+        result = _run(lambda c: integrations.startgg_check(c, "", "fgc-weekly"))
+        assert result["isRegistered"] is False
+        assert stand_in.requests == []
+
+    def test_http_error_reads_as_not_registered(self, stand_in):
+        stand_in.fail = True
+        result = _run(lambda c: integrations.startgg_check(c, "logisticuz", "fgc-weekly"))
+        assert result["isRegistered"] is False
+        assert result["error"] is True
+
+    def test_http_error_raises_when_requested(self, stand_in):
+        stand_in.fail = True
+        with pytest.raises(httpx.HTTPError):
+            _run(
+                lambda c: integrations.startgg_check(
+                    c, "logisticuz", "fgc-weekly", raise_on_error=True
+                )
+            )
+
+
+# ============================================================================
+# eBas check
+# ============================================================================
+
+
+class TestEbasCheck:
+
+    def test_member_found(self, stand_in):
+        result = _run(lambda c: integrations.ebas_check(c, "900101-1234"))
+
+        assert result["isMember"] is True
+        request = stand_in.requests[0]["body"]["request"]
+        assert request["action"] == "confirm_membership"
+        assert request["association_number"] == "F161215-9"
+        assert request["api_key"] == "ebas-key"
+        assert request["socialsecuritynumber"] == "199001011234"
+
+    def test_not_member(self, stand_in):
+        result = _run(lambda c: integrations.ebas_check(c, "200001011234"))
+        assert result["isMember"] is False
+
+    def test_no_personnummer_skips_request(self, stand_in):
+        result = _run(lambda c: integrations.ebas_check(c, ""))
+        assert result["isMember"] is False
+        assert result["skipped"] is True
+        assert stand_in.requests == []
+
+
+# ============================================================================
+# Full v5 flow
+# ============================================================================
+
+
+class TestRunCheckinIntegrations:
+
+    def test_applies_both_results(self, stand_in):
+        apply_fn = _RecordingApply()
+        summary = _run(
+            lambda c: integrations.run_checkin_integrations(
+                c, apply_fn, "ci-1", " Logisticuz ", "fgc-weekly", "199001011234"
+            )
+        )
+
+        assert summary == {
+            "checkin_id": "ci-1",
+            "member": True,
+            "startgg": True,
+            "events": ["Street Fighter 6", "Tekken 8"],
+            "integration_complete": True,
+        }
+        calls = apply_fn.by_source()
+        assert calls["startgg"]["ok"] is True
+        assert calls["startgg"]["data"]["email"] == "viktor@example.com"
+        assert calls["startgg"]["error"] is None
+        assert calls["ebas"]["data"] == {"member": True}
+        assert calls["ebas"]["fetched_at"] == calls["startgg"]["fetched_at"]
+
+    def test_failures_are_reported_as_not_ok(self, stand_in):
+        stand_in.fail = True
+        apply_fn = _RecordingApply()
+        summary = _run(
+            lambda c: integrations.run_checkin_integrations(
+                c, apply_fn, "ci-2", "logisticuz", "fgc-weekly", "199001011234"
+            )
+        )
+
+        assert summary["member"] is False
+        assert summary["startgg"] is False
+        calls = apply_fn.by_source()
+        assert calls["startgg"]["ok"] is False
+        assert calls["startgg"]["error"]["code"] == "api_error"
+        assert calls["ebas"]["ok"] is False
+        assert calls["ebas"]["error"]["code"] == "api_error"
+
+    def test_checks_run_concurrently(self, stand_in, monkeypatch):
+        """Both checks must be in flight before either completes."""
+        in_flight = []
+        both_started = None
+
+        async def slow(name):
+            in_flight.append(name)
+            if len(in_flight) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=2)
+            return {"isMember": True} if name == "ebas" else {"isRegistered": True, "events": []}
+
+        async def fake_ebas(client, pnr):
+            return await slow("ebas")
+
+        async def fake_startgg(client, tag, slug):
+            return await slow("startgg")
+
+        monkeypatch.setattr(integrations, "ebas_check", fake_ebas)
+        monkeypatch.setattr(integrations, "startgg_check", fake_startgg)
+
+        async def flow(client):
+            nonlocal both_started
+            both_started = asyncio.Event()
+            return await integrations.run_checkin_integrations(
+                client, _RecordingApply(), "ci-3", "logisticuz", "fgc-weekly", "199001011234"
+            )
+
+        summary = _run(flow)
+        assert summary["member"] is True and summary["startgg"] is True
@@ -0,0 +1,178 @@
+# test_postgres_admin_jobs.py
+"""
+Tests for the admin jobs behind the dashboard's background callbacks:
+start_admin_job / update_admin_job / finish_admin_job in
+shared/postgres_api.py (one running job per kind, stale jobs failed,
+cancellation) and callbacks.run_admin_job on top of them.
+
+Needs a scratch database (see conftest.py):
+
+Run with: TEST_DATABASE_URL=postgresql://... pytest tests/test_postgres_admin_jobs.py -v
+"""
+import time
+from datetime import timedelta
+
+import pytest
+
+from fgt_dashboard import callbacks
+
+KIND = "archive_event"
+
+
+def _execute(pg, sql, params=()):
+    with pg._get_pool().connection() as conn:
+        conn.execute(sql, params)
+
+
+def _age(pg, job_id, delta):
+    """Pretend the job last reported progress delta ago."""
+    _execute(pg, "UPDATE admin_jobs SET updated_at = now() - %s WHERE job_id = %s", (delta, job_id))
+
+
+# ============================================================================
+# start_admin_job / update_admin_job / finish_admin_job
+# ============================================================================
+
+
+class TestAdminJobs:
+
+    def test_one_running_job_per_kind(self, postgres_db):
+        pg = postgres_db
+
+        assert pg.start_admin_job(KIND, "job-1", "weekly-1", {"started_by": "Anna"}) is True
+        assert pg.start_admin_job(KIND, "job-2") is False
+        assert pg.start_admin_job("recompute_event_stats", "job-3") is True
+        assert pg.get_admin_job(kind=KIND)["job_id"] == "job-1"
+
+        assert pg.finish_admin_job("job-1", "done", {}) is True
+        assert pg.start_admin_job(KIND, "job-2") is True
+
+    def test_stale_job_is_failed_by_the_next_start(self, postgres_db):
+        pg = postgres_db
+        pg.start_admin_job(KIND, "dead")
+        _age(pg, "dead", pg.ADMIN_JOB_STALE_AFTER - timedelta(minutes=1))
+        assert pg.start_admin_job(KIND, "too-early") is False
+
+        _age(pg, "dead", pg.ADMIN_JOB_STALE_AFTER + timedelta(minutes=1))
+
+        assert pg.start_admin_job(KIND, "next") is True
+        dead = pg.get_admin_job(job_id="dead")
+        assert dead["state"] == "failed"
+        assert dead["result"] == {"error": "job stopped reporting progress"}
+        assert dead["finished_at"] is not None
+
+    def test_progress_keeps_a_job_alive(self, postgres_db):
+        pg = postgres_db
+        pg.start_admin_job(KIND, "slow")
+        _age(pg, "slow", pg.ADMIN_JOB_STALE_AFTER + timedelta(minutes=1))
+
+        assert pg.update_admin_job("slow", {"elapsed_seconds": 700}) is False
+        assert pg.start_admin_job(KIND, "next") is False
+        assert pg.get_admin_job(job_id="slow")["progress"] == {"elapsed_seconds": 700}
+
+    def test_update_reports_cancel_request(self, postgres_db):
+        pg = postgres_db
+        pg.start_admin_job(KIND, "job-1")
+        _execute(pg, "UPDATE admin_jobs SET cancel_requested = true WHERE job_id = 'job-1'")
+
+        assert pg.update_admin_job("job-1", {}) is True
+        assert pg.update_admin_job("unknown", {}) is False
+
+    def test_finish_after_cancel_keeps_cancelled(self, postgres_db):
+        pg = postgres_db
+        pg.start_admin_job(KIND, "job-1")
+        assert pg.finish_admin_job("job-1", "cancelled", {"error": "cancelled from dashboard"})
+
+        assert pg.finish_admin_job("job-1", "done", {"rows": 12}) is False
+        job = pg.get_admin_job(job_id="job-1")
+        assert job["state"] == "cancelled"
+        assert job["result"] == {"error": "cancelled from dashboard"}
+        assert pg.start_admin_job(KIND, "job-2") is True
+
+
+# ============================================================================
+# callbacks.run_admin_job
+# ============================================================================
+
+
+class TestRunAdminJob:
+
+    @pytest.fixture
+    def progress(self, postgres_db, monkeypatch):
+        monkeypatch.setattr(callbacks, "ADMIN_JOB_HEARTBEAT_SECONDS", 0.05)
+        return []
+
+    def _run(self, progress, action, **kwargs):
+        return callbacks.run_admin_job(
+            progress.append, KIND, "Archiving", action, started_by="Viktor", **kwargs
+        )
+
+    def test_result_is_returned_and_recorded(self, postgres_db, progress):
+        pg = postgres_db
+
+        assert self._run(progress, lambda: "archived", event_slug="weekly-1") == "archived"
+
+        job = pg.get_admin_job(kind=KIND)
+        assert (job["state"], job["event_slug"]) == ("done", "weekly-1")
+        assert job["result"]["started_by"] == "Viktor"
+        assert progress[0] == "⏳ Archiving…"
+
+    def test_failure_is_recorded_and_raised(self, postgres_db, progress):
+        pg = postgres_db
+
+        def fail():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            self._run(progress, fail)
+
+        job = pg.get_admin_job(kind=KIND)
+        assert job["state"] == "failed"
+        assert job["result"]["error"] == "boom"
+
+    def test_busy_kind_raises_without_running(self, postgres_db, progress):
+        pg = postgres_db
+        pg.start_admin_job(KIND, "other", "", {"started_by": "Anna"})
+        calls = []
+
+        with pytest.raises(callbacks.AdminJobBusy, match="started by Anna"):
+            self._run(progress, lambda: calls.append(1))
+
+        assert calls == []
+        assert pg.get_admin_job(kind=KIND)["job_id"] == "other"
+
+    def test_heartbeat_reports_progress(self, postgres_db, progress):
+        pg = postgres_db
+        seen = []
+
+        def slow():
+            # Wait for the heartbeat to write elapsed time to the running row
+            deadline = time.monotonic() + 5
+            while time.monotonic() < deadline:
+                job = pg.get_admin_job(kind=KIND)
+                if "elapsed_seconds" in job["progress"]:
+                    seen.append(job["progress"])
+                    break
+                time.sleep(0.02)
+            return "ok"
+
+        assert self._run(progress, slow) == "ok"
+
+        assert seen and seen[0]["started_by"] == "Viktor"
+        assert "⏳ Archiving… 0s" in progress
+
+    def test_cancelled_job_stays_cancelled(self, postgres_db, progress):
+        pg = postgres_db
+
+        def cancelled_meanwhile():
+            # The dashboard's cancel callback marks the row while the job runs
+            job = pg.get_admin_job(kind=KIND)
+            pg.finish_admin_job(job["job_id"], "cancelled", {"error": "cancelled from dashboard"})
+            return "late result"
+
+        self._run(progress, cancelled_meanwhile)
+
+        job = pg.get_admin_job(kind=KIND)
+        assert job["state"] == "cancelled"
+        assert job["result"] == {"error": "cancelled from dashboard"}
+        assert self._run(progress, lambda: "next") == "next"
@@ -0,0 +1,231 @@
+# test_postgres_archive.py
+"""
+Tests for archive_event in shared/postgres_api.py: set-based player matching
+(_match_or_create_players_bulk) must give the same players and archive rows
+as the row-by-row _match_or_create_player loop it replaced.
+
+Needs a scratch database (see conftest.py):
+
+Run with: TEST_DATABASE_URL=postgresql://... pytest tests/test_postgres_archive.py -v
+"""
+from decimal import Decimal
+
+import pytest
+
+EVENT = "weekly-42"
+EVENT_DATE = "2026-10-10"
+
+
+def _rows(pg, sql, params=()):
+    with pg._get_pool().connection() as conn:
+        return conn.execute(sql, params).fetchall()
+
+
+def _seed(pg, players, checkins):
+    """Insert existing players and the active check-ins of EVENT."""
+    from psycopg.types.json import Json  # type: ignore
+
+    with pg._get_pool().connection() as conn:
+        for p in players:
+            conn.execute(
+                """
+                INSERT INTO players (
+                    name, tag, email, games_played, game_counts, favorite_game,
+                    total_events, total_paid, first_seen, last_seen, first_event, last_event,
+                    events_list, is_member
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                """,
+                (
+                    p["name"],
+                    p.get("tag"),
+                    p.get("email"),
+                    p.get("games", []),
+                    Json(p.get("game_counts", {})),
+                    p.get("favorite"),
+                    len(p.get("events", [])),
+                    p.get("paid", 0),
+                    p.get("first_seen"),
+                    p.get("last_seen"),
+                    (p.get("events") or [None])[0],
+                    (p.get("events") or [None])[-1],
+                    Json(p.get("events", [])),
+                    p.get("member", False),
+                ),
+            )
+        for c in checkins:
+            conn.execute(
+                """
+                INSERT INTO active_event_data (
+                    event_slug, name, tag, email, telephone, status, member,
+                    payment_amount, tournament_games_registered
+                ) VALUES (%s, %s, %s, %s, %s, 'Ready', %s, %s, %s)
+                """,
+                (
+                    EVENT,
+                    c["name"],
+                    c.get("tag"),
+                    c.get("email"),
+                    c.get("telephone"),
+                    c.get("member"),
+                    c.get("paid", 0),
+                    c.get("games", []),
+                ),
+            )
+
+
+def _archive_snapshot(pg, players, checkins):
+    """Seed, archive EVENT and return everything the player matching decides."""
+    _seed(pg, players, checkins)
+    result = pg.archive_event(
+        EVENT,
+        event_date=EVENT_DATE,
+        event_display_name="Weekly 42",
+        swish_expected_per_game=25,
+        startgg_snapshot={},
+    )
+    player_rows = _rows(
+        pg,
+        """
+        SELECT name, tag, email, telephone, games_played, game_counts, favorite_game,
+               total_events, total_paid, first_seen::date, last_seen::date,
+               first_event, last_event, events_list, is_member
+        FROM players ORDER BY LOWER(tag), LOWER(email), name
+        """,
+    )
+    player_rows = [row[:4] + (sorted(row[4] or []),) + row[5:] for row in player_rows]
+    archive_rows = _rows(
+        pg,
+        """
+        SELECT a.name, p.name, p.tag, p.email
+        FROM event_archive a JOIN players p ON p.uuid = a.player_uuid
+        ORDER BY a.name
+        """,
+    )
+    summary = {k: result[k] for k in ("archived", "new_players", "returning_players")}
+    return player_rows, archive_rows, summary
+
+
+PLAYERS = [
+    {
+        "name": "Viktor",
+        "tag": "Logisticuz",
+        "email": "viktor@example.com",
+        "games": ["Tekken 8"],
+        "game_counts": {"Tekken 8": 3},
+        "favorite": "Tekken 8",
+        "events": ["weekly-40", "weekly-41"],
+        "paid": 100,
+        "first_seen": "2026-09-01",
+        "last_seen": "2026-10-03",
+    },
+    {
+        "name": "Anna",
+        "tag": "Annie",
+        "email": "anna@example.com",
+        "events": ["weekly-41"],
+        "first_seen": "2026-10-03",
+        "last_seen": "2026-10-03",
+    },
+    {"name": "Old Email", "tag": None, "email": "olle@example.com", "events": ["weekly-39"]},
+    # Re-archived event: already in events_list, so no extra event or payment
+    {"name": "Repeat", "tag": "Repeat", "events": [EVENT], "paid": 25, "last_seen": EVENT_DATE},
+]
+
+CHECKINS = [
+    {
+        "name": "Viktor",
+        "tag": "LOGISTICUZ",
+        "games": ["Street Fighter 6", "Tekken 8"],
+        "paid": 50,
+        "member": True,
+    },
+    {"name": "Anna B", "tag": "Annie", "email": "anna.b@example.com", "telephone": "0701234567"},
+    {"name": "Olle", "tag": "Olle", "email": "OLLE@example.com", "games": ["Tekken 8"]},
+    {"name": "Repeat", "tag": "repeat", "paid": 25},
+    {
+        "name": "Newcomer",
+        "tag": "Newbie",
+        "email": "new@example.com",
+        "games": ["Street Fighter 6"],
+    },
+    {"name": "No Tag", "email": "notag@example.com", "paid": 25},
+]
+
+
+# ============================================================================
+# Bulk vs row-by-row equivalence
+# ============================================================================
+
+
+class TestBulkPlayerMatching:
+
+    @pytest.fixture
+    def spy(self, postgres_db, monkeypatch):
+        """Records what _match_or_create_players_bulk returned (None = fell back)."""
+        pg = postgres_db
+        real = pg._match_or_create_players_bulk
+        calls = []
+
+        def recording(*args, **kwargs):
+            result = real(*args, **kwargs)
+            calls.append(result)
+            return result
+
+        monkeypatch.setattr(pg, "_match_or_create_players_bulk", recording)
+        return calls
+
+    def _compare(self, pg, reset, monkeypatch, players, checkins):
+        bulk = _archive_snapshot(pg, players, checkins)
+        reset()
+        monkeypatch.setattr(pg, "_match_or_create_players_bulk", lambda *args, **kwargs: None)
+        rows = _archive_snapshot(pg, players, checkins)
+        assert bulk == rows
+        return bulk
+
+    def test_bulk_matches_row_loop(self, postgres_db, postgres_reset, monkeypatch, spy):
+        pg = postgres_db
+        player_rows, archive_rows, summary = self._compare(
+            pg, postgres_reset, monkeypatch, PLAYERS, CHECKINS
+        )
+
+        assert spy and spy[0] is not None  # the set-based path ran
+        assert summary == {"archived": 6, "new_players": 2, "returning_players": 4}
+        assert len(player_rows) == len(PLAYERS) + 2  # Newcomer + No Tag created
+        viktor = next(r for r in player_rows if r[1] == "LOGISTICUZ")
+        assert viktor[4] == ["Street Fighter 6", "Tekken 8"]
+        assert viktor[5] == {"Tekken 8": 4, "Street Fighter 6": 1}
+        assert viktor[7:9] == (3, Decimal("150.00"))
+        repeat = next(r for r in player_rows if r[1] == "repeat")
+        assert repeat[7:9] == (1, Decimal("25.00"))
+        # Matched by email (no tag on the player), then re-keyed with the check-in tag
+        assert ("Olle", "Olle", "Olle", "OLLE@example.com") in archive_rows
+
+    def test_shared_lookup_key_falls_back_to_row_loop(
+        self, postgres_db, postgres_reset, monkeypatch, spy
+    ):
+        pg = postgres_db
+        # Two check-ins share an email: the first creates a player the second must match
+        checkins = CHECKINS + [
+            {"name": "Newcomer Alt", "tag": "Newbie2", "email": "NEW@example.com"}
+        ]
+        player_rows, archive_rows, _ = self._compare(
+            pg, postgres_reset, monkeypatch, PLAYERS, checkins
+        )
+
+        assert spy == [None]
+        assert len(player_rows) == len(PLAYERS) + 2
+        newcomer = [r for r in archive_rows if r[0].startswith("Newcomer")]
+        assert {r[1:] for r in newcomer} == {("Newcomer Alt", "Newbie2", "NEW@example.com")}
+
+    def test_matched_player_rekeyed_by_other_checkin_falls_back(
+        self, postgres_db, postgres_reset, monkeypatch, spy
+    ):
+        pg = postgres_db
+        # Row 1 matches Anna by tag and overwrites her email with one row 2 looks up
+        checkins = [
+            {"name": "Anna", "tag": "Annie", "email": "shared@example.com"},
+            {"name": "Someone", "tag": "Other", "email": "shared@example.com"},
+        ]
+        self._compare(pg, postgres_reset, monkeypatch, PLAYERS, checkins)
+
+        assert spy == [None]
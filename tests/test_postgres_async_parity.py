@@ -0,0 +1,387 @@
+# test_postgres_async_parity.py
+"""
+Parity tests for the native async storage in shared/postgres_async_api.py:
+each scenario runs once against the sync functions in shared/postgres_api.py
+and once against their async copies on a fresh schema, and both runs must
+return the same values and leave the same rows behind. A change to one copy
+that is not made to the other fails here.
+
+Generated values (record ids, timestamps) are compared by position, not by
+value.
+
+Needs a scratch database (see conftest.py):
+
+Run with: TEST_DATABASE_URL=postgresql://... pytest tests/test_postgres_async_parity.py -v
+"""
+import asyncio
+import inspect
+import re
+from datetime import date, datetime
+
+import pytest
+
+EVENT = "weekly-1"
+USER = {"user_id": "1", "user_name": "admin", "user_email": "admin@example.com"}
+
+# Tables a scenario can write: (compared columns - no serials / clocks, order)
+SNAPSHOT = {
+    "settings": ("active_event_slug, event_display_name, require_payment, require_startgg", "id"),
+    "active_event_data": (
+        "record_id, event_slug, name, tag, email, telephone, status, member, startgg, "
+        "payment_valid, payment_amount, payment_expected, tournament_games_registered, "
+        "tournament_game_ids, checkin_uuid, startgg_event_id, is_guest, added_via, "
+        "acquisition_source, player_uuid",
+        "id",
+    ),
+    "games": ("name", "id"),
+    "game_aliases": ("alias, game_id", "alias"),
+    "checkin_jobs": ("checkin_id, state, result, finished_at IS NOT NULL", "checkin_id"),
+    "admin_jobs": (
+        "job_id, kind, event_slug, state, progress, result, cancel_requested",
+        "job_id",
+    ),
+    "audit_log": (
+        "user_id, user_name, action, target_table, target_event, target_record, details",
+        "id",
+    ),
+}
+
+_GENERATED = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$")
+
+
+class _Normalizer:
+    """Replaces generated ids and timestamps with placeholders numbered by first use."""
+
+    def __init__(self):
+        self.ids = {}
+
+    def __call__(self, value):
+        if isinstance(value, dict):
+            return {k: self(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self(v) for v in value]
+        if isinstance(value, (datetime, date)):
+            return "<time>"
+        if isinstance(value, str):
+            if _GENERATED.match(value):
+                return self.ids.setdefault(value, f"<id {len(self.ids)}>")
+            if re.match(r"^\d{4}-\d{2}-\d{2}T", value):
+                return "<time>"
+        return value
+
+
+def _snapshot(pg):
+    pg.flush_audit_log(timeout=10)
+    tables = {}
+    with pg._get_pool().connection() as conn:
+        for table, (columns, order) in SNAPSHOT.items():
+            tables[table] = conn.execute(
+                f"SELECT {columns} FROM {table} ORDER BY {order}"
+            ).fetchall()
+    return tables
+
+
+def _setup(pg):
+    with pg._get_pool().connection() as conn:
+        conn.execute(
+            """
+            INSERT INTO settings (is_active, active_event_slug, event_display_name,
+                                  require_payment, require_startgg)
+            VALUES (true, %s, 'Weekly 1', true, true)
+            """,
+            (EVENT,),
+        )
+        conn.execute(
+            "INSERT INTO players (uuid, name, tag, email) "
+            "VALUES ('p-viktor', 'Viktor', 'Logisticuz', 'viktor@example.com')"
+        )
+
+
+def _run(api, scenario):
+    """Run scenario(call) against api; call(name, ...) awaits coroutine results."""
+
+    async def call(name, *args, **kwargs):
+        result = getattr(api, name)(*args, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def main():
+        try:
+            return await scenario(call)
+        finally:
+            pool = getattr(api, "_async_pool", None)
+            if pool is not None:
+                await pool.close()
+                api._async_pool = None
+                api._async_pool_lock = None
+
+    return asyncio.run(main())
+
+
+def _assert_parity(postgres_db, postgres_reset, scenario):
+    from shared import postgres_async_api as apg
+
+    pg = postgres_db
+    runs = []
+    for api in (pg, apg):
+        postgres_reset()
+        _setup(pg)
+        results = _run(api, scenario)
+        normalize = _Normalizer()
+        runs.append((normalize(results), normalize(_snapshot(pg))))
+
+    (sync_results, sync_rows), (async_results, async_rows) = runs
+    assert async_results == sync_results
+    for table in SNAPSHOT:
+        assert async_rows[table] == sync_rows[table], table
+    return sync_results, sync_rows
+
+
+# ============================================================================
+# Check-ins
+# ============================================================================
+
+
+class TestCheckinParity:
+
+    def test_begin_checkin(self, postgres_db, postgres_reset):
+        async def scenario(call):
+            tagged = {"name": "Viktor", "tag": "Logisticuz", "email": "viktor@example.com"}
+            return [
+                await call(
+                    "begin_checkin",
+                    EVENT,
+                    {**tagged, "tournament_games_registered": ["tekken 8", "SF6"]},
+                ),
+                # Same tag, other case: the existing row is updated
+                await call("begin_checkin", EVENT, {**tagged, "tag": "LOGISTICUZ"}),
+                await call("begin_checkin", EVENT, {"name": "Anna", "telephone": "0701"}),
+                # Untagged again by name: updated in place
+                await call("begin_checkin", EVENT, {"name": "anna", "email": "ANNA@x.se"}),
+                await call("begin_checkin", "weekly-2", {"name": "Olle", "tag": "Olle"}),
+            ]
+
+        results, rows = _assert_parity(postgres_db, postgres_reset, scenario)
+
+        assert [r["created"] for r in results] == [True, False, True, False, True]
+        assert results[0]["player_uuid"] == "p-viktor"
+        assert len(rows["active_event_data"]) == 3
+        assert len(rows["games"]) == 2
+
+    def test_reads(self, postgres_db, postgres_reset):
+        async def scenario(call):
+            first = await call("begin_checkin", EVENT, {"name": "Viktor", "tag": "Logisticuz"})
+            await call(
+                "begin_checkin",
+                EVENT,
+                {"name": "Anna", "tournament_games_registered": ["Tekken 8"]},
+            )
+            await call("begin_checkin", "weekly-2", {"name": "Olle", "tag": "Olle"})
+            return [
+                await call("get_checkins", EVENT),
+                await call("get_checkins", None, include_all=True, sort_by=[{"column_id": "name"}]),
+                await call("get_checkins", EVENT, search="ann", game="tekken 8"),
+                await call("get_checkin_by_name", "viktor", EVENT),
+                await call("get_checkin_by_tag", "LOGISTICUZ", EVENT),
+                await call("get_checkin_by_record_id", first["checkin_id"]),
+                await call("get_checkin_by_record_id", "missing"),
+                await call("get_all_event_slugs"),
+            ]
+
+        results, _ = _assert_parity(postgres_db, postgres_reset, scenario)
+
+        assert [r["name"] for r in results[2]] == ["Anna"]
+
+    def test_update_and_delete(self, postgres_db, postgres_reset):
+        async def scenario(call):
+            first = await call("begin_checkin", EVENT, {"name": "Viktor", "tag": "Logisticuz"})
+            record_id = first["checkin_id"]
+            return [
+                await call(
+                    "update_checkin",
+                    record_id,
+                    {"UUID": "u-1", "status": "Ready", "tournament_games_registered": ["T8"]},
+                ),
+                await call("update_checkin", record_id, {}),
+                await call("update_checkin", "missing", {"status": "Ready"}),
+                await call("delete_checkin", record_id),
+                await call("delete_checkin", record_id),
+            ]
+
+        _assert_parity(postgres_db, postgres_reset, scenario)
+
+    def test_integration_results(self, postgres_db, postgres_reset):
+        async def scenario(call):
+            first = await call("begin_checkin", EVENT, {"name": "Viktor", "tag": "Logisticuz"})
+            guest = await call("begin_checkin", EVENT, {"name": "Anna", "tag": "Anna"})
+            record_id = first["checkin_id"]
+            startgg = {
+                "registered": True,
+                "events": ["Tekken 8", "sf6"],
+                "startgg_event_id": 123,
+                "email": "viktor@example.com",
+            }
+            swish = {"payment_amount": 50, "payment_expected": 100, "payment_valid": False}
+            return [
+                await call("apply_integration_result", record_id, "startgg", True, startgg),
+                await call("apply_integration_result", guest["checkin_id"], "startgg", False),
+                await call("apply_integration_result", record_id, "eBas", False, None, {"e": 1}),
+                await call("apply_integration_result", record_id, "swish", True, swish),
+                await call("apply_integration_result", record_id, "stripe", True),
+                await call("apply_integration_result", record_id, "discord", True),
+                await call("get_checkin_by_record_id", record_id),
+            ]
+
+        results, rows = _assert_parity(postgres_db, postgres_reset, scenario)
+
+        assert results[-1]["fields"]["payment_valid"] is True
+        assert len(rows["audit_log"]) == 6
+
+
+# ============================================================================
+# Settings, jobs, players, audit
+# ============================================================================
+
+
+class TestSupportParity:
+
+    def test_settings(self, postgres_db, postgres_reset):
+        async def scenario(call):
+            row = await call("get_active_settings_with_id")
+            return [
+                row,
+                await call("get_active_settings"),
+                await call("get_active_slug"),
+                await call(
+                    "update_settings", row["record_id"], {"event_display_name": "Weekly One"}
+                ),
+                await call("update_settings", "not-an-id", {"event_display_name": "x"}),
+                await call("get_active_settings"),
+            ]
+
+        results, _ = _assert_parity(postgres_db, postgres_reset, scenario)
+
+        assert results[-1]["event_display_name"] == "Weekly One"
+
+    def test_checkin_jobs(self, postgres_db, postgres_reset):
+        async def scenario(call):
+            await call("start_checkin_job", "c-1")
+            await call("start_checkin_job", "c-2")
+            await call("start_checkin_job", "c-3")
+            await call("finish_checkin_job", "c-1", "done", {"status": "Ready"})
+            settled = [
+                await call("settle_checkin_job", "c-3", {"status": "Pending"}),
+                # Only the first poll settling a stale job wins
+                await call("settle_checkin_job", "c-3", {"status": "Ready"}),
+                await call("settle_checkin_job", "c-1", {"status": "Pending"}),
+            ]
+            # A re-submit restarts the job
+            await call("start_checkin_job", "c-1")
+            return settled + [
+                await call("get_checkin_job", "c-1"),
+                await call("get_checkin_job", "c-2"),
+                await call("get_checkin_job", "c-3"),
+                await call("get_checkin_job", "missing"),
+            ]
+
+        results, _ = _assert_parity(postgres_db, postgres_reset, scenario)
+
+        assert results[:3] == [True, False, False]
+        assert results[5]["result"] == {"status": "Pending"}
+
+    def test_admin_jobs(self, postgres_db, postgres_reset):
+        async def scenario(call):
+            return [
+                await call("start_admin_job", "archive_event", "j-1", EVENT, {"label": "x"}),
+                await call("start_admin_job", "archive_event", "j-2"),
+                await call("update_admin_job", "j-1", {"elapsed_seconds": 2}),
+                await call("update_admin_job", "missing", {}),
+                await call("finish_admin_job", "j-1", "cancelled", {"error": "cancelled"}),
+                # The job's own finish after the cancel keeps the cancel
+                await call("finish_admin_job", "j-1", "done", {"rows": 1}),
+                await call("get_admin_job", "j-1"),
+                await call("get_admin_job", None, "archive_event"),
+                await call("get_admin_job"),
+            ]
+
+        results, _ = _assert_parity(postgres_db, postgres_reset, scenario)
+
+        assert results[4:6] == [True, False]
+
+    def test_players_history_and_audit(self, postgres_db, postgres_reset):
+        async def scenario(call):
+            return [
+                await call("get_players"),
+                await call("get_event_history"),
+                await call("log_action", USER, "edit", "players", target_player="p-viktor"),
+                await call("log_action", USER, "archive_event", "event_archive", durable=True)
+                is not None,
+            ]
+
+        _assert_parity(postgres_db, postgres_reset, scenario)
+
+
+# ============================================================================
+# Bulk Start.gg re-check (async only) vs the per-check-in path
+# ============================================================================
+
+
+class TestApplyStartggResultsParity:
+
+    REQUIREMENTS = {"require_payment": True, "require_startgg": True}
+    RESULTS = {
+        "Viktor": {"registered": True, "events": ["Tekken 8", "sf6"], "email": "v@x.se"},
+        "Anna": {"registered": False, "events": None, "email": None},
+        "Olle": {"registered": True, "events": [], "email": None},
+    }
+
+    async def _checkins(self, call):
+        ids = {}
+        for name in self.RESULTS:
+            checkin = await call("begin_checkin", EVENT, {"name": name, "tag": name})
+            ids[name] = checkin["checkin_id"]
+        await call("update_checkin", ids["Viktor"], {"payment_valid": True})
+        await call("update_checkin", ids["Olle"], {"payment_valid": True})
+        return ids
+
+    def _fields(self, pg):
+        with pg._get_pool().connection() as conn:
+            return conn.execute(
+                """
+                SELECT name, startgg, is_guest, tournament_games_registered,
+                       tournament_game_ids, email, status, payment_expected
+                FROM active_event_data ORDER BY name
+                """
+            ).fetchall()
+
+    def test_bulk_matches_one_by_one(self, postgres_db, postgres_reset):
+        from shared import postgres_async_api as apg
+
+        pg = postgres_db
+
+        async def one_by_one(call):
+            ids = await self._checkins(call)
+            for name, result in self.RESULTS.items():
+                data = {k: v for k, v in result.items() if v is not None}
+                await call(
+                    "apply_integration_result", ids[name], "startgg", result["registered"], data
+                )
+                fields = (await call("get_checkin_by_record_id", ids[name]))["fields"]
+                update = {"status": pg.compute_checkin_status(fields, self.REQUIREMENTS)["status"]}
+                if result["events"] is not None:
+                    update["payment_expected"] = len(result["events"]) * 25
+                await call("update_checkin", ids[name], update)
+
+        async def bulk(call):
+            ids = await self._checkins(call)
+            results = [{"record_id": ids[name], **r} for name, r in self.RESULTS.items()]
+            return await call("apply_startgg_results", results, self.REQUIREMENTS, 25)
+
+        postgres_reset()
+        _run(pg, one_by_one)
+        expected = self._fields(pg)
+        postgres_reset()
+
+        assert _run(apg, bulk) == 3
+        assert self._fields(pg) == expected
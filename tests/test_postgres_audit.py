@@ -0,0 +1,186 @@
+# test_postgres_audit.py
+"""
+Tests for the audit log in shared/postgres_api.py: the write-behind queue
+(log_action, flush_audit_log, the writer thread) and its failure handling,
+and maintain_audit_log (payload compaction, partition retention).
+
+Needs a scratch database (see conftest.py):
+
+Run with: TEST_DATABASE_URL=postgresql://... pytest tests/test_postgres_audit.py -v
+"""
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+USER = {"user_id": "1", "user_name": "admin"}
+
+
+def _rows(pg, sql, params=()):
+    with pg._get_pool().connection() as conn:
+        return conn.execute(sql, params).fetchall()
+
+
+def _actions(pg):
+    return [r[0] for r in _rows(pg, "SELECT action FROM audit_log ORDER BY id")]
+
+
+@pytest.fixture
+def audit(postgres_db, monkeypatch):
+    pg = postgres_db
+    monkeypatch.setattr(pg, "AUDIT_WRITE_BEHIND", True)
+    monkeypatch.setattr(pg, "AUDIT_FLUSH_INTERVAL_SECONDS", 0.05)
+    return pg
+
+
+# ============================================================================
+# Write-behind queue
+# ============================================================================
+
+
+class TestAuditWriteBehind:
+
+    def test_queued_entries_are_written_on_flush(self, audit):
+        pg = audit
+        for n in range(3):
+            assert pg.log_action(USER, f"edit_{n}", "active_event_data") is None
+
+        assert pg.flush_audit_log(timeout=10) is True
+        assert _actions(pg) == ["edit_0", "edit_1", "edit_2"]
+
+    def test_full_queue_writes_inline(self, audit, monkeypatch):
+        pg = audit
+        monkeypatch.setattr(pg, "AUDIT_QUEUE_MAX", 0)
+
+        record_id = pg.log_action(USER, "edit", "active_event_data")
+
+        assert record_id is not None
+        assert _rows(pg, "SELECT action FROM audit_log WHERE id = %s", (int(record_id),)) == [
+            ("edit",)
+        ]
+
+    def test_durable_entry_is_written_before_returning(self, audit):
+        pg = audit
+
+        record_id = pg.log_action(USER, "archive_event", "event_archive", durable=True)
+
+        assert record_id is not None
+        assert _actions(pg) == ["archive_event"]
+
+    def test_rejected_entry_is_dropped_after_max_attempts(self, audit, monkeypatch, caplog):
+        pg = audit
+        monkeypatch.setattr(pg, "AUDIT_MAX_ATTEMPTS", 2)
+        attempts = []
+        real = pg._write_audit_rows
+
+        def recording(conn, rows):
+            attempts.append(len(rows))
+            return real(conn, rows)
+
+        monkeypatch.setattr(pg, "_write_audit_rows", recording)
+        # action is NOT NULL: the database rejects this row every time
+        poison = dict(pg._audit_fields(USER, "poison", "players"), action=None)
+        with caplog.at_level(logging.ERROR, logger=pg.__name__):
+            pg.log_action(USER, "before", "players")
+            assert pg._enqueue_audit_entry(poison)
+            pg.log_action(USER, "after", "players")
+            assert pg.flush_audit_log(timeout=10) is True
+
+        assert sorted(_actions(pg)) == ["after", "before"]
+        assert "Dropping audit entry after 2 attempts" in caplog.text
+        assert attempts.count(1) >= 2  # isolated by bisecting, retried once
+
+    def test_connection_errors_retry_without_dropping(self, audit, monkeypatch):
+        import psycopg  # type: ignore
+
+        pg = audit
+        monkeypatch.setattr(pg, "AUDIT_MAX_ATTEMPTS", 1)
+        failures = [psycopg.OperationalError("server closed the connection")] * 2
+        real = pg._write_audit_rows
+
+        def flaky(conn, rows):
+            if failures:
+                raise failures.pop()
+            return real(conn, rows)
+
+        monkeypatch.setattr(pg, "_write_audit_rows", flaky)
+        pg.log_action(USER, "edit", "active_event_data")
+
+        assert pg.flush_audit_log(timeout=10) is True
+        assert failures == []
+        assert _actions(pg) == ["edit"]
+
+
+# ============================================================================
+# maintain_audit_log: payload compaction and retention
+# ============================================================================
+
+
+class TestAuditMaintenance:
+
+    def _insert(self, pg, months_ago, action, details):
+        """One entry in the month `months_ago` months back (its partition created first)."""
+        month = pg._month_start(datetime.now(timezone.utc), -months_ago)
+        with pg._get_pool().connection() as conn:
+            with conn.transaction():
+                with conn.cursor() as cur:
+                    pg._create_audit_partitions(cur, month)
+            conn.execute(
+                "INSERT INTO audit_log (timestamp, action, details) VALUES (%s, %s, %s)",
+                (month + timedelta(days=1), action, details),
+            )
+
+    def _details(self, pg):
+        return dict(_rows(pg, "SELECT reason, details FROM audit_log WHERE reason IS NOT NULL"))
+
+    def test_old_integration_payloads_are_trimmed(self, audit, monkeypatch):
+        pg = audit
+        monkeypatch.setattr(pg, "AUDIT_DETAILS_RETENTION_MONTHS", 3)
+        payload = json.dumps({"source": "startgg", "ok": True, "response": "x" * 200})
+        entries = {
+            "old_object": (5, "integration_result", payload),
+            # Not JSON objects: left alone instead of failing the cast
+            "old_broken": (5, "integration_result", "{not json" + "x" * 100),
+            "old_array": (5, "integration_result", json.dumps(["x" * 100])),
+            "old_other_action": (5, "checkin_edit", payload),
+            "recent_object": (1, "integration_result", payload),
+        }
+        for reason, (months_ago, action, details) in entries.items():
+            self._insert(pg, months_ago, action, details)
+            with pg._get_pool().connection() as conn:
+                conn.execute(
+                    "UPDATE audit_log SET reason = %s WHERE id = (SELECT MAX(id) FROM audit_log)",
+                    (reason,),
+                )
+
+        result = pg.maintain_audit_log()
+
+        assert result["compacted_rows"] == 1
+        details = self._details(pg)
+        assert json.loads(details["old_object"]) == {"source": "startgg", "ok": True}
+        for reason in ("old_broken", "old_array", "old_other_action", "recent_object"):
+            assert details[reason] == entries[reason][2]
+
+    def test_partitions_are_kept_by_default(self, audit, monkeypatch):
+        pg = audit
+        monkeypatch.setattr(pg, "AUDIT_RETENTION_MONTHS", 0)
+        self._insert(pg, 40, "edit", "")
+
+        assert pg.maintain_audit_log()["dropped"] == []
+        assert _actions(pg) == ["edit"]
+
+    def test_partitions_older_than_retention_are_dropped(self, audit, monkeypatch):
+        pg = audit
+        monkeypatch.setattr(pg, "AUDIT_RETENTION_MONTHS", 24)
+        self._insert(pg, 30, "expired", "")
+        self._insert(pg, 12, "kept", "")
+        now = datetime.now(timezone.utc)
+
+        result = pg.maintain_audit_log()
+
+        # Every month from 30 back up to the cutoff (24 months back)
+        assert result["dropped"] == [
+            f"audit_log_p{pg._month_start(now, -months):%Y_%m}" for months in range(30, 24, -1)
+        ]
+        assert _actions(pg) == ["kept"]
@@ -0,0 +1,303 @@
+# test_postgres_checkins.py
+"""
+Tests for the check-in write path in shared/postgres_api.py: the begin_checkin
+upsert on idx_active_event_tag_unique, the locked fallback used while that
+index is missing, and the migration that merges duplicate check-ins before
+creating the index.
+
+Needs a scratch database (see conftest.py):
+
+Run with: TEST_DATABASE_URL=postgresql://... pytest tests/test_postgres_checkins.py -v
+"""
+import asyncio
+import json
+import threading
+
+import pytest
+
+
+def _rows(pg, sql, params=()):
+    with pg._get_pool().connection() as conn:
+        return conn.execute(sql, params).fetchall()
+
+
+def _scalar(pg, sql, params=()):
+    return _rows(pg, sql, params)[0][0]
+
+
+# ============================================================================
+# begin_checkin upsert
+# ============================================================================
+
+
+class TestBeginCheckinUpsert:
+
+    def test_same_tag_updates_existing_row(self, postgres_db):
+        pg = postgres_db
+        first = pg.begin_checkin("weekly-1", {"name": "Viktor", "tag": "Logisticuz"})
+        second = pg.begin_checkin(
+            "weekly-1", {"name": "Viktor L", "tag": "LOGISTICUZ", "email": "viktor@example.com"}
+        )
+
+        assert first["created"] is True
+        assert second["created"] is False
+        assert second["checkin_id"] == first["checkin_id"]
+        rows = _rows(pg, "SELECT name, email FROM active_event_data WHERE event_slug = 'weekly-1'")
+        assert rows == [("Viktor L", "viktor@example.com")]
+
+    def test_same_tag_other_event_is_a_new_row(self, postgres_db):
+        pg = postgres_db
+        first = pg.begin_checkin("weekly-1", {"name": "Viktor", "tag": "Logisticuz"})
+        other = pg.begin_checkin("weekly-2", {"name": "Viktor", "tag": "Logisticuz"})
+
+        assert other["created"] is True
+        assert other["checkin_id"] != first["checkin_id"]
+
+    def test_concurrent_checkins_of_one_tag_create_one_row(self, postgres_db):
+        pg = postgres_db
+        barrier = threading.Barrier(8)
+        results, errors = [], []
+
+        def check_in(i):
+            try:
+                barrier.wait()
+                results.append(
+                    pg.begin_checkin("weekly-1", {"name": f"Viktor {i}", "tag": "Logisticuz"})
+                )
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=check_in, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        assert len({r["checkin_id"] for r in results}) == 1
+        assert sum(r["created"] for r in results) == 1
+        assert _scalar(pg, "SELECT COUNT(*) FROM active_event_data") == 1
+
+
+# ============================================================================
+# begin_checkin without the unique index
+# ============================================================================
+
+
+class TestBeginCheckinWithoutTagIndex:
+
+    @pytest.fixture
+    def without_index(self, postgres_db, monkeypatch):
+        """Index dropped and its creation failing at startup (e.g. a lock timeout)."""
+        pg = postgres_db
+
+        def fail(conn):
+            raise RuntimeError("lock timeout")
+
+        monkeypatch.setattr(pg, "_ensure_checkin_tag_index", fail)
+        with pg._get_pool().connection() as conn:
+            conn.execute("DROP INDEX idx_active_event_tag_unique")
+        # Reopen the pool like a restart: the migrations run again and find no index
+        pg._pool.close()
+        pg._pool = None
+        pg._migrations_ran = False
+        pg._get_pool()
+        assert pg._checkin_tag_index_ready is False
+        return pg
+
+    def test_same_tag_updates_existing_row(self, without_index):
+        pg = without_index
+        first = pg.begin_checkin(
+            "weekly-1", {"name": "Viktor", "tag": "Logisticuz", "acquisition_source": "friend"}
+        )
+        second = pg.begin_checkin(
+            "weekly-1", {"name": "Viktor L", "tag": "LOGISTICUZ", "email": "viktor@example.com"}
+        )
+
+        assert (first["created"], second["created"]) == (True, False)
+        assert second["checkin_id"] == first["checkin_id"]
+        rows = _rows(pg, "SELECT name, email, acquisition_source FROM active_event_data")
+        assert rows == [("Viktor L", "viktor@example.com", "friend")]
+
+    def test_newest_duplicate_is_updated(self, without_index):
+        pg = without_index
+        with pg._get_pool().connection() as conn:
+            for record_id, created in (
+                ("old", "2026-10-01 18:00+00"),
+                ("new", "2026-10-01 18:05+00"),
+            ):
+                conn.execute(
+                    "INSERT INTO active_event_data (record_id, event_slug, name, tag, created) "
+                    "VALUES (%s, 'weekly-1', 'Viktor', 'Logisticuz', %s)",
+                    (record_id, created),
+                )
+
+        result = pg.begin_checkin("weekly-1", {"name": "Viktor L", "tag": "logisticuz"})
+
+        assert (result["checkin_id"], result["created"]) == ("new", False)
+
+    def test_concurrent_checkins_of_one_tag_create_one_row(self, without_index):
+        pg = without_index
+        barrier = threading.Barrier(8)
+        results, errors = [], []
+
+        def check_in(i):
+            try:
+                barrier.wait()
+                results.append(
+                    pg.begin_checkin("weekly-1", {"name": f"Viktor {i}", "tag": "Logisticuz"})
+                )
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=check_in, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        assert len({r["checkin_id"] for r in results}) == 1
+        assert sum(r["created"] for r in results) == 1
+        assert _scalar(pg, "SELECT COUNT(*) FROM active_event_data") == 1
+
+    def test_async_concurrent_checkins_create_one_row(self, without_index):
+        pg = without_index
+        from shared import postgres_async_api as apg
+
+        async def main():
+            try:
+                return await asyncio.gather(
+                    *(
+                        apg.begin_checkin("weekly-1", {"name": f"Viktor {i}", "tag": "Logisticuz"})
+                        for i in range(8)
+                    )
+                )
+            finally:
+                await apg._async_pool.close()
+                apg._async_pool = None
+                apg._async_pool_lock = None
+
+        results = asyncio.run(main())
+
+        assert len({r["checkin_id"] for r in results}) == 1
+        assert sum(r["created"] for r in results) == 1
+        assert _scalar(pg, "SELECT COUNT(*) FROM active_event_data") == 1
+
+    def test_reopen_restores_rows(self, without_index):
+        pg = without_index
+        pg.begin_checkin("weekly-1", {"name": "Viktor", "tag": "Logisticuz"})
+        pg.begin_checkin("weekly-1", {"name": "Anna", "tag": "Annie"})
+        pg.archive_event("weekly-1", event_display_name="Weekly 1", clear_active=True)
+        assert _scalar(pg, "SELECT COUNT(*) FROM active_event_data") == 0
+
+        result = pg.reopen_event("weekly-1")
+
+        assert result["restored_rows"] == 2
+        assert _scalar(pg, "SELECT COUNT(*) FROM active_event_data") == 2
+
+
+# ============================================================================
+# Duplicate merge before the unique index
+# ============================================================================
+
+
+class TestDuplicateCheckinMerge:
+
+    def _insert(self, conn, record_id, tag, created, **flags):
+        conn.execute(
+            """
+            INSERT INTO active_event_data
+                (record_id, event_slug, name, tag, email, member, startgg, payment_valid,
+                 payment_amount, is_guest, created)
+            VALUES (%s, 'weekly-1', 'Viktor', %s, %s, %s, %s, %s, %s, %s, %s)
+            """,
+            (
+                record_id,
+                tag,
+                flags.get("email"),
+                flags.get("member", False),
+                flags.get("startgg", False),
+                flags.get("payment_valid", False),
+                flags.get("payment_amount", 0),
+                flags.get("is_guest", False),
+                created,
+            ),
+        )
+
+    @pytest.fixture
+    def duplicates(self, postgres_db):
+        """Three rows for one tag (as left by the old read-then-insert path), index dropped."""
+        pg = postgres_db
+        with pg._get_pool().connection() as conn:
+            conn.execute("DROP INDEX idx_active_event_tag_unique")
+            self._insert(
+                conn,
+                "old",
+                "logisticuz",
+                "2026-10-01 18:00+00",
+                member=True,
+                email="viktor@example.com",
+            )
+            self._insert(
+                conn,
+                "mid",
+                "Logisticuz",
+                "2026-10-01 18:01+00",
+                payment_valid=True,
+                payment_amount=50,
+            )
+            self._insert(conn, "new", "LOGISTICUZ", "2026-10-01 18:02+00", is_guest=True)
+            self._insert(conn, "other", "Someone", "2026-10-01 18:03+00")
+        return pg
+
+    def test_flags_are_merged_into_newest_row(self, duplicates):
+        pg = duplicates
+        with pg._get_pool().connection() as conn:
+            pg._ensure_checkin_tag_index(conn)
+
+        rows = _rows(
+            pg,
+            """
+            SELECT record_id, member, startgg, payment_valid, payment_amount, is_guest, email
+            FROM active_event_data ORDER BY record_id
+            """,
+        )
+        assert rows == [
+            ("new", True, False, True, 50, True, "viktor@example.com"),
+            ("other", False, False, False, 0, False, None),
+        ]
+        assert _scalar(pg, "SELECT to_regclass('idx_active_event_tag_unique') IS NOT NULL")
+
+    def test_merge_is_audited_with_removed_rows(self, duplicates):
+        pg = duplicates
+        with pg._get_pool().connection() as conn:
+            pg._ensure_checkin_tag_index(conn)
+
+        (entry,) = pg.get_audit_log(action="checkin_duplicates_merged")
+        assert entry["target_record"] == "new"
+        assert json.loads(entry["details"])["merged_record_ids"] == ["mid", "old"]
+
+    def test_merge_bumps_row_version(self, duplicates):
+        pg = duplicates
+        row_version_sql = "SELECT row_version FROM active_event_data WHERE record_id = 'new'"
+        before = _scalar(pg, row_version_sql)
+        with pg._get_pool().connection() as conn:
+            pg._ensure_checkin_tag_index(conn)
+
+        assert _scalar(pg, row_version_sql) > before
+
+    def test_failed_merge_leaves_rows_untouched(self, duplicates, monkeypatch):
+        pg = duplicates
+
+        def fail(cur):
+            cur.execute("DELETE FROM active_event_data WHERE record_id = 'old'")
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(pg, "_merge_duplicate_checkins", fail)
+        with pg._get_pool().connection() as conn:
+            with pytest.raises(RuntimeError):
+                pg._ensure_checkin_tag_index(conn)
+
+        assert _scalar(pg, "SELECT COUNT(*) FROM active_event_data") == 4
+        assert _scalar(pg, "SELECT to_regclass('idx_active_event_tag_unique')") is None
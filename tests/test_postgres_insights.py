@@ -0,0 +1,293 @@
+# test_postgres_insights.py
+"""
+Tests for the insights queries in shared/postgres_api.py: get_insights_bundle
+(all KPIs of a dashboard view in one pipelined round-trip) must return what
+the individual get_* functions return for the same scope.
+
+Needs a scratch database (see conftest.py):
+
+Run with: TEST_DATABASE_URL=postgresql://... pytest tests/test_postgres_insights.py -v
+"""
+import pytest
+
+from shared.games import STREET_FIGHTER_6, TEKKEN_8
+
+EVENTS = [
+    ("weekly-1", "2026-01-10"),
+    ("weekly-2", "2026-02-14"),
+    ("weekly-3", "2026-03-14"),
+    ("weekly-4", "2026-04-11"),
+]
+
+# tag -> (events attended, games); the first event of a player is where they are new
+ATTENDANCE = {
+    "Logisticuz": (
+        ["weekly-1", "weekly-2", "weekly-3", "weekly-4"],
+        ["Street Fighter 6", "Tekken 8"],
+    ),
+    "Annie": (["weekly-1", "weekly-3", "weekly-4"], ["Tekken 8"]),
+    "Olle": (["weekly-2", "weekly-4"], ["Street Fighter 6", "Mortal Kombat 1"]),
+    "Newbie": (["weekly-4"], ["Street Fighter 6"]),
+    "Gone": (["weekly-1"], ["Mortal Kombat 1", "Tekken 8"]),
+}
+
+
+def _archive_events(pg):
+    """Check everyone in and archive EVENTS in date order."""
+    for slug, event_date in EVENTS:
+        with pg._get_pool().connection() as conn:
+            for tag, (events, games) in ATTENDANCE.items():
+                if slug not in events:
+                    continue
+                conn.execute(
+                    """
+                    INSERT INTO active_event_data (
+                        event_slug, name, tag, email, status, payment_amount,
+                        tournament_games_registered, added_via, acquisition_source
+                    ) VALUES (%s, %s, %s, %s, 'Ready', 25, %s, %s, %s)
+                    """,
+                    (
+                        slug,
+                        tag.title(),
+                        tag,
+                        f"{tag.lower()}@example.com",
+                        games,
+                        "manual_dashboard" if tag == "Newbie" else "startgg_flow",
+                        "discord" if tag in ("Olle", "Newbie") else None,
+                    ),
+                )
+        pg.archive_event(
+            slug,
+            event_date=event_date,
+            event_display_name=slug.title(),
+            swish_expected_per_game=25,
+            startgg_snapshot={},
+            clear_active=True,
+        )
+
+
+@pytest.fixture
+def archived(postgres_db, monkeypatch):
+    """Archived EVENTS, insights cache off (every call computes)."""
+    pg = postgres_db
+    _archive_events(pg)
+    monkeypatch.setattr(pg, "INSIGHTS_CACHE_ENABLED", False)
+    return pg
+
+
+SCOPE = {"event_slugs": None, "start_date": "2026-02-01", "end_date": "2026-04-30"}
+COMPARE_SCOPE = {"event_slugs": ["weekly-1"], "start_date": None, "end_date": "2026-01-31"}
+
+
+def _individual(pg, scope, full=True):
+    """The bundle's values computed with one get_* call each."""
+    slugs, start, end = scope["event_slugs"], scope["start_date"], scope["end_date"]
+    values = {
+        "manual_by_event": pg.get_event_manual_add_stats(slugs, start, end),
+        "multi_game": pg.get_multi_game_count(slugs, start, end),
+        "community_health": pg.get_community_health_v2_stats(slugs, start, end, end),
+        "unique_count": pg.get_unique_attendee_count(slugs, start, end),
+        "churn": pg.get_player_churn_stats(slugs, start, end, end),
+    }
+    if full:
+        values.update(
+            {
+                "added_via": pg.get_added_via_breakdown(slugs, start, end),
+                "acquisition_source": pg.get_acquisition_source_breakdown(slugs, start, end),
+                "top_players": pg.get_top_players_history(slugs, start, end, 3, "Tekken 8"),
+                "funnel": pg.get_player_funnel_stats(slugs, start, end, end),
+                "crossover": pg.get_game_crossover_stats(slugs, start, end, 5),
+            }
+        )
+    return values
+
+
+# ============================================================================
+# Bundle vs individual queries
+# ============================================================================
+
+
+class TestInsightsBundle:
+
+    def test_bundle_matches_individual_queries(self, archived):
+        pg = archived
+        bundle = pg.get_insights_bundle(
+            SCOPE,
+            COMPARE_SCOPE,
+            top_players_limit=3,
+            top_players_game="Tekken 8",
+            crossover_limit=5,
+        )
+
+        assert bundle["current"] == _individual(pg, SCOPE)
+        assert bundle["previous"] == _individual(pg, COMPARE_SCOPE, full=False)
+
+    def test_bundle_has_data(self, archived):
+        pg = archived
+        current = pg.get_insights_bundle(SCOPE)["current"]
+
+        assert current["unique_count"] == 4  # Gone only attended weekly-1
+        assert current["multi_game"] == {"multi_game_count": 5, "total_count": 8}
+        assert current["top_players"][0]["tag"] == "Logisticuz"
+        # Raw names resolve to canonical games (shared.games)
+        assert {"game_a": STREET_FIGHTER_6, "game_b": TEKKEN_8, "shared_players": 1} in (
+            current["crossover"]
+        )
+
+    def test_without_compare_scope(self, archived):
+        pg = archived
+
+        assert pg.get_insights_bundle(SCOPE)["previous"] is None
+
+    def test_event_slug_scope(self, archived):
+        pg = archived
+        scope = {"event_slugs": ["weekly-2", "weekly-4"], "start_date": None, "end_date": None}
+
+        assert pg.get_insights_bundle(scope)["current"]["unique_count"] == 4
+        assert pg.get_insights_bundle(scope)["current"]["manual_by_event"] == (
+            pg.get_event_manual_add_stats(["weekly-2", "weekly-4"])
+        )
+
+    def test_sections_limit_current(self, archived):
+        pg = archived
+        full = pg.get_insights_bundle(SCOPE, COMPARE_SCOPE)
+
+        bundle = pg.get_insights_bundle(SCOPE, COMPARE_SCOPE, sections=["unique_count", "funnel"])
+
+        assert bundle["current"] == {k: full["current"][k] for k in ("unique_count", "funnel")}
+        assert bundle["previous"] == full["previous"]
+        assert pg.get_insights_bundle(SCOPE, sections=[])["current"] == {}
+
+    def test_community_health_section_runs_its_source_queries(self, archived):
+        pg = archived
+
+        queries = pg._insights_scope_queries(SCOPE, True, ["community_health"])
+        current = pg.get_insights_bundle(SCOPE, sections=["community_health"])["current"]
+
+        assert set(queries) == {"core_players", "player_lifetime"}
+        assert current == {"community_health": _individual(pg, SCOPE)["community_health"]}
+
+
+# ============================================================================
+# Cache staleness (archive generation)
+# ============================================================================
+
+
+def _scalar(pg, sql, params=()):
+    with pg._get_pool().connection() as conn:
+        return conn.execute(sql, params).fetchone()[0]
+
+
+def _generation(pg):
+    return _scalar(pg, "SELECT generation FROM archive_generation WHERE id = 1")
+
+
+class TestInsightsCache:
+
+    @pytest.fixture
+    def cached(self, postgres_db, monkeypatch):
+        pg = postgres_db
+        monkeypatch.setattr(pg, "INSIGHTS_CACHE_ENABLED", True)
+        return pg
+
+    def _counting(self, pg):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return {"value": len(calls)}
+
+        return calls, lambda: pg._cached_insights("test", {"scope": 1}, compute)
+
+    def test_hit_skips_compute(self, cached):
+        calls, get = self._counting(cached)
+
+        assert get() == {"value": 1}
+        assert get() == {"value": 1}
+        assert len(calls) == 1
+
+    def test_sections_are_cached_separately(self, cached):
+        pg = cached
+        pg.get_insights_bundle(SCOPE, sections=["churn", "funnel"])
+        pg.get_insights_bundle(SCOPE, sections=["funnel", "churn"])
+        assert _scalar(pg, "SELECT COUNT(*) FROM insights_cache") == 1
+
+        assert set(pg.get_insights_bundle(SCOPE, sections=["churn"])["current"]) == {"churn"}
+        assert _scalar(pg, "SELECT COUNT(*) FROM insights_cache") == 2
+
+    def test_archiving_an_event_invalidates(self, cached):
+        pg = cached
+        scope = {"event_slugs": None, "start_date": None, "end_date": None}
+        before = pg.get_insights_bundle(scope)["current"]["unique_count"]
+        _archive_events(pg)
+
+        assert before == 0
+        assert pg.get_insights_bundle(scope)["current"]["unique_count"] == len(ATTENDANCE)
+
+    def test_rows_changed_bumps_generation(self, cached):
+        pg = cached
+        _archive_events(pg)
+        calls, get = self._counting(pg)
+        get()
+        generation = _generation(pg)
+        with pg._get_pool().connection() as conn:
+            conn.execute("UPDATE event_archive SET name = 'Renamed' WHERE tag = 'Newbie'")
+
+        assert _generation(pg) == generation + 1
+        get()
+        assert len(calls) == 2
+
+    def test_statements_without_rows_keep_generation(self, cached):
+        pg = cached
+        _archive_events(pg)
+        calls, get = self._counting(pg)
+        get()
+        generation = _generation(pg)
+        with pg._get_pool().connection() as conn:
+            conn.execute("UPDATE event_archive SET name = 'x' WHERE tag = 'nobody'")
+            conn.execute("DELETE FROM players WHERE tag = 'nobody'")
+            conn.execute("INSERT INTO games (name) VALUES ('Tekken 8') ON CONFLICT DO NOTHING")
+
+        assert _generation(pg) == generation
+        get()
+        assert len(calls) == 1
+
+    def test_rerunning_migrations_keeps_generation(self, cached):
+        pg = cached
+        _archive_events(pg)
+        generation = _generation(pg)
+        pg._run_migrations(pg._get_pool())
+
+        assert _generation(pg) == generation
+
+    def test_game_changes_bump_generation(self, cached):
+        pg = cached
+        generation = _generation(pg)
+        # Registration runs beside writers' open transactions and must not bump
+        pg._register_game_names(["Tekken 8 Weekly"])
+
+        assert _generation(pg) == generation
+        with pg._get_pool().connection() as conn:
+            conn.execute("UPDATE games SET name = 'Tekken 8' WHERE name = %s", (TEKKEN_8,))
+        assert _generation(pg) == generation + 1
+        with pg._get_pool().connection() as conn:
+            conn.execute("DELETE FROM game_aliases WHERE alias = 'tekken 8 weekly'")
+        assert _generation(pg) == generation + 2
+
+    def test_hit_at_is_rewritten_only_when_older_than_interval(self, cached, monkeypatch):
+        pg = cached
+        monkeypatch.setattr(pg, "INSIGHTS_CACHE_HIT_INTERVAL_SECONDS", 300)
+        _, get = self._counting(pg)
+        get()
+        hit_at_sql = "SELECT hit_at FROM insights_cache"
+        with pg._get_pool().connection() as conn:
+            conn.execute("UPDATE insights_cache SET hit_at = now() - interval '1 minute'")
+        recent = _scalar(pg, hit_at_sql)
+        get()
+
+        assert _scalar(pg, hit_at_sql) == recent
+        with pg._get_pool().connection() as conn:
+            conn.execute("UPDATE insights_cache SET hit_at = now() - interval '1 hour'")
+        old = _scalar(pg, hit_at_sql)
+        get()
+        assert _scalar(pg, hit_at_sql) > old
@@ -0,0 +1,249 @@
+# test_postgres_migrations.py
+"""
+Tests for the startup migrations in shared/postgres_api.py: one-time data
+backfills (_run_backfill) run once, atomically, across concurrent starts.
+
+Needs a scratch database (see conftest.py):
+
+Run with: TEST_DATABASE_URL=postgresql://... pytest tests/test_postgres_migrations.py -v
+"""
+import threading
+import time
+
+import pytest
+
+
+def _rows(pg, sql, params=()):
+    with pg._get_pool().connection() as conn:
+        return conn.execute(sql, params).fetchall()
+
+
+def _scalar(pg, sql, params=()):
+    return _rows(pg, sql, params)[0][0]
+
+
+def _done(pg):
+    return {r[0] for r in _rows(pg, "SELECT name FROM schema_backfills")}
+
+
+def _archive_rows(pg):
+    pg._register_game_names(["Tekken 8"])
+    with pg._get_pool().connection() as conn:
+        conn.execute("INSERT INTO players (uuid, name, tag) VALUES ('p1', 'Viktor', 'Logisticuz')")
+        conn.execute(
+            """
+            INSERT INTO event_archive (event_slug, event_date, name, player_uuid,
+                                       tournament_games_registered)
+            VALUES ('weekly-1', '2026-10-01', 'Viktor', 'p1', ARRAY['Tekken 8'])
+            """
+        )
+
+
+# ============================================================================
+# _run_backfill
+# ============================================================================
+
+
+class TestRunBackfill:
+
+    def _run(self, pg, backfill, name="test_backfill"):
+        with pg._get_pool().connection() as conn:
+            return pg._run_backfill(conn, name, backfill)
+
+    def test_runs_once_and_is_recorded(self, postgres_db):
+        pg = postgres_db
+        calls = []
+
+        assert self._run(pg, calls.append) is True
+        assert self._run(pg, calls.append) is True
+        assert len(calls) == 1
+        assert "test_backfill" in _done(pg)
+
+    def test_failure_rolls_back_and_runs_again(self, postgres_db):
+        pg = postgres_db
+
+        def fail(cur):
+            cur.execute("INSERT INTO players (uuid, name) VALUES ('half', 'Half Done')")
+            raise RuntimeError("boom")
+
+        assert self._run(pg, fail) is False
+        assert "test_backfill" not in _done(pg)
+        assert _scalar(pg, "SELECT COUNT(*) FROM players") == 0
+
+        calls = []
+        assert self._run(pg, calls.append) is True
+        assert len(calls) == 1
+
+    def test_concurrent_starts_run_it_once(self, postgres_db):
+        pg = postgres_db
+        barrier = threading.Barrier(4)
+        calls, results = [], []
+
+        def slow(cur):
+            calls.append(1)
+            time.sleep(0.2)
+
+        def start():
+            barrier.wait()
+            results.append(self._run(pg, slow))
+
+        threads = [threading.Thread(target=start) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert results == [True] * 4
+        assert len(calls) == 1
+
+
+# ============================================================================
+# player_event_facts backfill
+# ============================================================================
+
+
+class TestPlayerEventFactsBackfill:
+
+    def test_migration_builds_facts_once(self, postgres_db, monkeypatch):
+        pg = postgres_db
+        _archive_rows(pg)
+        with pg._get_pool().connection() as conn:
+            conn.execute("DELETE FROM player_event_facts")
+            conn.execute("DELETE FROM schema_backfills")
+        pg._run_migrations(pg._get_pool())
+
+        assert "player_event_facts" in _done(pg)
+        assert _scalar(pg, "SELECT COUNT(*) FROM player_event_facts") == 2
+
+        calls = []
+        monkeypatch.setattr(pg, "_refresh_player_event_facts", lambda cur: calls.append(cur))
+        pg._run_migrations(pg._get_pool())
+        assert calls == []
+
+    def test_failed_build_does_not_stop_later_migrations(self, postgres_db, monkeypatch):
+        pg = postgres_db
+        with pg._get_pool().connection() as conn:
+            conn.execute("DELETE FROM schema_backfills")
+            conn.execute("DROP INDEX idx_active_slug_created")
+
+        def fail(cur, *args, **kwargs):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(pg, "_refresh_player_event_facts", fail)
+        pg._run_migrations(pg._get_pool())
+
+        assert "player_event_facts" not in _done(pg)
+        assert _scalar(pg, "SELECT to_regclass('idx_active_slug_created') IS NOT NULL")
+
+    def test_game_column_layout_is_rebuilt(self, postgres_db):
+        pg = postgres_db
+        _archive_rows(pg)
+        pg._run_migrations(pg._get_pool())
+        # First layout: raw game names instead of game ids, facts already built
+        with pg._get_pool().connection() as conn:
+            conn.execute("DROP INDEX idx_pef_event")
+            conn.execute("DROP INDEX idx_pef_game")
+            conn.execute("ALTER TABLE player_event_facts DROP COLUMN game_id, ADD COLUMN game TEXT")
+        assert "player_event_facts" in _done(pg)
+
+        pg._run_migrations(pg._get_pool())
+
+        assert "player_event_facts" in _done(pg)
+        assert _scalar(pg, "SELECT COUNT(game_id) FROM player_event_facts") == 1
+
+
+# ============================================================================
+# tournament_game_ids backfill
+# ============================================================================
+
+
+class TestTournamentGameIdsBackfill:
+
+    @pytest.fixture
+    def unresolved(self, postgres_db):
+        """Rows written before the game dimension: names, no ids, no aliases."""
+        pg = postgres_db
+        _archive_rows(pg)
+        with pg._get_pool().connection() as conn:
+            conn.execute("UPDATE event_archive SET tournament_game_ids = NULL")
+            conn.execute("DELETE FROM game_aliases")
+            conn.execute("DELETE FROM games")
+            conn.execute("DELETE FROM schema_backfills WHERE name = 'tournament_game_ids'")
+        pg._known_game_aliases.clear()
+        return pg
+
+    def test_migration_resolves_stored_names(self, unresolved):
+        pg = unresolved
+        pg._run_migrations(pg._get_pool())
+
+        assert "tournament_game_ids" in _done(pg)
+        assert _scalar(pg, "SELECT tournament_game_ids FROM event_archive") == [
+            _scalar(pg, "SELECT game_id FROM game_aliases WHERE alias = 'tekken 8'")
+        ]
+
+    def test_failed_backfill_leaves_alias_cache_alone(self, unresolved):
+        pg = unresolved
+        with pg._get_pool().connection() as conn:
+            conn.execute("ALTER TABLE event_archive RENAME COLUMN tournament_game_ids TO ids_gone")
+            pg._run_backfill(conn, "tournament_game_ids", pg._backfill_tournament_game_ids)
+            conn.execute("ALTER TABLE event_archive RENAME COLUMN ids_gone TO tournament_game_ids")
+
+        assert "tournament_game_ids" not in _done(pg)
+        assert _scalar(pg, "SELECT COUNT(*) FROM game_aliases") == 0
+        assert pg._known_game_aliases == set()
+
+
+# ============================================================================
+# duplicate_candidates seed
+# ============================================================================
+
+
+class TestDuplicateCandidatesBackfill:
+
+    @pytest.fixture
+    def decided(self, postgres_db):
+        """Players, one earlier merge and one dismissal; the seed not run yet."""
+        pg = postgres_db
+        with pg._get_pool().connection() as conn:
+            for uuid in ("a", "b", "c"):
+                conn.execute(
+                    "INSERT INTO players (uuid, name, tag) VALUES (%s, 'Viktor', %s)", (uuid, uuid)
+                )
+            conn.execute(
+                """
+                INSERT INTO merge_log (keep_uuid, remove_uuid, user_name, removed_player_snapshot)
+                VALUES ('b', 'a', 'admin', '{}')
+                """
+            )
+            conn.execute("DELETE FROM duplicate_scan_queue")
+            conn.execute("DELETE FROM schema_backfills WHERE name = 'duplicate_candidates'")
+        pg.log_action(
+            {"user_id": "1", "user_name": "admin"},
+            "duplicate_dismissed",
+            "players",
+            details='{"pair": ["c", "b"]}',
+            durable=True,
+        )
+        return pg
+
+    def test_migration_seeds_queue_and_decisions(self, decided):
+        pg = decided
+        pg._run_migrations(pg._get_pool())
+
+        assert "duplicate_candidates" in _done(pg)
+        assert _scalar(pg, "SELECT COUNT(*) FROM duplicate_scan_queue") == 3
+        assert _rows(
+            pg, "SELECT uuid_a, uuid_b, state FROM duplicate_candidates ORDER BY uuid_a"
+        ) == [("a", "b", "merged"), ("b", "c", "rejected")]
+
+    def test_existing_candidates_do_not_fail_the_seed(self, decided):
+        pg = decided
+        # Another process already recorded the pair (e.g. a refresh between starts)
+        with pg._get_pool().connection() as conn:
+            conn.execute(
+                "INSERT INTO duplicate_candidates (uuid_a, uuid_b, state) VALUES ('a', 'b', 'open')"
+            )
+            assert pg._run_backfill(conn, "duplicate_candidates", pg._backfill_duplicate_candidates)
+
+        assert "duplicate_candidates" in _done(pg)
+        assert _scalar(pg, "SELECT COUNT(*) FROM duplicate_candidates") == 2
@@ -0,0 +1,204 @@
+# test_postgres_sessions.py
+"""
+Tests for the per-process session cache in shared/postgres_api.py:
+get_session serves cached rows while the listener is connected, revoked
+sessions (delete, expiry change) are dropped via NOTIFY, and
+update_session_activity writes last_active at most once per interval.
+
+Needs a scratch database (see conftest.py):
+
+Run with: TEST_DATABASE_URL=postgresql://... pytest tests/test_postgres_sessions.py -v
+"""
+import threading
+import time
+from datetime import timedelta
+
+import pytest
+
+USER = {"id": 7, "name": "Viktor", "email": "viktor@example.com"}
+
+
+def _execute(pg, sql, params=()):
+    with pg._get_pool().connection() as conn:
+        conn.execute(sql, params)
+
+
+def _scalar(pg, sql, params=()):
+    with pg._get_pool().connection() as conn:
+        return conn.execute(sql, params).fetchone()[0]
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return condition()
+
+
+@pytest.fixture
+def sessions(postgres_db, monkeypatch):
+    """Session cache on, listener connected."""
+    pg = postgres_db
+    monkeypatch.setattr(pg, "SESSION_CACHE_TTL_SECONDS", 30)
+    monkeypatch.setattr(pg, "SESSION_ACTIVITY_WRITE_INTERVAL_SECONDS", 60)
+    pg._ensure_settings_listener()
+    assert pg._settings_listener_ready.wait(5)
+    return pg
+
+
+def _rename(pg, session_id, name):
+    """Change the row behind the cache's back (no NOTIFY for user_name)."""
+    _execute(pg, "UPDATE sessions SET user_name = %s WHERE session_id = %s", (name, session_id))
+
+
+# ============================================================================
+# get_session cache
+# ============================================================================
+
+
+class TestSessionCache:
+
+    def test_cached_row_is_served(self, sessions):
+        pg = sessions
+        session_id = pg.create_session(USER, "token")
+        assert pg.get_session(session_id)["user_name"] == "Viktor"
+        _rename(pg, session_id, "Renamed")
+
+        assert pg.get_session(session_id)["user_name"] == "Viktor"
+
+    def test_expired_ttl_reads_again(self, sessions):
+        pg = sessions
+        session_id = pg.create_session(USER, "token")
+        pg.get_session(session_id)
+        _rename(pg, session_id, "Renamed")
+        cached_at, row = pg._session_cache[session_id]
+        pg._session_cache[session_id] = (cached_at - 31, row)
+
+        assert pg.get_session(session_id)["user_name"] == "Renamed"
+
+    def test_ttl_zero_disables_the_cache(self, sessions, monkeypatch):
+        pg = sessions
+        monkeypatch.setattr(pg, "SESSION_CACHE_TTL_SECONDS", 0)
+        session_id = pg.create_session(USER, "token")
+        pg.get_session(session_id)
+        _rename(pg, session_id, "Renamed")
+
+        assert pg.get_session(session_id)["user_name"] == "Renamed"
+        assert pg._session_cache == {}
+
+    def test_not_cached_while_listener_is_down(self, sessions, monkeypatch):
+        pg = sessions
+        monkeypatch.setattr(pg, "_settings_listener_ready", threading.Event())
+        session_id = pg.create_session(USER, "token")
+        pg.get_session(session_id)
+        _rename(pg, session_id, "Renamed")
+
+        assert pg.get_session(session_id)["user_name"] == "Renamed"
+
+    def test_revoked_while_reading_is_not_stored(self, sessions):
+        pg = sessions
+        session_id = pg.create_session(USER, "token")
+        _, generation = pg._session_cache_lookup(session_id)
+        pg.invalidate_session_cache("other-session")  # a NOTIFY arrives mid-query
+
+        pg._session_cache_store(session_id, ("row",), generation)
+
+        assert session_id not in pg._session_cache
+
+    def test_logout_drops_the_session(self, sessions):
+        pg = sessions
+        session_id = pg.create_session(USER, "token")
+        pg.get_session(session_id)
+
+        assert pg.delete_session(session_id) is True
+        assert pg.get_session(session_id) is None
+
+    def test_delete_by_another_worker_is_notified(self, sessions):
+        pg = sessions
+        session_id = pg.create_session(USER, "token")
+        pg.get_session(session_id)
+        _execute(pg, "DELETE FROM sessions WHERE session_id = %s", (session_id,))
+
+        assert _wait_for(lambda: session_id not in pg._session_cache)
+        assert pg.get_session(session_id) is None
+
+    def test_expiry_change_by_another_worker_is_notified(self, sessions):
+        pg = sessions
+        session_id = pg.create_session(USER, "token")
+        pg.get_session(session_id)
+        _execute(
+            pg,
+            "UPDATE sessions SET expires_at = now() - interval '1 minute' WHERE session_id = %s",
+            (session_id,),
+        )
+
+        assert _wait_for(lambda: session_id not in pg._session_cache)
+        assert pg.get_session(session_id) is None
+
+    def test_idle_session_is_deleted(self, sessions):
+        pg = sessions
+        session_id = pg.create_session(USER, "token")
+        _execute(
+            pg,
+            "UPDATE sessions SET last_active = now() - %s WHERE session_id = %s",
+            (pg.SESSION_IDLE_TIMEOUT + timedelta(minutes=1), session_id),
+        )
+
+        assert pg.get_session(session_id) is None
+        assert _scalar(pg, "SELECT COUNT(*) FROM sessions") == 0
+
+
+# ============================================================================
+# update_session_activity
+# ============================================================================
+
+
+class TestSessionActivity:
+
+    def _age(self, pg, session_id, minutes):
+        _execute(
+            pg,
+            "UPDATE sessions SET last_active = now() - %s WHERE session_id = %s",
+            (timedelta(minutes=minutes), session_id),
+        )
+
+    def _idle_seconds(self, pg, session_id):
+        return _scalar(
+            pg,
+            "SELECT EXTRACT(EPOCH FROM now() - last_active) FROM sessions WHERE session_id = %s",
+            (session_id,),
+        )
+
+    def test_written_at_most_once_per_interval(self, sessions):
+        pg = sessions
+        session_id = pg.create_session(USER, "token")
+        self._age(pg, session_id, 10)
+
+        pg.update_session_activity(session_id)
+        assert self._idle_seconds(pg, session_id) < 5
+
+        self._age(pg, session_id, 10)
+        pg.update_session_activity(session_id)
+        assert self._idle_seconds(pg, session_id) > 500
+
+    def test_recent_write_by_another_worker_is_kept(self, sessions):
+        pg = sessions
+        session_id = pg.create_session(USER, "token")
+        idle = self._idle_seconds(pg, session_id)
+        time.sleep(0.1)
+
+        pg.update_session_activity(session_id)
+
+        assert self._idle_seconds(pg, session_id) > idle
+
+    def test_cached_row_gets_the_new_last_active(self, sessions):
+        pg = sessions
+        session_id = pg.create_session(USER, "token")
+        self._age(pg, session_id, 10)
+        stale = pg.get_session(session_id)["last_active"]
+
+        pg.update_session_activity(session_id)
+
+        assert pg.get_session(session_id)["last_active"] > stale
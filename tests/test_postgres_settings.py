@@ -0,0 +1,214 @@
+# test_postgres_settings.py
+"""
+Tests for the per-process settings cache in shared/postgres_api.py: the
+active settings row (or its absence) is served from memory while the
+listener is connected, dropped on NOTIFY and when the listener disconnects,
+and a row fetched while an invalidation arrives is not stored.
+
+Needs a scratch database (see conftest.py):
+
+Run with: TEST_DATABASE_URL=postgresql://... pytest tests/test_postgres_settings.py -v
+"""
+import threading
+import time
+
+import pytest
+
+
+def _execute(pg, sql, params=()):
+    with pg._get_pool().connection() as conn:
+        conn.execute(sql, params)
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return condition()
+
+
+def _insert_settings(pg, name="Weekly 1"):
+    _execute(
+        pg,
+        "INSERT INTO settings (is_active, active_event_slug, event_display_name) "
+        "VALUES (true, 'weekly-1', %s)",
+        (name,),
+    )
+
+
+def _rename_quietly(pg, name):
+    """Change the row behind the cache's back (NOTIFY trigger disabled)."""
+    with pg._get_pool().connection() as conn:
+        with conn.transaction():
+            conn.execute("ALTER TABLE settings DISABLE TRIGGER USER")
+            conn.execute("UPDATE settings SET event_display_name = %s", (name,))
+            conn.execute("ALTER TABLE settings ENABLE TRIGGER USER")
+
+
+def _display_name(pg):
+    return (pg.get_active_settings() or {}).get("event_display_name")
+
+
+@pytest.fixture
+def settings(postgres_db, monkeypatch):
+    """Settings cache on, listener connected."""
+    pg = postgres_db
+    monkeypatch.setattr(pg, "SETTINGS_CACHE_ENABLED", True)
+    pg._ensure_settings_listener()
+    assert pg._settings_listener_ready.wait(5)
+    pg.invalidate_settings_cache()
+    return pg
+
+
+# ============================================================================
+# Cached row
+# ============================================================================
+
+
+class TestSettingsCache:
+
+    def test_cached_row_is_served(self, settings):
+        pg = settings
+        _insert_settings(pg)
+        assert _display_name(pg) == "Weekly 1"
+        _rename_quietly(pg, "Renamed")
+
+        assert _display_name(pg) == "Weekly 1"
+
+    def test_returned_rows_are_copies(self, settings):
+        pg = settings
+        _insert_settings(pg)
+        pg.get_active_settings()["event_display_name"] = "Changed by caller"
+
+        assert _display_name(pg) == "Weekly 1"
+
+    def test_notify_invalidates(self, settings):
+        pg = settings
+        _insert_settings(pg)
+        assert _display_name(pg) == "Weekly 1"
+
+        _execute(pg, "UPDATE settings SET event_display_name = 'Renamed'")
+
+        assert _wait_for(lambda: _display_name(pg) == "Renamed")
+
+    def test_update_settings_invalidates_without_waiting(self, settings):
+        pg = settings
+        _insert_settings(pg)
+        record_id = pg.get_active_settings_with_id()["record_id"]
+        _execute(pg, "ALTER TABLE settings DISABLE TRIGGER USER")
+
+        pg.update_settings(record_id, {"event_display_name": "Renamed"})
+
+        assert _display_name(pg) == "Renamed"
+
+    def test_disabled_cache_reads_every_time(self, settings, monkeypatch):
+        pg = settings
+        monkeypatch.setattr(pg, "SETTINGS_CACHE_ENABLED", False)
+        _insert_settings(pg)
+        assert _display_name(pg) == "Weekly 1"
+        _rename_quietly(pg, "Renamed")
+
+        assert _display_name(pg) == "Renamed"
+        assert pg._settings_cache_row is None
+
+
+# ============================================================================
+# No active row
+# ============================================================================
+
+
+class TestMissingSettingsRow:
+
+    def test_missing_row_is_cached(self, settings):
+        pg = settings
+        assert pg.get_active_settings() is None
+        assert pg._settings_cache_row is pg._SETTINGS_ROW_MISSING
+        with pg._get_pool().connection() as conn:
+            with conn.transaction():
+                conn.execute("ALTER TABLE settings DISABLE TRIGGER USER")
+                conn.execute(
+                    "INSERT INTO settings (is_active, event_display_name) VALUES (true, 'Quiet')"
+                )
+                conn.execute("ALTER TABLE settings ENABLE TRIGGER USER")
+
+        assert pg.get_active_settings() is None
+        assert pg.get_active_settings_with_id() is None
+        assert pg.get_active_slug() is None
+
+    def test_first_active_row_invalidates(self, settings):
+        pg = settings
+        assert pg.get_active_settings() is None
+
+        _insert_settings(pg)
+
+        assert _wait_for(lambda: _display_name(pg) == "Weekly 1")
+
+
+# ============================================================================
+# Invalidation races and listener state
+# ============================================================================
+
+
+class TestSettingsCacheInvalidation:
+
+    def test_fetch_racing_an_invalidation_is_not_stored(self, settings, monkeypatch):
+        pg = settings
+        _insert_settings(pg)
+        real = pg._row_to_dict
+
+        def notify_mid_query(columns, row):
+            # A settings NOTIFY arrives while the SELECT is in flight
+            pg.invalidate_settings_cache()
+            return real(columns, row)
+
+        monkeypatch.setattr(pg, "_row_to_dict", notify_mid_query)
+        assert _display_name(pg) == "Weekly 1"
+        monkeypatch.setattr(pg, "_row_to_dict", real)
+
+        assert pg._settings_cache_row is None
+        _rename_quietly(pg, "Renamed")
+        assert _display_name(pg) == "Renamed"
+
+    def test_store_with_stale_generation_is_ignored(self, settings):
+        pg = settings
+        _, generation = pg._settings_cache_lookup()
+        pg.invalidate_settings_cache()
+
+        pg._settings_cache_store({"event_display_name": "Old"}, generation)
+
+        assert pg._settings_cache_row is None
+
+    def test_not_cached_while_listener_is_down(self, settings, monkeypatch):
+        pg = settings
+        monkeypatch.setattr(pg, "_settings_listener_ready", threading.Event())
+        _insert_settings(pg)
+        assert _display_name(pg) == "Weekly 1"
+        _rename_quietly(pg, "Renamed")
+
+        assert _display_name(pg) == "Renamed"
+        assert pg._settings_cache_row is None
+
+    def test_listener_disconnect_drops_the_cache(self, settings):
+        pg = settings
+        _insert_settings(pg)
+        assert _display_name(pg) == "Weekly 1"
+        _rename_quietly(pg, "Renamed")
+        generation = pg._settings_cache_generation
+
+        # Kill the listener's connection; changes made meanwhile were never notified
+        _execute(
+            pg,
+            """
+            SELECT pg_terminate_backend(pid) FROM pg_stat_activity
+            WHERE query = %s AND pid <> pg_backend_pid()
+            """,
+            (f"LISTEN {pg.SESSION_NOTIFY_CHANNEL}",),
+        )
+
+        assert _wait_for(lambda: not pg._settings_listener_ready.is_set(), timeout=1)
+        assert pg._settings_cache_generation > generation
+        assert pg._settings_cache_row is None
+        assert _display_name(pg) == "Renamed"
+        assert pg._settings_listener_ready.wait(5)
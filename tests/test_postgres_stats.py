@@ -0,0 +1,132 @@
+# test_postgres_stats.py
+"""
+Tests for the set-based event funnel in shared/postgres_api.py
+(_event_funnel_counts, used by recompute_event_stats): new vs returning
+players per event, compared against a brute-force count.
+
+Needs a scratch database (see conftest.py):
+
+Run with: TEST_DATABASE_URL=postgresql://... pytest tests/test_postgres_stats.py -v
+"""
+import random
+from datetime import date, timedelta
+
+
+def _insert_archive(pg, rows):
+    """rows: (event_slug, event_date, player_uuid)"""
+    with pg._get_pool().connection() as conn:
+        with conn.cursor() as cur:
+            cur.executemany(
+                "INSERT INTO event_archive (event_slug, event_date, name, player_uuid) "
+                "VALUES (%s, %s, 'Player', %s)",
+                rows,
+            )
+
+
+def _funnel(pg, event_dates):
+    with pg._get_pool().connection() as conn:
+        with conn.cursor() as cur:
+            return pg._event_funnel_counts(cur, event_dates)
+
+
+def _brute_force(rows, event_dates):
+    """Returning = the player has an archive row for another event dated before this one."""
+    first_date = {}
+    for slug, day, player in rows:
+        key = (player, slug)
+        first_date[key] = min(first_date.get(key, day), day)
+
+    counts = {}
+    for target, target_date in event_dates.items():
+        new = returning = 0
+        for slug, _, player in rows:
+            if slug != target or not player:
+                continue
+            if any(
+                p == player and s != target and d < target_date for (p, s), d in first_date.items()
+            ):
+                returning += 1
+            else:
+                new += 1
+        counts[target] = (new, returning)
+    return counts
+
+
+# ============================================================================
+# _event_funnel_counts
+# ============================================================================
+
+
+class TestEventFunnelCounts:
+
+    def test_first_event_is_all_new(self, postgres_db):
+        pg = postgres_db
+        _insert_archive(
+            pg,
+            [
+                ("w1", date(2026, 1, 1), "a"),
+                ("w1", date(2026, 1, 1), "b"),
+                ("w2", date(2026, 1, 8), "a"),
+                ("w2", date(2026, 1, 8), "c"),
+            ],
+        )
+
+        assert _funnel(pg, {"w1": date(2026, 1, 1), "w2": date(2026, 1, 8)}) == {
+            "w1": (2, 0),
+            "w2": (1, 1),
+        }
+
+    def test_later_event_does_not_make_a_player_returning(self, postgres_db):
+        pg = postgres_db
+        # Re-archiving an older event after a newer one exists
+        _insert_archive(pg, [("w2", date(2026, 1, 8), "a"), ("w1", date(2026, 1, 1), "a")])
+
+        assert _funnel(pg, {"w1": date(2026, 1, 1)}) == {"w1": (1, 0)}
+
+    def test_same_day_event_is_not_earlier(self, postgres_db):
+        pg = postgres_db
+        _insert_archive(pg, [("am", date(2026, 1, 1), "a"), ("pm", date(2026, 1, 1), "a")])
+
+        assert _funnel(pg, {"am": date(2026, 1, 1), "pm": date(2026, 1, 1)}) == {
+            "am": (1, 0),
+            "pm": (1, 0),
+        }
+
+    def test_rows_without_player_count_as_neither(self, postgres_db):
+        pg = postgres_db
+        _insert_archive(
+            pg,
+            [
+                ("w1", date(2026, 1, 1), None),
+                ("w1", date(2026, 1, 1), ""),
+                ("w1", date(2026, 1, 1), "a"),
+            ],
+        )
+
+        assert _funnel(pg, {"w1": date(2026, 1, 1)}) == {"w1": (1, 0)}
+
+    def test_event_without_rows_and_empty_input(self, postgres_db):
+        pg = postgres_db
+
+        assert _funnel(pg, {"empty": date(2026, 1, 1)}) == {"empty": (0, 0)}
+        assert _funnel(pg, {}) == {}
+
+    def test_matches_brute_force(self, postgres_db):
+        pg = postgres_db
+        rng = random.Random(11)
+        start = date(2026, 1, 1)
+        # Some events share a date; players attend at random, a few rows lack a player
+        event_dates = {f"w{i}": start + timedelta(days=7 * (i // 2)) for i in range(10)}
+        players = [f"p{i}" for i in range(25)] + [None]
+        rows = [
+            (slug, day, player)
+            for slug, day in event_dates.items()
+            for player in players
+            if rng.random() < 0.4
+        ]
+        rng.shuffle(rows)
+        _insert_archive(pg, rows)
+
+        assert _funnel(pg, event_dates) == _brute_force(rows, event_dates)
+        subset = {slug: event_dates[slug] for slug in ("w3", "w8")}
+        assert _funnel(pg, subset) == _brute_force(rows, subset)
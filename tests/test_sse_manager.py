@@ -0,0 +1,329 @@
+# test_sse_manager.py
+"""
+Tests for SSEManager in backend/main.py: the cross-worker broadcast relay
+and the per-worker `checkin_delta` stream (seq numbering, connect handshake).
+
+Workers are SSEManager instances sharing an in-memory stand-in for the
+Postgres NOTIFY channel (publish_notification / listen_notifications), which
+- like Postgres - also delivers a worker's own messages back to it.
+
+Run with: pytest tests/test_sse_manager.py -v
+"""
+import asyncio
+import json
+import os
+import sys
+import types
+
+import pytest
+
+BACKEND = os.path.join(os.path.dirname(__file__), '..', 'backend')
+sys.path.insert(0, BACKEND)
+
+
+@pytest.fixture(scope="module")
+def main():
+    # main mounts static/ and templates/ relative to the working directory
+    cwd = os.getcwd()
+    os.chdir(BACKEND)
+    try:
+        import main
+    finally:
+        os.chdir(cwd)
+    return main
+
+
+# ============================================================================
+# Stand-ins
+# ============================================================================
+
+
+class _NotifyBus:
+    """publish_notification / listen_notifications over in-process handlers."""
+
+    def __init__(self, payload_limit=8000):
+        self.payload_limit = payload_limit
+        self.handlers = {}
+        self.published = []
+
+    async def publish_notification(self, channel, payload):
+        if len(payload) > self.payload_limit:
+            return False
+        self.published.append((channel, json.loads(payload)))
+        for on_message in list(self.handlers.get(channel, ())):
+            await on_message(payload)
+        return True
+
+    async def listen_notifications(self, channel, on_message, ready=None, on_connect=None):
+        self.handlers.setdefault(channel, []).append(on_message)
+        if ready is not None:
+            ready.set()
+        if on_connect is not None:
+            await on_connect()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            self.handlers[channel].remove(on_message)
+            if ready is not None:
+                ready.clear()
+
+    def storage(self):
+        return types.SimpleNamespace(
+            publish_notification=self.publish_notification,
+            listen_notifications=self.listen_notifications,
+        )
+
+
+@pytest.fixture
+def bus(main, monkeypatch):
+    bus = _NotifyBus()
+    monkeypatch.setattr(main, "storage_api", bus.storage())
+    monkeypatch.setattr(main, "CHECKIN_DELTA_CHANNEL", "fgc_checkin_delta")
+    return bus
+
+
+def _run(main, test, workers=2):
+    """Run test(*managers) with relays started; managers are stopped afterwards."""
+
+    async def run():
+        managers = [main.SSEManager() for _ in range(workers)]
+        for manager in managers:
+            await manager.start_relay()
+        await asyncio.sleep(0)  # let the listener tasks subscribe
+        try:
+            return await test(*managers)
+        finally:
+            for manager in managers:
+                await manager.stop_relay()
+
+    return asyncio.run(run())
+
+
+def _drain(queue):
+    """(event, data) of every queued SSE message; watcher queues hold plain dicts."""
+    messages = []
+    while not queue.empty():
+        message = queue.get_nowait()
+        if isinstance(message, str):
+            head, data = message.strip().split("\n")
+            message = (head.removeprefix("event: "), json.loads(data.removeprefix("data: ")))
+        messages.append(message)
+    return messages
+
+
+async def _connect(manager):
+    """Connect a client; returns its queue and 'connected' handshake."""
+    queue = await manager.connect()
+    event, hello = _drain(queue)[0]
+    assert event == "connected"
+    return queue, hello
+
+
+async def _client(manager):
+    """Connect a client and drop its 'connected' handshake."""
+    queue, _ = await _connect(manager)
+    return queue
+
+
+async def _delta(bus, op, *rows):
+    """Publish one check-in change feed notification."""
+    payload = json.dumps({"op": op, "rows": list(rows)})
+    await bus.publish_notification("fgc_checkin_delta", payload)
+
+
+# ============================================================================
+# broadcast / _on_notification
+# ============================================================================
+
+
+class TestBroadcastRelay:
+
+    def test_broadcast_reaches_every_worker_once(self, main, bus):
+        async def test(a, b):
+            local, remote = await _client(a), await _client(b)
+
+            await a.broadcast("new_checkin", {"tag": "Viktor"})
+
+            return _drain(local), _drain(remote)
+
+        local, remote = _run(main, test)
+
+        assert local == [("new_checkin", {"tag": "Viktor"})]
+        assert remote == [("new_checkin", {"tag": "Viktor"})]
+
+    def test_worker_skips_its_own_messages(self, main, bus):
+        async def test(a):
+            client = await _client(a)
+
+            await a.broadcast("update", {"type": "refresh"})
+
+            return _drain(client)
+
+        # The bus echoes the message back to its sender, as Postgres does
+        assert _run(main, test, workers=1) == [("update", {"type": "refresh"})]
+        assert len(bus.published) == 1
+
+    def test_unsendable_payload_falls_back_to_refresh(self, main, bus):
+        bus.payload_limit = 200
+        rows = [{"tag": f"Player {i}"} for i in range(20)]
+
+        async def test(a, b):
+            local, remote = await _client(a), await _client(b)
+
+            await a.broadcast("checkins", {"rows": rows})
+
+            return _drain(local), _drain(remote)
+
+        local, remote = _run(main, test)
+
+        assert local == [("checkins", {"rows": rows})]
+        assert remote == [("update", {"type": "refresh"})]
+        assert [message["event"] for _, message in bus.published] == ["update"]
+
+    def test_checkin_result_goes_only_to_its_watchers(self, main, bus):
+        result = {"checkin_id": "c-1", "status": "Ready", "tag": "Viktor"}
+
+        async def test(a, b):
+            clients = [await _client(a), await _client(b)]
+            watcher = await b.watch_checkin("c-1")
+            other = await b.watch_checkin("c-2")
+
+            await a.broadcast("checkin_result", result)
+
+            return [_drain(client) for client in clients], _drain(watcher), _drain(other)
+
+        clients, watcher, other = _run(main, test)
+
+        assert clients == [[], []]
+        assert watcher == [result]
+        assert other == []
+
+    def test_unwatched_checkin_is_forgotten(self, main, bus):
+        async def test(a):
+            watcher = await a.watch_checkin("c-1")
+            await a.unwatch_checkin("c-1", watcher)
+
+            await a.broadcast("checkin_result", {"checkin_id": "c-1"})
+
+            return _drain(watcher), a.checkin_watchers
+
+        assert _run(main, test, workers=1) == ([], {})
+
+    def test_malformed_notification_is_ignored(self, main, bus):
+        async def test(a):
+            client = await _client(a)
+
+            await a._on_notification("not json")
+            await a._on_notification(json.dumps({"origin": "other-worker"}))
+
+            return _drain(client)
+
+        assert _run(main, test, workers=1) == [("update", {})]
+
+    def test_without_relay_delivery_is_local(self, main, monkeypatch):
+        monkeypatch.setattr(main, "storage_api", types.SimpleNamespace())
+
+        async def test(a):
+            client = await _client(a)
+
+            await a.broadcast("new_checkin", {"tag": "Viktor"})
+
+            return _drain(client), a._relay_task
+
+        assert _run(main, test, workers=1) == ([("new_checkin", {"tag": "Viktor"})], None)
+
+
+# ============================================================================
+# _on_checkin_delta / connect
+# ============================================================================
+
+
+class TestCheckinDelta:
+
+    def test_seq_counts_per_worker_stream(self, main, bus):
+        async def test(a, b):
+            clients = [await _client(a), await _client(b)]
+
+            await _delta(bus, "insert", {"record_id": "r1"})
+            await _delta(bus, "update", {"record_id": "r1"}, {"record_id": "r2"})
+
+            return [(m.worker_id, _drain(c)) for m, c in zip((a, b), clients)]
+
+        for worker_id, messages in _run(main, test):
+            assert messages == [
+                (
+                    "checkin_delta",
+                    {"stream": worker_id, "seq": 1, "op": "insert", "rows": [{"record_id": "r1"}]},
+                ),
+                (
+                    "checkin_delta",
+                    {
+                        "stream": worker_id,
+                        "seq": 2,
+                        "op": "update",
+                        "rows": [{"record_id": "r1"}, {"record_id": "r2"}],
+                    },
+                ),
+            ]
+
+    def test_handshake_carries_stream_and_seq(self, main, bus):
+        async def test(a):
+            await _delta(bus, "insert", {"record_id": "r1"})
+            await _delta(bus, "delete", {"record_id": "r1"})
+            client, hello = await _connect(a)
+
+            await _delta(bus, "insert", {"record_id": "r2"})
+
+            return a.worker_id, hello, _drain(client)
+
+        worker_id, hello, messages = _run(main, test, workers=1)
+
+        assert hello == {"status": "connected", "delta_stream": worker_id, "delta_seq": 2}
+        assert [(e, d["stream"], d["seq"]) for e, d in messages] == [
+            ("checkin_delta", worker_id, 3)
+        ]
+
+    def test_handshake_without_feed_has_no_stream(self, main, bus):
+        async def test():
+            _, hello = await _connect(main.SSEManager())
+            return hello
+
+        assert asyncio.run(test()) == {"status": "connected", "delta_stream": None, "delta_seq": 0}
+
+    def test_unknown_op_refreshes_without_using_a_seq(self, main, bus):
+        async def test(a):
+            client = await _client(a)
+
+            await _delta(bus, "truncate")
+            await _delta(bus, "insert", {"record_id": "r1"})
+
+            return _drain(client)
+
+        messages = _run(main, test, workers=1)
+
+        assert messages[0] == ("update", {"type": "refresh"})
+        assert [(e, d["seq"]) for e, d in messages[1:]] == [("checkin_delta", 1)]
+
+    def test_malformed_delta_is_ignored(self, main, bus):
+        async def test(a):
+            client = await _client(a)
+
+            await a._on_checkin_delta("not json")
+
+            return _drain(client), a._delta_seq
+
+        assert _run(main, test, workers=1) == ([], 0)
+
+    def test_feed_connect_refreshes_clients(self, main, bus):
+        async def test():
+            manager = main.SSEManager()
+            client = await _client(manager)
+            await manager.start_relay()
+            await asyncio.sleep(0)
+            try:
+                return _drain(client)
+            finally:
+                await manager.stop_relay()
+
+        # Changes made while the feed was down were never sent as deltas
+        assert asyncio.run(test()) == [("update", {"type": "refresh"})]
@@ -0,0 +1,256 @@
+# test_startgg_roster.py
+"""
+Tests for the Start.gg roster prefetch (backend/startgg_roster.py).
+
+A local stand-in server (conftest.py) plays Start.gg GraphQL (paged participants +
+numAttendees probe); storage is an in-memory stand-in for the
+startgg_roster / startgg_roster_sync tables.
+
+Run with: pytest tests/test_startgg_roster.py -v
+"""
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import integrations  # noqa: E402
+from startgg_roster import StartggRoster  # noqa: E402
+
+
+def _participant(pid, tag, events=("Street Fighter 6",)):
+    return {
+        "id": pid,
+        "gamerTag": tag,
+        "email": f"{tag.lower()}@example.com",
+        "user": {"name": tag.title()},
+        "events": [{"id": i, "name": name} for i, name in enumerate(events)],
+    }
+
+
+# ============================================================================
+# Stand-ins
+# ============================================================================
+
+
+def _respond_startgg(server, path, body):
+    """Answer roster pages, numAttendees probes and single-tag queries."""
+    query, variables = body["query"], body["variables"]
+    participants = server.participants
+
+    if "Roster(" in query:
+        kind = "roster"
+        per_page, page = variables["perPage"], variables["page"]
+        nodes = participants[(page - 1) * per_page : page * per_page]
+        total_pages = max(1, -(-len(participants) // per_page))
+        tournament = {
+            "id": 1,
+            "name": "Weekly",
+            "numAttendees": len(participants),
+            "participants": {"pageInfo": {"totalPages": total_pages}, "nodes": nodes},
+        }
+    elif "numAttendees" in query:
+        kind = "probe"
+        tournament = {"id": 1, "numAttendees": len(participants)}
+    else:
+        kind = "tag"
+        key = variables["tag"].casefold()
+        nodes = [p for p in participants if p["gamerTag"].casefold() == key]
+        tournament = {"id": 1, "name": "Weekly", "participants": {"nodes": nodes}}
+    server.calls.append(kind)
+    return 200, {"data": {"tournament": tournament}}
+
+
+class _MemoryRosterStorage:
+    """In-memory stand-in for the roster storage functions."""
+
+    def __init__(self):
+        self.rows = {}  # (slug, participant_id) -> entry
+        self.state = {}  # slug -> {claimed_at, synced_at, full_synced_at, attendee_count}
+        self.saves = []
+
+    async def claim_startgg_roster_sync(self, slug, min_interval_seconds):
+        now = datetime.now(timezone.utc)
+        st = self.state.setdefault(
+            slug,
+            {"claimed_at": None, "synced_at": None, "full_synced_at": None, "attendee_count": None},
+        )
+        if st["claimed_at"] and now - st["claimed_at"] < timedelta(seconds=min_interval_seconds):
+            return None
+        st["claimed_at"] = now
+        return {k: st[k] for k in ("synced_at", "full_synced_at", "attendee_count")}
+
+    async def get_startgg_roster_state(self, slug):
+        st = self.state.get(slug)
+        return {k: st[k] for k in ("synced_at", "full_synced_at", "attendee_count")} if st else None
+
+    async def get_startgg_roster(self, slug):
+        return [dict(e) for (s, _), e in self.rows.items() if s == slug]
+
+    async def save_startgg_roster(self, slug, entries, complete=False, attendee_count=None):
+        self.saves.append((slug, len(entries), complete))
+        for e in entries:
+            self.rows[(slug, e["participant_id"])] = dict(e)
+        if complete:
+            keep = {e["participant_id"] for e in entries}
+            for key in [k for k in self.rows if k[0] == slug and k[1] not in keep]:
+                del self.rows[key]
+            now = datetime.now(timezone.utc)
+            st = self.state.setdefault(slug, {"claimed_at": None})
+            st.update(synced_at=now, full_synced_at=now, attendee_count=attendee_count)
+        return {"changed": len(entries), "deleted": 0}
+
+    async def touch_startgg_roster(self, slug):
+        self.state[slug]["synced_at"] = datetime.now(timezone.utc)
+
+    def expire_lease(self, slug):
+        self.state[slug]["claimed_at"] = None
+
+
+@pytest.fixture
+def startgg(http_stand_in, monkeypatch):
+    server = http_stand_in(_respond_startgg)
+    server.participants = [_participant(i, f"Player{i}") for i in range(1, 8)]
+    server.participants.append(_participant(100, "Logisticuz", ("Street Fighter 6", "Tekken 8")))
+    server.calls = []
+    monkeypatch.setattr(integrations, "startgg_limiter", integrations.TokenBucket(1000.0, 1000))
+    monkeypatch.setattr(integrations, "STARTGG_API_URL", f"{server.base_url}/gql/alpha")
+    return server
+
+
+def _run(coro_fn):
+    """Run coro_fn(roster) with a real httpx client and in-memory storage."""
+
+    async def main():
+        async with httpx.AsyncClient() as client:
+            roster = StartggRoster(client, _MemoryRosterStorage(), refresh_seconds=60, page_size=3)
+            return await coro_fn(roster)
+
+    return asyncio.run(main())
+
+
+# ============================================================================
+# Sync
+# ============================================================================
+
+
+class TestRosterSync:
+
+    def test_full_sync_pages_through_all_entrants(self, startgg):
+        async def flow(roster):
+            await roster.refresh("weekly")
+            return roster
+
+        roster = _run(flow)
+        assert len(roster) == 8
+        assert startgg.calls == ["roster", "roster", "roster"]  # 8 entrants / 3 per page
+        assert roster.storage.saves == [("weekly", 8, True)]
+
+    def test_unchanged_attendee_count_only_probes(self, startgg):
+        async def flow(roster):
+            await roster.refresh("weekly")
+            roster.storage.expire_lease("weekly")
+            await roster.refresh("weekly")
+            return roster
+
+        roster = _run(flow)
+        assert startgg.calls == ["roster", "roster", "roster", "probe"]
+        assert len(roster.storage.saves) == 1
+
+    def test_changed_attendee_count_resyncs(self, startgg):
+        async def flow(roster):
+            await roster.refresh("weekly")
+            startgg.participants.append(_participant(200, "NewPlayer"))
+            roster.storage.expire_lease("weekly")
+            await roster.refresh("weekly")
+            return roster
+
+        roster = _run(flow)
+        assert startgg.calls.count("probe") == 1
+        assert len(roster) == 9
+        assert roster.lookup("newplayer", "weekly")["isRegistered"] is True
+
+    def test_lease_holder_only_hits_startgg(self, startgg):
+        """A second worker sharing the table reloads from storage instead of Start.gg."""
+
+        async def flow(roster):
+            await roster.refresh("weekly")
+            other = StartggRoster(roster.client, roster.storage, refresh_seconds=60)
+            await other.refresh("weekly")
+            return other
+
+        other = _run(flow)
+        assert startgg.calls == ["roster", "roster", "roster"]
+        assert len(other) == 8
+
+
+# ============================================================================
+# Lookups
+# ============================================================================
+
+
+class TestRosterLookup:
+
+    def test_lookup_is_case_insensitive(self, startgg):
+        async def flow(roster):
+            await roster.refresh("weekly")
+            return roster.lookup("  LOGISTICUZ ", "weekly")
+
+        hit = _run(flow)
+        assert hit["isRegistered"] is True
+        assert hit["tag"] == "Logisticuz"
+        assert hit["events"] == ["Street Fighter 6", "Tekken 8"]
+        assert hit["email"] == "logisticuz@example.com"
+
+    def test_lookup_other_slug_misses(self, startgg):
+        async def flow(roster):
+            await roster.refresh("weekly")
+            return roster.lookup("logisticuz", "another-tournament")
+
+        assert _run(flow) is None
+
+    def test_stale_roster_is_not_trusted(self, startgg):
+        async def flow(roster):
+            await roster.refresh("weekly")
+            roster.synced_at -= timedelta(seconds=3 * roster.refresh_seconds + 1)
+            return roster.lookup("logisticuz", "weekly")
+
+        assert _run(flow) is None
+
+    def test_check_hit_does_not_call_startgg(self, startgg):
+        async def flow(roster):
+            await roster.refresh("weekly")
+            startgg.calls.clear()
+            return await roster.check("player3", "weekly")
+
+        result = _run(flow)
+        assert result["isRegistered"] is True
+        assert startgg.calls == []
+
+    def test_check_miss_goes_live_and_remembers(self, startgg):
+        async def flow(roster):
+            await roster.refresh("weekly")
+            startgg.participants.append(_participant(300, "LateSignup"))
+            startgg.calls.clear()
+            first = await roster.check("latesignup", "weekly")
+            second = await roster.check("latesignup", "weekly")
+            return roster, first, second
+
+        roster, first, second = _run(flow)
+        assert first["isRegistered"] is True
+        assert second["source"] == "roster"
+        assert startgg.calls == ["tag"]
+        assert ("weekly", "300") in roster.storage.rows
+
+    def test_check_unregistered_tag(self, startgg):
+        async def flow(roster):
+            await roster.refresh("weekly")
+            return await roster.check("nobody", "weekly")
+
+        assert _run(flow)["isRegistered"] is False